@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Ingest-path throughput benchmark on synthetic Factorio console.log corpora.
+
+Generates a reproducible corpus (seeded) with a tunable mix of chat, join,
+leave, death, research, mention, malicious and noise lines, then drives:
+
+- parse:    EventParser.parse_line
+- security: SecurityMonitor.check_malicious_pattern (chat payloads only)
+- pipeline: Application.handle_log_line with a stub Discord interface
+
+Each benchmark reports lines/sec, p50/p99 per-line latency and allocated
+bytes per line (tracemalloc, measured in a separate pass so tracing doesn't
+skew timings). Results are appended to a JSONL file tagged with the git
+commit, so runs can be compared across commits.
+
+Usage:
+    python scripts/bench_parser.py
+    python scripts/bench_parser.py --lines 100000 --mix chat=70,join=10,malicious=5
+    python scripts/bench_parser.py --chat-length 400 --bench parse
+    python scripts/bench_parser.py --compare --fail-threshold 10   # CI regression gate
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# Quiet import-time log lines; main() applies --log-level
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR),
+    logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+)
+
+from event_parser import MAX_LINE_LENGTH, EventParser  # noqa: E402
+from security_monitor import SecurityMonitor  # noqa: E402
+
+DEFAULT_RESULTS_FILE = PROJECT_ROOT / ".benchmarks" / "parser.jsonl"
+BENCHMARKS = ("parse", "security", "pipeline")
+
+# Relative weights of each line kind in the corpus
+DEFAULT_MIX: Dict[str, int] = {
+    "chat": 45,
+    "join": 8,
+    "leave": 8,
+    "death": 7,
+    "research": 5,
+    "mention": 4,
+    "server": 8,
+    "achievement": 3,
+    "malicious": 2,
+    "noise": 9,
+    "edge": 1,
+}
+
+PLAYERS = [
+    "Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Grace", "Heidi",
+    "Ivan", "Judy", "Mallory", "Niaj", "Olivia", "Peggy", "Rupert", "Sybil",
+    "Trent", "Victor", "Walter", "Xena", "Yusuf", "Zoe", "Kovarex", "Twinsen",
+]
+WORDS = [
+    "iron", "copper", "plates", "belt", "inserter", "train", "station", "biters",
+    "nest", "turret", "ammo", "oil", "refinery", "science", "red", "green", "blue",
+    "main", "bus", "smelting", "column", "rails", "signal", "north", "south",
+    "base", "power", "steam", "solar", "nuclear", "need", "more", "help", "please",
+    "anyone", "where", "is", "the", "we", "lol", "ok", "thanks", "gg", "brb",
+]
+TECHNOLOGIES = [
+    "automation", "logistics", "steel-processing", "electronics", "oil-processing",
+    "advanced-material-processing", "railway", "military-2", "solar-energy",
+]
+KILLERS = ["a small biter", "a medium spitter", "a gun turret", "a big worm", "Bob"]
+MALICIOUS_PAYLOADS = [
+    "eval(print('x'))",
+    "__import__('os').system('id')",
+    "../../../etc/passwd",
+    "hi && curl evil",
+    "ok; rm -rf /",
+    "`whoami`",
+    "$(reboot)",
+]
+
+
+def _timestamp(rng: random.Random) -> str:
+    base = datetime(2025, 1, 1)
+    return (base + timedelta(seconds=rng.randrange(86400 * 30))).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    """Build chat text of roughly length characters."""
+    target = max(1, rng.randint(max(1, length // 2), max(1, length * 3 // 2)))
+    words: List[str] = []
+    size = 0
+    while size < target:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:target]
+
+
+class CorpusGenerator:
+    """Seeded generator of realistic console.log lines."""
+
+    def __init__(self, seed: int, chat_length: int) -> None:
+        self.rng = random.Random(seed)
+        self.chat_length = chat_length
+        self._offender = 0
+
+    def line(self, kind: str) -> str:
+        rng = self.rng
+        ts = _timestamp(rng)
+        player = rng.choice(PLAYERS)
+
+        if kind == "chat":
+            return f"{ts} [CHAT] {player}: {_sentence(rng, self.chat_length)}"
+        if kind == "join":
+            return f"{ts} [JOIN] {player} joined the game"
+        if kind == "leave":
+            return f"{ts} [LEAVE] {player} left the game"
+        if kind == "death":
+            return rng.choice([
+                f"{ts} {player} was killed by {rng.choice(KILLERS)}.",
+                f"{ts} {player} was killed by a locomotive.",
+                f"{ts} {player} committed suicide.",
+                f"{ts} {player} died in space.",
+            ])
+        if kind == "research":
+            tech = rng.choice(TECHNOLOGIES)
+            return rng.choice([
+                f"{ts} [RESEARCH] Started researching {tech}.",
+                f"{ts} [RESEARCH] Finished researching {tech}.",
+                f"{ts} [TECH] {player} unlocked {tech}.",
+            ])
+        if kind == "mention":
+            target = rng.choice(["@admins", "@mods", f"@{rng.choice(PLAYERS)}", "@everyone"])
+            return f"{ts} [CHAT] {player}: {target} {_sentence(rng, self.chat_length)}"
+        if kind == "server":
+            return rng.choice([
+                f"{ts} [SERVER] Saving game.",
+                f"{ts} [SERVER] Server restart in {rng.randint(1, 30)} minutes",
+                f"{ts} [INFO] Autosave finished in {rng.randint(100, 900)}ms",
+                f"{ts} [WARNING] Mod {rng.choice(WORDS)} uses deprecated API",
+                f"{ts} [MOD] Loaded mod: {rng.choice(WORDS)} (1.{rng.randint(0, 9)}.0)",
+            ])
+        if kind == "achievement":
+            return rng.choice([
+                f"{ts} [ACHIEVEMENT] {player} earned Smoke me a kipper.",
+                f"{ts} {player} launched a rocket!",
+                f"{ts} [MILESTONE] Produced {rng.randint(1, 9)},000 iron-plate.",
+            ])
+        if kind == "malicious":
+            # Unique offender per line: auto-bans must not short-circuit later lines
+            self._offender += 1
+            payload = rng.choice(MALICIOUS_PAYLOADS)
+            return f"{ts} [CHAT] Griefer{self._offender}: {_sentence(rng, 20)} {payload}"
+        if kind == "noise":
+            return rng.choice([
+                f"{rng.uniform(0, 9999):10.3f} Info ServerMultiplayerManager.cpp:{rng.randint(100, 999)}: "
+                f"updateTick({rng.randint(10**6, 10**7)}) received stateChanged",
+                f"{rng.uniform(0, 9999):10.3f} Script @__level__/control.lua:{rng.randint(1, 500)}: tick",
+                "",
+            ])
+        if kind == "edge":
+            prefix = f"{ts} [CHAT] {player}: "
+            return rng.choice([
+                prefix + "x" * (MAX_LINE_LENGTH - len(prefix)),      # exactly at the cap
+                prefix + "x" * (MAX_LINE_LENGTH - len(prefix) + 1),  # one over: rejected
+                prefix + "@mods " * ((MAX_LINE_LENGTH - len(prefix)) // 6),
+                prefix + "ünïcödé ✓ " * 20,
+                "   ",
+            ])
+        raise ValueError(f"Unknown line kind: {kind}")
+
+    def corpus(self, lines: int, mix: Dict[str, int]) -> List[str]:
+        kinds = list(mix)
+        weights = [mix[k] for k in kinds]
+        return [self.line(kind) for kind in self.rng.choices(kinds, weights=weights, k=lines)]
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse 'chat=60,join=10' into weights; unspecified kinds keep defaults."""
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        kind, _, weight = item.partition("=")
+        if kind not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(
+                f"unknown line kind '{kind}' (choose from {', '.join(DEFAULT_MIX)})"
+            )
+        try:
+            mix[kind] = int(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"weight for '{kind}' must be an integer")
+    if sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("mix weights must sum to more than zero")
+    return mix
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return float(sorted_values[index])
+
+
+def _summarize(latencies_ns: List[int], elapsed_ns: int) -> Dict[str, float]:
+    latencies_ns.sort()
+    count = len(latencies_ns)
+    return {
+        "lines": count,
+        "lines_per_sec": round(count / (elapsed_ns / 1e9), 1) if elapsed_ns else 0.0,
+        "mean_us": round(statistics.fmean(latencies_ns) / 1000, 3) if count else 0.0,
+        "p50_us": round(_percentile(latencies_ns, 0.50) / 1000, 3),
+        "p99_us": round(_percentile(latencies_ns, 0.99) / 1000, 3),
+        "max_us": round(latencies_ns[-1] / 1000, 3) if count else 0.0,
+    }
+
+
+def time_sync(fn: Callable[[Any], Any], items: List[Any]) -> Dict[str, float]:
+    clock = time.perf_counter_ns
+    latencies: List[int] = []
+    append = latencies.append
+    start = clock()
+    for item in items:
+        t0 = clock()
+        fn(item)
+        append(clock() - t0)
+    return _summarize(latencies, clock() - start)
+
+
+async def time_async(fn: Callable[[Any], Any], items: List[Any]) -> Dict[str, float]:
+    clock = time.perf_counter_ns
+    latencies: List[int] = []
+    append = latencies.append
+    start = clock()
+    for item in items:
+        t0 = clock()
+        await fn(item)
+        append(clock() - t0)
+    return _summarize(latencies, clock() - start)
+
+
+def allocations_sync(fn: Callable[[Any], Any], items: List[Any]) -> float:
+    """Mean bytes allocated (transient peak) per call, via tracemalloc."""
+    total = 0
+    tracemalloc.start()
+    try:
+        for item in items:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            fn(item)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return round(total / max(1, len(items)), 1)
+
+
+async def allocations_async(fn: Callable[[Any], Any], items: List[Any]) -> float:
+    total = 0
+    tracemalloc.start()
+    try:
+        for item in items:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await fn(item)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return round(total / max(1, len(items)), 1)
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+
+class StubDiscord:
+    """Discord interface stand-in that accepts every event."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+
+    async def send_event(self, event: Any) -> bool:
+        self.sent += 1
+        return True
+
+
+def _security_monitor(workdir: Path) -> SecurityMonitor:
+    workdir.mkdir(parents=True, exist_ok=True)
+    return SecurityMonitor(
+        infractions_file=workdir / "infractions.jsonl",
+        banned_players_file=workdir / "server-banlist.json",
+    )
+
+
+def _chat_payloads(corpus: List[str]) -> List[Tuple[str, str]]:
+    """(player, message) pairs for every chat-style line in the corpus."""
+    payloads = []
+    for line in corpus:
+        _, tag, rest = line.partition("[CHAT] ")
+        if tag:
+            player, _, message = rest.partition(": ")
+            payloads.append((player, message))
+    return payloads
+
+
+def run_benchmarks(
+    corpus: List[str],
+    selected: List[str],
+    patterns_dir: Path,
+    workdir: Path,
+    measure_allocations: bool,
+) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+
+    # Every pass gets fresh state so bans/infractions from one pass don't leak
+    def new_parser(tag: str) -> EventParser:
+        return EventParser(patterns_dir, security_monitor=_security_monitor(workdir / tag))
+
+    if "parse" in selected:
+        parser = new_parser("parse")
+        results["parse"] = time_sync(lambda line: parser.parse_line(line, "bench"), corpus)
+        if measure_allocations:
+            parser = new_parser("parse-alloc")
+            results["parse"]["alloc_bytes_per_line"] = allocations_sync(
+                lambda line: parser.parse_line(line, "bench"), corpus
+            )
+
+    if "security" in selected:
+        payloads = _chat_payloads(corpus)
+        monitor = _security_monitor(workdir / "security")
+        check = lambda p: monitor.check_malicious_pattern(p[1], player_name=p[0])  # noqa: E731
+        results["security"] = time_sync(check, payloads)
+        if measure_allocations:
+            monitor = _security_monitor(workdir / "security-alloc")
+            results["security"]["alloc_bytes_per_line"] = allocations_sync(check, payloads)
+
+    if "pipeline" in selected:
+        from main import Application
+
+        def new_app(tag: str) -> Any:
+            app = Application()
+            app.event_parser = new_parser(tag)
+            app.discord = StubDiscord()  # type: ignore[assignment]
+            return app
+
+        async def run() -> None:
+            app = new_app("pipeline")
+            results["pipeline"] = await time_async(
+                lambda line: app.handle_log_line(line, "bench"), corpus
+            )
+            results["pipeline"]["events_sent"] = app.discord.sent
+            if measure_allocations:
+                app = new_app("pipeline-alloc")
+                results["pipeline"]["alloc_bytes_per_line"] = await allocations_async(
+                    lambda line: app.handle_log_line(line, "bench"), corpus
+                )
+
+        asyncio.run(run())
+
+    return results
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def load_previous(path: Path, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the most recent saved run with an identical configuration."""
+    if not path.exists():
+        return None
+    previous = None
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if record.get("config") == config:
+                previous = record
+    return previous
+
+
+def compare(
+    current: Dict[str, Dict[str, float]], baseline: Dict[str, Any], threshold: Optional[float]
+) -> bool:
+    """Print deltas against baseline; return False if throughput regressed past threshold."""
+    ok = True
+    print(f"\nCompared with {baseline.get('commit') or 'unknown'} ({baseline.get('timestamp')}):")
+    for bench, metrics in current.items():
+        before = baseline.get("results", {}).get(bench)
+        if not before:
+            continue
+        for key in ("lines_per_sec", "p50_us", "p99_us", "alloc_bytes_per_line"):
+            if key not in metrics or not before.get(key):
+                continue
+            change = (metrics[key] - before[key]) / before[key] * 100
+            print(f"  {bench:<9} {key:<22} {before[key]:>12} -> {metrics[key]:>12} ({change:+.1f}%)")
+            if key == "lines_per_sec" and threshold is not None and change < -threshold:
+                ok = False
+    return ok
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    header = f"{'bench':<9} {'lines':>8} {'lines/s':>12} {'p50 us':>9} {'p99 us':>9} {'max us':>10} {'B/line':>9}"
+    print(header)
+    print("-" * len(header))
+    for bench, m in results.items():
+        alloc = m.get("alloc_bytes_per_line", "-")
+        print(
+            f"{bench:<9} {m['lines']:>8} {m['lines_per_sec']:>12} {m['p50_us']:>9} "
+            f"{m['p99_us']:>9} {m['max_us']:>10} {alloc:>9}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--lines", type=int, default=20000, help="corpus size (default: 20000)")
+    ap.add_argument("--seed", type=int, default=1, help="corpus RNG seed (default: 1)")
+    ap.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX),
+                    help="line kind weights, e.g. chat=60,malicious=5 (kinds: %s)" % ", ".join(DEFAULT_MIX))
+    ap.add_argument("--chat-length", type=int, default=60, help="mean chat payload length in chars (default: 60)")
+    ap.add_argument("--bench", action="append", choices=BENCHMARKS, help="benchmark to run (repeatable; default: all)")
+    ap.add_argument("--patterns-dir", type=Path, default=PROJECT_ROOT / "patterns")
+    ap.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc pass")
+    ap.add_argument("--results", type=Path, default=DEFAULT_RESULTS_FILE, help="JSONL results file")
+    ap.add_argument("--no-save", action="store_true", help="don't append this run to the results file")
+    ap.add_argument("--compare", action="store_true", help="compare with the last run of the same configuration")
+    ap.add_argument("--fail-threshold", type=float, default=None, metavar="PCT",
+                    help="with --compare, exit 1 if lines/sec drops by more than PCT percent")
+    ap.add_argument("--log-level", default="error", choices=["debug", "info", "warning", "error"])
+    args = ap.parse_args(argv)
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, args.log_level.upper())),
+        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+    )
+
+    selected = args.bench or list(BENCHMARKS)
+    config = {
+        "lines": args.lines,
+        "seed": args.seed,
+        "mix": args.mix,
+        "chat_length": args.chat_length,
+        "patterns_dir": str(args.patterns_dir),
+    }
+
+    corpus = CorpusGenerator(args.seed, args.chat_length).corpus(args.lines, args.mix)
+    with tempfile.TemporaryDirectory(prefix="isr-bench-") as tmp:
+        results = run_benchmarks(corpus, selected, args.patterns_dir, Path(tmp), not args.no_alloc)
+
+    print_results(results)
+
+    ok = True
+    if args.compare:
+        baseline = load_previous(args.results, config)
+        if baseline is None:
+            print("\nNo previous run with this configuration to compare against.")
+        else:
+            ok = compare(results, baseline, args.fail_threshold)
+
+    if not args.no_save:
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+            "results": results,
+        }
+        args.results.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.results, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"\nSaved to {args.results}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
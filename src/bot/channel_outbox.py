@@ -0,0 +1,209 @@
+"""Per-channel outbox that coalesces bursts of event messages."""
+
+import asyncio
+import time
+from typing import Any, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Discord's hard limit for message content
+DISCORD_MESSAGE_LIMIT = 2000
+
+DEFAULT_COALESCE_WINDOW = 0.5
+DEFAULT_MAX_LATENCY = 2.0
+
+# Buffered characters at which submit() waits for the flush to catch up
+DEFAULT_MAX_BUFFERED_CHARS = 4 * DISCORD_MESSAGE_LIMIT
+
+
+def pack_messages(lines: List[str], limit: int = DISCORD_MESSAGE_LIMIT) -> List[str]:
+    """
+    Join lines into as few newline-separated messages as fit within limit.
+
+    Order is preserved; a single line longer than limit is sent on its own.
+    """
+    messages: List[str] = []
+    current: List[str] = []
+    size = 0
+    for line in lines:
+        added = len(line) + (1 if current else 0)
+        if current and size + added > limit:
+            messages.append("\n".join(current))
+            current, size = [], 0
+            added = len(line)
+        current.append(line)
+        size += added
+    if current:
+        messages.append("\n".join(current))
+    return messages
+
+
+class ChannelOutbox:
+    """
+    Coalesce messages for one Discord channel.
+
+    An idle channel sends immediately (no added latency). Messages that
+    arrive while a send is in flight, or within coalesce_window of the last
+    send, are buffered and merged into as few messages as fit Discord's
+    2000-char limit. Each new buffered message pushes the flush back by
+    coalesce_window, but never past max_latency after the oldest one.
+    Sends are serialized, so channel ordering is preserved.
+
+    The buffer is bounded: once it holds max_buffered_chars, submit() waits
+    until a flush takes it, so a slow or rate-limited channel pushes back on
+    the caller (the delivery queue, which can then shed) instead of growing
+    memory without limit.
+    """
+
+    def __init__(
+        self,
+        channel: Any,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+        max_buffered_chars: int = DEFAULT_MAX_BUFFERED_CHARS,
+    ) -> None:
+        """
+        Initialize outbox.
+
+        Args:
+            channel: discord.TextChannel (anything with async send(content))
+            coalesce_window: Quiet period before buffered messages are flushed
+            max_latency: Max seconds a buffered message waits before flushing
+            max_buffered_chars: Buffer size at which submit() starts waiting
+        """
+        self.channel = channel
+        self.coalesce_window = coalesce_window
+        self.max_latency = max(max_latency, coalesce_window)
+        self.max_buffered_chars = max(max_buffered_chars, DISCORD_MESSAGE_LIMIT)
+
+        self._buffer: List[str] = []
+        self._buffer_chars = 0
+        self._first_buffered = 0.0
+        self._deadline = 0.0
+        self._last_send = float("-inf")
+        self._lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        # Set whenever a flush takes the buffer
+        self._drained = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task[None]] = None
+
+        # Counters
+        self.messages_in = 0
+        self.api_calls = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered messages not yet sent."""
+        return len(self._buffer)
+
+    async def submit(self, message: str) -> bool:
+        """
+        Send message now if the channel is idle, otherwise buffer it.
+
+        Waits while the buffer is full (see max_buffered_chars).
+
+        Returns:
+            True if sent immediately, False if buffered for a coalesced send.
+
+        Raises:
+            Exception: Whatever channel.send raised for an immediate send.
+        """
+        self.messages_in += 1
+        while self._buffer_chars >= self.max_buffered_chars:
+            self._ensure_flush_task()
+            self._drained.clear()
+            await self._drained.wait()
+        now = time.monotonic()
+
+        if (
+            not self._buffer
+            and not self._lock.locked()
+            and now - self._last_send >= self.coalesce_window
+        ):
+            async with self._lock:
+                await self._send(message)
+            return True
+
+        if not self._buffer:
+            self._first_buffered = now
+        self._buffer.append(message)
+        self._buffer_chars += len(message) + 1
+        self._deadline = min(now + self.coalesce_window, self._first_buffered + self.max_latency)
+
+        # A full message's worth is waiting: flush without waiting for the window
+        if self._buffer_chars >= DISCORD_MESSAGE_LIMIT:
+            self._deadline = now
+            self._wake.set()
+
+        self._ensure_flush_task()
+        return False
+
+    def _ensure_flush_task(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _send(self, content: str) -> None:
+        """Send one message (caller holds the lock)."""
+        self.api_calls += 1
+        try:
+            await self.channel.send(content)
+        finally:
+            self._last_send = time.monotonic()
+
+    async def _flush_loop(self) -> None:
+        """Flush buffered messages once their deadline passes, until empty."""
+        while self._buffer:
+            delay = self._deadline - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                if self._deadline > time.monotonic():
+                    continue  # pushed back by a newer message
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything buffered now, merged and in order."""
+        async with self._lock:
+            if not self._buffer:
+                return
+            lines = self._buffer
+            self._buffer = []
+            self._buffer_chars = 0
+            self._drained.set()
+
+            messages = pack_messages(lines)
+            failed = 0
+            for content in messages:
+                try:
+                    await self._send(content)
+                except Exception as e:
+                    failed += 1
+                    logger.error(
+                        "outbox_send_failed",
+                        channel_id=getattr(self.channel, "id", None),
+                        error=str(e),
+                        exc_info=True,
+                    )
+
+            logger.debug(
+                "outbox_flushed",
+                channel_id=getattr(self.channel, "id", None),
+                events=len(lines),
+                messages=len(messages),
+                failed=failed,
+            )
+
+    async def close(self) -> None:
+        """Flush pending messages now and wait for the flush task to finish."""
+        self._deadline = float("-inf")
+        self._wake.set()
+        task = self._flush_task
+        self._flush_task = None
+        if task is not None and not task.done():
+            await task
+        await self.flush()
@@ -40,6 +40,20 @@ import re
 import discord
 import structlog
 
+try:
+    from player_roster import PLAYERS_ONLINE_COMMAND, PlayerRoster, parse_online_players
+except ImportError:
+    from src.player_roster import (  # type: ignore
+        PLAYERS_ONLINE_COMMAND,
+        PlayerRoster,
+        parse_online_players,
+    )
+
+try:
+    from rcon_cache import EVOLUTION_ALL_COMMAND, evolution_surface_command
+except ImportError:
+    from src.rcon_cache import EVOLUTION_ALL_COMMAND, evolution_surface_command  # type: ignore
+
 logger = structlog.get_logger()
 
 
@@ -81,6 +95,9 @@ class ServerManagerProvider(Protocol):
 
     def get_metrics_engine(self, server_tag: str) -> Optional[RconMetricsProvider]:...
     """Get metrics engine for a server."""
+
+    async def get_metrics_snapshot(self, server_tag: str) -> Optional[Any]: ...
+    """Get the server's cached metrics snapshot (sampled only when stale)."""
         
 
     def list_servers(self) -> Dict[str, Any]: ...
@@ -261,12 +278,16 @@ class StatusCommandHandler:
         if not interaction.response.is_done():
             await interaction.response.defer()
         try:
-            # Gather metrics via metrics engine
-            metrics_engine = self.server_manager.get_metrics_engine(server_tag)
-            if metrics_engine is None:
-                raise RuntimeError(f"Metrics engine not available for {server_tag}")
+            # Read the shared metrics snapshot (no RCON work while it is fresh)
+            snapshot = await self.server_manager.get_metrics_snapshot(server_tag)
+            if snapshot is not None:
+                metrics = snapshot.to_dict()
+            else:
+                metrics_engine = self.server_manager.get_metrics_engine(server_tag)
+                if metrics_engine is None:
+                    raise RuntimeError(f"Metrics engine not available for {server_tag}")
 
-            metrics = await metrics_engine.gather_all_metrics()
+                metrics = await metrics_engine.gather_all_metrics()
 
             # Calculate uptime
             uptime_text = self._calculate_uptime(server_tag)
@@ -467,16 +488,19 @@ class PlayersCommandHandler:
         if not interaction.response.is_done():
             await interaction.response.defer()
         try:
-            response = await rcon_client.execute("/players")
-            players = []
-            if response:
-                for line in response.split("\n"):
-                    line = line.strip()
-                    if "(online)" in line.lower():
-                        player_name = line.split("(online)")[0].strip()
-                        player_name = player_name.lstrip("-").strip()
-                        if player_name and not player_name.startswith("Player"):
-                            players.append(player_name)
+            # Answer from the live roster when it is current (no RCON traffic)
+            roster = getattr(rcon_client, "roster", None)
+            if not isinstance(roster, PlayerRoster):
+                roster = None
+
+            if roster is not None and roster.is_current():
+                players = roster.players()
+            else:
+                since = roster.version if roster is not None else None
+                response = await rcon_client.execute(PLAYERS_ONLINE_COMMAND)
+                players = parse_online_players(response)
+                if roster is not None:
+                    roster.reconcile(players, since=since)
 
             embed = discord.Embed(
                 title=f"👥 Players on {server_name}",
@@ -749,30 +773,7 @@ class EvolutionCommandHandler:
 
     async def _handle_aggregate_evolution(self, rcon_client: RconClientProvider) -> CommandResult:
         """Query all non-platform surfaces and aggregate evolution."""
-        lua = (
-            "/sc "
-            "local f = game.forces['enemy']; "
-            "local total = 0; local count = 0; "
-            "local lines = {}; "
-            "for _, s in pairs(game.surfaces) do "
-            " if not string.find(string.lower(s.name), 'platform') then "
-            " local evo = f.get_evolution_factor(s); "
-            " total = total + evo; count = count + 1; "
-            " table.insert(lines, s.name .. ':' .. string.format('%.2f%%', evo * 100)); "
-            " end "
-            "end; "
-            "if count > 0 then "
-            " local avg = total / count; "
-            " rcon.print('AGG:' .. string.format('%.2f%%', avg * 100)); "
-            "else "
-            " rcon.print('AGG:0.00%%'); "
-            "end; "
-            "for _, line in ipairs(lines) do "
-            " rcon.print(line); "
-            "end"
-        )
-
-        resp = await rcon_client.execute(lua)
+        resp = await rcon_client.execute(EVOLUTION_ALL_COMMAND)
         lines = [ln.strip() for ln in resp.splitlines() if ln.strip()]
         agg_line = next((ln for ln in lines if ln.startswith("AGG:")), None)
         per_surface = [ln for ln in lines if not ln.startswith("AGG:")]
@@ -809,22 +810,7 @@ class EvolutionCommandHandler:
         self, rcon_client: RconClientProvider, surface: str
     ) -> CommandResult:
         """Query evolution for a single surface."""
-        lua = (
-            "/sc "
-            f"local s = game.get_surface('{surface}'); "
-            "if not s then "
-            " rcon.print('SURFACE_NOT_FOUND'); "
-            " return "
-            "end; "
-            "if string.find(string.lower(s.name), 'platform') then "
-            " rcon.print('SURFACE_PLATFORM_IGNORED'); "
-            " return "
-            "end; "
-            "local evo = game.forces['enemy'].get_evolution_factor(s); "
-            "rcon.print(string.format('%.2f%%', evo * 100))"
-        )
-
-        resp = await rcon_client.execute(lua)
+        resp = await rcon_client.execute(evolution_surface_command(surface))
         resp_str = resp.strip()
 
         if resp_str == "SURFACE_NOT_FOUND":
@@ -24,19 +24,22 @@ try:
     # Try flat layout first (when run from src/ directory)
     from utils.rate_limiting import QUERY_COOLDOWN, ADMIN_COOLDOWN, DANGER_COOLDOWN
     from discord_interface import EmbedBuilder
+    from rcon_scheduler import CommandPriority, command_priority
 except ImportError:
     try:
         # Fallback to package style (when installed as package)
         from src.utils.rate_limiting import QUERY_COOLDOWN, ADMIN_COOLDOWN, DANGER_COOLDOWN  # type: ignore
         from src.discord_interface import EmbedBuilder  # type: ignore
+        from src.rcon_scheduler import CommandPriority, command_priority  # type: ignore
     except ImportError:
         # Last resort: use relative imports from parent
         try:
             from ..utils.rate_limiting import QUERY_COOLDOWN, ADMIN_COOLDOWN, DANGER_COOLDOWN  # type: ignore
             from ..discord_interface import EmbedBuilder  # type: ignore
+            from ..rcon_scheduler import CommandPriority, command_priority  # type: ignore
         except ImportError:
             raise ImportError(
-                "Could not import rate_limiting or discord_interface from any path"
+                "Could not import rate_limiting, discord_interface or rcon_scheduler from any path"
             )
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -618,7 +621,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await kick_handler.execute(interaction, player=player, reason=reason)
+        with command_priority(CommandPriority.ADMIN):
+            result = await kick_handler.execute(interaction, player=player, reason=reason)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="ban", description="Ban a player from the server")
@@ -634,7 +638,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await ban_handler.execute(interaction, player=player, reason=reason)
+        with command_priority(CommandPriority.ADMIN):
+            result = await ban_handler.execute(interaction, player=player, reason=reason)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="unban", description="Unban a player")
@@ -649,7 +654,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await unban_handler.execute(interaction, player=player)
+        with command_priority(CommandPriority.ADMIN):
+            result = await unban_handler.execute(interaction, player=player)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="mute", description="Mute a player")
@@ -661,7 +667,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await mute_handler.execute(interaction, player=player)
+        with command_priority(CommandPriority.ADMIN):
+            result = await mute_handler.execute(interaction, player=player)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="unmute", description="Unmute a player")
@@ -673,7 +680,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await unmute_handler.execute(interaction, player=player)
+        with command_priority(CommandPriority.ADMIN):
+            result = await unmute_handler.execute(interaction, player=player)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="promote", description="Promote player to admin")
@@ -685,7 +693,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await promote_handler.execute(interaction, player=player)
+        with command_priority(CommandPriority.ADMIN):
+            result = await promote_handler.execute(interaction, player=player)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="demote", description="Demote player from admin")
@@ -697,7 +706,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await demote_handler.execute(interaction, player=player)
+        with command_priority(CommandPriority.ADMIN):
+            result = await demote_handler.execute(interaction, player=player)
         await send_command_response(interaction, result, defer_before_send=False)
 
     # ════════════════════════════════════════════════════════════════════════════
@@ -713,7 +723,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await save_handler.execute(interaction, name=name)
+        with command_priority(CommandPriority.ADMIN):
+            result = await save_handler.execute(interaction, name=name)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="broadcast", description="Send message to all players")
@@ -725,7 +736,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await broadcast_handler.execute(interaction, message=message)
+        with command_priority(CommandPriority.ADMIN):
+            result = await broadcast_handler.execute(interaction, message=message)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="whisper", description="Send private message to a player")
@@ -741,7 +753,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await whisper_handler.execute(interaction, player=player, message=message)
+        with command_priority(CommandPriority.ADMIN):
+            result = await whisper_handler.execute(interaction, player=player, message=message)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="whitelist", description="Manage server whitelist")
@@ -760,7 +773,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await whitelist_handler.execute(interaction, action=action, player=player)
+        with command_priority(CommandPriority.ADMIN):
+            result = await whitelist_handler.execute(interaction, action=action, player=player)
         await send_command_response(interaction, result, defer_before_send=False)
 
     # ════════════════════════════════════════════════════════════════════════════
@@ -776,7 +790,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await clock_handler.execute(interaction, value=value)
+        with command_priority(CommandPriority.ADMIN):
+            result = await clock_handler.execute(interaction, value=value)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="speed", description="Set game speed")
@@ -788,7 +803,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await speed_handler.execute(interaction, value=value)
+        with command_priority(CommandPriority.ADMIN):
+            result = await speed_handler.execute(interaction, value=value)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(
@@ -813,9 +829,10 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                     ephemeral=True,
                 )
                 return
-            result = await research_handler.execute(
-                interaction, force=force, action=action, technology=technology
-            )
+            with command_priority(CommandPriority.ADMIN):
+                result = await research_handler.execute(
+                    interaction, force=force, action=action, technology=technology
+                )
             await send_command_response(interaction, result, defer_before_send=False)
         except Exception as e:
             logger.error("research_command_exception", error=str(e), exc_info=True)
@@ -838,7 +855,8 @@ def register_factorio_commands(bot: FactorioBot) -> None:
                 ephemeral=True,
             )
             return
-        result = await rcon_handler.execute(interaction, command=command)
+        with command_priority(CommandPriority.ADMIN):
+            result = await rcon_handler.execute(interaction, command=command)
         await send_command_response(interaction, result, defer_before_send=False)
 
     @factorio_group.command(name="help", description="Show available Factorio commands")
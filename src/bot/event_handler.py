@@ -3,26 +3,53 @@
 """Event handling and Discord message delivery with mention resolution."""
 
 import os
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 import discord
 import yaml  # type: ignore[import]
 import structlog
 
+from .channel_outbox import ChannelOutbox, DEFAULT_COALESCE_WINDOW, DEFAULT_MAX_LATENCY
+from .guild_index import GuildIndexCache
+
+# Built-in mention groups (config/mentions.yml may add or override)
+BASE_GROUP_KEYWORDS: Dict[str, List[str]] = {
+    "admins": ["admin", "admins", "administrator", "administrators"],
+    "mods": ["mod", "mods", "moderator", "moderators"],
+    "everyone": ["everyone"],
+    "here": ["here"],
+    "staff": ["staff"],
+}
+
 logger = structlog.get_logger()
 
 
 class EventHandler:
     """Handle Factorio event delivery to Discord with mention resolution."""
 
-    def __init__(self, bot: Any) -> None:
+    def __init__(
+        self,
+        bot: Any,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+    ) -> None:
         """
         Initialize event handler.
 
         Args:
             bot: DiscordBot instance with server_manager
+            coalesce_window: Seconds after a send during which further events
+                for the same channel are merged into one message
+            max_latency: Max seconds a merged event waits before it is sent
         """
         self.bot = bot
+        self.coalesce_window = coalesce_window
+        self.max_latency = max_latency
+        self._outboxes: Dict[int, ChannelOutbox] = {}
+        self.guild_indexes = GuildIndexCache()
         self._mention_group_keywords: Dict[str, List[str]] = {}
+        # Lowercased token -> (group key, variants), rebuilt when the config changes
+        self._group_lookup: Dict[str, Tuple[str, List[str]]] = {}
+        self._group_lookup_source: Optional[Dict[str, List[str]]] = None
         self._load_mention_config()
 
     def _load_mention_config(self) -> None:
@@ -201,9 +228,10 @@ class EventHandler:
                         mention_count=len(discord_mentions),
                     )
 
-            await channel.send(message)
+            # Bursts for the same channel are coalesced into fewer API calls
+            sent_now = await self._get_outbox(channel_id, channel).submit(message)
             logger.debug(
-                "event_sent",
+                "event_sent" if sent_now else "event_coalesced",
                 event_type=event.event_type.value,
                 server_tag=getattr(event, "server_tag", None),
                 channel_id=channel_id,
@@ -219,6 +247,28 @@ class EventHandler:
             )
             return False
 
+    def _get_outbox(self, channel_id: int, channel: Any) -> ChannelOutbox:
+        """Return the outbox for a channel, creating it on first use."""
+        outbox = self._outboxes.get(channel_id)
+        if outbox is None:
+            outbox = ChannelOutbox(
+                channel,
+                coalesce_window=self.coalesce_window,
+                max_latency=self.max_latency,
+            )
+            self._outboxes[channel_id] = outbox
+        else:
+            outbox.channel = channel
+        return outbox
+
+    async def flush(self) -> None:
+        """Send all coalesced events still waiting in channel outboxes."""
+        for channel_id, outbox in list(self._outboxes.items()):
+            try:
+                await outbox.close()
+            except Exception as e:
+                logger.error("outbox_flush_failed", channel_id=channel_id, error=str(e))
+
     async def _resolve_mentions(
         self,
         guild: discord.Guild,
@@ -234,43 +284,28 @@ class EventHandler:
             List of mention strings you can append to a message.
         """
         discord_mentions: List[str] = []
-
-        # Built-in groups
-        base_group_keywords: Dict[str, List[str]] = {
-            "admins": ["admin", "admins", "administrator", "administrators"],
-            "mods": ["mod", "mods", "moderator", "moderators"],
-            "everyone": ["everyone"],
-            "here": ["here"],
-            "staff": ["staff"],
-        }
-
-        # Merge in custom groups from config/mentions.yml (may override built-ins)
-        group_keywords: Dict[str, List[str]] = {**base_group_keywords, **self._mention_group_keywords}
+        group_lookup = self._get_group_lookup()
 
         for token in mentions:
-            token_lower = token.lower()
-            is_group = False
-
-            for group_key, variants in group_keywords.items():
-                if token_lower in [v.lower() for v in variants]:
-                    is_group = True
-
-                    if group_key == "everyone":
-                        discord_mentions.append("@everyone")
-                        logger.debug(
-                            "mention_resolved_to_everyone",
-                            original=token,
-                        )
-                        break
+            group = group_lookup.get(token.lower())
+            is_group = group is not None
 
-                    if group_key == "here":
-                        discord_mentions.append("@here")
-                        logger.debug(
-                            "mention_resolved_to_here",
-                            original=token,
-                        )
-                        break
+            if group is not None:
+                group_key, variants = group
 
+                if group_key == "everyone":
+                    discord_mentions.append("@everyone")
+                    logger.debug(
+                        "mention_resolved_to_everyone",
+                        original=token,
+                    )
+                elif group_key == "here":
+                    discord_mentions.append("@here")
+                    logger.debug(
+                        "mention_resolved_to_here",
+                        original=token,
+                    )
+                else:
                     role = self._find_role_by_name(guild, variants)
                     if role:
                         discord_mentions.append(role.mention)
@@ -286,7 +321,6 @@ class EventHandler:
                             original=token,
                             searched_names=variants,
                         )
-                    break
 
             if is_group:
                 continue
@@ -306,6 +340,26 @@ class EventHandler:
 
         return discord_mentions
 
+    def _get_group_lookup(self) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Return the lowercased token -> mention group table.
+
+        Built-in groups come first and custom groups from config/mentions.yml
+        may override them; the first group listing a token wins.
+        """
+        if self._group_lookup_source is not self._mention_group_keywords:
+            group_keywords: Dict[str, List[str]] = {
+                **BASE_GROUP_KEYWORDS,
+                **self._mention_group_keywords,
+            }
+            lookup: Dict[str, Tuple[str, List[str]]] = {}
+            for group_key, variants in group_keywords.items():
+                for variant in variants:
+                    lookup.setdefault(variant.lower(), (group_key, variants))
+            self._group_lookup = lookup
+            self._group_lookup_source = self._mention_group_keywords
+        return self._group_lookup
+
     def _find_role_by_name(
         self,
         guild: discord.Guild,
@@ -314,12 +368,7 @@ class EventHandler:
         """
         Find a role by trying multiple name variants (case-insensitive).
         """
-        for role in guild.roles:
-            role_name_lower = role.name.lower()
-            for candidate in role_names:
-                if role_name_lower == candidate.lower():
-                    return role
-        return None
+        return self.guild_indexes.get(guild).find_role(role_names)
 
     async def _find_member_by_name(
         self,
@@ -329,22 +378,4 @@ class EventHandler:
         """
         Find a guild member by username or display name (exact, then partial).
         """
-        name_lower = name.lower()
-
-        # Exact match
-        for member in guild.members:
-            if (
-                member.name.lower() == name_lower
-                or member.display_name.lower() == name_lower
-            ):
-                return member
-
-        # Partial match
-        for member in guild.members:
-            if (
-                name_lower in member.name.lower()
-                or name_lower in member.display_name.lower()
-            ):
-                return member
-
-        return None
+        return self.guild_indexes.get(guild).find_member(name)
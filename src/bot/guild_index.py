@@ -0,0 +1,222 @@
+"""Indexed guild member and role lookup for mention resolution."""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Substring queries at least this long use the trigram index
+TRIGRAM = 3
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+class GuildIndex:
+    """
+    Lowercased name/display-name index over one guild's members and roles.
+
+    Lookups return exactly what a linear scan of guild.members / guild.roles
+    would (first match in guild order), without lowercasing every member per
+    query: exact names are dict lookups and substring matches intersect
+    trigram posting sets before verifying a handful of candidates.
+    """
+
+    def __init__(self, guild: Any) -> None:
+        """
+        Build the index from the guild's current members and roles.
+
+        Args:
+            guild: discord.Guild
+        """
+        self.guild = guild
+        self._next_slot = 0
+        # slot (guild order) -> (lower name, lower display name, member)
+        self._entries: Dict[int, Tuple[str, str, Any]] = {}
+        self._slot_by_member_id: Dict[Any, int] = {}
+        self._exact: Dict[str, Set[int]] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        self._roles: Dict[str, List[Tuple[int, Any]]] = {}
+        self.role_count = 0
+
+        for member in guild.members:
+            self.add_member(member)
+        self.rebuild_roles()
+
+        logger.debug(
+            "guild_index_built",
+            guild_id=getattr(guild, "id", None),
+            members=len(self._entries),
+            roles=self.role_count,
+        )
+
+    @property
+    def member_count(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add_member(self, member: Any, slot: Optional[int] = None) -> None:
+        """Index a member (new members go last, matching guild.members order)."""
+        if slot is None:
+            slot = self._next_slot
+            self._next_slot += 1
+
+        name = str(member.name).lower()
+        display = str(member.display_name).lower()
+        self._entries[slot] = (name, display, member)
+        self._slot_by_member_id[member.id] = slot
+
+        for key in {name, display}:
+            self._exact.setdefault(key, set()).add(slot)
+        for gram in _trigrams(name) | _trigrams(display):
+            self._grams.setdefault(gram, set()).add(slot)
+
+    def remove_member(self, member: Any) -> Optional[int]:
+        """Drop a member from the index; returns its slot if it was indexed."""
+        slot = self._slot_by_member_id.pop(member.id, None)
+        if slot is None:
+            return None
+
+        name, display, _ = self._entries.pop(slot)
+        for key in {name, display}:
+            self._discard(self._exact, key, slot)
+        for gram in _trigrams(name) | _trigrams(display):
+            self._discard(self._grams, gram, slot)
+        return slot
+
+    def update_member(self, member: Any) -> None:
+        """Re-index a member whose name or nickname changed, keeping its position."""
+        slot = self.remove_member(member)
+        self.add_member(member, slot)
+
+    def rebuild_roles(self) -> None:
+        """Re-read guild.roles (cheap: guilds have at most a few hundred roles)."""
+        roles: Dict[str, List[Tuple[int, Any]]] = {}
+        for position, role in enumerate(self.guild.roles):
+            roles.setdefault(str(role.name).lower(), []).append((position, role))
+        self._roles = roles
+        self.role_count = len(self.guild.roles)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[int]], key: str, slot: int) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(slot)
+            if not bucket:
+                del index[key]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find_member(self, name: str) -> Optional[Any]:
+        """
+        Find a member by username or display name: exact, then substring.
+
+        Args:
+            name: Name to look up (case-insensitive)
+        """
+        name_lower = name.lower()
+
+        exact = self._exact.get(name_lower)
+        if exact:
+            return self._entries[min(exact)][2]
+
+        if len(name_lower) >= TRIGRAM:
+            candidates: Optional[Set[int]] = None
+            # Rarest trigrams first keeps the intersection small
+            for gram in sorted(_trigrams(name_lower), key=lambda g: len(self._grams.get(g, ()))):
+                posting = self._grams.get(gram)
+                if not posting:
+                    return None
+                candidates = set(posting) if candidates is None else candidates & posting
+                if not candidates:
+                    return None
+            slots: Iterable[int] = sorted(candidates or ())
+        else:
+            slots = sorted(self._entries)
+
+        for slot in slots:
+            member_name, display, member = self._entries[slot]
+            if name_lower in member_name or name_lower in display:
+                return member
+        return None
+
+    def find_role(self, role_names: List[str]) -> Optional[Any]:
+        """Find the first role (guild order) matching any name variant."""
+        best: Optional[Tuple[int, Any]] = None
+        for candidate in role_names:
+            for position, role in self._roles.get(candidate.lower(), ()):
+                if best is None or position < best[0]:
+                    best = (position, role)
+                break
+        return best[1] if best is not None else None
+
+
+class GuildIndexCache:
+    """Per-guild GuildIndex instances, built lazily and kept current by gateway events."""
+
+    def __init__(self) -> None:
+        self._indexes: Dict[Any, GuildIndex] = {}
+
+    @staticmethod
+    def _key(guild: Any) -> Any:
+        guild_id = getattr(guild, "id", None)
+        return guild_id if guild_id is not None else id(guild)
+
+    def get(self, guild: Any) -> GuildIndex:
+        """
+        Return the index for guild, (re)building it if missing or stale.
+
+        An index is stale if the guild object was replaced (e.g. after a
+        reconnect) or its member/role counts drifted from what was indexed,
+        which catches any gateway event we didn't see.
+        """
+        key = self._key(guild)
+        index = self._indexes.get(key)
+        if (
+            index is None
+            or index.guild is not guild
+            or index.member_count != len(guild.members)
+        ):
+            index = GuildIndex(guild)
+            self._indexes[key] = index
+        elif index.role_count != len(guild.roles):
+            index.rebuild_roles()
+        return index
+
+    def _existing(self, guild: Any) -> Optional[GuildIndex]:
+        index = self._indexes.get(self._key(guild))
+        if index is not None and index.guild is guild:
+            return index
+        return None
+
+    def member_joined(self, member: Any) -> None:
+        index = self._existing(member.guild)
+        if index is not None:
+            index.add_member(member)
+
+    def member_removed(self, member: Any) -> None:
+        index = self._existing(member.guild)
+        if index is not None:
+            index.remove_member(member)
+
+    def member_updated(self, before: Any, after: Any) -> None:
+        if before.name == after.name and before.display_name == after.display_name:
+            return
+        index = self._existing(after.guild)
+        if index is not None:
+            index.update_member(after)
+
+    def roles_changed(self, guild: Any) -> None:
+        index = self._existing(guild)
+        if index is not None:
+            index.rebuild_roles()
+
+    def clear(self) -> None:
+        self._indexes.clear()
@@ -54,6 +54,16 @@ class PresenceManager:
                         status_text = f"🔺 RCON (0/{total})"
                         status = discord.Status.idle
 
+                # Player total from cached metrics snapshots (never triggers RCON)
+                get_snapshots = getattr(self.bot.server_manager, "get_latest_snapshots", None)
+                snapshots = get_snapshots() if callable(get_snapshots) else None
+                if isinstance(snapshots, dict) and snapshots:
+                    players_online = sum(
+                        max(0, int(snapshot.metrics.get("player_count") or 0))
+                        for snapshot in snapshots.values()
+                    )
+                    status_text = f"{status_text} 👥 {players_online}"
+
             activity = discord.Activity(
                 type=activity_type,
                 name=f"{status_text} | /factorio help",
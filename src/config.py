@@ -235,6 +235,9 @@ class ServerConfig:
     enable_evolution_stat: bool = True
     """Enable evolution stat collection. Default: True."""
 
+    rcon_batch_metrics: bool = True
+    """Collect metrics with one batched Lua script per cycle instead of one RCON command per metric. Default: True."""
+
     # Alert configuration
     enable_alerts: bool = True
     """Enable UPS alerts. Default: True."""
@@ -257,6 +260,19 @@ class ServerConfig:
     ups_ema_alpha: float = 0.2
     """EMA smoothing factor for UPS. Default: 0.2."""
 
+    ups_burst_samples: int = 1
+    """game.tick reads per UPS sample; the one with the lowest RCON round trip is used. Default: 1."""
+
+    metrics_snapshot_ttl: int = 90
+    """Max age in seconds of a cached metrics snapshot served to consumers before a fresh sample is taken. Default: 90s."""
+
+    # RCON connection pooling
+    rcon_pool_size: int = 2
+    """Max persistent RCON connections kept open to this server. Default: 2."""
+
+    rcon_max_concurrency: int = 4
+    """Max RCON commands in flight to this server; others queue by priority. Default: 4."""
+
     def __post_init__(self) -> None:
         """Validate server config after initialization."""
         if not isinstance(self.log_path, (Path, type(None))):
@@ -286,6 +302,30 @@ class ServerConfig:
                 f"got {self.rcon_status_alert_interval}"
             )
 
+        if self.metrics_snapshot_ttl <= 0:
+            raise ValueError(
+                f"Server {self.tag}: metrics_snapshot_ttl must be > 0, "
+                f"got {self.metrics_snapshot_ttl}"
+            )
+
+        if self.rcon_pool_size <= 0:
+            raise ValueError(
+                f"Server {self.tag}: rcon_pool_size must be > 0, "
+                f"got {self.rcon_pool_size}"
+            )
+
+        if self.ups_burst_samples <= 0:
+            raise ValueError(
+                f"Server {self.tag}: ups_burst_samples must be > 0, "
+                f"got {self.ups_burst_samples}"
+            )
+
+        if self.rcon_max_concurrency <= 0:
+            raise ValueError(
+                f"Server {self.tag}: rcon_max_concurrency must be > 0, "
+                f"got {self.rcon_max_concurrency}"
+            )
+
         # Validate alert config
         if self.enable_alerts:
             if self.alert_check_interval <= 0:
@@ -346,6 +386,33 @@ class Config:
     log_format: str = "console"
     """Logging format: console or json. Default: console"""
 
+    # Log tailing configuration
+    log_watch_mode: str = "auto"
+    """Log tailing wakeups: auto (inotify on Linux, polling fallback) or poll. Default: auto"""
+
+    log_checkpoint_file: Optional[Path] = None
+    """JSON file storing per-server log read positions for resume after restart. None disables."""
+
+    log_max_catchup_bytes: int = 5 * 1024 * 1024
+    """Max bytes of log backlog replayed per server on resume. Default: 5 MiB"""
+
+    log_catchup_rate: float = 200.0
+    """Max log lines per second replayed from a resumed backlog (0 = unlimited). Default: 200"""
+
+    # Event pipeline configuration
+    event_queue_size: int = 1000
+    """Bound of the parse queue and of each Discord delivery queue. Default: 1000"""
+
+    event_delivery_workers: int = 4
+    """Concurrent Discord delivery workers (events for one channel stay ordered). Default: 4"""
+
+    # Pattern loading
+    pattern_cache_file: Optional[Path] = None
+    """JSON cache of validated patterns keyed by file content hash (faster restarts). None disables."""
+
+    pattern_reload_interval: float = 5.0
+    """Seconds between checks of patterns_dir for edited/added/removed files (0 = disabled). Default: 5"""
+
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         if not self.discord_bot_token:
@@ -382,6 +449,40 @@ class Config:
                 f"Invalid log_format '{self.log_format}'. Must be one of: {', '.join(valid_formats)}"
             )
 
+        # Validate log watch mode
+        valid_watch_modes = {"auto", "poll"}
+        if self.log_watch_mode.lower() not in valid_watch_modes:
+            raise ValueError(
+                f"Invalid log_watch_mode '{self.log_watch_mode}'. "
+                f"Must be one of: {', '.join(sorted(valid_watch_modes))}"
+            )
+        self.log_watch_mode = self.log_watch_mode.lower()
+
+        if self.log_max_catchup_bytes < 0:
+            raise ValueError(
+                f"log_max_catchup_bytes must be >= 0, got {self.log_max_catchup_bytes}"
+            )
+
+        if self.log_catchup_rate < 0:
+            raise ValueError(
+                f"log_catchup_rate must be >= 0, got {self.log_catchup_rate}"
+            )
+
+        if self.event_queue_size < 1:
+            raise ValueError(
+                f"event_queue_size must be >= 1, got {self.event_queue_size}"
+            )
+
+        if self.event_delivery_workers < 1:
+            raise ValueError(
+                f"event_delivery_workers must be >= 1, got {self.event_delivery_workers}"
+            )
+
+        if self.pattern_reload_interval < 0:
+            raise ValueError(
+                f"pattern_reload_interval must be >= 0, got {self.pattern_reload_interval}"
+            )
+
 
 def _expand_env_vars(value: str) -> str:
     """
@@ -490,6 +591,7 @@ def load_config() -> Config:
             enable_stats_collector=server_data.get("enable_stats_collector", True),
             enable_ups_stat=server_data.get("enable_ups_stat", True),
             enable_evolution_stat=server_data.get("enable_evolution_stat", True),
+            rcon_batch_metrics=server_data.get("rcon_batch_metrics", True),
             enable_alerts=server_data.get("enable_alerts", True),
             alert_check_interval=_safe_int(server_data.get("alert_check_interval", 60), f"Server {tag} alert_check_interval", 60),
             alert_samples_required=_safe_int(server_data.get("alert_samples_required", 3), f"Server {tag} alert_samples_required", 3),
@@ -497,6 +599,10 @@ def load_config() -> Config:
             ups_recovery_threshold=_safe_float(server_data.get("ups_recovery_threshold", 58.0), f"Server {tag} ups_recovery_threshold", 58.0),
             alert_cooldown=_safe_int(server_data.get("alert_cooldown", 300), f"Server {tag} alert_cooldown", 300),
             ups_ema_alpha=_safe_float(server_data.get("ups_ema_alpha", 0.2), f"Server {tag} ups_ema_alpha", 0.2),
+            ups_burst_samples=_safe_int(server_data.get("ups_burst_samples", 1), f"Server {tag} ups_burst_samples", 1),
+            metrics_snapshot_ttl=_safe_int(server_data.get("metrics_snapshot_ttl", 90), f"Server {tag} metrics_snapshot_ttl", 90),
+            rcon_pool_size=_safe_int(server_data.get("rcon_pool_size", 2), f"Server {tag} rcon_pool_size", 2),
+            rcon_max_concurrency=_safe_int(server_data.get("rcon_max_concurrency", 4), f"Server {tag} rcon_max_concurrency", 4),
         )
         servers[tag] = server_config
     
@@ -532,6 +638,62 @@ def load_config() -> Config:
         default="console",
     )
     
+    log_watch_mode = get_config_value(
+        env_var="LOG_WATCH_MODE",
+        default="auto",
+    )
+    
+    # Checkpoints live next to servers.yml by default (config/ is writable)
+    log_checkpoint_value = get_config_value(
+        env_var="LOG_CHECKPOINT_FILE",
+        default=str(Path(config_dir) / "log_checkpoints.json"),
+    )
+    log_checkpoint_file = (
+        Path(log_checkpoint_value)
+        if log_checkpoint_value and log_checkpoint_value.lower() not in {"none", "off", "false"}
+        else None
+    )
+    
+    log_max_catchup_bytes = _safe_int(
+        get_config_value(env_var="LOG_MAX_CATCHUP_BYTES", default=str(5 * 1024 * 1024)),
+        "log_max_catchup_bytes",
+        5 * 1024 * 1024,
+    )
+    
+    log_catchup_rate = _safe_float(
+        get_config_value(env_var="LOG_CATCHUP_RATE", default="200"),
+        "log_catchup_rate",
+        200.0,
+    )
+    
+    event_queue_size = _safe_int(
+        get_config_value(env_var="EVENT_QUEUE_SIZE", default="1000"),
+        "event_queue_size",
+        1000,
+    )
+    
+    event_delivery_workers = _safe_int(
+        get_config_value(env_var="EVENT_DELIVERY_WORKERS", default="4"),
+        "event_delivery_workers",
+        4,
+    )
+    
+    pattern_cache_value = get_config_value(
+        env_var="PATTERN_CACHE_FILE",
+        default=str(Path(config_dir) / "pattern_cache.json"),
+    )
+    pattern_cache_file = (
+        Path(pattern_cache_value)
+        if pattern_cache_value and pattern_cache_value.lower() not in {"none", "off", "false"}
+        else None
+    )
+    
+    pattern_reload_interval = _safe_float(
+        get_config_value(env_var="PATTERN_RELOAD_INTERVAL", default="5"),
+        "pattern_reload_interval",
+        5.0,
+    )
+    
     # Patterns directory is hardcoded relative to working directory
     # Docker: resolves to /app/patterns (due to WORKDIR /app)
     # Local: resolves to ./patterns (when running from repo root)
@@ -545,6 +707,14 @@ def load_config() -> Config:
         health_check_port=health_check_port,
         log_level=log_level or "info",
         log_format=log_format or "console",
+        log_watch_mode=log_watch_mode or "auto",
+        log_checkpoint_file=log_checkpoint_file,
+        log_max_catchup_bytes=log_max_catchup_bytes,
+        log_catchup_rate=log_catchup_rate,
+        event_queue_size=event_queue_size,
+        event_delivery_workers=event_delivery_workers,
+        pattern_cache_file=pattern_cache_file,
+        pattern_reload_interval=pattern_reload_interval,
         patterns_dir=patterns_dir,
     )
     
@@ -111,6 +111,8 @@ class DiscordBot(discord.Client):
 
         # Phase 6: Multi-server support
         self.server_manager: Optional[Any] = None  # ServerManager instance
+        # Set by set_server_manager() when startup asked connect_bot() to wait for it
+        self._server_manager_wired: Optional[asyncio.Event] = None
 
         # Phase 5.2: RCON status monitoring
         self.rcon_last_connected: Optional[datetime] = None
@@ -260,6 +262,34 @@ class DiscordBot(discord.Client):
         """Called when an error occurs."""
         logger.error("discord_bot_error", event=event, exc_info=True)
 
+    # ========================================================================
+    # Guild Cache Events (keep mention lookup index current)
+    # ========================================================================
+
+    async def on_member_join(self, member: discord.Member) -> None:
+        """Index a newly joined member."""
+        self.event_handler.guild_indexes.member_joined(member)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        """Drop a departed member from the index."""
+        self.event_handler.guild_indexes.member_removed(member)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        """Re-index a member whose name or nickname changed."""
+        self.event_handler.guild_indexes.member_updated(before, after)
+
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        """Refresh role names after a role is created."""
+        self.event_handler.guild_indexes.roles_changed(role.guild)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """Refresh role names after a role is deleted."""
+        self.event_handler.guild_indexes.roles_changed(role.guild)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Refresh role names after a rename or reorder."""
+        self.event_handler.guild_indexes.roles_changed(after.guild)
+
     # ========================================================================
     # Connection Management (Phase 5.2 Enhanced)
     # ========================================================================
@@ -276,6 +306,11 @@ class DiscordBot(discord.Client):
                 logger.info("discord_bot_connected")
                 self._connected = True
 
+                # Startup may still be connecting RCON servers; notify once they're known
+                if self._server_manager_wired is not None:
+                    await self._server_manager_wired.wait()
+                    self._server_manager_wired = None
+
                 # Send connection notification
                 await self._send_connection_notification()
 
@@ -312,6 +347,9 @@ class DiscordBot(discord.Client):
             # ✅ Stop presence updater
             await self.presence_manager.stop()
 
+            # Deliver events still coalescing in channel outboxes
+            await self.event_handler.flush()
+
             # Send disconnection notification
             await self._send_disconnection_notification()
 
@@ -473,9 +511,22 @@ class DiscordBot(discord.Client):
         self.rcon_client = rcon_client
         logger.info("rcon_client_set_for_bot_commands")
 
+    def expect_server_manager(self) -> None:
+        """
+        Make connect_bot() wait for set_server_manager() after the gateway is ready.
+
+        Lets the application log in to Discord while servers are still being
+        added; the connection notification and RCON monitoring need the
+        server list, so they start only once the ServerManager is wired.
+        """
+        if self.server_manager is None:
+            self._server_manager_wired = asyncio.Event()
+
     def set_server_manager(self, server_manager: Any) -> None:
         """Set ServerManager for multi-server mode."""
         self.server_manager = server_manager
+        if self._server_manager_wired is not None:
+            self._server_manager_wired.set()
         logger.info("server_manager_set_for_multi_server_mode")
 
     @property
@@ -10,7 +10,6 @@ Uses utils/ for general features, implements Discord-specific features here.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional, Any
-from unittest.mock import MagicMock, Mock, patch
 import asyncio
 import structlog
 import sys
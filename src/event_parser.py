@@ -8,7 +8,8 @@ with @mention detection and security monitoring.
 
 SECURITY HARDENING (Runtime Defenses):
 - ReDoS protection via google-re2 (linear-time regex engine)
-- Timeout wrapper for regex matching (fallback if RE2 unavailable)
+- Load-time ReDoS classification with input-length budgets for risky
+  patterns (fallback if RE2 unavailable; no signals, thread-safe)
 - Discord markdown escaping to prevent formatting exploits
 - Selective @mention sanitization: blocks @everyone/@here, preserves user/role mentions
 - Input length limits on log lines
@@ -17,11 +18,12 @@ SECURITY HARDENING (Runtime Defenses):
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
-import signal
 import re as stdlib_re  # For selective mention sanitization
 import structlog
 
@@ -45,13 +47,24 @@ try:  # pragma: no cover - import wiring
 except ImportError:  # pragma: no cover - import wiring
     from pattern_loader import PatternLoader, EventPattern  # type: ignore[no-redef]
 
+try:  # pragma: no cover - import wiring
+    from .pattern_cache import PatternCache
+    from .pattern_matcher import PatternMatcher, required_literals
+    from .regex_guard import RegexRisk, classify_pattern, input_budget
+except ImportError:  # pragma: no cover - import wiring
+    from pattern_cache import PatternCache  # type: ignore[no-redef]
+    from pattern_matcher import PatternMatcher, required_literals  # type: ignore[no-redef]
+    from regex_guard import RegexRisk, classify_pattern, input_budget  # type: ignore[no-redef]
+
 logger = structlog.get_logger()
 
 # Security configuration constants
 MAX_LINE_LENGTH = 10000  # chars - reject extremely long log lines
 MAX_PLAYER_NAME_LENGTH = 100  # chars
 MAX_MESSAGE_LENGTH = 1000  # chars
-REGEX_TIMEOUT_SECONDS = 1  # max time per pattern match (if using stdlib re)
+
+# Min seconds between warnings about lines skipped by one pattern's ReDoS budget
+OVER_BUDGET_WARNING_INTERVAL = 60.0
 
 # Log RE2 status
 if USING_RE2:
@@ -64,16 +77,6 @@ else:
     )
 
 
-class TimeoutError(Exception):
-    """Raised when regex matching exceeds timeout."""
-    pass
-
-
-def timeout_handler(signum, frame):
-    """Signal handler for regex timeout."""
-    raise TimeoutError("Regex match exceeded timeout")
-
-
 class EventType(str, Enum):
     """Types of Factorio events."""
     JOIN = "join"
@@ -121,6 +124,7 @@ class EventParser:
         pattern_files: Optional[List[str]] = None,
         security_monitor: Optional[SecurityMonitor] = None,
         security_channel: Optional[str] = None,
+        pattern_cache_file: Optional[Path] = None,
     ) -> None:
         """
         Initialize event parser with pattern loader.
@@ -128,27 +132,69 @@ class EventParser:
         Args:
             patterns_dir: Directory containing YAML pattern files.
             pattern_files: Specific pattern files to load (None = load all).
+            pattern_cache_file: Optional cache of validated patterns and regex
+                analysis, keyed by file content hash (None = no cache).
         """
         if not isinstance(patterns_dir, Path):
             raise AssertionError(f"patterns_dir must be Path, got {type(patterns_dir)}")
 
-        self.pattern_loader = PatternLoader(patterns_dir)
+        self.pattern_cache: Optional[PatternCache] = (
+            PatternCache(pattern_cache_file) if pattern_cache_file is not None else None
+        )
+        self.pattern_loader = PatternLoader(patterns_dir, cache=self.pattern_cache)
         self.compiled_patterns: CompiledPatternMap = {}
+        self._matcher: Optional[PatternMatcher] = None
+        self._matcher_source: Optional[CompiledPatternMap] = None
+        # ReDoS guard: pattern name -> risk class / max input length (None = unguarded)
+        self.pattern_risks: Dict[str, RegexRisk] = {}
+        self._input_budgets: Dict[str, Optional[int]] = {}
+        # Lines a guarded pattern was not searched on (over its input budget)
+        self.over_budget_skips: Dict[str, int] = {}
+        self._over_budget_warned_at: Dict[str, float] = {}
+        self._over_budget_unreported: Dict[str, int] = {}
         self.security_monitor = security_monitor or SecurityMonitor()
         self.security_channel = security_channel or "security-alerts"
+        self._refresh_lock = asyncio.Lock()
 
         count = self.pattern_loader.load_patterns(pattern_files)
         logger.info("event_parser_initialized", patterns_loaded=count)
         self._compile_patterns()
+        self._save_pattern_cache()
 
     def _compile_patterns(self) -> None:
         """Compile all loaded patterns into regex objects."""
-        patterns: Iterable[EventPattern] = self.pattern_loader.get_patterns(
-            enabled_only=True
+        self._install_patterns(
+            *self._build_pattern_table(self.pattern_loader.get_patterns(enabled_only=True))
         )
 
+    def _build_pattern_table(
+        self, patterns: Iterable[EventPattern]
+    ) -> Tuple[CompiledPatternMap, Dict[str, RegexRisk], PatternMatcher]:
+        """
+        Compile patterns and index them, without touching the live table.
+
+        Regexes (and their ReDoS classification) are reused from the current
+        table when a pattern's source is unchanged, so a reload only pays for
+        patterns that were added or edited. Safe to call from a worker thread.
+        """
+        previous = self.compiled_patterns
+        previous_risks = self.pattern_risks
+
         compiled: CompiledPatternMap = {}
+        risks: Dict[str, RegexRisk] = {}
+        reused = 0
         for pattern in patterns:
+            existing = previous.get(pattern.name)
+            if (
+                existing is not None
+                and existing[0].pattern == pattern.pattern
+                and pattern.name in previous_risks
+            ):
+                compiled[pattern.name] = (existing[0], pattern)
+                risks[pattern.name] = previous_risks[pattern.name]
+                reused += 1
+                continue
+
             try:
                 regex = re.compile(pattern.pattern, re.IGNORECASE)
             except re.error as exc:
@@ -161,15 +207,95 @@ class EventParser:
                 continue
 
             compiled[pattern.name] = (regex, pattern)
+
+            # RE2 is linear-time; stdlib patterns are classified once here
+            risk = RegexRisk.SAFE if USING_RE2 else self._classify_pattern(pattern.pattern)
+            risks[pattern.name] = risk
+            if risk is not RegexRisk.SAFE:
+                logger.warning(
+                    "pattern_redos_risk",
+                    name=pattern.name,
+                    risk=risk.value,
+                    max_input_length=input_budget(risk),
+                )
+
             logger.debug(
                 "pattern_compiled",
                 name=pattern.name,
                 type=pattern.event_type,
+                risk=risk.value,
             )
 
+        matcher = PatternMatcher(
+            [(name, regex, config) for name, (regex, config) in compiled.items()],
+            literals_for=self._required_literals,
+        )
+        logger.debug("pattern_table_built", total=len(compiled), reused=reused)
+        return compiled, risks, matcher
+
+    def _classify_pattern(self, source: str) -> RegexRisk:
+        """classify_pattern(), memoized in the pattern cache."""
+        cache = self.pattern_cache
+        info = cache.get_regex(source) if cache is not None else None
+        if info is not None and "risk" in info:
+            try:
+                return RegexRisk(info["risk"])
+            except ValueError:
+                pass
+
+        risk = classify_pattern(source)
+        if cache is not None:
+            cache.put_regex(source, {**(info or {}), "risk": risk.value})
+        return risk
+
+    def _required_literals(self, source: str) -> List[str]:
+        """required_literals(), memoized in the pattern cache."""
+        cache = self.pattern_cache
+        info = cache.get_regex(source) if cache is not None else None
+        if info is not None and isinstance(info.get("literals"), list):
+            return list(info["literals"])
+
+        literals = required_literals(source)
+        if cache is not None:
+            cache.put_regex(source, {**(info or {}), "literals": literals})
+        return literals
+
+    def _save_pattern_cache(self) -> None:
+        if self.pattern_cache is not None:
+            self.pattern_cache.save()
+
+    def _install_patterns(
+        self,
+        compiled: CompiledPatternMap,
+        risks: Dict[str, RegexRisk],
+        matcher: PatternMatcher,
+    ) -> None:
+        """Swap in a fully built pattern table (call on the event loop thread)."""
         self.compiled_patterns = compiled
+        self.pattern_risks = risks
+        self._input_budgets = {name: input_budget(risk) for name, risk in risks.items()}
+        self._matcher = matcher
+        self._matcher_source = compiled
         logger.info("patterns_compiled", total=len(self.compiled_patterns))
 
+    def _build_matcher(self) -> PatternMatcher:
+        """Index compiled_patterns (priority order) for literal prefiltering."""
+        self._matcher = PatternMatcher(
+            [(name, regex, config) for name, (regex, config) in self.compiled_patterns.items()]
+        )
+        self._matcher_source = self.compiled_patterns
+        return self._matcher
+
+    def _get_matcher(self) -> PatternMatcher:
+        """Return the matcher, rebuilding it if compiled_patterns was replaced."""
+        if (
+            self._matcher is None
+            or self._matcher_source is not self.compiled_patterns
+            or len(self._matcher.entries) != len(self.compiled_patterns)
+        ):
+            return self._build_matcher()
+        return self._matcher
+
     def _safe_regex_search(
         self,
         compiled_regex: re.Pattern[str],
@@ -177,69 +303,70 @@ class EventParser:
         pattern_name: str
     ) -> Optional[re.Match[str]]:
         """
-        Safely execute regex search with timeout protection.
+        Execute a regex search within the pattern's ReDoS budget.
+
+        Patterns classified SAFE at load time run unguarded. Risky patterns
+        are only searched on lines within their input-length budget, which
+        bounds worst-case backtracking without signals or timers.
 
         Args:
             compiled_regex: Compiled regex pattern
             line: Input line to search
-            pattern_name: Pattern name (for logging)
+            pattern_name: Pattern name (for budget lookup and logging)
 
         Returns:
             Match object or None
         """
-        if USING_RE2:
-            # RE2 is linear-time, no timeout needed
-            try:
-                return compiled_regex.search(line)
-            except Exception as exc:
-                logger.warning(
-                    "re2_search_failed",
-                    pattern=pattern_name,
-                    error=str(exc)
-                )
-                return None
-
-        # SECURITY: Timeout wrapper for stdlib re to prevent ReDoS
-        # Note: signal.alarm only works on Unix; for Windows, consider threading
-        try:
-            # Set timeout alarm
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(REGEX_TIMEOUT_SECONDS)
-
-            try:
-                match = compiled_regex.search(line)
-                return match
-            finally:
-                # Always clear the alarm
-                signal.alarm(0)
-
-        except TimeoutError:
-            logger.warning(
-                "regex_timeout",
-                pattern=pattern_name,
-                line_preview=line[:100],
-                timeout_seconds=REGEX_TIMEOUT_SECONDS
-            )
+        budget = self._input_budgets.get(pattern_name)
+        if budget is not None and len(line) > budget:
+            self._record_over_budget(pattern_name, len(line), budget)
             return None
 
-        except AttributeError:
-            # signal.alarm not available (Windows)
-            logger.debug("signal_alarm_unavailable", using_untimed_regex=True)
-            try:
-                return compiled_regex.search(line)
-            except Exception as exc:
-                logger.warning("regex_search_failed", pattern=pattern_name, error=str(exc))
-                return None
-
+        try:
+            return compiled_regex.search(line)
         except Exception as exc:
-            logger.error(
-                "unexpected_regex_error",
+            logger.warning(
+                "regex_search_failed",
                 pattern=pattern_name,
                 error=str(exc),
                 error_type=type(exc).__name__
             )
             return None
 
+    def _record_over_budget(self, pattern_name: str, length: int, budget: int) -> None:
+        """Count a line skipped by a pattern's ReDoS budget; warn at most once a minute."""
+        self.over_budget_skips[pattern_name] = self.over_budget_skips.get(pattern_name, 0) + 1
+        unreported = self._over_budget_unreported.get(pattern_name, 0) + 1
+
+        now = time.monotonic()
+        last = self._over_budget_warned_at.get(pattern_name)
+        if last is not None and now - last < OVER_BUDGET_WARNING_INTERVAL:
+            self._over_budget_unreported[pattern_name] = unreported
+            return
+
+        self._over_budget_warned_at[pattern_name] = now
+        self._over_budget_unreported[pattern_name] = 0
+        logger.warning(
+            "regex_input_over_budget",
+            pattern=pattern_name,
+            risk=self.pattern_risks[pattern_name].value,
+            length=length,
+            max_input_length=budget,
+            skipped_lines=unreported,
+            total_skipped=self.over_budget_skips[pattern_name],
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pattern counts and lines skipped by ReDoS input budgets."""
+        return {
+            "patterns": len(self.compiled_patterns),
+            "using_re2": USING_RE2,
+            "guarded_patterns": sum(
+                1 for budget in self._input_budgets.values() if budget is not None
+            ),
+            "over_budget_skips": dict(self.over_budget_skips),
+        }
+
     def parse_line(self, line: str, server_tag: Optional[str] = None) -> Optional[FactorioEvent]:
         """
         Parse a single log line into a FactorioEvent.
@@ -269,7 +396,9 @@ class EventParser:
 
         event: Optional[FactorioEvent] = None
 
-        for pattern_name, (compiled_regex, pattern_config) in self.compiled_patterns.items():
+        # Only patterns whose required literals appear in the line are tried,
+        # still in priority order (first match wins)
+        for pattern_name, compiled_regex, pattern_config in self._get_matcher().candidates(line):
             match = self._safe_regex_search(compiled_regex, line, pattern_name)
 
             if match:
@@ -643,9 +772,54 @@ class EventParser:
         """
         count = self.pattern_loader.reload()
         self._compile_patterns()
+        self._save_pattern_cache()
         logger.info("patterns_reloaded", count=count)
         return count
 
+    def _prepare_pattern_refresh(
+        self,
+    ) -> Optional[Tuple[CompiledPatternMap, Dict[str, RegexRisk], PatternMatcher]]:
+        """Re-read changed pattern files and build a new table (None if unchanged)."""
+        if not self.pattern_loader.refresh():
+            return None
+        table = self._build_pattern_table(self.pattern_loader.get_patterns(enabled_only=True))
+        self._save_pattern_cache()
+        return table
+
+    async def refresh_patterns(self) -> bool:
+        """
+        Pick up edited, added or removed pattern files without a restart.
+
+        File reads, YAML parsing and regex compilation run in a worker
+        thread; the finished table is swapped in on the event loop in one
+        step, so parse_line() always sees either the old or the new
+        patterns, never a partial table.
+
+        Returns:
+            True if the pattern table was replaced.
+        """
+        async with self._refresh_lock:
+            prepared = await asyncio.to_thread(self._prepare_pattern_refresh)
+            if prepared is None:
+                return False
+            self._install_patterns(*prepared)
+            return True
+
+    async def watch_patterns(self, interval: float) -> None:
+        """
+        Poll the patterns directory and hot-reload changes until cancelled.
+
+        Args:
+            interval: Seconds between checks (mtime/size stat per file)
+        """
+        logger.info("pattern_watch_started", interval=interval)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_patterns()
+            except Exception as e:
+                logger.error("pattern_refresh_failed", error=str(e), exc_info=True)
+
 
 class FactorioEventFormatter:
     """Format Factorio events for Discord display."""
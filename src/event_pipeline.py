@@ -0,0 +1,309 @@
+"""
+Bounded async event pipeline between log ingest and Discord delivery.
+
+Stages: ingest -> parse -> route -> deliver
+
+- ingest: submit() puts raw lines on a bounded parse queue. Parsing is pure
+  CPU work, so when this queue is full the tailer waits (lossless backpressure)
+  instead of buffering without limit.
+- parse: one task turns lines into FactorioEvents.
+- route: events are hashed by (server_tag, channel) onto one of N delivery
+  queues, so events for one channel stay in order while a slow channel only
+  stalls its own shard.
+- deliver: one worker per shard awaits the Discord send. Delivery queues
+  never block the parser: when a shard is full the lowest-priority queued
+  event is shed (chat first, security alerts last).
+
+Discord latency and rate-limit sleeps therefore no longer hold up log reads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+try:
+    from .event_parser import EventType, FactorioEvent
+except ImportError:
+    from event_parser import EventType, FactorioEvent  # type: ignore
+
+logger = structlog.get_logger()
+
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_DELIVERY_WORKERS = 4
+
+# Parsed lines between forced yields to the event loop during bursts
+PARSE_YIELD_EVERY = 100
+
+# Shedding order when a delivery queue is full: lowest value is dropped first
+EVENT_PRIORITY: Dict[EventType, int] = {
+    EventType.CHAT: 0,
+    EventType.UNKNOWN: 0,
+    EventType.DEATH: 1,
+    EventType.TASK: 1,
+    EventType.JOIN: 2,
+    EventType.LEAVE: 2,
+    EventType.SERVER: 2,
+    EventType.RESEARCH: 2,
+    EventType.MILESTONE: 2,
+    EventType.MENTION: 3,
+}
+SECURITY_ALERT_PRIORITY = 4
+
+
+def event_priority(event: FactorioEvent) -> int:
+    """Return the shedding priority of an event (higher = kept longer)."""
+    if "infraction" in event.metadata:
+        return SECURITY_ALERT_PRIORITY
+    return EVENT_PRIORITY.get(event.event_type, 0)
+
+
+class SheddingQueue(asyncio.Queue):
+    """
+    asyncio.Queue whose offer() never blocks: when full, the oldest item of
+    the lowest priority is dropped to make room, or the new item itself if
+    everything queued outranks it.
+    """
+
+    def __init__(self, maxsize: int, priority: Callable[[Any], int]) -> None:
+        super().__init__(maxsize)
+        self._priority = priority
+
+    def offer(self, item: Any) -> Optional[Any]:
+        """
+        Enqueue item without waiting.
+
+        Returns:
+            The item that was dropped (possibly item itself), or None.
+        """
+        if not self.full():
+            self.put_nowait(item)
+            return None
+
+        incoming = self._priority(item)
+        victim_index: Optional[int] = None
+        victim_priority = incoming
+        for index, queued in enumerate(self._queue):  # type: ignore[attr-defined]
+            queued_priority = self._priority(queued)
+            if queued_priority < victim_priority or (
+                victim_index is None and queued_priority == incoming
+            ):
+                victim_index = index
+                victim_priority = queued_priority
+
+        if victim_index is None:
+            return item
+
+        # Swap in place: one out, one in, so unfinished-task accounting holds
+        # and no getter can be waiting on a full queue
+        victim = self._queue[victim_index]  # type: ignore[attr-defined]
+        del self._queue[victim_index]  # type: ignore[attr-defined]
+        self._put(item)  # type: ignore[attr-defined]
+        return victim
+
+
+class EventPipeline:
+    """Staged, bounded log-line -> Discord pipeline."""
+
+    def __init__(
+        self,
+        parse: Callable[[str, str], Optional[FactorioEvent]],
+        deliver: Callable[[FactorioEvent], Awaitable[bool]],
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        delivery_workers: int = DEFAULT_DELIVERY_WORKERS,
+    ) -> None:
+        """
+        Initialize pipeline (call start() to launch its tasks).
+
+        Args:
+            parse: Sync parser, called as parse(line, server_tag)
+            deliver: Async sender returning True on success
+            queue_size: Bound of the parse queue and of each delivery queue
+            delivery_workers: Number of delivery shards/workers
+
+        Raises:
+            ValueError: queue_size or delivery_workers < 1
+        """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+        if delivery_workers < 1:
+            raise ValueError(f"delivery_workers must be >= 1, got {delivery_workers}")
+
+        self.parse = parse
+        self.deliver = deliver
+        self.queue_size = queue_size
+        self.delivery_workers = delivery_workers
+
+        self.parse_queue: asyncio.Queue[Tuple[str, str]] = asyncio.Queue(queue_size)
+        self.delivery_queues: List[SheddingQueue] = [
+            SheddingQueue(queue_size, event_priority) for _ in range(delivery_workers)
+        ]
+        self._tasks: List[asyncio.Task[None]] = []
+        self.running = False
+
+        # Counters exposed via get_stats()
+        self.lines_in = 0
+        self.events_routed = 0
+        self.delivered = 0
+        self.delivery_failed = 0
+        self.dropped: Dict[str, int] = {}
+        self.parse_high_water = 0
+        self.delivery_high_water = 0
+
+    async def start(self) -> None:
+        """Launch the parse task and delivery workers."""
+        if self.running:
+            return
+        self.running = True
+        self._tasks = [asyncio.create_task(self._parse_loop(), name="event-pipeline-parse")]
+        for shard, queue in enumerate(self.delivery_queues):
+            self._tasks.append(
+                asyncio.create_task(
+                    self._deliver_loop(shard, queue), name=f"event-pipeline-deliver-{shard}"
+                )
+            )
+        logger.info(
+            "event_pipeline_started",
+            queue_size=self.queue_size,
+            delivery_workers=self.delivery_workers,
+        )
+
+    async def submit(self, line: str, server_tag: str) -> None:
+        """
+        Ingest one log line (usable directly as a log tailer line_callback).
+
+        Waits only while the parse queue is full.
+        """
+        self.lines_in += 1
+        await self.parse_queue.put((line, server_tag))
+        depth = self.parse_queue.qsize()
+        if depth > self.parse_high_water:
+            self.parse_high_water = depth
+
+    async def _parse_loop(self) -> None:
+        """Parse queued lines and route resulting events."""
+        parsed_since_yield = 0
+        while True:
+            line, server_tag = await self.parse_queue.get()
+            try:
+                event = self.parse(line, server_tag)
+                if event is not None:
+                    self._route(event)
+            except Exception as e:
+                logger.error(
+                    "event_pipeline_parse_failed",
+                    server_tag=server_tag,
+                    error=str(e),
+                    exc_info=True,
+                )
+            finally:
+                self.parse_queue.task_done()
+
+            # get() doesn't suspend while lines are queued; let tailers/workers run
+            parsed_since_yield += 1
+            if parsed_since_yield >= PARSE_YIELD_EVERY:
+                parsed_since_yield = 0
+                await asyncio.sleep(0)
+
+    def _route(self, event: FactorioEvent) -> None:
+        """Place event on its channel's delivery shard, shedding if full."""
+        key = (event.server_tag, event.metadata.get("channel"))
+        queue = self.delivery_queues[hash(key) % self.delivery_workers]
+        dropped = queue.offer(event)
+        self.events_routed += 1
+
+        depth = queue.qsize()
+        if depth > self.delivery_high_water:
+            self.delivery_high_water = depth
+
+        if dropped is not None:
+            event_type = dropped.event_type.value
+            self.dropped[event_type] = self.dropped.get(event_type, 0) + 1
+            logger.warning(
+                "event_pipeline_event_shed",
+                server_tag=dropped.server_tag,
+                event_type=event_type,
+                queue_depth=depth,
+                total_dropped=sum(self.dropped.values()),
+            )
+
+    async def _deliver_loop(self, shard: int, queue: SheddingQueue) -> None:
+        """Send events from one delivery shard, in order."""
+        while True:
+            event = await queue.get()
+            try:
+                if await self.deliver(event):
+                    self.delivered += 1
+                else:
+                    self.delivery_failed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.delivery_failed += 1
+                logger.error(
+                    "event_pipeline_delivery_failed",
+                    shard=shard,
+                    server_tag=event.server_tag,
+                    event_type=event.event_type.value,
+                    error=str(e),
+                    exc_info=True,
+                )
+            finally:
+                queue.task_done()
+
+    async def stop(self, drain_timeout: float = 5.0) -> bool:
+        """
+        Stop the pipeline, first giving queued work up to drain_timeout to finish.
+
+        Args:
+            drain_timeout: Seconds to wait for queued lines/events (0 = don't drain)
+
+        Returns:
+            True if all queued work finished, False if the drain timed out
+            or was skipped (queued lines/events may have been abandoned).
+        """
+        if not self.running:
+            return True
+        self.running = False
+
+        drained = False
+        if drain_timeout > 0:
+            try:
+                await asyncio.wait_for(self._drain(), timeout=drain_timeout)
+                drained = True
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "event_pipeline_drain_timeout",
+                    parse_queue=self.parse_queue.qsize(),
+                    delivery_queues=[q.qsize() for q in self.delivery_queues],
+                )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("event_pipeline_stopped", **self.get_stats())
+        return drained
+
+    async def _drain(self) -> None:
+        await self.parse_queue.join()
+        for queue in self.delivery_queues:
+            await queue.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-stage queue depths and counters."""
+        return {
+            "running": self.running,
+            "parse_queue": self.parse_queue.qsize(),
+            "parse_queue_high_water": self.parse_high_water,
+            "delivery_queues": [q.qsize() for q in self.delivery_queues],
+            "delivery_queue_high_water": self.delivery_high_water,
+            "queue_size": self.queue_size,
+            "lines_in": self.lines_in,
+            "events_routed": self.events_routed,
+            "delivered": self.delivered,
+            "delivery_failed": self.delivery_failed,
+            "dropped": dict(self.dropped),
+        }
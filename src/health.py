@@ -6,7 +6,7 @@ Health check HTTP server for container orchestration.
 Provides /health endpoint for Docker healthchecks and monitoring.
 """
 import asyncio
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from aiohttp import web
 import structlog
@@ -30,6 +30,7 @@ class HealthCheckServer:
         self.app = web.Application()
         self.runner: Optional[web.AppRunner] = None
         self.site: Optional[web.TCPSite] = None
+        self.status_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
         self._setup_routes()
     
     def _setup_routes(self) -> None:
@@ -37,6 +38,16 @@ class HealthCheckServer:
         self.app.router.add_get("/health", self.health_handler)
         self.app.router.add_get("/", self.root_handler)
     
+    def add_status_provider(self, name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Include a component's status in /health responses.
+        
+        Args:
+            name: Key the status is reported under
+            provider: Callable returning a JSON-serializable dict
+        """
+        self.status_providers[name] = provider
+    
     async def health_handler(self, request: web.Request) -> web.Response:
         """
         Health check endpoint.
@@ -44,10 +55,16 @@ class HealthCheckServer:
         Returns:
             200 OK with status info
         """
-        return web.json_response({
+        payload: Dict[str, Any] = {
             "status": "healthy",
             "service": "factorio-isr"
-        })
+        }
+        for name, provider in self.status_providers.items():
+            try:
+                payload[name] = provider()
+            except Exception as e:
+                logger.warning("health_status_provider_failed", provider=name, error=str(e))
+        return web.json_response(payload)
     
     async def root_handler(self, request: web.Request) -> web.Response:
         """
@@ -0,0 +1,303 @@
+"""
+Segmented, indexed JSONL store for security infractions.
+
+The active segment is the configured file (e.g. config/infractions.jsonl),
+so existing tooling such as `tail -f` keeps working. When it grows past
+max_segment_bytes it is renamed to a numbered segment
+(infractions.000001.jsonl, ...) and a fresh active file is started.
+
+Byte offsets of every record, overall and per player, are indexed in memory
+(one scan at startup), so "most recent N" and per-player lookups seek
+straight to the records they return instead of parsing the whole history.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_MAX_SEGMENT_BYTES = 10 * 1024 * 1024
+
+# (segment number in self.segments, byte offset)
+RecordPosition = Tuple[int, int]
+
+
+class InfractionStore:
+    """Append-only infraction log with rotation and an offset index."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ) -> None:
+        """
+        Open the store and index any existing segments.
+
+        Args:
+            path: Active segment path; rotated segments live beside it
+            max_segment_bytes: Rotate the active segment once it reaches this size
+
+        Raises:
+            ValueError: max_segment_bytes < 1
+        """
+        if max_segment_bytes < 1:
+            raise ValueError(f"max_segment_bytes must be >= 1, got {max_segment_bytes}")
+
+        self.path = path
+        self.max_segment_bytes = max_segment_bytes
+
+        self.segments: List[Path] = []
+        # Per-segment record offsets, in append order
+        self._offsets: List[array] = []
+        self._by_player: Dict[str, List[RecordPosition]] = {}
+        self._handle: Optional[Any] = None
+        self._active_size = 0
+        self._next_sequence = 1
+
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _rotated_segments(self) -> List[Tuple[int, Path]]:
+        """Return (sequence, path) for rotated segments, oldest first."""
+        pattern = re.compile(
+            rf"^{re.escape(self.path.stem)}\.(\d+){re.escape(self.path.suffix)}$"
+        )
+        found: List[Tuple[int, Path]] = []
+        if self.path.parent.is_dir():
+            for candidate in self.path.parent.iterdir():
+                match = pattern.match(candidate.name)
+                if match:
+                    found.append((int(match.group(1)), candidate))
+        return sorted(found)
+
+    def _load_index(self) -> None:
+        """Scan all segments once, recording each record's offset."""
+        rotated = self._rotated_segments()
+        if rotated:
+            self._next_sequence = rotated[-1][0] + 1
+
+        for _sequence, segment in rotated:
+            self._index_segment(segment)
+        self._active_size = self._index_segment(self.path)
+
+        logger.debug(
+            "infraction_store_indexed",
+            file=str(self.path),
+            segments=len(self.segments),
+            records=self.count(),
+            players=len(self._by_player),
+        )
+
+    def _index_segment(self, segment: Path) -> int:
+        """Index one segment file; returns its size in bytes."""
+        segment_no = len(self.segments)
+        self.segments.append(segment)
+        offsets = array("q")
+        self._offsets.append(offsets)
+
+        if not segment.exists():
+            return 0
+
+        offset = 0
+        try:
+            with open(segment, "rb") as f:
+                for line in f:
+                    start = offset
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(
+                            "infraction_record_unreadable",
+                            file=str(segment),
+                            offset=start,
+                        )
+                        continue
+                    self._add_position(offsets, segment_no, start, record)
+        except OSError as exc:
+            logger.error(
+                "failed_to_index_infractions",
+                error=str(exc),
+                file=str(segment),
+            )
+        return offset
+
+    def _add_position(
+        self, offsets: array, segment_no: int, offset: int, record: Dict[str, Any]
+    ) -> None:
+        offsets.append(offset)
+        player = record.get("player_name") if isinstance(record, dict) else None
+        if isinstance(player, str):
+            self._by_player.setdefault(player, []).append((segment_no, offset))
+
+    def count(self, player_name: Optional[str] = None) -> int:
+        """Number of indexed records (optionally for one player)."""
+        if player_name is not None:
+            return len(self._by_player.get(player_name, ()))
+        return sum(len(offsets) for offsets in self._offsets)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append one record and index it.
+
+        The line is flushed to the OS before returning so readers of the
+        active file (including `tail -f`) see it immediately.
+
+        Raises:
+            OSError: The record could not be written
+        """
+        data = (json.dumps(record) + "\n").encode("utf-8")
+
+        if self._active_size and self._active_size + len(data) > self.max_segment_bytes:
+            self._rotate()
+
+        handle = self._open_active()
+        offset = self._active_size
+        handle.write(data)
+        handle.flush()
+        self._active_size += len(data)
+
+        segment_no = len(self.segments) - 1
+        self._add_position(self._offsets[segment_no], segment_no, offset, record)
+
+    def _open_active(self) -> Any:
+        """Return the append handle for the active segment, opening it lazily."""
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(self.path, "ab")
+            size = handle.tell()
+            if size != self._active_size:
+                # Truncated or written by someone else since indexing: re-index it
+                handle.close()
+                self._reindex_active()
+                handle = open(self.path, "ab")
+                size = handle.tell()
+            if size and not self._ends_with_newline():
+                # Don't glue a new record onto a torn last line
+                handle.write(b"\n")
+                size += 1
+            self._active_size = size
+            self._handle = handle
+        return self._handle
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    def _reindex_active(self) -> None:
+        segment_no = len(self.segments) - 1
+        for player, positions in list(self._by_player.items()):
+            kept = [p for p in positions if p[0] != segment_no]
+            if kept:
+                self._by_player[player] = kept
+            else:
+                del self._by_player[player]
+        self.segments.pop()
+        self._offsets.pop()
+        self._active_size = self._index_segment(self.path)
+
+    def _rotate(self) -> None:
+        """Rename the active segment to the next numbered segment."""
+        self.close()
+        rotated = self.path.with_name(
+            f"{self.path.stem}.{self._next_sequence:06d}{self.path.suffix}"
+        )
+        self.path.rename(rotated)
+        self._next_sequence += 1
+
+        self.segments[-1] = rotated
+        self.segments.append(self.path)
+        self._offsets.append(array("q"))
+        self._active_size = 0
+
+        logger.info(
+            "infraction_segment_rotated",
+            file=str(self.path),
+            rotated_to=str(rotated),
+            segments=len(self.segments),
+        )
+
+    def close(self) -> None:
+        """Close the append handle (reopened on the next append)."""
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            finally:
+                self._handle = None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def recent(self, player_name: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Return the most recent records, newest first.
+
+        Args:
+            player_name: Only this player's records
+            limit: Maximum records to return
+
+        Raises:
+            OSError: A segment could not be read
+        """
+        if player_name is not None:
+            positions = self._by_player.get(player_name, [])[-limit:]
+        else:
+            positions = self._tail_positions(limit)
+        return self._read(reversed(positions))
+
+    def _tail_positions(self, limit: int) -> List[RecordPosition]:
+        """Positions of the last `limit` records across segments, oldest first."""
+        if limit <= 0:
+            # Mirror list slicing: [-0:] is everything
+            limit = self.count()
+        tail: List[RecordPosition] = []
+        for segment_no in range(len(self.segments) - 1, -1, -1):
+            offsets = self._offsets[segment_no]
+            needed = limit - len(tail)
+            if needed <= 0:
+                break
+            chunk = offsets[-needed:] if needed < len(offsets) else offsets
+            tail[:0] = [(segment_no, offset) for offset in chunk]
+        return tail
+
+    def _read(self, positions: Iterable[RecordPosition]) -> List[Dict[str, Any]]:
+        """Read records at positions (in the given order)."""
+        records: List[Dict[str, Any]] = []
+        handles: Dict[int, Any] = {}
+        try:
+            for segment_no, offset in positions:
+                f = handles.get(segment_no)
+                if f is None:
+                    f = handles[segment_no] = open(self.segments[segment_no], "rb")
+                f.seek(offset)
+                line = f.readline()
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    logger.warning(
+                        "infraction_record_unreadable",
+                        file=str(self.segments[segment_no]),
+                        offset=offset,
+                    )
+        finally:
+            for f in handles.values():
+                f.close()
+        return records
@@ -0,0 +1,237 @@
+"""
+Linux inotify file watcher for event-driven log tailing.
+
+Wraps the inotify(7) syscalls via ctypes (no third-party dependency) and
+integrates the inotify descriptor with the asyncio event loop, so a tailer
+sleeps until its log file is written, moved, or recreated instead of
+polling on a timer.
+
+INOTIFY_AVAILABLE is False on non-Linux platforms or when libc lacks the
+inotify symbols; callers fall back to polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+# Watched on the log file itself (follows the inode)
+FILE_EVENTS = IN_MODIFY | IN_MOVE_SELF | IN_DELETE_SELF | IN_ATTRIB
+# Watched on the parent directory, filtered by log file name
+DIR_EVENTS = IN_CREATE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+# Events that mean the path may now point at a different file
+ROTATION_EVENTS = (
+    IN_MOVE_SELF | IN_DELETE_SELF | IN_CREATE | IN_MOVED_TO | IN_MOVED_FROM
+    | IN_DELETE | IN_Q_OVERFLOW
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc() -> Optional[Any]:
+    """Load libc with the inotify entry points, or None if unsupported."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        libc.inotify_rm_watch.restype = ctypes.c_int
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+INOTIFY_AVAILABLE = _libc is not None
+
+
+def _os_error(action: str, path: Optional[Path] = None) -> OSError:
+    """Build an OSError from the current ctypes errno."""
+    errno = ctypes.get_errno()
+    message = f"inotify {action} failed: {os.strerror(errno)}"
+    return OSError(errno, message, str(path) if path is not None else None)
+
+
+class InotifyWatcher:
+    """
+    Wake an asyncio task when one file changes.
+
+    Watches the file (IN_MODIFY, IN_MOVE_SELF, IN_DELETE_SELF) and its
+    parent directory (IN_CREATE, IN_MOVED_TO, ...) so rotation and late
+    creation are noticed without stat() polling. Events are coalesced: wait()
+    returns once per burst, and `rotated` records whether any of them could
+    have replaced the file at the watched path.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize watcher state (call open() to start watching).
+
+        Args:
+            path: File to watch; its parent directory must exist
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+        self._dir_wd: Optional[int] = None
+        self._file_wd: Optional[int] = None
+        self._changed = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.rotated = False
+
+    @property
+    def is_open(self) -> bool:
+        """True while the inotify descriptor is registered with the loop."""
+        return self._fd is not None
+
+    def open(self) -> None:
+        """
+        Create the inotify instance and watch the parent directory.
+
+        Raises:
+            OSError: inotify unavailable, watch limit reached, or missing directory
+        """
+        if _libc is None:
+            raise OSError("inotify is not available on this platform")
+        if self._fd is not None:
+            return
+
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise _os_error("init")
+
+        parent = self.path.parent
+        dir_wd = _libc.inotify_add_watch(fd, os.fsencode(str(parent)), DIR_EVENTS)
+        if dir_wd < 0:
+            error = _os_error("add_watch", parent)
+            os.close(fd)
+            raise error
+
+        self._fd = fd
+        self._dir_wd = dir_wd
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._on_readable)
+        logger.debug("inotify_watch_started", path=str(self.path))
+
+    def watch_file(self) -> None:
+        """(Re)attach the file watch to whatever inode is at path now."""
+        if self._fd is None or _libc is None:
+            return
+
+        if self._file_wd is not None:
+            # Old inode may already be gone (IN_IGNORED); failure is harmless
+            _libc.inotify_rm_watch(self._fd, self._file_wd)
+            self._file_wd = None
+
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(str(self.path)), FILE_EVENTS)
+        if wd < 0:
+            logger.warning(
+                "inotify_file_watch_failed",
+                path=str(self.path),
+                error=str(_os_error("add_watch", self.path)),
+            )
+            return
+
+        self._file_wd = wd
+        self.rotated = False
+
+    def _on_readable(self) -> None:
+        """Drain pending inotify events and wake the waiter if relevant."""
+        assert self._fd is not None
+        relevant = False
+
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                logger.warning("inotify_read_failed", path=str(self.path), error=str(e))
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\x00")
+                offset += name_len
+
+                if mask & IN_IGNORED:
+                    if wd == self._file_wd:
+                        self._file_wd = None
+                    continue
+
+                if wd == self._dir_wd and os.fsdecode(name) != self.path.name:
+                    continue
+
+                relevant = True
+                if mask & ROTATION_EVENTS:
+                    self.rotated = True
+
+        if relevant:
+            self._changed.set()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the watched file changes.
+
+        Args:
+            timeout: Maximum seconds to wait (None = forever)
+
+        Returns:
+            True if woken by an event, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._changed.clear()
+
+    def close(self) -> None:
+        """Stop watching and release the inotify descriptor."""
+        if self._fd is None:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._fd = None
+        self._dir_wd = None
+        self._file_wd = None
+        self._loop = None
+        logger.debug("inotify_watch_stopped", path=str(self.path))
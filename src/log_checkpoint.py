@@ -0,0 +1,203 @@
+"""
+Persistent log tailing checkpoints.
+
+Records, per server, how far into console.log the tailer has delivered
+lines (inode + byte offset + a hash of the bytes just before the offset),
+so a restarted bot resumes where it stopped instead of skipping everything
+logged while it was down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+FINGERPRINT_BYTES = 256
+
+
+def fingerprint_at(file: BinaryIO, offset: int) -> str:
+    """
+    Hash the bytes immediately before offset without moving the file position.
+
+    Args:
+        file: File opened in binary mode
+        offset: Byte offset the fingerprint should end at
+
+    Returns:
+        Hex digest identifying the content preceding offset.
+    """
+    position = file.tell()
+    try:
+        start = max(0, offset - FINGERPRINT_BYTES)
+        file.seek(start)
+        data = file.read(offset - start)
+    finally:
+        file.seek(position)
+    return hashlib.sha1(data).hexdigest()
+
+
+@dataclass(frozen=True)
+class LogCheckpoint:
+    """Position of the last delivered line in one log file."""
+
+    inode: int
+    """Inode of the file the offset belongs to."""
+
+    offset: int
+    """Byte offset just past the last delivered line."""
+
+    fingerprint: str
+    """Hash of up to FINGERPRINT_BYTES bytes ending at offset."""
+
+    saved_at: float = 0.0
+    """Wall-clock time (epoch seconds) the checkpoint was taken."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LogCheckpoint":
+        """Build a checkpoint from to_dict() output."""
+        return cls(
+            inode=int(data["inode"]),
+            offset=int(data["offset"]),
+            fingerprint=str(data["fingerprint"]),
+            saved_at=float(data.get("saved_at", 0.0)),
+        )
+
+
+class LogCheckpointStore:
+    """
+    JSON file of checkpoints keyed by server tag.
+
+    Updates are kept in memory and written with save() (shutdown) or
+    save_async() (periodic, in a worker thread), which replace the file
+    atomically so a crash mid-write never leaves a truncated store. Writes
+    are serialized and an older snapshot never overwrites a newer one, so
+    tailers sharing a store can save concurrently.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize checkpoint store and load existing checkpoints.
+
+        Args:
+            path: JSON file to persist checkpoints in
+        """
+        self.path = path
+        self._checkpoints: Dict[str, LogCheckpoint] = {}
+        self._dirty = False
+        # Snapshot sequence numbers; guarded by _write_lock once written
+        self._snapshot_seq = 0
+        self._written_seq = 0
+        self._write_lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load checkpoints from disk, ignoring missing or corrupt files."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entries = data.get("checkpoints", {})
+            for key, entry in entries.items():
+                self._checkpoints[key] = LogCheckpoint.from_dict(entry)
+        except Exception as e:
+            logger.warning(
+                "log_checkpoints_load_failed",
+                path=str(self.path),
+                error=str(e),
+            )
+            self._checkpoints = {}
+            return
+
+        logger.info(
+            "log_checkpoints_loaded",
+            path=str(self.path),
+            count=len(self._checkpoints),
+        )
+
+    def get(self, key: str) -> Optional[LogCheckpoint]:
+        """Return the checkpoint for key, if any."""
+        return self._checkpoints.get(key)
+
+    def update(self, key: str, checkpoint: LogCheckpoint) -> None:
+        """Record a checkpoint in memory (call save() to persist)."""
+        if self._checkpoints.get(key) != checkpoint:
+            self._checkpoints[key] = checkpoint
+            self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Persist checkpoints if anything changed since the last save.
+
+        Writes on the calling thread; use save_async() from the event loop.
+
+        Returns:
+            True if the file was written (or nothing needed writing).
+        """
+        if not self._dirty:
+            return True
+        return self._finish(self._write(*self._snapshot()))
+
+    async def save_async(self) -> bool:
+        """Like save(), but the file is written in a worker thread."""
+        if not self._dirty:
+            return True
+        return self._finish(await asyncio.to_thread(self._write, *self._snapshot()))
+
+    def _snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """Capture the current checkpoints for writing and clear the dirty flag."""
+        self._snapshot_seq += 1
+        self._dirty = False
+        payload = {
+            "checkpoints": {key: cp.to_dict() for key, cp in sorted(self._checkpoints.items())},
+            "last_updated": time.time(),
+        }
+        return self._snapshot_seq, payload
+
+    def _finish(self, written: bool) -> bool:
+        # Retry on the next save
+        if not written:
+            self._dirty = True
+        return written
+
+    def _write(self, seq: int, payload: Dict[str, Any]) -> bool:
+        """Atomically replace the store file with a snapshot (thread-safe)."""
+        with self._write_lock:
+            if seq <= self._written_seq:
+                # A newer snapshot is already on disk
+                return True
+
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.error(
+                    "log_checkpoints_save_failed",
+                    path=str(self.path),
+                    error=str(e),
+                )
+                return False
+
+            self._written_seq = seq
+            return True
@@ -3,28 +3,71 @@
 Log file tailer for real-time monitoring.
 
 Watches Factorio console.log and emits new lines as they appear.
+
+On Linux the tailer sleeps on inotify events (IN_MODIFY, IN_MOVE_SELF,
+IN_CREATE, ...) and wakes only when the file changes; elsewhere, or when
+inotify cannot be set up, it falls back to polling every poll_interval.
+
+Content is read in large byte chunks and split on newlines with a carry-over
+buffer for partial lines, so a burst of output costs one read per chunk
+rather than one syscall and one callback hop per line.
+
+With a checkpoint store, the byte offset of the last delivered line is
+persisted periodically and on shutdown; on start the tailer resumes from it
+(bounded by max_catchup_bytes) instead of seeking to the end.
 """
 import asyncio
+import time
 from pathlib import Path
-from typing import Callable, Optional, Awaitable
+from typing import Callable, List, Optional, Awaitable
 
 import structlog
 
+try:
+    from inotify_watcher import INOTIFY_AVAILABLE, InotifyWatcher
+except ImportError:
+    from .inotify_watcher import INOTIFY_AVAILABLE, InotifyWatcher
+
+try:
+    from log_checkpoint import LogCheckpoint, LogCheckpointStore, fingerprint_at
+except ImportError:
+    from .log_checkpoint import LogCheckpoint, LogCheckpointStore, fingerprint_at
+
 logger = structlog.get_logger()
 
+WATCH_MODES = ("auto", "poll")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_PARTIAL_LINE = 1024 * 1024  # flush an unterminated line beyond this size
+DEFAULT_MAX_CATCHUP_BYTES = 5 * 1024 * 1024
+CATCHUP_SLICE_SECONDS = 0.1  # granularity of rate-limited catch-up delivery
+
 
 class LogTailer:
     """
     Asynchronous file tailer that monitors a log file for new content.
     
     Handles file rotation, creation delays, and graceful shutdown.
+    
+    Lines are delivered either one at a time to line_callback or, when
+    lines_callback is given, as one list per chunk read.
     """
     
     def __init__(
         self,
         log_path: Path,
-        line_callback: Callable[[str], Awaitable[None]],
-        poll_interval: float = 0.1
+        line_callback: Optional[Callable[[str], Awaitable[None]]] = None,
+        poll_interval: float = 0.1,
+        watch_mode: str = "auto",
+        watch_timeout: float = 2.0,
+        lines_callback: Optional[Callable[[List[str]], Awaitable[None]]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checkpoint_store: Optional[LogCheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        checkpoint_interval: float = 5.0,
+        max_catchup_bytes: Optional[int] = DEFAULT_MAX_CATCHUP_BYTES,
+        catchup_rate: Optional[float] = None,
+        gap_callback: Optional[Callable[[str], None]] = None,
     ):
         """
         Initialize log tailer.
@@ -33,14 +76,68 @@ class LogTailer:
             log_path: Path to the log file to monitor
             line_callback: Async function to call with each new line
             poll_interval: How often to check for new content (seconds)
+            watch_mode: "auto" (inotify when available, else polling) or "poll"
+            watch_timeout: In inotify mode, max seconds to sleep without an
+                event before re-checking the file (covers filesystems that
+                don't deliver inotify events, e.g. network mounts)
+            lines_callback: Async function called with each batch of new
+                lines (takes precedence over line_callback)
+            chunk_size: Bytes to read per syscall
+            checkpoint_store: Where to persist/resume the read position
+                (None = always start at end of file)
+            checkpoint_key: Key in the store (default: str(log_path))
+            checkpoint_interval: Min seconds between periodic checkpoints
+            max_catchup_bytes: Max backlog replayed when resuming; older
+                content is skipped (None = unlimited)
+            catchup_rate: Max lines per second delivered while replaying a
+                resumed backlog (None = unlimited)
+            gap_callback: Called with a reason when existing content is
+                skipped unread (started at end of file, catch-up window
+                exceeded), so consumers of the line stream can resync
+        
+        Raises:
+            ValueError: If no callback is given, or watch_mode/chunk_size is invalid
         """
+        if line_callback is None and lines_callback is None:
+            raise ValueError("Either line_callback or lines_callback is required")
+        if watch_mode not in WATCH_MODES:
+            raise ValueError(
+                f"Invalid watch_mode '{watch_mode}'. Must be one of: {', '.join(WATCH_MODES)}"
+            )
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if catchup_rate is not None and catchup_rate <= 0:
+            raise ValueError(f"catchup_rate must be positive, got {catchup_rate}")
+        
         self.log_path = log_path
         self.line_callback = line_callback
+        self.lines_callback = lines_callback
+        self.chunk_size = chunk_size
         self.poll_interval = poll_interval
+        self.watch_mode = watch_mode
+        self.watch_timeout = watch_timeout
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_key = checkpoint_key or str(log_path)
+        self.checkpoint_interval = checkpoint_interval
+        self.max_catchup_bytes = max_catchup_bytes
+        self.catchup_rate = catchup_rate
+        self.gap_callback = gap_callback
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._file = None
         self._inode: Optional[int] = None
+        self._watcher: Optional[InotifyWatcher] = None
+        self._rotation_pending = True
+        self._partial = b""
+        self._delivered_offset = 0
+        self._catchup_end: Optional[int] = None
+        self._last_checkpoint = 0.0
+        self._checkpointed: Optional[tuple] = None
+    
+    @property
+    def using_inotify(self) -> bool:
+        """True while the tailer is woken by inotify events instead of polling."""
+        return self._watcher is not None and self._watcher.is_open
     
     async def start(self) -> None:
         """Start tailing the log file."""
@@ -52,8 +149,36 @@ class LogTailer:
         self._task = asyncio.create_task(self._tail_loop())
         logger.info("log_tailer_started", path=str(self.log_path))
     
-    async def stop(self) -> None:
-        """Stop tailing the log file."""
+    async def stop(self, save_checkpoint: bool = True) -> None:
+        """
+        Stop tailing the log file.
+        
+        Args:
+            save_checkpoint: Save the final checkpoint (False keeps the last
+                periodic one, e.g. when delivered lines were never processed)
+        """
+        if not self._running and self._file is None:
+            return
+        
+        await self.stop_reading()
+        
+        if self._file is not None:
+            if save_checkpoint:
+                self._save_final_checkpoint()
+            self._file.close()
+            self._file = None
+        
+        self._stop_watcher()
+        
+        logger.info("log_tailer_stopped")
+    
+    async def stop_reading(self) -> None:
+        """
+        Stop reading new lines but keep the file open for stop().
+        
+        Lets the caller finish lines it was already handed (e.g. queued in an
+        EventPipeline) before stop() records them in the final checkpoint.
+        """
         if not self._running:
             return
         
@@ -65,12 +190,47 @@ class LogTailer:
                 await self._task
             except asyncio.CancelledError:
                 pass
+    
+    def _start_watcher(self) -> None:
+        """Set up inotify wakeups, falling back to polling on any failure."""
+        if self.watch_mode == "poll" or not INOTIFY_AVAILABLE or self._watcher is not None:
+            return
         
-        if self._file is not None:
-            self._file.close()
-            self._file = None
+        watcher = InotifyWatcher(self.log_path)
+        try:
+            watcher.open()
+        except OSError as e:
+            logger.warning(
+                "inotify_unavailable_using_polling",
+                path=str(self.log_path),
+                error=str(e),
+            )
+            return
         
-        logger.info("log_tailer_stopped")
+        self._watcher = watcher
+        logger.debug("log_tailer_using_inotify", path=str(self.log_path))
+    
+    def _stop_watcher(self) -> None:
+        """Release the inotify watcher, if any."""
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+    
+    async def _wait_for_change(self) -> None:
+        """
+        Sleep until the log file may have new content.
+        
+        With inotify this blocks until the file is written, moved, or
+        recreated (or watch_timeout elapses); otherwise it sleeps poll_interval.
+        """
+        if self._watcher is None:
+            await asyncio.sleep(self.poll_interval)
+            self._rotation_pending = True
+            return
+        
+        woke = await self._watcher.wait(timeout=self.watch_timeout)
+        if not woke or self._watcher.rotated:
+            self._rotation_pending = True
     
     async def _wait_for_file(self) -> None:
         """Wait for log file to exist."""
@@ -80,14 +240,24 @@ class LogTailer:
                 path=str(self.log_path),
                 check_interval=self.poll_interval
             )
-            await asyncio.sleep(self.poll_interval)
+            if self._watcher is not None:
+                await self._watcher.wait(timeout=self.watch_timeout)
+            else:
+                await asyncio.sleep(self.poll_interval)
     
-    def _open_file(self) -> None:
-        """Open the log file and seek to end."""
+    def _open_file(self, start_offset: Optional[int] = None) -> None:
+        """
+        Open the log file and position the reader.
+        
+        Args:
+            start_offset: Byte offset to start reading at. None resumes from
+                a matching checkpoint if there is one, else seeks to end.
+        """
         if self._file is not None:
             self._file.close()
         
-        self._file = open(self.log_path, 'r', encoding='utf-8', errors='replace')
+        self._file = open(self.log_path, 'rb')
+        self._partial = b""
         
         # Assert file was opened successfully
         assert self._file is not None
@@ -96,8 +266,32 @@ class LogTailer:
         stat = self.log_path.stat()
         self._inode = stat.st_ino
         
-        # Seek to end (only tail new content)
-        self._file.seek(0, 2)
+        if start_offset is None:
+            start_offset = self._resume_offset(stat.st_ino, stat.st_size)
+        
+        if start_offset is None:
+            # Seek to end (only tail new content)
+            self._file.seek(0, 2)
+            if stat.st_size:
+                self._report_gap("started_at_end")
+        else:
+            self._file.seek(start_offset)
+        self._delivered_offset = self._file.tell()
+        
+        self._catchup_end = None
+        if self._delivered_offset < stat.st_size:
+            self._catchup_end = stat.st_size
+            logger.info(
+                "log_catchup_started",
+                path=str(self.log_path),
+                offset=self._delivered_offset,
+                backlog_bytes=stat.st_size - self._delivered_offset,
+                rate_limit=self.catchup_rate,
+            )
+        
+        # Follow the new inode for IN_MODIFY/IN_MOVE_SELF
+        if self._watcher is not None:
+            self._watcher.watch_file()
         
         logger.info(
             "log_file_opened",
@@ -106,6 +300,121 @@ class LogTailer:
             size=stat.st_size
         )
     
+    def _resume_offset(self, inode: int, size: int) -> Optional[int]:
+        """
+        Validate the stored checkpoint against the freshly opened file.
+        
+        Args:
+            inode: Inode of the opened file
+            size: Current file size in bytes
+        
+        Returns:
+            Line-aligned byte offset to resume at, or None to start at end
+        """
+        if self.checkpoint_store is None:
+            return None
+        
+        checkpoint = self.checkpoint_store.get(self.checkpoint_key)
+        if checkpoint is None:
+            return None
+        
+        assert self._file is not None
+        if (
+            checkpoint.inode != inode
+            or checkpoint.offset > size
+            or fingerprint_at(self._file, checkpoint.offset) != checkpoint.fingerprint
+        ):
+            logger.info(
+                "log_checkpoint_stale",
+                path=str(self.log_path),
+                checkpoint_inode=checkpoint.inode,
+                inode=inode,
+                checkpoint_offset=checkpoint.offset,
+                size=size,
+            )
+            return None
+        
+        backlog = size - checkpoint.offset
+        if self.max_catchup_bytes is not None and backlog > self.max_catchup_bytes:
+            # Skip ahead, then forward to the next line boundary
+            self._file.seek(size - self.max_catchup_bytes - 1)
+            self._file.readline()
+            offset = self._file.tell()
+            logger.warning(
+                "log_catchup_window_exceeded",
+                path=str(self.log_path),
+                backlog_bytes=backlog,
+                skipped_bytes=offset - checkpoint.offset,
+                max_catchup_bytes=self.max_catchup_bytes,
+            )
+            self._report_gap("catchup_window_exceeded")
+            return offset
+        
+        logger.info(
+            "log_checkpoint_resumed",
+            path=str(self.log_path),
+            offset=checkpoint.offset,
+            backlog_bytes=backlog,
+        )
+        return checkpoint.offset
+    
+    def _update_checkpoint(self, force: bool = False) -> Optional[tuple]:
+        """
+        Record the offset of the last delivered line in the store.
+        
+        Args:
+            force: Record even if checkpoint_interval hasn't elapsed
+        
+        Returns:
+            The (inode, offset) position recorded, or None if nothing needs saving.
+        """
+        if self.checkpoint_store is None or self._file is None or self._inode is None:
+            return None
+        
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.checkpoint_interval:
+            return None
+        self._last_checkpoint = now
+        
+        position = (self._inode, self._delivered_offset)
+        if position == self._checkpointed:
+            return None
+        
+        try:
+            checkpoint = LogCheckpoint(
+                inode=self._inode,
+                offset=self._delivered_offset,
+                fingerprint=fingerprint_at(self._file, self._delivered_offset),
+                saved_at=time.time(),
+            )
+        except (OSError, ValueError) as e:
+            logger.warning("log_checkpoint_failed", path=str(self.log_path), error=str(e))
+            return None
+        
+        self.checkpoint_store.update(self.checkpoint_key, checkpoint)
+        return position
+    
+    async def _save_checkpoint(self) -> None:
+        """Persist the read position periodically, writing off the event loop."""
+        position = self._update_checkpoint()
+        if position is not None and await self.checkpoint_store.save_async():
+            self._checkpointed = position
+    
+    def _save_final_checkpoint(self) -> None:
+        """Persist the read position on shutdown (synchronous write)."""
+        position = self._update_checkpoint(force=True)
+        if position is not None and self.checkpoint_store.save():
+            self._checkpointed = position
+    
+    def _report_gap(self, reason: str) -> None:
+        """Tell gap_callback that lines were skipped; its errors are only logged."""
+        if self.gap_callback is None:
+            return
+        try:
+            self.gap_callback(reason)
+        except Exception as e:
+            logger.warning("gap_callback_failed", path=str(self.log_path), error=str(e))
+    
     def _check_rotation(self) -> bool:
         """
         Check if file has been rotated.
@@ -135,9 +444,118 @@ class LogTailer:
         
         return False
     
+    def _split_lines(self, chunk: bytes) -> List[str]:
+        """
+        Split a chunk into complete lines, carrying any partial line over.
+        
+        Args:
+            chunk: Raw bytes just read from the file
+        
+        Returns:
+            Decoded non-empty lines, without line terminators
+        """
+        data = self._partial + chunk if self._partial else chunk
+        complete, newline, self._partial = data.rpartition(b"\n")
+        
+        if len(self._partial) > MAX_PARTIAL_LINE:
+            logger.warning(
+                "log_line_too_long_flushed",
+                path=str(self.log_path),
+                length=len(self._partial),
+            )
+            complete = complete + newline + self._partial
+            newline = b"\n"
+            self._partial = b""
+        
+        if not newline:
+            return []
+        
+        text = complete.decode("utf-8", errors="replace")
+        return [line for line in (raw.rstrip("\r") for raw in text.split("\n")) if line]
+    
+    async def _deliver(self, lines: List[str]) -> None:
+        """Hand lines to the batch callback, or to line_callback one by one."""
+        if self.lines_callback is not None:
+            try:
+                await self.lines_callback(lines)
+            except Exception as e:
+                logger.error(
+                    "lines_callback_failed",
+                    line_count=len(lines),
+                    first_line=lines[0][:100],
+                    error=str(e),
+                    exc_info=True
+                )
+            return
+        
+        assert self.line_callback is not None
+        for line in lines:
+            try:
+                await self.line_callback(line)
+            except Exception as e:
+                logger.error(
+                    "line_callback_failed",
+                    line=line[:100],
+                    error=str(e),
+                    exc_info=True
+                )
+    
+    async def _read_chunk(self) -> bool:
+        """
+        Read one chunk from the file and deliver its complete lines.
+        
+        Returns:
+            True if any bytes were read, False at end of file
+        """
+        assert self._file is not None
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            return False
+        
+        lines = self._split_lines(chunk)
+        if lines:
+            if self._catchup_end is not None and self.catchup_rate is not None:
+                await self._deliver_paced(lines)
+            else:
+                await self._deliver(lines)
+        self._delivered_offset = self._file.tell() - len(self._partial)
+        
+        if self._catchup_end is not None and self._delivered_offset >= self._catchup_end:
+            logger.info("log_catchup_complete", path=str(self.log_path), offset=self._delivered_offset)
+            self._catchup_end = None
+        return True
+    
+    async def _deliver_paced(self, lines: List[str]) -> None:
+        """Deliver backlog lines at no more than catchup_rate lines per second."""
+        assert self.catchup_rate is not None
+        batch_size = max(1, int(self.catchup_rate * CATCHUP_SLICE_SECONDS))
+        for i in range(0, len(lines), batch_size):
+            batch = lines[i:i + batch_size]
+            await self._deliver(batch)
+            await asyncio.sleep(len(batch) / self.catchup_rate)
+    
+    async def _drain_file(self) -> None:
+        """Read the current file to EOF and flush any unterminated last line."""
+        if self._file is None:
+            return
+        try:
+            while await self._read_chunk():
+                pass
+        except (OSError, ValueError) as e:
+            logger.warning("log_drain_failed", path=str(self.log_path), error=str(e))
+        
+        tail = self._partial.decode("utf-8", errors="replace").rstrip("\r")
+        self._partial = b""
+        if tail:
+            await self._deliver([tail])
+        if self._file is not None and not self._file.closed:
+            self._delivered_offset = self._file.tell()
+    
     async def _tail_loop(self) -> None:
         """Main tailing loop."""
         try:
+            self._start_watcher()
+            
             # Wait for file to exist
             await self._wait_for_file()
             
@@ -153,35 +571,33 @@ class LogTailer:
             logger.info("log_tailing_active", path=str(self.log_path))
             
             while self._running:
-                # Check for file rotation
-                if self._check_rotation():
-                    logger.info("reopening_log_file")
-                    await self._wait_for_file()
-                    if self._running:
-                        self._open_file()
+                # Check for file rotation once caught up (after an idle poll,
+                # an inotify move/create/delete event, or a watch timeout),
+                # never per line
+                if self._rotation_pending:
+                    self._rotation_pending = False
+                    if self._watcher is not None:
+                        self._watcher.rotated = False
+                    if self._check_rotation():
+                        logger.info("reopening_log_file")
+                        # Deliver whatever the old file still holds first
+                        await self._drain_file()
+                        await self._wait_for_file()
+                        if self._running:
+                            # A new file: everything in it is unread
+                            self._open_file(start_offset=0)
                 
                 # Assert file is still valid
                 assert self._file is not None
                 
-                # Read new lines
-                line = self._file.readline()
-                
-                if line:
-                    # Got a new line - process it
-                    line = line.rstrip('\n\r')
-                    if line:  # Skip empty lines
-                        try:
-                            await self.line_callback(line)
-                        except Exception as e:
-                            logger.error(
-                                "line_callback_failed",
-                                line=line[:100],
-                                error=str(e),
-                                exc_info=True
-                            )
+                if not await self._read_chunk():
+                    # No new content - wait for the file to change
+                    await self._save_checkpoint()
+                    await self._wait_for_change()
                 else:
-                    # No new content - wait before checking again
-                    await asyncio.sleep(self.poll_interval)
+                    await self._save_checkpoint()
+                    # Let other tasks run between chunks during catch-up
+                    await asyncio.sleep(0)
         
         except asyncio.CancelledError:
             logger.debug("tail_loop_cancelled")
@@ -194,9 +610,12 @@ class LogTailer:
             )
             raise
         finally:
-            if self._file is not None:
+            # Stopped via stop_reading(): stop() saves the checkpoint and closes
+            if self._file is not None and self._running:
+                self._save_final_checkpoint()
                 self._file.close()
                 self._file = None
+            self._stop_watcher()
 
 
 class LogTailerFactory:
@@ -205,7 +624,8 @@ class LogTailerFactory:
     @staticmethod
     def create_factorio_tailer(
         log_path: Path,
-        line_callback: Callable[[str], Awaitable[None]]
+        line_callback: Optional[Callable[[str], Awaitable[None]]] = None,
+        lines_callback: Optional[Callable[[List[str]], Awaitable[None]]] = None,
     ) -> LogTailer:
         """
         Create a log tailer configured for Factorio logs.
@@ -213,6 +633,7 @@ class LogTailerFactory:
         Args:
             log_path: Path to Factorio console.log
             line_callback: Async function to call with each new line
+            lines_callback: Async function to call with each batch of lines
         
         Returns:
             Configured LogTailer instance
@@ -220,5 +641,6 @@ class LogTailerFactory:
         return LogTailer(
             log_path=log_path,
             line_callback=line_callback,
-            poll_interval=0.1  # Check every 100ms
+            poll_interval=0.1,  # Check every 100ms
+            lines_callback=lines_callback,
         )
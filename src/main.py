@@ -15,19 +15,33 @@ Phase 6: Multi-server architecture with ServerManager (REQUIRED).
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import contextlib
 import logging
 import signal
 import sys
 from pathlib import Path
-from typing import Optional, Any, Union
+from typing import Awaitable, ContextManager, Optional, Any, Union
+
+try:
+    from startup_profile import StartupProfiler
+except ImportError:
+    from .startup_profile import StartupProfiler
+
+# Started before the imports below so --profile-startup can time them
+_startup_profiler = StartupProfiler.from_argv(sys.argv) if __name__ == "__main__" else None
 
 try:
     from multi_log_tailer import MultiServerLogTailer
+    from log_checkpoint import LogCheckpointStore
+    from event_pipeline import EventPipeline
 except ImportError:
     from .multi_log_tailer import MultiServerLogTailer
+    from .log_checkpoint import LogCheckpointStore
+    from .event_pipeline import EventPipeline
 
-import structlog
+import structlog  # noqa: E402 - after the profiler starts, so its import is timed
 
 # Import helpers with support for package vs. flat layout
 try:
@@ -105,26 +119,41 @@ def setup_logging(log_level: str, log_format: str) -> None:
 class Application:
     """Main application orchestrator with multi-server support via ServerManager."""
 
-    def __init__(self) -> None:
-        """Initialize application components."""
+    def __init__(self, profiler: Optional[StartupProfiler] = None) -> None:
+        """
+        Initialize application components.
+
+        Args:
+            profiler: Records startup phase timings (--profile-startup)
+        """
+        self.profiler = profiler
         self.config: Any = None
         self.health_server: Optional[HealthCheckServer] = None
         self.logtailer: Optional[Union[MultiServerLogTailer, Any]] = None
         self.discord: Optional[DiscordInterface] = None
         self.event_parser: Optional[EventParser] = None
+        self.event_pipeline: Optional[EventPipeline] = None
+        self.pattern_watch_task: Optional[asyncio.Task[None]] = None
         self.server_manager: Optional[Any] = None
         self.shutdown_event: asyncio.Event = asyncio.Event()
 
+    def _phase(self, name: str) -> ContextManager[None]:
+        """Time a startup phase when profiling, otherwise do nothing."""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.phase(name)
+
     async def setup(self) -> None:
         """Load configuration and initialize core components."""
         logger.info("application_starting")
 
         # Load and validate configuration
         try:
-            self.config = load_config()
-            assert self.config is not None, "Config loading returned None"
-            if not validate_config(self.config):
-                raise ValueError("Configuration validation failed")
+            with self._phase("config"):
+                self.config = load_config()
+                assert self.config is not None, "Config loading returned None"
+                if not validate_config(self.config):
+                    raise ValueError("Configuration validation failed")
         except Exception as e:
             logger.error("config_load_failed", error=str(e))
             raise
@@ -146,10 +175,12 @@ class Application:
                     )
 
         # Initialize EventParser
-        self.event_parser = EventParser(
-            patterns_dir=self.config.patterns_dir,
-            pattern_files=self.config.pattern_files,
-        )
+        with self._phase("event_parser"):
+            self.event_parser = EventParser(
+                patterns_dir=self.config.patterns_dir,
+                pattern_files=self.config.pattern_files,
+                pattern_cache_file=self.config.pattern_cache_file,
+            )
 
         logger.info(
             "event_parser_initialized",
@@ -177,17 +208,8 @@ class Application:
         assert self.config is not None, "Config not loaded"
         assert self.health_server is not None, "Health server not initialized"
 
-        # Start health server
-        await self.health_server.start()
-
-        logger.info(
-            "health_server_started",
-            url=f"http://{self.config.health_check_host}:"
-            f"{self.config.health_check_port}/health",
-        )
-
         # Servers config is REQUIRED (no legacy fallback)
-        # Check this BEFORE attempting Discord connection
+        # Check this BEFORE starting any component
         if not self.config.servers:
             logger.error(
                 "servers_configuration_required",
@@ -202,16 +224,22 @@ class Application:
             )
 
         # Initialize Discord interface (bot mode only)
-        # Now safe to do after servers config validation
-        self.discord = DiscordInterfaceFactory.create_interface(self.config)
+        with self._phase("discord_interface"):
+            self.discord = DiscordInterfaceFactory.create_interface(self.config)
         assert self.discord is not None
 
-        # Setup ServerManager, add servers (without stats), and wire to bot BEFORE Discord connects
-        # This ensures connection notification can access server channels
-        await self._setup_multi_server_manager()
-
-        # NOW connect Discord (connection notification will have populated server_manager)
-        await self.discord.connect()
+        # The health server, Discord login and RCON connects are independent,
+        # so start them together. The bot holds its connection notification
+        # (which needs the server channels) until the ServerManager is wired.
+        bot = getattr(self.discord, "bot", None)
+        if bot is not None:
+            bot.expect_server_manager()
+
+        await self._start_concurrently(
+            self._start_health_server(),
+            self._setup_multi_server_manager(),
+            self._connect_discord(),
+        )
 
         # Optional: Test connection (skip for production to avoid test messages)
         if getattr(self.config, "send_test_message", False):
@@ -227,13 +255,36 @@ class Application:
         assert self.event_parser is not None, "Event parser not initialized"
 
         # Start stats collectors now that Discord is connected
-        await self._start_multi_server_stats_collectors()
-
-        # Start multi-server log tailer
+        with self._phase("stats_collectors"):
+            await self._start_multi_server_stats_collectors()
+
+        # Parse/deliver off the tailer's read loop so Discord latency can't stall ingest
+        self.event_pipeline = EventPipeline(
+            parse=self._parse_line,
+            deliver=self._deliver_event,
+            queue_size=self.config.event_queue_size,
+            delivery_workers=self.config.event_delivery_workers,
+        )
+        with self._phase("event_pipeline"):
+            await self.event_pipeline.start()
+        self.health_server.add_status_provider("event_pipeline", self.event_pipeline.get_stats)
+        self.health_server.add_status_provider("event_parser", self.event_parser.get_stats)
+
+        # Start multi-server log tailer (resuming from checkpoints if enabled)
+        checkpoint_store = (
+            LogCheckpointStore(self.config.log_checkpoint_file)
+            if self.config.log_checkpoint_file is not None
+            else None
+        )
         self.logtailer = MultiServerLogTailer(
             server_configs=self.config.servers,
-            line_callback=self.handle_log_line,
+            line_callback=self.event_pipeline.submit,
             poll_interval=0.1,
+            watch_mode=self.config.log_watch_mode,
+            checkpoint_store=checkpoint_store,
+            max_catchup_bytes=self.config.log_max_catchup_bytes,
+            catchup_rate=self.config.log_catchup_rate or None,
+            gap_callback=self._on_log_gap,
         )
 
         logger.info(
@@ -242,16 +293,81 @@ class Application:
             servers=list(self.config.servers.keys()),
         )
 
-        await self.logtailer.start()
+        with self._phase("log_tailer"):
+            await self.logtailer.start()
+
+        # Hot-reload edited pattern files (parsed/compiled off the event loop)
+        if self.config.pattern_reload_interval > 0:
+            self.pattern_watch_task = asyncio.create_task(
+                self.event_parser.watch_patterns(self.config.pattern_reload_interval),
+                name="pattern-watch",
+            )
 
         logger.info("application_running")
 
+        if self.profiler is not None:
+            self._report_startup_profile()
+
+    async def _start_concurrently(self, *steps: Awaitable[None]) -> None:
+        """
+        Run independent startup steps together.
+
+        If one fails, the others are cancelled and the first error is raised.
+        """
+        tasks = [asyncio.ensure_future(step) for step in steps]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _start_health_server(self) -> None:
+        assert self.config is not None
+        assert self.health_server is not None
+
+        with self._phase("health_server"):
+            await self.health_server.start()
+
+        logger.info(
+            "health_server_started",
+            url=f"http://{self.config.health_check_host}:"
+            f"{self.config.health_check_port}/health",
+        )
+
+    async def _connect_discord(self) -> None:
+        assert self.discord is not None
+
+        with self._phase("discord_connect"):
+            await self.discord.connect()
+
+    def _report_startup_profile(self) -> None:
+        """Write the --profile-startup report to stderr and log a summary."""
+        assert self.profiler is not None
+
+        self.profiler.mark_ready()
+        print(self.profiler.format_report(), file=sys.stderr)
+
+        logger.info(
+            "startup_profile",
+            ready_ms=self.profiler.ready_ms,
+            modules_imported=len(self.profiler.imports.timings),
+            slowest_imports={
+                timing.name: round(timing.cumulative_us / 1000, 1)
+                for timing in self.profiler.slowest_imports()
+            },
+            phases={phase.name: phase.duration_ms for phase in self.profiler.phases},
+        )
+
     async def _setup_multi_server_manager(self) -> None:
         """
         Initialize ServerManager, add servers, and wire to Discord bot.
         
         Servers are added with defer_stats=True so RCON connects but
-        stats collectors don't start until Discord is ready.
+        stats collectors don't start until Discord is ready. All servers
+        connect concurrently, so startup waits for the slowest RCON
+        handshake rather than the sum of them.
         """
         assert self.config is not None
         assert self.discord is not None
@@ -304,29 +420,37 @@ class Application:
         added_servers: list[str] = []
         failed_servers: list[str] = []
 
-        for tag, server_config in self.config.servers.items():
-            try:
-                await self.server_manager.add_server(server_config, defer_stats=True)
-                added_servers.append(f"{tag} ({server_config.name})")
-
-                logger.info(
-                    "server_added_to_manager",
-                    tag=tag,
-                    name=server_config.name,
-                    host=server_config.rcon_host,
-                    port=server_config.rcon_port,
-                    stats_deferred=True
-                )
+        with self._phase("servers"):
+            results = await asyncio.gather(
+                *(
+                    self.server_manager.add_server(server_config, defer_stats=True)
+                    for server_config in self.config.servers.values()
+                ),
+                return_exceptions=True,
+            )
 
-            except Exception as e:
-                failed_servers.append(f"{tag}: {str(e)}")
+        for (tag, server_config), result in zip(self.config.servers.items(), results):
+            if isinstance(result, BaseException):
+                failed_servers.append(f"{tag}: {str(result)}")
                 logger.error(
                     "failed_to_add_server_to_manager",
                     tag=tag,
                     name=server_config.name,
-                    error=str(e),
-                    exc_info=True,
+                    error=str(result),
+                    exc_info=result,
                 )
+                continue
+
+            added_servers.append(f"{tag} ({server_config.name})")
+
+            logger.info(
+                "server_added_to_manager",
+                tag=tag,
+                name=server_config.name,
+                host=server_config.rcon_host,
+                port=server_config.rcon_port,
+                stats_deferred=True
+            )
 
         # Report summary
         logger.info(
@@ -364,19 +488,24 @@ class Application:
         started_count = 0
         failed_count = 0
 
-        for tag in self.server_manager.list_tags():
-            try:
-                await self.server_manager.start_stats_for_server(tag)
-                started_count += 1
-                logger.debug("stats_started_for_server", tag=tag)
-            except Exception as e:
+        tags = self.server_manager.list_tags()
+        results = await asyncio.gather(
+            *(self.server_manager.start_stats_for_server(tag) for tag in tags),
+            return_exceptions=True,
+        )
+
+        for tag, result in zip(tags, results):
+            if isinstance(result, BaseException):
                 failed_count += 1
                 logger.error(
                     "failed_to_start_stats_for_server",
                     tag=tag,
-                    error=str(e),
-                    exc_info=True
+                    error=str(result),
+                    exc_info=result
                 )
+            else:
+                started_count += 1
+                logger.debug("stats_started_for_server", tag=tag)
 
         logger.info(
             "multi_server_stats_collectors_started",
@@ -385,6 +514,25 @@ class Application:
             failed=failed_count
         )
 
+    def _parse_line(self, line: str, server_tag: str) -> Optional[FactorioEvent]:
+        """
+        Parse a log line and keep the server's player roster current.
+
+        Runs in the pipeline's parse stage, so rosters see join/leave events
+        in log order even if delivery later sheds them.
+        """
+        assert self.event_parser is not None, "Event parser not initialized"
+
+        event = self.event_parser.parse_line(line, server_tag=server_tag)
+        if event is not None and self.server_manager is not None:
+            self.server_manager.observe_event(event)
+        return event
+
+    def _on_log_gap(self, server_tag: str, reason: str) -> None:
+        """Log lines were skipped unread; the roster may have missed joins/leaves."""
+        if self.server_manager is not None:
+            self.server_manager.mark_roster_stale(server_tag, reason)
+
     async def handle_log_line(self, line: str, server_tag: str) -> None:
         """
         Process a log line from Factorio.
@@ -409,24 +557,68 @@ class Application:
         assert self.discord is not None, "Discord client not initialized"
 
         # Parse the line using EventParser with server_tag parameter
-        event = self.event_parser.parse_line(line, server_tag=server_tag)
+        event = self._parse_line(line, server_tag)
 
         if event is not None:
-            # Send event to Discord
-            success = await self.discord.send_event(event)
-
-            if not success:
-                logger.warning(
-                    "failed_to_send_event",
-                    server_tag=server_tag,
-                    event_type=event.event_type.value,
-                    player=event.player_name,
-                )
+            await self._deliver_event(event)
+
+    async def _deliver_event(self, event: FactorioEvent) -> bool:
+        """
+        Send a parsed event to Discord.
+
+        Args:
+            event: Parsed event (server_tag set by the parser)
+
+        Returns:
+            True if Discord accepted the event.
+        """
+        if self.discord is None:
+            logger.warning("deliver_event_no_discord")
+            return False
+
+        success = await self.discord.send_event(event)
+
+        if not success:
+            logger.warning(
+                "failed_to_send_event",
+                server_tag=event.server_tag,
+                event_type=event.event_type.value,
+                player=event.player_name,
+            )
+
+        return success
+
+    async def _stop_event_pipeline(self) -> bool:
+        """
+        Drain and stop the event pipeline.
+
+        Returns:
+            True if every submitted line was processed (see EventPipeline.stop)
+        """
+        if self.event_pipeline is None:
+            return True
+        try:
+            drained = await self.event_pipeline.stop()
+        except Exception as e:
+            logger.error("event_pipeline_stop_failed", error=str(e))
+            return False
+
+        logger.debug("event_pipeline_stopped")
+        return drained
 
     async def stop(self) -> None:
         """Gracefully stop all components."""
         logger.info("application_stopping")
 
+        # Pattern watcher
+        if self.pattern_watch_task is not None:
+            self.pattern_watch_task.cancel()
+            try:
+                await self.pattern_watch_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self.pattern_watch_task = None
+
         # ServerManager (stops all RCON clients and stats collectors)
         if self.server_manager is not None:
             try:
@@ -436,15 +628,26 @@ class Application:
 
             logger.debug("server_manager_stopped")
 
-        # Log tailer
+        # Log tailer: stop reading, drain the pipeline, then save final
+        # checkpoints, so they never cover lines still queued for parsing
         if self.logtailer is not None:
             try:
-                await self.logtailer.stop()
+                await self.logtailer.stop(drain=self._stop_event_pipeline)
             except Exception:
                 pass
 
             logger.debug("log_tailer_stopped")
 
+        # Event pipeline (no-op if the tailer already drained it)
+        await self._stop_event_pipeline()
+
+        # Pending ban-list writes (after the pipeline, so no new bans arrive)
+        if self.event_parser is not None:
+            try:
+                await self.event_parser.security_monitor.flush_ban_list()
+            except Exception as e:
+                logger.error("ban_list_flush_failed", error=str(e))
+
         # Discord interface
         if self.discord is not None:
             try:
@@ -484,9 +687,28 @@ class Application:
         await self.run()
 
 
-async def main() -> None:
-    """Main async entry point."""
-    app = Application()
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line flags (configuration itself comes from env/servers.yml)."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main",
+        description="Factorio ISR - Factorio server event monitoring for Discord",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print per-module import times and startup phase timings once running",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(profiler: Optional[StartupProfiler] = None) -> None:
+    """
+    Main async entry point.
+
+    Args:
+        profiler: Startup profiler started at import time (--profile-startup)
+    """
+    app = Application(profiler=profiler)
     assert app is not None
 
     # Signal handlers for graceful shutdown
@@ -509,8 +731,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    parse_args()
     try:
-        asyncio.run(main())
+        asyncio.run(main(_startup_profiler))
     except KeyboardInterrupt:
         print("\nShutdown complete.")
         sys.exit(0)
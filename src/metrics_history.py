@@ -0,0 +1,402 @@
+"""
+Fixed-memory metrics history for one server.
+
+Each metric (UPS, player count, per-surface evolution, RCON round-trip
+time) is a MetricSeries: raw samples covering the last hour, plus rollups
+into 1-minute buckets kept for a day and 10-minute buckets kept for 30
+days. Every tier is a ring of stdlib ``array('d')`` columns with a fixed
+capacity, so a series never grows past a known size however long the bot
+runs.
+
+Window statistics (mean, min, max, p5, p95, slope) are computed from the
+finest tier that still covers the requested window. Rollup percentiles and
+slope are taken over bucket means, so they describe sustained levels rather
+than single-sample spikes.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Metric names recorded by RconMetricsEngine
+UPS_METRIC = "ups"
+PLAYER_COUNT_METRIC = "player_count"
+RCON_RTT_METRIC = "rcon_rtt"
+EVOLUTION_METRIC_PREFIX = "evolution:"
+
+RAW_RETENTION = 3600.0
+# Raw samples kept per series; at one sample per second this is the full hour
+RAW_CAPACITY = 3600
+
+
+class RollupTier(NamedTuple):
+    """Bucket width and how long buckets are kept."""
+
+    resolution: float
+    retention: float
+
+
+DEFAULT_ROLLUPS: Tuple[RollupTier, ...] = (
+    RollupTier(60.0, 86400.0),
+    RollupTier(600.0, 30 * 86400.0),
+)
+
+# Series kept per server (one per evolution surface, plus the fixed metrics)
+MAX_SERIES = 32
+
+
+class WindowStats(NamedTuple):
+    """Summary of one metric over a time window."""
+
+    count: int
+    """Raw samples in the window."""
+
+    mean: float
+    min: float
+    max: float
+    p5: float
+    p95: float
+
+    slope: float
+    """Least-squares trend, in units per second."""
+
+    resolution: float
+    """Seconds per point the stats were computed from (0 = raw samples)."""
+
+
+class _Ring:
+    """Circular buffer of float rows, one array per column; column 0 is time."""
+
+    __slots__ = ("capacity", "columns", "_start")
+
+    def __init__(self, capacity: int, width: int) -> None:
+        self.capacity = capacity
+        # Arrays grow until capacity, then the oldest row is overwritten
+        self.columns: Tuple[array, ...] = tuple(array("d") for _ in range(width))
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    @property
+    def full(self) -> bool:
+        return len(self) >= self.capacity
+
+    def append(self, row: Sequence[float]) -> None:
+        if not self.full:
+            for column, value in zip(self.columns, row):
+                column.append(value)
+            return
+        for column, value in zip(self.columns, row):
+            column[self._start] = value
+        self._start = (self._start + 1) % self.capacity
+
+    def oldest(self) -> Optional[float]:
+        return self.columns[0][self._start] if len(self) else None
+
+    def newest(self) -> Optional[float]:
+        if not len(self):
+            return None
+        return self.columns[0][(self._start - 1) % len(self)]
+
+    def _at(self, column: int, index: int) -> float:
+        return self.columns[column][(self._start + index) % len(self)]
+
+    def since(self, start: float) -> Tuple[List[float], ...]:
+        """Columns of the rows with time >= start, oldest first."""
+        size = len(self)
+        lo, hi = 0, size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._at(0, mid) < start:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        first = (self._start + lo) % size if size else 0
+        count = size - lo
+        if first + count <= size:
+            return tuple(column[first:first + count].tolist() for column in self.columns)
+        return tuple(
+            column[first:].tolist() + column[:first + count - size].tolist()
+            for column in self.columns
+        )
+
+    def tail(self, n: int, column: int = 1) -> List[float]:
+        """Last n values of a column, oldest first."""
+        n = min(n, len(self))
+        return [self._at(column, i) for i in range(len(self) - n, len(self))]
+
+
+class _Rollup:
+    """One rollup tier: closed buckets in a ring, plus the bucket being filled."""
+
+    # Ring columns
+    START, COUNT, SUM, MIN, MAX = range(5)
+
+    __slots__ = ("tier", "ring", "_open")
+
+    def __init__(self, tier: RollupTier) -> None:
+        self.tier = tier
+        self.ring = _Ring(math.ceil(tier.retention / tier.resolution), 5)
+        # [start, count, sum, min, max] of the current bucket
+        self._open: Optional[List[float]] = None
+
+    def add(self, at: float, value: float) -> None:
+        start = at - at % self.tier.resolution
+        bucket = self._open
+        if bucket is not None and bucket[self.START] == start:
+            bucket[self.COUNT] += 1
+            bucket[self.SUM] += value
+            bucket[self.MIN] = min(bucket[self.MIN], value)
+            bucket[self.MAX] = max(bucket[self.MAX], value)
+            return
+        if bucket is not None:
+            self.ring.append(bucket)
+        self._open = [start, 1.0, value, value, value]
+
+    def covers(self, start: float) -> bool:
+        oldest = self.ring.oldest()
+        if oldest is None:
+            oldest = self._open[self.START] if self._open else None
+        return not self.ring.full or (oldest is not None and oldest <= start)
+
+    def since(self, start: float) -> Tuple[List[float], ...]:
+        """Columns of buckets overlapping [start, now], oldest first."""
+        columns = self.ring.since(start - self.tier.resolution)
+        # A bucket is in the window if any part of it is
+        skip = 0
+        while skip < len(columns[0]) and columns[0][skip] + self.tier.resolution <= start:
+            skip += 1
+        columns = tuple(column[skip:] for column in columns)
+        if self._open is not None and self._open[self.START] + self.tier.resolution > start:
+            for column, value in zip(columns, self._open):
+                column.append(value)
+        return columns
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile of sorted values (q in 0..100)."""
+    position = (len(ordered) - 1) * q / 100.0
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _slope(times: Sequence[float], values: Sequence[float]) -> float:
+    """Least-squares slope of values over times (0 for fewer than 2 points)."""
+    n = len(times)
+    if n < 2:
+        return 0.0
+    mean_t = math.fsum(times) / n
+    mean_v = math.fsum(values) / n
+    covariance = math.fsum((t - mean_t) * (v - mean_v) for t, v in zip(times, values))
+    variance = math.fsum((t - mean_t) ** 2 for t in times)
+    return covariance / variance if variance else 0.0
+
+
+class MetricSeries:
+    """Time series of one metric: raw samples and rollup tiers."""
+
+    def __init__(
+        self,
+        raw_retention: float = RAW_RETENTION,
+        raw_capacity: int = RAW_CAPACITY,
+        rollups: Iterable[RollupTier] = DEFAULT_ROLLUPS,
+    ) -> None:
+        """
+        Create an empty series.
+
+        Args:
+            raw_retention: Longest window answered from raw samples (seconds)
+            raw_capacity: Raw samples kept
+            rollups: Rollup tiers, finest first
+
+        Raises:
+            ValueError: raw_capacity < 1
+        """
+        if raw_capacity < 1:
+            raise ValueError(f"raw_capacity must be >= 1, got {raw_capacity}")
+
+        self.raw_retention = raw_retention
+        self._raw = _Ring(raw_capacity, 2)
+        self._rollups = tuple(_Rollup(tier) for tier in rollups)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def append(self, value: float, at: Optional[float] = None) -> None:
+        """
+        Record a sample.
+
+        Args:
+            value: Metric value
+            at: Wall-clock time of the sample (default: now)
+        """
+        if at is None:
+            at = time.time()
+        newest = self._raw.newest()
+        if newest is not None and at < newest:
+            # Keep each ring sorted if the wall clock steps back
+            at = newest
+
+        value = float(value)
+        self._raw.append((at, value))
+        for rollup in self._rollups:
+            rollup.add(at, value)
+
+    def last(self, n: int) -> List[float]:
+        """The n most recent raw values, oldest first."""
+        return self._raw.tail(n)
+
+    def window(self, seconds: float, now: Optional[float] = None) -> Optional[WindowStats]:
+        """
+        Summarize the last `seconds` of the series.
+
+        Args:
+            seconds: Window length
+            now: End of the window (default: now)
+
+        Returns:
+            Stats from the finest tier covering the window, or None if the
+            window holds no samples.
+        """
+        if now is None:
+            now = time.time()
+        start = now - seconds
+
+        if seconds <= self.raw_retention and (
+            not self._raw.full or (self._raw.oldest() or math.inf) <= start
+        ):
+            return self._raw_window(start)
+
+        for rollup in self._rollups:
+            if seconds <= rollup.tier.retention and rollup.covers(start):
+                return self._rollup_window(rollup, start)
+
+        # Longer than every tier keeps: best effort from the coarsest
+        if self._rollups:
+            return self._rollup_window(self._rollups[-1], start)
+        return self._raw_window(start)
+
+    def _raw_window(self, start: float) -> Optional[WindowStats]:
+        times, values = self._raw.since(start)
+        if not values:
+            return None
+        ordered = sorted(values)
+        return WindowStats(
+            count=len(values),
+            mean=math.fsum(values) / len(values),
+            min=ordered[0],
+            max=ordered[-1],
+            p5=_percentile(ordered, 5),
+            p95=_percentile(ordered, 95),
+            slope=_slope(times, values),
+            resolution=0.0,
+        )
+
+    def _rollup_window(self, rollup: _Rollup, start: float) -> Optional[WindowStats]:
+        starts, counts, sums, mins, maxs = rollup.since(start)
+        if not starts:
+            return None
+        means = [total / count for total, count in zip(sums, counts)]
+        ordered = sorted(means)
+        half = rollup.tier.resolution / 2
+        return WindowStats(
+            count=int(math.fsum(counts)),
+            mean=math.fsum(sums) / math.fsum(counts),
+            min=min(mins),
+            max=max(maxs),
+            p5=_percentile(ordered, 5),
+            p95=_percentile(ordered, 95),
+            slope=_slope([bucket + half for bucket in starts], means),
+            resolution=rollup.tier.resolution,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the sample arrays."""
+        rings = [self._raw] + [rollup.ring for rollup in self._rollups]
+        return sum(len(column) * column.itemsize for ring in rings for column in ring.columns)
+
+
+class MetricsHistory:
+    """All metric series of one server."""
+
+    def __init__(self, server_tag: Optional[str] = None, max_series: int = MAX_SERIES) -> None:
+        """
+        Create an empty history.
+
+        Args:
+            server_tag: Server label for logs
+            max_series: Distinct metrics kept; samples of further metrics are dropped
+        """
+        self.server_tag = server_tag
+        self.max_series = max_series
+        self._series: Dict[str, MetricSeries] = {}
+        self.dropped_metrics = 0
+
+    def __contains__(self, metric: object) -> bool:
+        return metric in self._series
+
+    def metrics(self) -> List[str]:
+        return list(self._series)
+
+    def series(self, metric: str) -> Optional[MetricSeries]:
+        return self._series.get(metric)
+
+    def record(self, metric: str, value: Optional[float], at: Optional[float] = None) -> None:
+        """Record one sample (None values are skipped)."""
+        if value is None:
+            return
+        series = self._series.get(metric)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                self.dropped_metrics += 1
+                if self.dropped_metrics == 1:
+                    logger.warning(
+                        "metrics_history_series_limit",
+                        server_tag=self.server_tag,
+                        metric=metric,
+                        max_series=self.max_series,
+                    )
+                return
+            series = self._series[metric] = MetricSeries()
+        series.append(value, at)
+
+    def record_metrics(self, metrics: Dict[str, Any], at: Optional[float] = None) -> None:
+        """
+        Record the samples of a gather_all_metrics() result.
+
+        Player count is only recorded when the server answered (tick set),
+        so a failed collection doesn't show up as an empty server.
+        """
+        if at is None:
+            at = time.time()
+        self.record(UPS_METRIC, metrics.get("ups"), at)
+        if metrics.get("tick") is not None:
+            self.record(PLAYER_COUNT_METRIC, metrics.get("player_count"), at)
+        for surface, evolution in (metrics.get("evolution_by_surface") or {}).items():
+            self.record(f"{EVOLUTION_METRIC_PREFIX}{surface}", evolution, at)
+
+    def window(
+        self, metric: str, seconds: float, now: Optional[float] = None
+    ) -> Optional[WindowStats]:
+        """Window stats of a metric, or None if it has no samples there."""
+        series = self._series.get(metric)
+        return series.window(seconds, now) if series is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "series": len(self._series),
+            "samples": sum(len(series) for series in self._series.values()),
+            "bytes": sum(series.nbytes for series in self._series.values()),
+            "dropped_metrics": self.dropped_metrics,
+        }
@@ -5,7 +5,7 @@ with server context to a unified callback. Simplifies Application orchestration.
 """
 
 import asyncio
-from typing import Callable, Dict, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any
 from pathlib import Path
 import structlog
 
@@ -14,6 +14,11 @@ try:
 except ImportError:
     from .log_tailer import LogTailer
 
+try:
+    from log_checkpoint import LogCheckpointStore
+except ImportError:
+    from .log_checkpoint import LogCheckpointStore
+
 logger = structlog.get_logger()
 
 
@@ -42,6 +47,11 @@ class MultiServerLogTailer:
         server_configs: Dict[str, Any],
         line_callback: Callable[[str, str], Any],
         poll_interval: float = 0.1,
+        watch_mode: str = "auto",
+        checkpoint_store: Optional[LogCheckpointStore] = None,
+        max_catchup_bytes: Optional[int] = None,
+        catchup_rate: Optional[float] = None,
+        gap_callback: Optional[Callable[[str, str], None]] = None,
     ) -> None:
         """Initialize multi-server log tailer.
         
@@ -50,6 +60,16 @@ class MultiServerLogTailer:
                           ServerConfig must have .log_path attribute (Path).
             line_callback: Async or sync callable invoked as callback(line, server_tag).
             poll_interval: Polling interval for log tailing (default 0.1s).
+            watch_mode: "auto" to wake on inotify events where available
+                      (polling fallback), or "poll" to always poll.
+            checkpoint_store: Optional store for resuming each server's log
+                            position (keyed by server tag) across restarts.
+            max_catchup_bytes: Max backlog replayed per server on resume
+                             (None = LogTailer default).
+            catchup_rate: Max lines/second delivered while replaying a backlog
+                        (None = unlimited).
+            gap_callback: Optional sync callable invoked as callback(server_tag,
+                        reason) when a server's log content was skipped unread.
         
         Raises:
             ValueError: If server_configs is empty or log_path missing from any config.
@@ -60,6 +80,11 @@ class MultiServerLogTailer:
         self.server_configs = server_configs
         self.line_callback = line_callback
         self.poll_interval = poll_interval
+        self.watch_mode = watch_mode
+        self.checkpoint_store = checkpoint_store
+        self.max_catchup_bytes = max_catchup_bytes
+        self.catchup_rate = catchup_rate
+        self.gap_callback = gap_callback
         self.tailers: Dict[str, LogTailer] = {}
 
         # Validate all servers have log_path
@@ -77,6 +102,7 @@ class MultiServerLogTailer:
             "multi_server_log_tailer_initialized",
             server_count=len(server_configs),
             servers=list(server_configs.keys()),
+            watch_mode=watch_mode,
         )
 
     async def start(self) -> None:
@@ -91,23 +117,43 @@ class MultiServerLogTailer:
         for tag, config in self.server_configs.items():
             log_path = config.log_path
 
-            # Create bound callback with server tag captured via default argument
-            async def bound_callback(line: str, t: str = tag) -> None:
-                try:
-                    # Support both async and sync callbacks
-                    result = self.line_callback(line, t)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as e:
-                    logger.error(
-                        "callback_error",
-                        server_tag=t,
-                        line=line[:100],
-                        error=str(e),
-                        exc_info=True,
-                    )
-
-            tailer = LogTailer(log_path, bound_callback, poll_interval=self.poll_interval)
+            # Create bound batch callback with server tag captured via default
+            # argument; each chunk of lines is fanned out without extra hops
+            async def bound_callback(lines: List[str], t: str = tag) -> None:
+                for line in lines:
+                    try:
+                        # Support both async and sync callbacks
+                        result = self.line_callback(line, t)
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception as e:
+                        logger.error(
+                            "callback_error",
+                            server_tag=t,
+                            line=line[:100],
+                            error=str(e),
+                            exc_info=True,
+                        )
+
+            tailer_kwargs: Dict[str, Any] = {}
+            if self.max_catchup_bytes is not None:
+                tailer_kwargs["max_catchup_bytes"] = self.max_catchup_bytes
+            if self.gap_callback is not None:
+                gap_callback = self.gap_callback
+                tailer_kwargs["gap_callback"] = (
+                    lambda reason, t=tag: gap_callback(t, reason)
+                )
+
+            tailer = LogTailer(
+                log_path,
+                poll_interval=self.poll_interval,
+                watch_mode=self.watch_mode,
+                lines_callback=bound_callback,
+                checkpoint_store=self.checkpoint_store,
+                checkpoint_key=tag,
+                catchup_rate=self.catchup_rate,
+                **tailer_kwargs,
+            )
             self.tailers[tag] = tailer
             create_tasks.append(tailer.start())
 
@@ -125,17 +171,43 @@ class MultiServerLogTailer:
             await self.stop()
             raise
 
-    async def stop(self) -> None:
+    async def stop(self, drain: Optional[Callable[[], Awaitable[bool]]] = None) -> None:
         """Stop all per-server LogTailers concurrently.
         
         Calls stop() on all tailers in parallel. Logs errors but does not raise.
+        
+        Args:
+            drain: Optional async callable awaited once every tailer has stopped
+                 reading and before final checkpoints are saved, so lines already
+                 handed to line_callback (e.g. queued in an EventPipeline) are
+                 processed first. If it returns False, final checkpoints are
+                 skipped and the last periodic ones are kept.
         """
         logger.info("stopping_multi_server_log_tailers", count=len(self.tailers))
 
-        stop_tasks = [tailer.stop() for tailer in self.tailers.values()]
+        save_checkpoints = True
+        if drain is not None:
+            results = await asyncio.gather(
+                *(tailer.stop_reading() for tailer in self.tailers.values()),
+                return_exceptions=True,
+            )
+            self._log_stop_errors(results)
+            try:
+                save_checkpoints = await drain()
+            except Exception as e:
+                save_checkpoints = False
+                logger.error("log_tailer_drain_failed", error=str(e), exc_info=True)
+
+        stop_tasks = [
+            tailer.stop(save_checkpoint=save_checkpoints) for tailer in self.tailers.values()
+        ]
         results = await asyncio.gather(*stop_tasks, return_exceptions=True)
+        self._log_stop_errors(results)
+
+        logger.info("all_multi_server_log_tailers_stopped")
 
-        # Log any errors
+    def _log_stop_errors(self, results: List[Any]) -> None:
+        """Log exceptions returned by a gather over self.tailers."""
         for (tag, tailer), result in zip(self.tailers.items(), results):
             if isinstance(result, Exception):
                 logger.error(
@@ -145,8 +217,6 @@ class MultiServerLogTailer:
                     exc_info=True,
                 )
 
-        logger.info("all_multi_server_log_tailers_stopped")
-
     async def restart(self) -> None:
         """Restart all log tailers (stop and start).
         
@@ -167,6 +237,7 @@ class MultiServerLogTailer:
             tag: {
                 "log_path": str(self.server_configs[tag].log_path),
                 "started": tag in self.tailers,
+                "inotify": tag in self.tailers and self.tailers[tag].using_inotify,
             }
             for tag in self.server_configs.keys()
         }
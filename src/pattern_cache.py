@@ -0,0 +1,192 @@
+"""
+Content-addressed on-disk cache of validated event patterns.
+
+Keyed by the SHA-256 of each pattern file's bytes, the cache stores the
+validated EventPattern fields, so a restart with unchanged files skips YAML
+parsing. It also stores the per-regex load-time
+analysis (ReDoS risk class and required literals for the prefilter) keyed
+by pattern source.
+
+Compiled regex objects themselves are not cached: the stdlib engine has no
+serialized form (pickling a pattern just recompiles it from source).
+
+The whole cache is discarded when CACHE_VERSION, the validation limits, the
+analysis code (regex_guard.py, pattern_matcher.py: their ANALYSIS_VERSION
+and source) or the Python minor version change, since any of those can
+change what a file validates to or how a regex is analyzed. Cached records
+are still re-validated field by field when restored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import structlog
+
+try:
+    from . import pattern_loader, pattern_matcher, regex_guard
+except ImportError:
+    import pattern_loader  # type: ignore[no-redef]
+    import pattern_matcher  # type: ignore[no-redef]
+    import regex_guard  # type: ignore[no-redef]
+
+logger = structlog.get_logger()
+
+CACHE_VERSION = 1
+
+
+def _source_digest(module: Any) -> str:
+    """Hash a module's source, so analysis code changes invalidate the cache."""
+    try:
+        source = inspect.getsource(module)
+    except (OSError, TypeError):
+        return ""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _fingerprint() -> str:
+    """Identify the validation rules, analysis code and interpreter the cache was built with."""
+    rules = {
+        "version": CACHE_VERSION,
+        "python": list(sys.version_info[:2]),
+        "max_pattern_length": pattern_loader.MAX_PATTERN_LENGTH,
+        "max_template_length": pattern_loader.MAX_TEMPLATE_LENGTH,
+        "max_patterns_per_file": pattern_loader.MAX_PATTERNS_PER_FILE,
+        "allowed_yaml_keys": sorted(pattern_loader.ALLOWED_YAML_KEYS),
+        "allowed_placeholders": sorted(pattern_loader.ALLOWED_TEMPLATE_PLACEHOLDERS),
+        "regex_guard": [regex_guard.ANALYSIS_VERSION, _source_digest(regex_guard)],
+        "pattern_matcher": [
+            pattern_matcher.ANALYSIS_VERSION,
+            pattern_matcher.MIN_LITERAL_LENGTH,
+            _source_digest(pattern_matcher),
+        ],
+    }
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class PatternCache:
+    """JSON-backed cache of pattern file parses and regex analysis."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Load the cache file if it exists and matches the current fingerprint.
+
+        Args:
+            path: Cache file location (its directory must be writable to save)
+        """
+        self.path = path
+        self.fingerprint = _fingerprint()
+        self._files: Dict[str, List[Dict[str, Any]]] = {}
+        self._regexes: Dict[str, Dict[str, Any]] = {}
+        # Keys used by this process; save() drops everything else
+        self._used_files: Set[str] = set()
+        self._used_regexes: Set[str] = set()
+        self._dirty = False
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning("pattern_cache_unreadable", path=str(self.path), error=str(e))
+            return
+
+        if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+            logger.info("pattern_cache_invalidated", path=str(self.path))
+            self._dirty = True
+            return
+
+        files = data.get("files")
+        regexes = data.get("regexes")
+        if isinstance(files, dict):
+            self._files = files
+        if isinstance(regexes, dict):
+            self._regexes = regexes
+        logger.debug(
+            "pattern_cache_loaded",
+            path=str(self.path),
+            files=len(self._files),
+            regexes=len(self._regexes),
+        )
+
+    def get_file(self, digest: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the validated pattern records for a file's content hash."""
+        records = self._files.get(digest)
+        if records is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used_files.add(digest)
+        return records
+
+    def put_file(self, digest: str, records: List[Dict[str, Any]]) -> None:
+        self._files[digest] = records
+        self._used_files.add(digest)
+        self._dirty = True
+
+    def get_regex(self, source: str) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis ({"risk", "literals"}) of a regex source."""
+        info = self._regexes.get(source)
+        if info is not None:
+            self._used_regexes.add(source)
+        return info
+
+    def put_regex(self, source: str, info: Dict[str, Any]) -> None:
+        self._regexes[source] = info
+        self._used_regexes.add(source)
+        self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the cache if it changed, keeping only entries used by this process.
+
+        Returns:
+            True if the file was written (or nothing needed writing).
+        """
+        stale = (set(self._files) - self._used_files) or (set(self._regexes) - self._used_regexes)
+        if not self._dirty and not stale:
+            return True
+
+        files = {k: v for k, v in self._files.items() if k in self._used_files}
+        regexes = {k: v for k, v in self._regexes.items() if k in self._used_regexes}
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "fingerprint": self.fingerprint,
+                        "files": files,
+                        "regexes": regexes,
+                        "last_updated": time.time(),
+                    },
+                    f,
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning("pattern_cache_save_failed", path=str(self.path), error=str(e))
+            return False
+
+        self._files = files
+        self._regexes = regexes
+        self._dirty = False
+        logger.debug("pattern_cache_saved", path=str(self.path), files=len(files), regexes=len(regexes))
+        return True
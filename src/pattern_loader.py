@@ -16,7 +16,8 @@ SECURITY HARDENING:
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, NamedTuple, Optional, Any, Set
+import hashlib
 import re
 import yaml
 import structlog
@@ -107,6 +108,42 @@ class EventPattern:
         self.priority: int = priority
         self.channel: Optional[str] = channel
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the validated fields (see restore())."""
+        return {
+            "name": self.name,
+            "pattern": self.pattern,
+            "event_type": self.event_type,
+            "emoji": self.emoji,
+            "message_template": self.message_template,
+            "enabled": self.enabled,
+            "priority": self.priority,
+            "channel": self.channel,
+        }
+
+    @classmethod
+    def restore(cls, data: Dict[str, Any]) -> "EventPattern":
+        """
+        Rebuild a pattern from to_dict() output (the pattern cache).
+
+        The field checks are re-run, so an edited cache file can't bypass
+        the SECURITY limits; only YAML parsing is skipped.
+
+        Raises:
+            KeyError: data is missing a field
+            AssertionError: a field fails validation
+        """
+        return cls(
+            name=data["name"],
+            pattern=data["pattern"],
+            event_type=data["event_type"],
+            emoji=data["emoji"],
+            message_template=data["message_template"],
+            enabled=data["enabled"],
+            priority=data["priority"],
+            channel=data["channel"],
+        )
+
     def __repr__(self) -> str:
         """String representation of pattern."""
         return (
@@ -115,20 +152,36 @@ class EventPattern:
         )
 
 
+class PatternFileState(NamedTuple):
+    """What was parsed from one pattern file, keyed for change detection."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    patterns: List[EventPattern]
+
+
 class PatternLoader:
     """Loads and manages event patterns from YAML files."""
 
-    def __init__(self, patterns_dir: Path = Path("patterns")):
+    def __init__(self, patterns_dir: Path = Path("patterns"), cache: Optional[Any] = None):
         """
         Initialize pattern loader.
 
         Args:
             patterns_dir: Directory containing YAML pattern files
+            cache: Optional PatternCache; files whose content hash is cached
+                skip YAML parsing and validation
         """
         assert isinstance(patterns_dir, Path), f"patterns_dir must be Path, got {type(patterns_dir)}"
         self.patterns_dir: Path = patterns_dir
         self.patterns: List[EventPattern] = []
         self._loaded_files: List[str] = []
+        # Files selected by the last load_patterns() call (None = all)
+        self._pattern_files: Optional[List[str]] = None
+        # Per-file parse results for refresh(), keyed by path
+        self._file_states: Dict[str, PatternFileState] = {}
+        self.cache = cache
 
     def load_patterns(self, pattern_files: Optional[List[str]] = None) -> int:
         """
@@ -146,16 +199,13 @@ class PatternLoader:
             assert all(isinstance(f, str) for f in pattern_files), \
                 "All pattern_files must be strings"
 
+        self._pattern_files = list(pattern_files) if pattern_files is not None else None
+
         if not self.patterns_dir.exists():
             logger.warning("patterns_directory_not_found", path=str(self.patterns_dir))
             return 0
 
-        # Determine which files to load
-        yaml_files: List[Path]
-        if pattern_files is None:
-            yaml_files = list(self.patterns_dir.glob("*.yml")) + list(self.patterns_dir.glob("*.yaml"))
-        else:
-            yaml_files = [self.patterns_dir / f for f in pattern_files]
+        yaml_files = self._select_files(pattern_files)
 
         loaded_count: int = 0
         for yaml_file in yaml_files:
@@ -202,6 +252,12 @@ class PatternLoader:
 
         return loaded_count
 
+    def _select_files(self, pattern_files: Optional[List[str]]) -> List[Path]:
+        """Return the YAML files to load: the named ones, or every .yml/.yaml."""
+        if pattern_files is None:
+            return list(self.patterns_dir.glob("*.yml")) + list(self.patterns_dir.glob("*.yaml"))
+        return [self.patterns_dir / f for f in pattern_files]
+
     def _load_file(self, yaml_file: Path) -> int:
         """
         Load patterns from a single YAML file.
@@ -215,26 +271,93 @@ class PatternLoader:
         assert isinstance(yaml_file, Path), f"yaml_file must be Path, got {type(yaml_file)}"
         assert yaml_file.exists(), f"yaml_file does not exist: {yaml_file}"
 
-        with open(yaml_file, 'r', encoding='utf-8') as f:
-            # SECURITY: Use safe_load to prevent arbitrary code execution
-            data: Any = yaml.safe_load(f)
+        stat = yaml_file.stat()
+        with open(yaml_file, 'rb') as f:
+            content = f.read()
+
+        digest = hashlib.sha256(content).hexdigest()
+        file_patterns = self._patterns_for_content(yaml_file, content, digest)
+        self._file_states[str(yaml_file)] = PatternFileState(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=digest,
+            patterns=file_patterns,
+        )
+        return self._add_patterns(self.patterns, file_patterns, yaml_file)
+
+    def _patterns_for_content(
+        self, yaml_file: Path, content: bytes, digest: str
+    ) -> List[EventPattern]:
+        """Return a file's patterns from the cache by content hash, else parse them."""
+        if self.cache is not None:
+            records = self.cache.get_file(digest)
+            if records is not None:
+                try:
+                    patterns = [EventPattern.restore(record) for record in records]
+                except (KeyError, TypeError, AssertionError) as e:
+                    logger.warning("pattern_cache_entry_invalid", file=str(yaml_file), error=str(e))
+                else:
+                    logger.debug("patterns_from_cache", file=str(yaml_file), count=len(patterns))
+                    return patterns
+
+        patterns = self._parse_file(yaml_file, content)
+        if self.cache is not None:
+            self.cache.put_file(digest, [p.to_dict() for p in patterns])
+        return patterns
+
+    @staticmethod
+    def _add_patterns(
+        loaded: List[EventPattern], file_patterns: List[EventPattern], yaml_file: Path
+    ) -> int:
+        """Append one file's patterns to loaded, skipping names already present."""
+        count: int = 0
+        for pattern in file_patterns:
+            # Check for duplicate event names across files
+            if any(p.name == pattern.name for p in loaded):
+                logger.warning(
+                    "duplicate_event_pattern_name",
+                    name=pattern.name,
+                    file=str(yaml_file),
+                )
+                continue
+            loaded.append(pattern)
+            count += 1
+        return count
+
+    def _parse_file(self, yaml_file: Path, content: bytes) -> List[EventPattern]:
+        """
+        Parse and validate the patterns in one YAML file's content.
+
+        Args:
+            yaml_file: Path the content was read from (for logging)
+            content: Raw file content
+
+        Returns:
+            Valid patterns in file order (including disabled)
+
+        Raises:
+            yaml.YAMLError: Content is not valid YAML
+            UnicodeDecodeError: Content is not UTF-8
+        """
+        # SECURITY: Use safe_load to prevent arbitrary code execution
+        data: Any = yaml.safe_load(content.decode("utf-8"))
 
         # Type check loaded data
         if data is None:
             logger.warning("empty_yaml_file", file=str(yaml_file))
-            return 0
+            return []
 
         if not isinstance(data, dict):
             logger.warning("yaml_root_not_dict", file=str(yaml_file), type=type(data).__name__)
-            return 0
+            return []
 
         if 'events' not in data:
             logger.warning("no_events_in_file", file=str(yaml_file), keys=list(data.keys()))
-            return 0
+            return []
 
         if not isinstance(data['events'], dict):
             logger.warning("events_not_dict", file=str(yaml_file), type=type(data['events']).__name__)
-            return 0
+            return []
 
         # SECURITY: Limit number of patterns per file
         if len(data['events']) > MAX_PATTERNS_PER_FILE:
@@ -244,9 +367,9 @@ class PatternLoader:
                 count=len(data['events']),
                 max=MAX_PATTERNS_PER_FILE
             )
-            return 0
+            return []
 
-        count: int = 0
+        file_patterns: List[EventPattern] = []
         for event_name, config in data["events"].items():
             # Validate event name type
             if not isinstance(event_name, str):
@@ -348,15 +471,6 @@ class PatternLoader:
                     )
                     enabled = True  # Use default
 
-                # Check for duplicate event names across files
-                if any(p.name == event_name for p in self.patterns):
-                    logger.warning(
-                        "duplicate_event_pattern_name",
-                        name=event_name,
-                        file=str(yaml_file),
-                    )
-                    continue
-
                 # Extract channel (optional)
                 channel: Optional[str] = config.get('channel')
                 if channel is not None and not isinstance(channel, str):
@@ -380,8 +494,7 @@ class PatternLoader:
                     channel=channel
                 )
 
-                self.patterns.append(pattern)
-                count += 1
+                file_patterns.append(pattern)
 
                 # Log successful creation
                 logger.debug(
@@ -414,7 +527,7 @@ class PatternLoader:
                 )
                 continue
 
-        return count
+        return file_patterns
 
     def get_patterns(self, enabled_only: bool = True) -> List[EventPattern]:
         """
@@ -472,6 +585,7 @@ class PatternLoader:
         """
         self.patterns.clear()
         self._loaded_files.clear()
+        self._file_states.clear()
         assert len(self.patterns) == 0, "patterns should be empty after clear"
         assert len(self._loaded_files) == 0, "_loaded_files should be empty after clear"
 
@@ -479,3 +593,96 @@ class PatternLoader:
         assert isinstance(count, int), f"load_patterns must return int, got {type(count)}"
 
         return count
+
+    def refresh(self) -> bool:
+        """
+        Re-read only the pattern files that changed since they were loaded.
+
+        Files whose mtime and size are unchanged are skipped without being
+        read; files that were touched but have the same content hash are not
+        re-parsed. New files (when loading the whole directory) are picked
+        up and deleted files dropped. A file that fails to read or parse
+        keeps its previous patterns, so a half-saved edit can't wipe them.
+
+        Returns:
+            True if self.patterns was replaced.
+        """
+        if not self.patterns_dir.exists():
+            logger.warning("patterns_directory_not_found", path=str(self.patterns_dir))
+            return False
+
+        states: Dict[str, PatternFileState] = {}
+        changed_files: List[str] = []
+        for yaml_file in self._select_files(self._pattern_files):
+            key = str(yaml_file)
+            previous = self._file_states.get(key)
+            try:
+                stat = yaml_file.stat()
+            except OSError:
+                continue
+
+            if previous is not None and (previous.mtime_ns, previous.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                states[key] = previous
+                continue
+
+            # SECURITY: Check file size before loading
+            if stat.st_size > MAX_FILE_SIZE_BYTES:
+                logger.error(
+                    "pattern_file_too_large",
+                    file=key,
+                    size_bytes=stat.st_size,
+                    max_bytes=MAX_FILE_SIZE_BYTES
+                )
+                if previous is not None:
+                    states[key] = previous
+                continue
+
+            try:
+                with open(yaml_file, 'rb') as f:
+                    content = f.read()
+                digest = hashlib.sha256(content).hexdigest()
+                if previous is not None and previous.digest == digest:
+                    states[key] = previous._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                    continue
+                file_patterns = self._patterns_for_content(yaml_file, content, digest)
+            except Exception as e:
+                logger.error(
+                    "pattern_file_reload_failed",
+                    file=key,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                if previous is not None:
+                    states[key] = previous
+                continue
+
+            states[key] = PatternFileState(stat.st_mtime_ns, stat.st_size, digest, file_patterns)
+            changed_files.append(yaml_file.name)
+
+        removed_files = [Path(key).name for key in self._file_states if key not in states]
+        if not changed_files and not removed_files:
+            return False
+
+        # Reassemble in file order so duplicate names resolve as in load_patterns(),
+        # then publish with a single assignment
+        patterns: List[EventPattern] = []
+        for key, state in states.items():
+            self._add_patterns(patterns, state.patterns, Path(key))
+        patterns.sort(key=lambda p: p.priority)
+
+        previous_count = len(self.patterns)
+        self.patterns = patterns
+        self._file_states = states
+        self._loaded_files = [Path(key).name for key in states]
+
+        logger.info(
+            "patterns_refreshed",
+            changed_files=changed_files,
+            removed_files=removed_files,
+            total_patterns=len(self.patterns),
+            previous_patterns=previous_count,
+        )
+        return True
@@ -0,0 +1,192 @@
+"""
+Literal-prefiltered multi-pattern matcher for EventParser.
+
+Every compiled event pattern is analyzed once at load time for literal text
+that any match must contain (e.g. "[chat] " or "was killed by"). Per line,
+bracket tags like [JOIN]/[CHAT]/[LEAVE] are looked up in a dict and the
+remaining literals are checked with substring tests, so only patterns that
+could possibly match are handed to the regex engine. Candidates are tried
+in the original priority order, preserving first-match-by-priority
+semantics exactly.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:  # Python 3.11+
+    import re._parser as sre_parse  # type: ignore[import-not-found]
+    import re._constants as sre_constants  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse  # type: ignore[no-redef]
+    import sre_constants  # type: ignore[no-redef]
+import re as stdlib_re
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Bracketed log tags such as [CHAT], [JOIN], [RESEARCH]. Tags can't contain
+# brackets, so findall sees every occurrence in a line.
+_BRACKET_TAG = stdlib_re.compile(r"\[[^\[\]\s]{1,32}\]")
+
+# Bump when required_literals() can return different literals for the same
+# pattern (invalidates cached analysis, see pattern_cache.py)
+ANALYSIS_VERSION = 1
+
+# Literals shorter than this filter too little to be worth checking
+MIN_LITERAL_LENGTH = 3
+
+_LITERAL = sre_constants.LITERAL
+_SUBPATTERN = sre_constants.SUBPATTERN
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) + tuple(
+    op for op in (getattr(sre_constants, "POSSESSIVE_REPEAT", None),) if op is not None
+)
+_ATOMIC = getattr(sre_constants, "ATOMIC_GROUP", None)
+
+
+def _collect_literals(items: Any, runs: List[str]) -> None:
+    """Append every literal run that a match of items must contain."""
+    current: List[str] = []
+
+    def flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    for op, av in items:
+        if op is _LITERAL:
+            current.append(chr(av))
+        elif op is _SUBPATTERN:
+            # (group, add_flags, del_flags, pattern): contents are mandatory
+            flush()
+            _collect_literals(av[-1], runs)
+        elif _ATOMIC is not None and op is _ATOMIC:
+            flush()
+            _collect_literals(av, runs)
+        elif op in _REPEATS:
+            flush()
+            min_count, _max_count, item = av
+            if min_count >= 1:
+                _collect_literals(item, runs)
+        else:
+            # Branches, classes, anchors, backrefs, lookarounds: not required text
+            flush()
+    flush()
+
+
+def required_literals(pattern: str, min_length: int = MIN_LITERAL_LENGTH) -> List[str]:
+    """
+    Return lowercase literal strings that every match of pattern contains.
+
+    Only ASCII literals are returned, so matching them against a lowercased
+    ASCII line is exact even for IGNORECASE patterns. Unparseable patterns
+    yield no literals (they are always treated as candidates).
+
+    Args:
+        pattern: Regex source
+        min_length: Shortest literal worth returning
+
+    Returns:
+        Required literals, longest first.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return []
+
+    runs: List[str] = []
+    _collect_literals(parsed, runs)
+    literals = {run.lower() for run in runs if run.isascii() and len(run) >= min_length}
+    return sorted(literals, key=len, reverse=True)
+
+
+class PatternMatcher:
+    """
+    Narrow a priority-ordered pattern list to the ones a line could match.
+
+    Each pattern is keyed by one required literal: a bracket tag when it has
+    one (resolved by dict lookup), otherwise its longest literal (resolved by
+    one substring test per distinct literal). Patterns without a usable
+    literal are always candidates.
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[Tuple[str, Any, Any]],
+        literals_for: Callable[[str], List[str]] = required_literals,
+    ) -> None:
+        """
+        Build the dispatch index.
+
+        Args:
+            entries: (name, compiled_regex, pattern_config) tuples in priority order
+            literals_for: Regex source -> required literals (e.g. a cached lookup)
+        """
+        self.entries: List[Tuple[str, Any, Any]] = list(entries)
+        self._always: List[int] = []
+        self._by_tag: Dict[str, List[int]] = {}
+        self._by_literal: Dict[str, List[int]] = {}
+
+        for index, (_name, regex, _config) in enumerate(self.entries):
+            source = getattr(regex, "pattern", None)
+            literals = literals_for(source) if isinstance(source, str) else []
+
+            tag = self._find_tag(literals)
+            if tag is not None:
+                self._by_tag.setdefault(tag, []).append(index)
+            elif literals:
+                self._by_literal.setdefault(literals[0], []).append(index)
+            else:
+                self._always.append(index)
+
+        self._literal_items = list(self._by_literal.items())
+        logger.debug(
+            "pattern_matcher_built",
+            patterns=len(self.entries),
+            tag_keys=len(self._by_tag),
+            literal_keys=len(self._by_literal),
+            unindexed=len(self._always),
+        )
+
+    @staticmethod
+    def _find_tag(literals: List[str]) -> Optional[str]:
+        """Return a bracket tag contained in any required literal, if present."""
+        for literal in literals:
+            found = _BRACKET_TAG.search(literal)
+            if found is not None:
+                return found.group(0)
+        return None
+
+    def candidates(self, line: str) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Yield entries that could match line, in priority order.
+
+        Args:
+            line: Raw log line
+
+        Yields:
+            (name, compiled_regex, pattern_config) tuples
+        """
+        if not line.isascii():
+            # Unicode case folding could defeat the ASCII prefilter; be exact
+            yield from self.entries
+            return
+
+        lowered = line.lower()
+        indices: List[int] = list(self._always)
+
+        if self._by_tag and "[" in lowered:
+            for tag in set(_BRACKET_TAG.findall(lowered)):
+                bucket = self._by_tag.get(tag)
+                if bucket:
+                    indices.extend(bucket)
+
+        for literal, bucket in self._literal_items:
+            if literal in lowered:
+                indices.extend(bucket)
+
+        indices.sort()
+        entries = self.entries
+        for index in indices:
+            yield entries[index]
@@ -0,0 +1,203 @@
+"""
+Live per-server player roster.
+
+The roster is maintained from the player join/leave events EventParser
+already produces, so player count and list queries need no RCON traffic.
+It is reconciled against an authoritative snapshot (`/players online`, or
+the connected-player list in a batched metrics sample) when it is first
+used, at most every reconcile_interval seconds afterwards, and whenever it
+was marked stale (RCON reconnect, skipped log content).
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+PLAYERS_ONLINE_COMMAND = "/players online"
+
+DEFAULT_RECONCILE_INTERVAL = 300.0
+
+# EventType values (a str Enum); compared by value so the RCON layer
+# doesn't import the parser
+JOIN_EVENT = "join"
+LEAVE_EVENT = "leave"
+
+# Join/leave changes kept for replay over a snapshot that was in flight
+JOURNAL_SIZE = 256
+
+# Placeholder entry ("Player 1 (online)") some servers list; Factorio names
+# can't contain spaces, so it never collides with a real player such as
+# "PlayerOne"
+_PLACEHOLDER_NAME = re.compile(r"Player \d+")
+
+
+def parse_online_players(response: Optional[str]) -> List[str]:
+    """
+    Extract online player names from `/players` or `/players online` output.
+
+    Args:
+        response: Raw RCON response ("  Alice (online)" lines)
+
+    Returns:
+        Player names in server order.
+    """
+    players: List[str] = []
+    if not response:
+        return players
+
+    for line in response.split("\n"):
+        line = line.strip()
+        if "(online)" in line.lower():
+            player_name = line.split("(online)")[0].strip()
+            player_name = player_name.lstrip("-").strip()
+            if player_name and not _PLACEHOLDER_NAME.fullmatch(player_name):
+                players.append(player_name)
+    return players
+
+
+class PlayerRoster:
+    """Online players of one server, kept current from join/leave events."""
+
+    def __init__(
+        self,
+        server_tag: Optional[str] = None,
+        reconcile_interval: float = DEFAULT_RECONCILE_INTERVAL,
+    ) -> None:
+        """
+        Create an empty roster (stale until the first reconcile).
+
+        Args:
+            server_tag: Server label for logs
+            reconcile_interval: Seconds a reconciled roster stays current
+
+        Raises:
+            ValueError: reconcile_interval <= 0
+        """
+        if reconcile_interval <= 0:
+            raise ValueError(f"reconcile_interval must be > 0, got {reconcile_interval}")
+
+        self.server_tag = server_tag
+        self.reconcile_interval = reconcile_interval
+
+        # Insertion-ordered set of online names
+        self._online: Dict[str, None] = {}
+        self._stale = True
+        self._reconciled_at: Optional[float] = None
+
+        # Every change bumps version; recent changes are journaled
+        self.version = 0
+        self._journal: Deque[Tuple[int, str, bool]] = deque(maxlen=JOURNAL_SIZE)
+
+        # Counters
+        self.events_applied = 0
+        self.reconciles = 0
+
+    @property
+    def count(self) -> int:
+        return len(self._online)
+
+    def players(self) -> List[str]:
+        """Online player names, in join order."""
+        return list(self._online)
+
+    def __contains__(self, player_name: object) -> bool:
+        return player_name in self._online
+
+    def is_current(self, now: Optional[float] = None) -> bool:
+        """True if the roster can answer queries without a reconcile."""
+        if self._stale or self._reconciled_at is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        return now - self._reconciled_at < self.reconcile_interval
+
+    def mark_stale(self, reason: str) -> None:
+        """Force a reconcile before the roster is trusted again."""
+        if not self._stale:
+            logger.debug("player_roster_stale", server_tag=self.server_tag, reason=reason)
+        self._stale = True
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def player_joined(self, player_name: str) -> None:
+        self._record(player_name, True)
+        self._online[player_name] = None
+
+    def player_left(self, player_name: str) -> None:
+        self._record(player_name, False)
+        self._online.pop(player_name, None)
+
+    def _record(self, player_name: str, joined: bool) -> None:
+        self.version += 1
+        self._journal.append((self.version, player_name, joined))
+        self.events_applied += 1
+
+    def apply_event(self, event: Any) -> bool:
+        """
+        Update the roster from a parsed FactorioEvent.
+
+        Returns:
+            True if the event was a join/leave with a player name.
+        """
+        if not event.player_name:
+            return False
+        if event.event_type == JOIN_EVENT:
+            self.player_joined(event.player_name)
+            return True
+        if event.event_type == LEAVE_EVENT:
+            self.player_left(event.player_name)
+            return True
+        return False
+
+    def reconcile(self, players: Iterable[str], since: Optional[int] = None) -> None:
+        """
+        Replace the roster with an authoritative snapshot.
+
+        Args:
+            players: Names online according to the server
+            since: Roster version read before the snapshot was requested;
+                join/leave events applied after it are replayed on top, so
+                a snapshot that was in flight doesn't undo them
+        """
+        online: Dict[str, None] = dict.fromkeys(players)
+
+        if since is not None:
+            for version, player_name, joined in self._journal:
+                if version <= since:
+                    continue
+                if joined:
+                    online[player_name] = None
+                else:
+                    online.pop(player_name, None)
+
+        added = online.keys() - self._online.keys()
+        removed = self._online.keys() - online.keys()
+        if (added or removed) and self._reconciled_at is not None:
+            logger.info(
+                "player_roster_drift",
+                server_tag=self.server_tag,
+                added=sorted(added),
+                removed=sorted(removed),
+            )
+
+        self._online = online
+        self._stale = False
+        self._reconciled_at = time.monotonic()
+        self.reconciles += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "online": self.count,
+            "current": self.is_current(),
+            "events_applied": self.events_applied,
+            "reconciles": self.reconciles,
+        }
@@ -5,19 +5,28 @@
 High-frequency UPS monitoring with performance alerts.
 
 Provides RconAlertMonitor for frequent UPS checks via RconMetricsEngine
-and threshold-based alerting to Discord channels.
+(or a shared RconMetricsSampler snapshot) and threshold-based alerting to
+Discord channels.
 """
 
 from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
+try:
+    from metrics_history import UPS_METRIC, MetricsHistory, WindowStats
+except ImportError:
+    from src.metrics_history import UPS_METRIC, MetricsHistory, WindowStats  # type: ignore
+
 logger = structlog.get_logger()
 
+# Seconds of UPS history summarized in a low UPS alert
+ALERT_TREND_WINDOW = 900.0
+
 
 class RconAlertMonitor:
     """Lightweight high-frequency UPS monitoring for performance alerts with pause detection."""
@@ -32,6 +41,7 @@ class RconAlertMonitor:
         ups_warning_threshold: float = 55.0,
         ups_recovery_threshold: float = 58.0,
         alert_cooldown: int = 300,
+        metrics_sampler: Optional[Any] = None,
     ) -> None:
         """
         Initialize alert monitor.
@@ -45,6 +55,8 @@ class RconAlertMonitor:
             ups_warning_threshold: UPS below this triggers alert (default: 55)
             ups_recovery_threshold: UPS above this clears alert (default: 58)
             alert_cooldown: Seconds between repeated alerts (default: 300)
+            metrics_sampler: Optional shared RconMetricsSampler; when set, each
+                check evaluates the latest snapshot instead of sampling UPS
         """
         self.rcon_client = rcon_client
         self.discord_interface = discord_interface
@@ -66,6 +78,9 @@ class RconAlertMonitor:
         else:
             self.metrics_engine = metrics_engine
 
+        self.metrics_sampler = metrics_sampler
+        self._last_snapshot_sequence: Optional[int] = None
+
         # Alert state
         self.alert_state: Dict[str, Any] = {
             "low_ups_active": False,
@@ -84,6 +99,7 @@ class RconAlertMonitor:
             threshold=ups_warning_threshold,
             ema_alpha=self.metrics_engine.ema_alpha,
             shared_metrics_engine=metrics_engine is not None,
+            shared_metrics_sampler=metrics_sampler is not None,
         )
 
     async def start(self) -> None:
@@ -134,20 +150,16 @@ class RconAlertMonitor:
             return
 
         try:
-            current_ups = await self.metrics_engine.sample_ups()
+            sample = await self._read_ups_sample()
+            if sample is None:
+                return
+            current_ups, is_paused, last_known_ups, engine_ema_ups = sample
 
             # PAUSE DETECTION: Skip alert processing when server is paused
-            if (
-                self.metrics_engine.ups_calculator
-                and self.metrics_engine.ups_calculator.is_paused
-            ):
+            if is_paused:
                 logger.debug(
                     "ups_check_skipped_server_paused",
-                    last_known_ups=(
-                        self.metrics_engine.ups_calculator.last_known_ups
-                        if self.metrics_engine.ups_calculator
-                        else None
-                    ),
+                    last_known_ups=last_known_ups,
                 )
 
                 # Clear low UPS alert state if paused (expected behavior)
@@ -180,8 +192,8 @@ class RconAlertMonitor:
 
             # Use EMA from shared engine
             ups_for_decision = (
-                self.metrics_engine.ema_ups
-                if self.metrics_engine.ema_ups is not None
+                engine_ema_ups
+                if engine_ema_ups is not None
                 else current_ups
             )
 
@@ -191,7 +203,7 @@ class RconAlertMonitor:
                 logger.debug(
                     "low_ups_detected",
                     current_ups=current_ups,
-                    ema_ups=self.metrics_engine.ema_ups,
+                    ema_ups=engine_ema_ups,
                     decision_ups=ups_for_decision,
                     threshold=self.ups_warning_threshold,
                     consecutive_count=self.alert_state["consecutive_bad_samples"],
@@ -212,8 +224,8 @@ class RconAlertMonitor:
                             sma_ups = current_ups
 
                         ema_ups = (
-                            self.metrics_engine.ema_ups
-                            if self.metrics_engine.ema_ups is not None
+                            engine_ema_ups
+                            if engine_ema_ups is not None
                             else sma_ups
                         )
                         await self._send_low_ups_alert(current_ups, sma_ups, ema_ups)
@@ -228,7 +240,7 @@ class RconAlertMonitor:
                     logger.debug(
                         "ups_recovery_detected",
                         current_ups=current_ups,
-                        ema_ups=self.metrics_engine.ema_ups,
+                        ema_ups=engine_ema_ups,
                         decision_ups=ups_for_decision,
                         threshold=self.ups_recovery_threshold,
                     )
@@ -243,8 +255,8 @@ class RconAlertMonitor:
                         sma_ups = current_ups
 
                     ema_ups = (
-                        self.metrics_engine.ema_ups
-                        if self.metrics_engine.ema_ups is not None
+                        engine_ema_ups
+                        if engine_ema_ups is not None
                         else sma_ups
                     )
                     await self._send_ups_recovered_alert(
@@ -257,6 +269,42 @@ class RconAlertMonitor:
         except Exception as e:
             logger.warning("ups_check_failed", error=str(e), exc_info=True)
 
+    async def _read_ups_sample(
+        self,
+    ) -> Optional[Tuple[Optional[float], bool, Optional[float], Optional[float]]]:
+        """
+        Get the UPS reading for this check.
+
+        Returns:
+            (current_ups, is_paused, last_known_ups, ema_ups), or None when the
+            shared sampler has not produced a new snapshot since the last check.
+        """
+        if self.metrics_sampler is not None:
+            # Allow a full sampler period of slack: the two loops drift in
+            # phase, and forcing a refresh here would double-poll the server
+            max_age = self.check_interval + self.metrics_sampler.interval
+            snapshot = await self.metrics_sampler.get_snapshot(max_age=max_age)
+            if snapshot.sequence == self._last_snapshot_sequence:
+                logger.debug("ups_check_skipped_no_new_sample", sequence=snapshot.sequence)
+                return None
+            self._last_snapshot_sequence = snapshot.sequence
+            metrics = snapshot.metrics
+            return (
+                metrics.get("ups"),
+                bool(metrics.get("is_paused")),
+                metrics.get("last_known_ups"),
+                metrics.get("ups_ema"),
+            )
+
+        current_ups = await self.metrics_engine.sample_ups()
+        calculator = self.metrics_engine.ups_calculator
+        return (
+            current_ups,
+            bool(calculator and calculator.is_paused),
+            calculator.last_known_ups if calculator else None,
+            self.metrics_engine.ema_ups,
+        )
+
     def _can_send_alert(self) -> bool:
         """Check if enough time has passed since last alert (cooldown)."""
         last_alert = self.alert_state.get("last_alert_time")
@@ -273,16 +321,30 @@ class RconAlertMonitor:
             )
         return can_send
 
+    def _ups_trend(self) -> Optional[WindowStats]:
+        """UPS over the last ALERT_TREND_WINDOW seconds, if the engine keeps history."""
+        history = getattr(self.metrics_engine, "history", None)
+        if not isinstance(history, MetricsHistory):
+            return None
+        trend = history.window(UPS_METRIC, ALERT_TREND_WINDOW)
+        return trend if trend is not None and trend.count >= 2 else None
+
     async def _send_low_ups_alert(
         self,
         current_ups: float,
         sma_ups: float,
         ema_ups: float,
     ) -> None:
-        """Send low UPS warning with SMA and EMA."""
+        """Send low UPS warning with SMA, EMA and the recent trend."""
         from discord_interface import EmbedBuilder  # type: ignore[import]
 
         server_label = self._build_server_label()
+        trend = self._ups_trend()
+        trend_text = (
+            f"p5 {trend.p5:.1f}, min {trend.min:.1f}, {trend.slope * 60:+.2f} UPS/min"
+            if trend is not None
+            else None
+        )
         embed = EmbedBuilder.create_base_embed(
             title=f"⚠️ {server_label}: Low UPS Warning",
             color=EmbedBuilder.COLOR_WARNING,
@@ -317,6 +379,12 @@ class RconAlertMonitor:
             ),
             inline=False,
         )
+        if trend_text is not None:
+            embed.add_field(
+                name=f"Trend (last {int(ALERT_TREND_WINDOW // 60)} min)",
+                value=trend_text,
+                inline=False,
+            )
         embed.add_field(
             name="Impact",
             value="Game is running slower than real-time. Performance degraded.",
@@ -333,7 +401,8 @@ class RconAlertMonitor:
                 f"(SMA: {sma_ups:.1f}, EMA: {ema_ups:.1f})\n"
                 f"Threshold: < {self.ups_warning_threshold}\n"
                 f"Duration: {self.alert_state['consecutive_bad_samples']} checks\n"
-                "Performance degraded."
+                + (f"Trend: {trend_text}\n" if trend_text is not None else "")
+                + "Performance degraded."
             )
             result = self.discord_interface.send_message(message)
             await result
@@ -345,6 +414,8 @@ class RconAlertMonitor:
             sma_ups=sma_ups,
             ema_ups=ema_ups,
             consecutive_bad=self.alert_state["consecutive_bad_samples"],
+            trend_p5=trend.p5 if trend is not None else None,
+            trend_slope=trend.slope if trend is not None else None,
         )
 
     async def _send_ups_recovered_alert(
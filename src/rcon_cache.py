@@ -0,0 +1,296 @@
+"""
+Per-server response cache for read-only RCON commands.
+
+Only commands matching a CachePolicy are cached; everything else goes
+straight to the server. Each policy has its own TTL: the version and map
+seed don't change until the server restarts, the admin list changes
+rarely, and player and evolution queries go stale within seconds.
+
+Identical concurrent queries are coalesced (singleflight), so ten users
+running /version during an incident cost one RCON round trip. Entries are
+dropped early by invalidation hooks: RCON reconnects clear everything, and
+log events (server start/stop, promotions, joins/leaves) or write commands
+(/promote, /demote) clear the policies they affect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Lua queries sent by the evolution command; kept here so the cache policy
+# matches exactly what is sent
+EVOLUTION_ALL_COMMAND = (
+    "/sc "
+    "local f = game.forces['enemy']; "
+    "local total = 0; local count = 0; "
+    "local lines = {}; "
+    "for _, s in pairs(game.surfaces) do "
+    " if not string.find(string.lower(s.name), 'platform') then "
+    " local evo = f.get_evolution_factor(s); "
+    " total = total + evo; count = count + 1; "
+    " table.insert(lines, s.name .. ':' .. string.format('%.2f%%', evo * 100)); "
+    " end "
+    "end; "
+    "if count > 0 then "
+    " local avg = total / count; "
+    " rcon.print('AGG:' .. string.format('%.2f%%', avg * 100)); "
+    "else "
+    " rcon.print('AGG:0.00%%'); "
+    "end; "
+    "for _, line in ipairs(lines) do "
+    " rcon.print(line); "
+    "end"
+)
+
+_EVOLUTION_SURFACE_PREFIX = "/sc local s = game.get_surface('"
+_EVOLUTION_SURFACE_SUFFIX = (
+    "'); "
+    "if not s then "
+    " rcon.print('SURFACE_NOT_FOUND'); "
+    " return "
+    "end; "
+    "if string.find(string.lower(s.name), 'platform') then "
+    " rcon.print('SURFACE_PLATFORM_IGNORED'); "
+    " return "
+    "end; "
+    "local evo = game.forces['enemy'].get_evolution_factor(s); "
+    "rcon.print(string.format('%.2f%%', evo * 100))"
+)
+
+
+def evolution_surface_command(surface: str) -> str:
+    """Lua query for one surface's enemy evolution."""
+    return f"{_EVOLUTION_SURFACE_PREFIX}{surface}{_EVOLUTION_SURFACE_SUFFIX}"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Which commands a cache rule covers and how long responses stay fresh."""
+
+    name: str
+    pattern: re.Pattern[str]
+    """Matched against the whole command (fullmatch)."""
+
+    ttl: Optional[float]
+    """Seconds a response is served from cache (None = until invalidated)."""
+
+
+DEFAULT_POLICIES: Tuple[CachePolicy, ...] = (
+    CachePolicy("version", re.compile(r"/version"), None),
+    CachePolicy(
+        "seed",
+        re.compile(r'/sc rcon\.print\(game\.surfaces\["\w+"\]\.map_gen_settings\.seed\)'),
+        None,
+    ),
+    CachePolicy("admins", re.compile(r"/admins"), 120.0),
+    CachePolicy("players", re.compile(r"/players(?: online)?"), 5.0),
+    CachePolicy(
+        "evolution",
+        re.compile(
+            # A quote or backslash in the surface name could escape the Lua
+            # string, so such commands are never treated as read-only
+            f"{re.escape(EVOLUTION_ALL_COMMAND)}"
+            f"|{re.escape(_EVOLUTION_SURFACE_PREFIX)}[^'\\\\\\n]*{re.escape(_EVOLUTION_SURFACE_SUFFIX)}"
+        ),
+        30.0,
+    ),
+)
+
+# Write commands and the policies whose responses they change
+COMMAND_INVALIDATIONS: Tuple[Tuple[re.Pattern[str], Tuple[str, ...]], ...] = (
+    (re.compile(r"/(?:promote|demote)\s"), ("admins",)),
+)
+
+# Server log lines (raw) and the policies they invalidate (None = all)
+EVENT_INVALIDATIONS: Tuple[Tuple[re.Pattern[str], Optional[Tuple[str, ...]]], ...] = (
+    (re.compile(r"\[SERVER\] Server (?:started|shutting down)\."), None),
+    (re.compile(r"\w+ (?:promoted \w+ to|demoted \w+ from) admin"), ("admins",)),
+)
+
+# EventType values, compared by value (EventType is a str Enum)
+PLAYER_EVENTS = ("join", "leave")
+SERVER_EVENT = "server"
+
+# Distinct cached commands kept per server (evolution varies by surface)
+MAX_ENTRIES = 128
+
+
+class RconResponseCache:
+    """TTL cache with singleflight for one server's read-only RCON commands."""
+
+    def __init__(
+        self,
+        server_tag: Optional[str] = None,
+        policies: Iterable[CachePolicy] = DEFAULT_POLICIES,
+    ) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            server_tag: Server label for logs
+            policies: Cacheable command rules (first match wins)
+        """
+        self.server_tag = server_tag
+        self.policies = tuple(policies)
+
+        # command -> (response, expires_at, policy name)
+        self._entries: Dict[str, Tuple[str, float, str]] = {}
+        # command -> in-flight fetch shared by concurrent callers
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        # Bumped by invalidate() (all / per policy); a fetch that started
+        # before an invalidation of its policy isn't stored
+        self._epoch = 0
+        self._policy_epochs: Dict[str, int] = {}
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def policy_for(self, command: str) -> Optional[CachePolicy]:
+        """Return the policy covering a command, or None if it is not cacheable."""
+        for policy in self.policies:
+            if policy.pattern.fullmatch(command):
+                return policy
+        return None
+
+    def _generation(self, policy_name: str) -> int:
+        return self._epoch + self._policy_epochs.get(policy_name, 0)
+
+    async def fetch(
+        self,
+        command: str,
+        policy: CachePolicy,
+        run: Callable[[str], Awaitable[str]],
+    ) -> str:
+        """
+        Return a fresh cached response, join an in-flight query, or run one.
+
+        Args:
+            command: RCON command (must match policy)
+            policy: Policy from policy_for()
+            run: Coroutine function that executes the command on the server
+
+        Raises:
+            Exception: Whatever run() raised (shared by every waiting caller)
+        """
+        entry = self._entries.get(command)
+        if entry is not None:
+            response, expires_at, _ = entry
+            if time.monotonic() < expires_at:
+                self.hits += 1
+                return response
+            del self._entries[command]
+
+        flight = self._inflight.get(command)
+        if flight is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            flight = asyncio.ensure_future(run(command))
+            self._inflight[command] = flight
+            generation = self._generation(policy.name)
+            flight.add_done_callback(
+                lambda f: self._flight_done(command, policy, generation, f)
+            )
+
+        # A cancelled caller must not cancel the query the others are waiting on
+        return await asyncio.shield(flight)
+
+    def _flight_done(
+        self,
+        command: str,
+        policy: CachePolicy,
+        generation: int,
+        flight: "asyncio.Future[str]",
+    ) -> None:
+        if self._inflight.get(command) is flight:
+            del self._inflight[command]
+        if flight.cancelled() or flight.exception() is not None:
+            # exception() also marks it retrieved if every caller went away
+            return
+        if generation != self._generation(policy.name):
+            # Invalidated while in flight; the response may predate the change
+            return
+
+        expires_at = float("inf") if policy.ttl is None else time.monotonic() + policy.ttl
+        self._entries.pop(command, None)
+        self._entries[command] = (flight.result(), expires_at, policy.name)
+        while len(self._entries) > MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, names: Optional[Iterable[str]] = None, reason: str = "") -> None:
+        """
+        Drop cached responses so the next query goes to the server.
+
+        Args:
+            names: Policy names to drop (None = all)
+            reason: Why (for logs)
+        """
+        selected = None if names is None else set(names)
+        dropped = [
+            command
+            for command, (_, _, name) in self._entries.items()
+            if selected is None or name in selected
+        ]
+        for command in dropped:
+            del self._entries[command]
+
+        # Later callers must not join a query that started before the change
+        for command in list(self._inflight):
+            policy = self.policy_for(command)
+            if selected is None or (policy is not None and policy.name in selected):
+                del self._inflight[command]
+
+        if selected is None:
+            self._epoch += 1
+        else:
+            for name in selected:
+                self._policy_epochs[name] = self._policy_epochs.get(name, 0) + 1
+        self.invalidations += 1
+        if dropped:
+            logger.debug(
+                "rcon_cache_invalidated",
+                server_tag=self.server_tag,
+                policies=sorted(selected) if selected is not None else "all",
+                dropped=len(dropped),
+                reason=reason,
+            )
+
+    def observe_command(self, command: str) -> None:
+        """Invalidate policies a write command just changed."""
+        for pattern, names in COMMAND_INVALIDATIONS:
+            if pattern.match(command):
+                self.invalidate(names, reason="command")
+
+    def observe_event(self, event: Any) -> None:
+        """Invalidate policies a parsed log event shows have changed."""
+        if event.event_type in PLAYER_EVENTS:
+            if self._entries or self._inflight:
+                self.invalidate(("players",), reason=str(event.event_type))
+            return
+        if event.event_type != SERVER_EVENT:
+            return
+        for pattern, names in EVENT_INVALIDATIONS:
+            if pattern.search(event.raw_line):
+                self.invalidate(names, reason="log_event")
+                return
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+        }
@@ -4,10 +4,16 @@
 """
 RCON client for Factorio server queries with automatic reconnection.
 
-Handles connection, authentication, and command execution using rcon library.
+Handles connection, authentication, and command execution over a native
+asyncio implementation of the Source RCON protocol (rcon_protocol.py).
 Includes automatic reconnection with exponential backoff and optional
 context helpers for server name/tag.
 
+Connections are long-lived: each RconClient keeps a small pool of
+authenticated connections. Commands are multiplexed by packet ID, so many
+can be in flight on one connection without blocking worker threads; dead
+connections are transparently re-opened.
+
 For metrics collection, stats posting, and alerting, see:
 - rcon_metrics_engine.py: UPSCalculator, RconMetricsEngine
 - rcon_stats_collector.py: RconStatsCollector
@@ -17,42 +23,85 @@ For metrics collection, stats posting, and alerting, see:
 from __future__ import annotations
 
 import asyncio
-from typing import Any, List, Optional
+import importlib
+import time
+from typing import Any, List, Optional, Tuple
 
 import structlog
 
-# Optional RCON support using rcon library
+# Native asyncio RCON protocol
 try:
-    from rcon.source import Client as RCONClient
-
-    RCON_AVAILABLE = True
+    from rcon_protocol import AsyncRconConnection, RconCommandNotSent
 except ImportError:
-    RCONClient = None  # type: ignore
-    RCON_AVAILABLE = False
+    try:
+        from src.rcon_protocol import (  # type: ignore
+            AsyncRconConnection,
+            RconCommandNotSent,
+        )
+    except ImportError:
+        AsyncRconConnection = None  # type: ignore
+        RconCommandNotSent = None  # type: ignore
 
-logger = structlog.get_logger()
+try:
+    from player_roster import PLAYERS_ONLINE_COMMAND, PlayerRoster, parse_online_players
+except ImportError:
+    from src.player_roster import (  # type: ignore
+        PLAYERS_ONLINE_COMMAND,
+        PlayerRoster,
+        parse_online_players,
+    )
 
+try:
+    from rcon_cache import RconResponseCache
+except ImportError:
+    from src.rcon_cache import RconResponseCache  # type: ignore
 
-# Backward compatibility: Re-export classes from new modules
 try:
-    from rcon_metrics_engine import UPSCalculator, RconMetricsEngine
-    from rcon_stats_collector import RconStatsCollector
-    from rcon_alert_monitor import RconAlertMonitor
+    from rcon_scheduler import DEFAULT_MAX_CONCURRENCY, RconScheduler, current_priority
 except ImportError:
+    from src.rcon_scheduler import (  # type: ignore
+        DEFAULT_MAX_CONCURRENCY,
+        RconScheduler,
+        current_priority,
+    )
+
+RCON_AVAILABLE = AsyncRconConnection is not None
+
+logger = structlog.get_logger()
+
+
+# Backward compatibility: classes that moved to their own modules are
+# re-exported on first access, so importing the client alone doesn't load
+# the metrics, stats and alerting stack
+_COMPAT_EXPORTS = {
+    "UPSCalculator": "rcon_metrics_engine",
+    "RconMetricsEngine": "rcon_metrics_engine",
+    "RconStatsCollector": "rcon_stats_collector",
+    "RconAlertMonitor": "rcon_alert_monitor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _COMPAT_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
     try:
-        from src.rcon_metrics_engine import UPSCalculator, RconMetricsEngine  # type: ignore
-        from src.rcon_stats_collector import RconStatsCollector  # type: ignore
-        from src.rcon_alert_monitor import RconAlertMonitor  # type: ignore
+        module = importlib.import_module(module_name)
     except ImportError:
-        # Graceful degradation if modules not found
-        UPSCalculator = None  # type: ignore
-        RconMetricsEngine = None  # type: ignore
-        RconStatsCollector = None  # type: ignore
-        RconAlertMonitor = None  # type: ignore
+        try:
+            module = importlib.import_module(f"src.{module_name}")
+        except ImportError:
+            # Graceful degradation if modules not found
+            module = None
+
+    value = getattr(module, name, None)
+    globals()[name] = value
+    return value
 
 
 class RconClient:
-    """Async wrapper for synchronous RCON client with auto-reconnection."""
+    """Async RCON client with connection pooling and auto-reconnection."""
 
     def __init__(
         self,
@@ -66,12 +115,24 @@ class RconClient:
         server_name: str | None = None,
         server_tag: str | None = None,
         server_config: Any | None = None,
+        pool_size: int = 2,
+        max_idle: float = 300.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
-        """Initialize RCON client with reconnection support."""
+        """
+        Initialize RCON client with reconnection support.
+
+        Args:
+            pool_size: Max persistent connections kept open to this server.
+                Commands are multiplexed, so each connection can carry
+                several in-flight commands.
+            max_idle: Seconds an idle pooled connection may sit unused before
+                it is closed.
+            max_concurrency: Max commands in flight to this server; further
+                commands queue by priority (see rcon_scheduler.py).
+        """
         if not RCON_AVAILABLE:
-            raise ImportError(
-                "rcon package not installed. Install with: pip install rcon"
-            )
+            raise ImportError("rcon_protocol module not available")
 
         self.host = host
         self.port = port
@@ -97,6 +158,23 @@ class RconClient:
         self.reconnect_task: Optional[asyncio.Task[None]] = None
         self._should_reconnect = True
 
+        # Persistent connection pool (AsyncRconConnection instances)
+        self.pool_size = max(1, pool_size)
+        self.max_idle = max_idle
+        self._connections: List[Any] = []
+        self._open_lock = asyncio.Lock()
+
+        # Online players, fed by join/leave log events (see ServerManager.observe_event)
+        self.roster = PlayerRoster(server_tag=server_tag)
+
+        # Responses to read-only commands (/version, /admins, ...), shared
+        # by concurrent callers
+        self.cache = RconResponseCache(server_tag=server_tag)
+
+        # Orders commands from all callers (tick samples first) under a
+        # per-server concurrency limit
+        self.scheduler = RconScheduler(max_concurrency=max_concurrency, server_tag=server_tag)
+
     def use_context(
         self,
         server_name: str | None = None,
@@ -107,6 +185,9 @@ class RconClient:
             self.server_name = server_name
         if server_tag is not None:
             self.server_tag = server_tag
+            self.roster.server_tag = server_tag
+            self.cache.server_tag = server_tag
+            self.scheduler.server_tag = server_tag
 
         logger.debug(
             "rcon_context_updated",
@@ -146,31 +227,32 @@ class RconClient:
 
     async def connect(self) -> None:
         """Establish RCON connection and authenticate."""
-        if not RCON_AVAILABLE or RCONClient is None:
+        if not RCON_AVAILABLE or AsyncRconConnection is None:
             logger.error("rcon_library_not_available")
             return
 
         try:
-
-            def _test_connect() -> bool:
-                assert RCONClient is not None
-                with RCONClient(
-                    self.host,
-                    self.port,
-                    passwd=self.password,
-                    timeout=self.timeout,
-                ):
-                    return True
-
-            result = await asyncio.to_thread(_test_connect)
-            if result:
-                self.connected = True
-                self.current_reconnect_delay = self.reconnect_delay
-                logger.info(
-                    "rcon_connected",
-                    host=self.host,
-                    port=self.port,
-                )
+            # Serialized, so concurrent callers after a disconnect open one
+            # connection between them
+            async with self._open_lock:
+                if self.connected and any(conn.is_alive for conn in self._connections):
+                    return
+
+                # Keep the authenticated connection for the first command
+                conn = await self._open_connection()
+                if conn:
+                    self._add_connection(conn)
+                    self.connected = True
+                    self.current_reconnect_delay = self.reconnect_delay
+                    # Players may have come and gone (or the server restarted)
+                    # while we were disconnected
+                    self.roster.mark_stale("rcon_connected")
+                    self.cache.invalidate(reason="rcon_connected")
+                    logger.info(
+                        "rcon_connected",
+                        host=self.host,
+                        port=self.port,
+                    )
         except Exception as e:
             self.connected = False
             logger.error(
@@ -187,7 +269,9 @@ class RconClient:
         while self._should_reconnect:
             try:
                 await asyncio.sleep(5.0)
-                if not self.connected:
+                if self.connected:
+                    self._prune_idle_connections()
+                else:
                     logger.info(
                         "rcon_attempting_reconnect",
                         next_retry_delay=self.current_reconnect_delay,
@@ -215,35 +299,181 @@ class RconClient:
                 await asyncio.sleep(5.0)
 
     async def disconnect(self) -> None:
-        """Close RCON connection."""
+        """Close all pooled RCON connections."""
         self.connected = False
+        connections = self._connections
+        self._connections = []
+        for conn in connections:
+            await self._close_connection(conn)
+        if connections:
+            logger.debug("rcon_pool_closed", closed_connections=len(connections))
         logger.info("rcon_disconnected")
 
+    # ------------------------------------------------------------------
+    # Connection pool
+    # ------------------------------------------------------------------
+
+    async def _open_connection(self) -> Any:
+        """Open and authenticate a new RCON connection."""
+        assert AsyncRconConnection is not None
+        conn = await AsyncRconConnection.open(
+            self.host,
+            self.port,
+            self.password,
+            timeout=self.timeout,
+        )
+        logger.debug("rcon_pool_connection_opened", host=self.host, port=self.port)
+        return conn
+
+    @staticmethod
+    async def _close_connection(conn: Any) -> None:
+        """Close a pooled connection, ignoring socket errors."""
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+    def _add_connection(self, conn: Any) -> None:
+        """
+        Add a connection to the pool, keeping it within pool_size.
+
+        Only idle connections are evicted to make room: closing one with
+        commands in flight would fail commands that may already have run.
+        If every older connection is busy, the pool is left over size and
+        the surplus is trimmed as connections go idle.
+        """
+        self._connections.append(conn)
+        while len(self._connections) > self.pool_size:
+            idle = next(
+                (c for c in self._connections if c is not conn and c.in_flight == 0),
+                None,
+            )
+            if idle is None:
+                break
+            self._connections.remove(idle)
+            idle.abort()
+
+    def _prune_idle_connections(self) -> None:
+        """Drop connections that were closed by the server or sat idle too long."""
+        now = time.monotonic()
+        keep: List[Any] = []
+        for conn in self._connections:
+            idle_seconds = now - conn.last_used
+            if conn.is_alive and (conn.in_flight or idle_seconds <= self.max_idle):
+                keep.append(conn)
+                continue
+            logger.debug(
+                "rcon_pool_connection_recycled",
+                idle_seconds=round(idle_seconds, 1),
+                host=self.host,
+                port=self.port,
+            )
+            conn.abort()
+        # Trim a pool left over size while its connections were busy
+        surplus = len(keep) - self.pool_size
+        for conn in [c for c in keep if c.in_flight == 0][:max(0, surplus)]:
+            keep.remove(conn)
+            conn.abort()
+        self._connections = keep
+
+    async def _acquire_connection(self) -> Tuple[Any, bool]:
+        """
+        Pick the least-loaded live connection, opening one if the pool has room.
+
+        Returns:
+            (connection, reused) - reused is False for a freshly opened connection.
+        """
+        self._prune_idle_connections()
+        for conn in self._connections:
+            if conn.in_flight == 0:
+                return conn, True
+
+        if len(self._connections) < self.pool_size:
+            async with self._open_lock:
+                # Another caller may have opened one while we waited
+                self._prune_idle_connections()
+                for conn in self._connections:
+                    if conn.in_flight == 0:
+                        return conn, True
+                if len(self._connections) < self.pool_size:
+                    conn = await self._open_connection()
+                    self._add_connection(conn)
+                    return conn, False
+
+        return min(self._connections, key=lambda c: c.in_flight), True
+
+    async def _run_pooled(self, command: str) -> str:
+        """
+        Run a command on a pooled connection.
+
+        If the connection turns out to be closed before the command was
+        written, it is replaced and the command retried once. A connection
+        dropped mid-command is not retried: the server may already have run
+        it (/ban, /promote, ...).
+        """
+        conn, reused = await self._acquire_connection()
+        try:
+            return await conn.execute(command)
+        except ConnectionError as e:
+            self._discard_connection(conn)
+            if not reused or RconCommandNotSent is None or not isinstance(e, RconCommandNotSent):
+                raise
+
+            logger.info(
+                "rcon_pool_connection_stale_reconnecting",
+                host=self.host,
+                port=self.port,
+                error=str(e) or type(e).__name__,
+            )
+            conn, _ = await self._acquire_connection()
+            return await conn.execute(command)
+
+    def _discard_connection(self, conn: Any) -> None:
+        """Remove a failed connection from the pool."""
+        conn.abort()
+        if conn in self._connections:
+            self._connections.remove(conn)
+
     async def execute(self, command: str) -> str:
-        """Execute RCON command with automatic reconnect attempt."""
+        """
+        Execute RCON command with automatic reconnect attempt.
+
+        Read-only commands covered by a cache policy are answered from the
+        response cache while fresh, and identical concurrent ones share a
+        single round trip.
+        """
         if not self.connected:
             logger.warning("rcon_not_connected_attempting_immediate_reconnect")
             await self.connect()
             if not self.connected:
                 raise ConnectionError("RCON not connected - connection failed")
 
-        if RCONClient is None:
+        if AsyncRconConnection is None:
             raise ConnectionError("RCON library not available")
 
-        try:
+        policy = self.cache.policy_for(command)
+        if policy is not None:
+            return await self.cache.fetch(command, policy, self._execute)
 
-            def _execute() -> str:
-                assert RCONClient is not None
-                with RCONClient(
-                    self.host,
-                    self.port,
-                    passwd=self.password,
-                    timeout=self.timeout,
-                ) as client:
-                    return client.run(command)
+        response = await self._execute(command)
+        self.cache.observe_command(command)
+        return response
 
+    async def _execute(self, command: str) -> str:
+        """
+        Run a command on the server (no cache) once the scheduler admits it.
+
+        Raises:
+            RconDeadlineExceeded: It waited in the queue past its deadline
+        """
+        priority, deadline = current_priority()
+        async with self.scheduler.slot(priority, deadline) as queue_wait:
+            return await self._send(command, queue_wait)
+
+    async def _send(self, command: str, queue_wait: float) -> str:
+        try:
             response = await asyncio.wait_for(
-                asyncio.to_thread(_execute),
+                self._run_pooled(command),
                 timeout=self.timeout + 5.0,
             )
 
@@ -251,6 +481,7 @@ class RconClient:
                 "rcon_command_executed",
                 command=command[:50],
                 response_length=len(response) if response else 0,
+                queue_wait_ms=round(queue_wait * 1000, 1),
             )
             return response if response else ""
         except asyncio.TimeoutError:
@@ -274,48 +505,40 @@ class RconClient:
         return self.connected
 
     async def get_player_count(self) -> int:
-        """Get current online player count."""
+        """Get current online player count (from the roster while it is current)."""
+        if self.connected and self.roster.is_current():
+            return self.roster.count
         try:
-            response = await self.execute("/players")
-            logger.debug("player_count_response", response=response)
-
-            if not response:
-                return 0
-
-            lines = response.split("\n")
-            count = 0
-            for line in lines:
-                if "(online)" in line.lower():
-                    count += 1
-            return count
+            return len(await self._reconcile_roster())
         except Exception as e:
             logger.warning("failed_to_get_player_count", error=str(e))
             return -1
 
     async def get_players_online(self) -> List[str]:
-        """Get list of online player names."""
+        """Get list of online player names (from the roster while it is current)."""
+        if self.connected and self.roster.is_current():
+            return self.roster.players()
         try:
-            response = await self.execute("/players")
-            logger.debug("players_online_response", response=response)
-
-            if not response:
-                return []
-
-            players: List[str] = []
-            lines = response.split("\n")
-            for line in lines:
-                line = line.strip()
-                if "(online)" in line.lower():
-                    player_name = line.split("(online)")[0].strip()
-                    player_name = player_name.lstrip("-").strip()
-                    if player_name and not player_name.startswith("Player"):
-                        players.append(player_name)
-
-            return players
+            return await self._reconcile_roster()
         except Exception as e:
             logger.warning("failed_to_get_players", error=str(e))
             return []
 
+    async def _reconcile_roster(self) -> List[str]:
+        """
+        Query /players online and reconcile the roster with the result.
+
+        Raises:
+            Exception: The RCON command failed
+        """
+        since = self.roster.version
+        response = await self.execute(PLAYERS_ONLINE_COMMAND)
+        logger.debug("players_online_response", response=response)
+
+        players = parse_online_players(response)
+        self.roster.reconcile(players, since=since)
+        return players
+
     async def get_players(self) -> List[str]:
         """Alias for get_players_online() for compatibility."""
         return await self.get_players_online()
@@ -9,24 +9,168 @@ shared use across stats collectors and alert monitors.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import structlog
 
+try:
+    from metrics_history import RCON_RTT_METRIC, UPS_METRIC, MetricsHistory, WindowStats
+except ImportError:
+    from src.metrics_history import (  # type: ignore
+        RCON_RTT_METRIC,
+        UPS_METRIC,
+        MetricsHistory,
+        WindowStats,
+    )
+
+try:
+    from player_roster import PlayerRoster
+except ImportError:
+    from src.player_roster import PlayerRoster  # type: ignore
+
+try:
+    from rcon_scheduler import CommandPriority, admitted_at, command_priority
+except ImportError:
+    from src.rcon_scheduler import (  # type: ignore
+        CommandPriority,
+        admitted_at,
+        command_priority,
+    )
+
 logger = structlog.get_logger()
 
+# Seconds a tick sample may wait behind other commands before it is skipped
+# (a late sample skews UPS more than a missing one)
+TICK_SAMPLE_DEADLINE = 5.0
+
+TICK_COMMAND = "/sc rcon.print(game.tick)"
+
+# Round-trip time tracking for tick samples (RFC 6298 smoothing): a sample
+# whose RTT exceeds SRTT + RTT_REJECT_DEVIATIONS * RTTVAR has too uncertain
+# a timestamp and is dropped
+RTT_ALPHA = 0.125
+RTT_BETA = 0.25
+RTT_REJECT_DEVIATIONS = 4.0
+# RTT excess (seconds) never worth rejecting a sample over
+RTT_REJECT_FLOOR = 0.05
+# Samples seen before rejection starts
+RTT_WARMUP_SAMPLES = 3
+
+
+def _wire_sent_time(issued: float) -> float:
+    """
+    When a command issued at `issued` actually went out.
+
+    Time spent queued in the client's scheduler is not part of the round
+    trip, so the send stamp moves to the moment the command was admitted.
+    """
+    admitted = admitted_at()
+    if admitted is not None and admitted >= issued:
+        return admitted
+    return issued
+
+
+class TickReading(NamedTuple):
+    """A game.tick value and when (monotonic) the server most likely read it."""
+
+    tick: int
+    observed_at: float
+    rtt: float
+
+
+# Lua helper shared by the batched metrics script: JSON-quote a Lua string.
+_LUA_JSON_STR = (
+    "local function q(v) "
+    r"""return '"' .. (string.gsub(v, '[\\"]', '\\%0')) .. '"' """
+    "end; "
+)
+
+
+def build_batch_metrics_script(include_evolution: bool = True) -> str:
+    """
+    Build the single-round-trip metrics script.
+
+    The script prints one JSON object, e.g.
+    ``{"tick":3600,"players":["alice"],"evolution":{"nauvis":0.42}}``.
+    JSON is built manually because the Lua API has no table_to_json.
+
+    Args:
+        include_evolution: Include per-surface enemy evolution.
+
+    Returns:
+        /sc command string.
+    """
+    parts = [
+        "/sc ",
+        _LUA_JSON_STR,
+        "local names = {}; ",
+        "for _, p in pairs(game.connected_players) do ",
+        "  table.insert(names, q(p.name)); ",
+        "end; ",
+        "local out = '{\"tick\":' .. game.tick .. ",
+        "',\"players\":[' .. table.concat(names, ',') .. ']'; ",
+    ]
+    if include_evolution:
+        parts += [
+            "local f = game.forces['enemy']; ",
+            "local evo = {}; ",
+            "for _, s in pairs(game.surfaces) do ",
+            "  if not string.find(string.lower(s.name), 'platform') then ",
+            "    table.insert(evo, q(s.name) .. ':' .. tostring(f.get_evolution_factor(s))); ",
+            "  end ",
+            "end; ",
+            "out = out .. ',\"evolution\":{' .. table.concat(evo, ',') .. '}'; ",
+        ]
+    parts.append("rcon.print(out .. '}')")
+    return "".join(parts)
+
+
+def format_play_time(tick: int) -> str:
+    """
+    Format a game tick as map age, e.g. "1 day, 2 hours, 5 minutes, 3 seconds".
+
+    Args:
+        tick: game.tick (60 ticks per second)
+
+    Returns:
+        Human-readable play time, omitting leading zero units.
+    """
+    remaining = max(0, int(tick)) // 60
+    units = []
+    for name, size in (("day", 86400), ("hour", 3600), ("minute", 60), ("second", 1)):
+        value, remaining = divmod(remaining, size)
+        if value or units or name == "second":
+            units.append(f"{value} {name}{'' if value == 1 else 's'}")
+    return ", ".join(units)
+
 
 class UPSCalculator:
-    """Calculate actual UPS from game.tick deltas with pause detection."""
+    """
+    Calculate actual UPS from game.tick deltas with pause detection.
 
-    def __init__(self, pause_time_threshold: float = 5.0) -> None:
+    Each tick is timestamped at the midpoint of its RCON round trip (on the
+    monotonic clock), where the server most likely read it, and samples
+    whose round trip was unusually slow are rejected: their timestamp could
+    be off by up to half the RTT, which would show up as UPS jitter.
+    """
+
+    def __init__(
+        self,
+        pause_time_threshold: float = 5.0,
+        burst_samples: int = 1,
+        burst_interval: float = 0.2,
+    ) -> None:
         """
         Initialize UPS calculator.
 
         Args:
             pause_time_threshold: Seconds of 0 tick advancement to confirm pause.
+            burst_samples: Tick reads per sample_ups() call; the one with the
+                lowest RTT (most precise timestamp) is used.
+            burst_interval: Seconds between reads in a burst.
         """
         self.last_tick: Optional[int] = None
         self.last_sample_time: Optional[float] = None
@@ -37,6 +181,34 @@ class UPSCalculator:
         self.last_known_ups: Optional[float] = None
         self.pause_time_threshold = pause_time_threshold
 
+        self.burst_samples = max(1, burst_samples)
+        self.burst_interval = burst_interval
+
+        # Smoothed RTT and RTT deviation of tick samples
+        self.srtt: Optional[float] = None
+        self.rttvar: float = 0.0
+        self.rtt_samples = 0
+        self.rejected_samples = 0
+        self.last_rtt: Optional[float] = None
+        # Whether the last record_tick() call dropped its sample for its RTT
+        self.last_sample_rejected: bool = False
+
+    async def read_tick(self, rcon_client: Any) -> TickReading:
+        """
+        Query game.tick, bracketing the request with monotonic timestamps.
+
+        Raises:
+            Exception: The RCON command failed or returned a non-integer
+        """
+        # Ahead of queued commands, and skipped rather than sent late
+        with command_priority(CommandPriority.TICK, deadline=TICK_SAMPLE_DEADLINE):
+            issued = time.monotonic()
+            response = await rcon_client.execute(TICK_COMMAND)
+            received = time.monotonic()
+        sent = _wire_sent_time(issued)
+        rtt = received - sent
+        return TickReading(int(response.strip()), sent + rtt / 2, rtt)
+
     async def sample_ups(self, rcon_client: Any) -> Optional[float]:
         """
         Calculate UPS by comparing tick delta to real-time delta.
@@ -50,85 +222,143 @@ class UPSCalculator:
             UPS value, or None if first sample or paused.
         """
         try:
-            # Get current tick (silent command)
-            response = await rcon_client.execute("/sc rcon.print(game.tick)")
-            current_tick = int(response.strip())
-            current_time = time.time()
-
-            # Need at least 2 samples to calculate
-            if self.last_tick is None or self.last_sample_time is None:
-                self.last_tick = current_tick
-                self.last_sample_time = current_time
-                logger.debug("ups_first_sample_initialized", tick=current_tick)
-                return None
-
-            # Calculate deltas
-            delta_ticks = current_tick - self.last_tick
-            delta_seconds = current_time - self.last_sample_time
-
-            # PAUSE DETECTION: No ticks advanced over significant time
-            if delta_ticks == 0 and delta_seconds >= self.pause_time_threshold:
-                if not self.is_paused:
-                    logger.info(
-                        "server_paused_detected",
-                        last_tick=current_tick,
-                        delta_seconds=delta_seconds,
-                    )
-                self.is_paused = True
-                # Update time even when paused
-                self.last_sample_time = current_time
-                return None
-
-            # Minimal tick advancement (< 1 second game time over 5+ real seconds)
-            # Likely still paused or just recovering
-            if delta_ticks < 60 and delta_seconds >= self.pause_time_threshold:
-                logger.debug(
-                    "minimal_tick_advancement",
-                    delta_ticks=delta_ticks,
-                    delta_seconds=delta_seconds,
-                    likely_paused=True,
-                )
-                self.is_paused = True
-                self.last_tick = current_tick
-                self.last_sample_time = current_time
-                return None
+            reading = await self.read_tick(rcon_client)
+            for _ in range(self.burst_samples - 1):
+                await asyncio.sleep(self.burst_interval)
+                candidate = await self.read_tick(rcon_client)
+                if candidate.rtt < reading.rtt:
+                    reading = candidate
+            return self.record_tick(reading.tick, reading.observed_at, rtt=reading.rtt)
 
-            # Avoid division by zero or extremely small intervals
-            if delta_seconds < 0.1:
-                logger.warning("ups_sample_too_fast", delta_seconds=delta_seconds)
-                return self.current_ups
+        except Exception as e:
+            logger.warning("ups_calculation_failed", error=str(e))
+            return None
+
+    def _accept_rtt(self, rtt: float) -> bool:
+        """Judge a sample's RTT against the running estimate, then fold it in."""
+        accept = True
+        if self.srtt is not None and self.rtt_samples >= RTT_WARMUP_SAMPLES:
+            limit = self.srtt + max(RTT_REJECT_DEVIATIONS * self.rttvar, RTT_REJECT_FLOOR)
+            accept = rtt <= limit
+
+        # Rejected samples still update the estimate, so a lasting shift in
+        # latency is absorbed instead of rejecting every sample after it
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+        self.rtt_samples += 1
+        return accept
+
+    def record_tick(
+        self,
+        current_tick: int,
+        current_time: float,
+        rtt: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Update UPS state from an already-fetched game.tick sample.
 
-            # Normal UPS calculation
-            ups = delta_ticks / delta_seconds
+        Used directly by batched metrics collection, where the tick arrives
+        as part of a larger response instead of its own RCON command.
 
-            # UNPAUSE DETECTION: Reasonable UPS resumed
-            if self.is_paused and ups > 10.0:
+        Args:
+            current_tick: game.tick reported by the server
+            current_time: Monotonic time the tick was observed (round-trip midpoint)
+            rtt: Round-trip time of the query, if measured; samples with an
+                outlying RTT are rejected
+
+        Returns:
+            UPS value, or None if first sample, paused or rejected. A rejected
+            sample sets last_sample_rejected and leaves the baseline (and
+            pause state) unchanged.
+        """
+        self.last_sample_rejected = False
+        if rtt is not None:
+            self.last_rtt = rtt
+        if rtt is not None and not self._accept_rtt(rtt):
+            self.rejected_samples += 1
+            self.last_sample_rejected = True
+            logger.debug(
+                "ups_sample_rejected_rtt",
+                rtt_ms=round(rtt * 1000, 1),
+                srtt_ms=round((self.srtt or 0.0) * 1000, 1),
+                rttvar_ms=round(self.rttvar * 1000, 1),
+            )
+            return None
+
+        # Need at least 2 samples to calculate
+        if self.last_tick is None or self.last_sample_time is None:
+            self.last_tick = current_tick
+            self.last_sample_time = current_time
+            logger.debug("ups_first_sample_initialized", tick=current_tick)
+            return None
+
+        # Calculate deltas
+        delta_ticks = current_tick - self.last_tick
+        delta_seconds = current_time - self.last_sample_time
+
+        # PAUSE DETECTION: No ticks advanced over significant time
+        if delta_ticks == 0 and delta_seconds >= self.pause_time_threshold:
+            if not self.is_paused:
                 logger.info(
-                    "server_unpaused_detected",
-                    ups=ups,
-                    delta_ticks=delta_ticks,
+                    "server_paused_detected",
+                    last_tick=current_tick,
                     delta_seconds=delta_seconds,
                 )
-                self.is_paused = False
+            self.is_paused = True
+            # Update time even when paused
+            self.last_sample_time = current_time
+            return None
 
-            # Update state
+        # Minimal tick advancement (< 1 second game time over 5+ real seconds)
+        # Likely still paused or just recovering
+        if delta_ticks < 60 and delta_seconds >= self.pause_time_threshold:
+            logger.debug(
+                "minimal_tick_advancement",
+                delta_ticks=delta_ticks,
+                delta_seconds=delta_seconds,
+                likely_paused=True,
+            )
+            self.is_paused = True
             self.last_tick = current_tick
             self.last_sample_time = current_time
-            self.current_ups = ups
-            self.last_known_ups = ups  # Save for display during future pause
+            return None
 
-            logger.debug(
-                "ups_calculated",
+        # Avoid division by zero or extremely small intervals
+        if delta_seconds < 0.1:
+            logger.warning("ups_sample_too_fast", delta_seconds=delta_seconds)
+            return self.current_ups
+
+        # Normal UPS calculation
+        ups = delta_ticks / delta_seconds
+
+        # UNPAUSE DETECTION: Reasonable UPS resumed
+        if self.is_paused and ups > 10.0:
+            logger.info(
+                "server_unpaused_detected",
                 ups=ups,
                 delta_ticks=delta_ticks,
                 delta_seconds=delta_seconds,
-                is_paused=self.is_paused,
             )
-            return ups
-
-        except Exception as e:
-            logger.warning("ups_calculation_failed", error=str(e))
-            return None
+            self.is_paused = False
+
+        # Update state
+        self.last_tick = current_tick
+        self.last_sample_time = current_time
+        self.current_ups = ups
+        self.last_known_ups = ups  # Save for display during future pause
+
+        logger.debug(
+            "ups_calculated",
+            ups=ups,
+            delta_ticks=delta_ticks,
+            delta_seconds=delta_seconds,
+            is_paused=self.is_paused,
+        )
+        return ups
 
 
 class RconMetricsEngine:
@@ -167,8 +397,17 @@ class RconMetricsEngine:
             "pause_time_threshold",
             5.0,
         )
+        burst_samples = getattr(
+            getattr(rcon_client, "server_config", None),
+            "ups_burst_samples",
+            1,
+        )
+        if not isinstance(burst_samples, int):
+            burst_samples = 1
         self.ups_calculator: Optional[UPSCalculator] = (
-            UPSCalculator(pause_time_threshold=pause_threshold) if enable_ups_stat else None
+            UPSCalculator(pause_time_threshold=pause_threshold, burst_samples=burst_samples)
+            if enable_ups_stat
+            else None
         )
 
         # Unified EMA/SMA state (single source of truth)
@@ -180,6 +419,22 @@ class RconMetricsEngine:
         self.ema_ups: Optional[float] = None
         self._ups_samples_for_sma: List[float] = []
 
+        # Batched collection: one /sc round trip per gather_all_metrics call
+        self.batch_metrics: bool = bool(
+            getattr(
+                getattr(self.rcon_client, "server_config", None),
+                "rcon_batch_metrics",
+                True,
+            )
+        )
+        self._batch_script = build_batch_metrics_script(
+            include_evolution=enable_evolution_stat
+        )
+
+        # Fixed-memory history of every sample, for trend queries
+        self.history = MetricsHistory(server_tag=getattr(rcon_client, "server_tag", None))
+        self._rtt_samples_recorded = 0
+
         logger.info(
             "metrics_engine_initialized",
             server_tag=rcon_client.server_tag,
@@ -188,6 +443,7 @@ class RconMetricsEngine:
             enable_evolution_stat=enable_evolution_stat,
             ema_alpha=self.ema_alpha,
             pause_threshold=pause_threshold,
+            batch_metrics=self.batch_metrics,
         )
 
     async def sample_ups(self) -> Optional[float]:
@@ -195,12 +451,38 @@ class RconMetricsEngine:
         Sample current UPS with pause detection.
 
         Returns:
-            UPS value, or None if first sample or server paused.
+            UPS value, or None if first sample, server paused or the sample
+            was rejected for its RTT (nothing is recorded then).
         """
         if not self.enable_ups_stat or not self.ups_calculator:
             return None
 
-        return await self.ups_calculator.sample_ups(self.rcon_client)
+        ups = await self.ups_calculator.sample_ups(self.rcon_client)
+        self.history.record(UPS_METRIC, ups)
+        self._record_rtt()
+        return ups
+
+    def _record_rtt(self) -> None:
+        """Record the tick sample RTT in history if a new one was measured."""
+        calculator = self.ups_calculator
+        if calculator is None or calculator.rtt_samples == self._rtt_samples_recorded:
+            return
+        self._rtt_samples_recorded = calculator.rtt_samples
+        self.history.record(RCON_RTT_METRIC, calculator.last_rtt)
+
+    def get_trend(self, metric: str, seconds: float) -> Optional[WindowStats]:
+        """
+        Summarize a metric over the last `seconds` from history.
+
+        Args:
+            metric: History metric name (e.g. "ups", "player_count",
+                "evolution:nauvis", "rcon_rtt")
+            seconds: Window length
+
+        Returns:
+            Window stats, or None if no samples fall in the window.
+        """
+        return self.history.window(metric, seconds)
 
     async def get_evolution_by_surface(self) -> Dict[str, float]:
         """
@@ -288,8 +570,10 @@ class RconMetricsEngine:
         """
         Gather all metrics in one pass (UPS, evolution, players, time).
 
-        Updates internal EMA/SMA state and returns complete metrics dict.
-        Ready for direct use by formatters (no further processing needed).
+        Uses a single batched /sc script round trip when the server supports
+        it, otherwise one RCON command per metric. Updates internal EMA/SMA
+        state and returns complete metrics dict. Ready for direct use by
+        formatters (no further processing needed).
 
         Returns:
             Dict with keys: ups, ups_sma, ups_ema, is_paused, last_known_ups,
@@ -312,64 +596,22 @@ class RconMetricsEngine:
         }
 
         try:
-            # Get tick and game time
-            try:
-                response = await self.rcon_client.execute("/sc rcon.print(game.tick)")
-                metrics["tick"] = int(response.strip())
-                metrics["game_time_seconds"] = metrics["tick"] / 60.0
-            except Exception as e:
-                logger.warning("tick_collection_failed", error=str(e))
-
-            # UPS with pause detection and smoothing
-            if self.enable_ups_stat and self.ups_calculator:
-                ups = await self.ups_calculator.sample_ups(self.rcon_client)
-
-                metrics["is_paused"] = self.ups_calculator.is_paused
-                metrics["last_known_ups"] = self.ups_calculator.last_known_ups
-
-                if ups is not None:
-                    metrics["ups"] = ups
-
-                    # Update SMA window (last 5 samples)
-                    self._ups_samples_for_sma.append(ups)
-                    if len(self._ups_samples_for_sma) > 5:
-                        self._ups_samples_for_sma.pop(0)
-                    if self._ups_samples_for_sma:
-                        metrics["ups_sma"] = sum(self._ups_samples_for_sma) / len(
-                            self._ups_samples_for_sma
-                        )
-
-                    # Update EMA (exponential moving average)
-                    if self.ema_ups is None:
-                        self.ema_ups = ups
-                    else:
-                        self.ema_ups = (
-                            self.ema_alpha * ups
-                            + (1.0 - self.ema_alpha) * self.ema_ups
-                        )
-                    metrics["ups_ema"] = self.ema_ups
-                    logger.debug(
-                        "metrics_engine_ups_updated",
-                        ups=ups,
-                        ema_ups=self.ema_ups,
-                        sma_ups=metrics.get("ups_sma"),
-                        alpha=self.ema_alpha,
-                    )
-
-            # Evolution per surface
-            if self.enable_evolution_stat:
-                evolution_by_surface = await self.get_evolution_by_surface()
-                if evolution_by_surface:
-                    metrics["evolution_by_surface"] = evolution_by_surface
-                    # Backward compat: store first surface as single value
-                    metrics["evolution_factor"] = next(
-                        iter(evolution_by_surface.values())
-                    )
-
-            # Players and time
-            metrics["player_count"] = await self.get_player_count()
-            metrics["players"] = await self.get_players()
-            metrics["play_time"] = await self.get_play_time()
+            roster = getattr(self.rcon_client, "roster", None)
+            roster_version = roster.version if isinstance(roster, PlayerRoster) else None
+
+            # Bulk stats queue behind admin actions and user queries
+            with command_priority(CommandPriority.STATS):
+                batch = await self._collect_batch() if self.batch_metrics else None
+                if batch is not None:
+                    self._apply_batch(metrics, *batch)
+                    # The batch lists connected players anyway: a free reconcile
+                    if isinstance(roster, PlayerRoster):
+                        roster.reconcile(metrics["players"], since=roster_version)
+                else:
+                    await self._collect_sequential(metrics)
+
+            self.history.record_metrics(metrics)
+            self._record_rtt()
 
             logger.debug(
                 "metrics_engine_gather_complete",
@@ -383,3 +625,145 @@ class RconMetricsEngine:
             logger.warning("metrics_engine_partial_failure", error=str(e), exc_info=True)
 
         return metrics
+
+    def _update_ups_smoothing(self, metrics: Dict[str, Any], ups: float) -> None:
+        """Record a UPS sample and update SMA/EMA fields in metrics."""
+        metrics["ups"] = ups
+
+        # Update SMA window (last 5 samples)
+        self._ups_samples_for_sma.append(ups)
+        if len(self._ups_samples_for_sma) > 5:
+            self._ups_samples_for_sma.pop(0)
+        if self._ups_samples_for_sma:
+            metrics["ups_sma"] = sum(self._ups_samples_for_sma) / len(
+                self._ups_samples_for_sma
+            )
+
+        # Update EMA (exponential moving average)
+        if self.ema_ups is None:
+            self.ema_ups = ups
+        else:
+            self.ema_ups = (
+                self.ema_alpha * ups
+                + (1.0 - self.ema_alpha) * self.ema_ups
+            )
+        metrics["ups_ema"] = self.ema_ups
+        logger.debug(
+            "metrics_engine_ups_updated",
+            ups=ups,
+            ema_ups=self.ema_ups,
+            sma_ups=metrics.get("ups_sma"),
+            alpha=self.ema_alpha,
+        )
+
+    async def _collect_batch(self) -> Optional[Tuple[Dict[str, Any], TickReading]]:
+        """
+        Run the batched metrics script.
+
+        Returns:
+            Parsed script output and its timed tick reading, or None to fall
+            back to per-command collection. A response that is not the expected JSON (older
+            Factorio, modded command handling) disables batching for good;
+            transport errors only skip it for this cycle.
+        """
+        try:
+            # The batch carries the UPS tick sample, so it isn't queued as bulk stats
+            with command_priority(CommandPriority.TICK):
+                issued = time.monotonic()
+                response = await self.rcon_client.execute(self._batch_script)
+                received = time.monotonic()
+            sent = _wire_sent_time(issued)
+            rtt = received - sent
+        except Exception as e:
+            logger.warning("metrics_batch_failed", error=str(e))
+            return None
+
+        try:
+            data = json.loads(response.strip()) if response else None
+            if (
+                not isinstance(data, dict)
+                or not isinstance(data.get("tick"), int)
+                or not isinstance(data.get("players"), list)
+            ):
+                raise ValueError("unexpected batch metrics payload")
+            return data, TickReading(data["tick"], sent + rtt / 2, rtt)
+        except (ValueError, AttributeError) as e:
+            self.batch_metrics = False
+            logger.warning(
+                "metrics_batch_disabled",
+                server_tag=getattr(self.rcon_client, "server_tag", None),
+                error=str(e),
+                response=response[:200] if isinstance(response, str) else "",
+            )
+            return None
+
+    def _apply_batch(
+        self, metrics: Dict[str, Any], batch: Dict[str, Any], reading: TickReading
+    ) -> None:
+        """Fan a batched script result into the metrics dict."""
+        tick: int = batch["tick"]
+        metrics["tick"] = tick
+        metrics["game_time_seconds"] = tick / 60.0
+
+        # UPS with pause detection and smoothing
+        if self.enable_ups_stat and self.ups_calculator:
+            ups = self.ups_calculator.record_tick(tick, reading.observed_at, rtt=reading.rtt)
+
+            metrics["is_paused"] = self.ups_calculator.is_paused
+            metrics["last_known_ups"] = self.ups_calculator.last_known_ups
+
+            if ups is not None:
+                self._update_ups_smoothing(metrics, ups)
+
+        # Evolution per surface
+        evolution_by_surface = batch.get("evolution")
+        if self.enable_evolution_stat and isinstance(evolution_by_surface, dict):
+            if evolution_by_surface:
+                metrics["evolution_by_surface"] = {
+                    str(surface): float(evo) for surface, evo in evolution_by_surface.items()
+                }
+                # Backward compat: store first surface as single value
+                metrics["evolution_factor"] = next(
+                    iter(metrics["evolution_by_surface"].values())
+                )
+
+        # Players and time
+        players = [str(name) for name in batch["players"]]
+        metrics["players"] = players
+        metrics["player_count"] = len(players)
+        metrics["play_time"] = format_play_time(tick)
+
+    async def _collect_sequential(self, metrics: Dict[str, Any]) -> None:
+        """Collect metrics one RCON command at a time (batching unavailable)."""
+        # Get tick and game time
+        try:
+            response = await self.rcon_client.execute(TICK_COMMAND)
+            metrics["tick"] = int(response.strip())
+            metrics["game_time_seconds"] = metrics["tick"] / 60.0
+        except Exception as e:
+            logger.warning("tick_collection_failed", error=str(e))
+
+        # UPS with pause detection and smoothing
+        if self.enable_ups_stat and self.ups_calculator:
+            ups = await self.ups_calculator.sample_ups(self.rcon_client)
+
+            metrics["is_paused"] = self.ups_calculator.is_paused
+            metrics["last_known_ups"] = self.ups_calculator.last_known_ups
+
+            if ups is not None:
+                self._update_ups_smoothing(metrics, ups)
+
+        # Evolution per surface
+        if self.enable_evolution_stat:
+            evolution_by_surface = await self.get_evolution_by_surface()
+            if evolution_by_surface:
+                metrics["evolution_by_surface"] = evolution_by_surface
+                # Backward compat: store first surface as single value
+                metrics["evolution_factor"] = next(
+                    iter(evolution_by_surface.values())
+                )
+
+        # Players and time
+        metrics["player_count"] = await self.get_player_count()
+        metrics["players"] = await self.get_players()
+        metrics["play_time"] = await self.get_play_time()
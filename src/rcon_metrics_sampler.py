@@ -0,0 +1,228 @@
+"""
+Shared per-server metrics sampling.
+
+Provides RconMetricsSampler, which owns the single sampling cadence for a
+server and publishes immutable MetricsSnapshot objects to every consumer
+(stats collector, alert monitor, status command, presence). Consumers read
+the latest snapshot instead of issuing their own RCON queries, so EMA/SMA
+smoothing in RconMetricsEngine advances exactly once per sample.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert lists/dicts into tuples/read-only mappings."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze: produce plain mutable dicts/lists."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Immutable point-in-time metrics for one server."""
+
+    metrics: Mapping[str, Any]
+    """Read-only view of a gather_all_metrics() result."""
+
+    sequence: int
+    """Monotonically increasing sample number (1 = first sample)."""
+
+    sampled_at: float
+    """time.monotonic() when the sample completed."""
+
+    server_tag: Optional[str] = None
+
+    @classmethod
+    def capture(
+        cls,
+        metrics: Dict[str, Any],
+        sequence: int,
+        server_tag: Optional[str] = None,
+    ) -> "MetricsSnapshot":
+        """Freeze a metrics dict into a snapshot stamped with the current time."""
+        return cls(
+            metrics=_freeze(metrics),
+            sequence=sequence,
+            sampled_at=time.monotonic(),
+            server_tag=server_tag,
+        )
+
+    @property
+    def age(self) -> float:
+        """Seconds since the sample completed."""
+        return time.monotonic() - self.sampled_at
+
+    def is_fresh(self, ttl: float) -> bool:
+        """True if the snapshot is no older than ttl seconds."""
+        return self.age <= ttl
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a mutable copy of the metrics (safe to hand to formatters)."""
+        return _thaw(self.metrics)
+
+
+class RconMetricsSampler:
+    """
+    Per-server sampling scheduler publishing immutable metrics snapshots.
+
+    One background loop calls RconMetricsEngine.gather_all_metrics() every
+    interval seconds. Concurrent refresh requests share a single in-flight
+    sample, and reads within the freshness TTL never touch RCON.
+    """
+
+    def __init__(
+        self,
+        metrics_engine: Any,
+        interval: float = 60.0,
+        ttl: float = 90.0,
+    ) -> None:
+        """
+        Initialize metrics sampler.
+
+        Args:
+            metrics_engine: RconMetricsEngine owning the smoothing state
+            interval: Seconds between background samples (default: 60)
+            ttl: Max snapshot age in seconds before a read triggers a fresh
+                sample (default: 90)
+        """
+        self.metrics_engine = metrics_engine
+        self.interval = interval
+        self.ttl = ttl
+
+        self._latest: Optional[MetricsSnapshot] = None
+        self._sequence = 0
+        self._inflight: Optional[asyncio.Task[MetricsSnapshot]] = None
+
+        self.running = False
+        self.task: Optional[asyncio.Task[None]] = None
+
+        logger.info(
+            "metrics_sampler_initialized",
+            server_tag=self.server_tag,
+            interval=interval,
+            ttl=ttl,
+        )
+
+    @property
+    def server_tag(self) -> Optional[str]:
+        """Tag of the server this sampler belongs to."""
+        return getattr(getattr(self.metrics_engine, "rcon_client", None), "server_tag", None)
+
+    @property
+    def latest(self) -> Optional[MetricsSnapshot]:
+        """Most recent snapshot (any age), or None before the first sample."""
+        return self._latest
+
+    async def start(self) -> None:
+        """Start the background sampling loop."""
+        if self.running:
+            logger.warning("metrics_sampler_already_running", server_tag=self.server_tag)
+            return
+
+        self.running = True
+        self.task = asyncio.create_task(self._sampling_loop())
+        logger.info("metrics_sampler_started", server_tag=self.server_tag, interval=self.interval)
+
+    async def stop(self) -> None:
+        """Stop the sampling loop and cancel any in-flight sample."""
+        self.running = False
+        for task in (self.task, self._inflight):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self.task = None
+        self._inflight = None
+        logger.info("metrics_sampler_stopped", server_tag=self.server_tag)
+
+    async def _sampling_loop(self) -> None:
+        """Take one sample per interval until stopped."""
+        while self.running:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "metrics_sampler_sample_failed",
+                    server_tag=self.server_tag,
+                    error=str(e),
+                    exc_info=True,
+                )
+
+            if self.running:
+                await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> MetricsSnapshot:
+        """
+        Take a new sample now, joining one already in flight.
+
+        Returns:
+            The snapshot produced by the (shared) sample.
+        """
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._sample())
+        # Shield so one caller's cancellation doesn't abort the shared sample
+        return await asyncio.shield(self._inflight)
+
+    async def _sample(self) -> MetricsSnapshot:
+        """Gather metrics once and publish the snapshot."""
+        metrics = await self.metrics_engine.gather_all_metrics()
+        self._sequence += 1
+        snapshot = MetricsSnapshot.capture(metrics, self._sequence, self.server_tag)
+        self._latest = snapshot
+        logger.debug(
+            "metrics_snapshot_published",
+            server_tag=self.server_tag,
+            sequence=snapshot.sequence,
+            ups=metrics.get("ups"),
+            player_count=metrics.get("player_count"),
+        )
+        return snapshot
+
+    async def get_snapshot(self, max_age: Optional[float] = None) -> MetricsSnapshot:
+        """
+        Return the latest snapshot, sampling only if it is missing or stale.
+
+        Args:
+            max_age: Freshness bound in seconds (default: the sampler TTL)
+
+        Returns:
+            A snapshot no older than max_age.
+        """
+        ttl = self.ttl if max_age is None else max_age
+        snapshot = self._latest
+        if snapshot is not None and snapshot.is_fresh(ttl):
+            return snapshot
+
+        logger.debug(
+            "metrics_snapshot_stale_refreshing",
+            server_tag=self.server_tag,
+            age=None if snapshot is None else round(snapshot.age, 1),
+            max_age=ttl,
+        )
+        return await self.refresh()
@@ -0,0 +1,326 @@
+"""
+Native asyncio Source RCON protocol for Factorio.
+
+Speaks the Source RCON wire format directly on asyncio streams, so RCON
+commands cost no executor threads regardless of how many are in flight:
+- Authentication (SERVERDATA_AUTH / SERVERDATA_AUTH_RESPONSE)
+- Request multiplexing by packet ID over one long-lived connection
+- Multi-packet response reassembly
+- Per-command timeouts
+
+Used by RconClient (rcon_client.py) as its transport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+import time
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Packet types (Valve Source RCON protocol)
+SERVERDATA_AUTH = 3
+SERVERDATA_AUTH_RESPONSE = 2
+SERVERDATA_EXECCOMMAND = 2
+SERVERDATA_RESPONSE_VALUE = 0
+
+# Source servers split responses into packets of this payload size. Factorio
+# sends large responses as one oversized packet, which the length prefix covers.
+FRAGMENT_THRESHOLD = 4096
+MAX_PACKET_SIZE = 4 * 1024 * 1024  # sanity bound on the length prefix
+
+_HEADER = struct.Struct("<iii")  # size, request id, type
+_MAX_REQUEST_ID = 2**31 - 1
+
+
+class RconProtocolError(ConnectionError):
+    """Raised when the server sends a malformed packet."""
+
+
+class RconAuthError(ConnectionError):
+    """Raised when the server rejects the RCON password."""
+
+
+class RconCommandNotSent(ConnectionError):
+    """Raised when the connection was closed before the command was written."""
+
+
+def encode_packet(request_id: int, packet_type: int, body: str) -> bytes:
+    """
+    Encode a Source RCON packet.
+
+    Args:
+        request_id: Client-chosen packet ID echoed back by the server
+        packet_type: One of the SERVERDATA_* constants
+        body: Command or password text
+
+    Returns:
+        Wire bytes including the little-endian length prefix.
+    """
+    payload = body.encode("utf-8") + b"\x00\x00"
+    return _HEADER.pack(len(payload) + 8, request_id, packet_type) + payload
+
+
+async def read_packet(reader: asyncio.StreamReader) -> Tuple[int, int, bytes]:
+    """
+    Read one Source RCON packet.
+
+    Returns:
+        (request_id, packet_type, body) with the null terminators stripped.
+
+    Raises:
+        asyncio.IncompleteReadError: Connection closed mid-packet
+        RconProtocolError: Length prefix out of bounds
+    """
+    header = await reader.readexactly(_HEADER.size)
+    size, request_id, packet_type = _HEADER.unpack(header)
+    if size < 10 or size > MAX_PACKET_SIZE:
+        raise RconProtocolError(f"Invalid RCON packet size: {size}")
+    body = await reader.readexactly(size - 8)
+    return request_id, packet_type, body[:-2]
+
+
+class _PendingResponse:
+    """Reassembly state for one in-flight command."""
+
+    __slots__ = ("future", "chunks", "flush_handle")
+
+    def __init__(self, future: asyncio.Future[str]) -> None:
+        self.future = future
+        self.chunks: List[bytes] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class AsyncRconConnection:
+    """
+    One authenticated Source RCON connection with packet-ID multiplexing.
+
+    Any number of commands may be in flight at once; a background reader task
+    routes response packets to their waiting callers by request ID.
+
+    Responses are complete when a packet shorter than FRAGMENT_THRESHOLD
+    arrives, when the server starts answering a later request (servers reply
+    in order), or after a short grace period for a full-size final fragment.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        password: str,
+        timeout: float = 10.0,
+        fragment_grace: float = 0.05,
+    ) -> None:
+        """
+        Initialize connection state (call open() to connect).
+
+        Args:
+            host: RCON host
+            port: RCON port
+            password: RCON password
+            timeout: Seconds allowed for connect, auth, and each command
+            fragment_grace: Seconds to wait for another fragment after a
+                full-size response packet
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.fragment_grace = fragment_grace
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._pending: Dict[int, _PendingResponse] = {}
+        self._next_request_id = 0
+        self._closed = False
+        self.last_used = time.monotonic()
+
+    @classmethod
+    async def open(
+        cls,
+        host: str,
+        port: int,
+        password: str,
+        timeout: float = 10.0,
+    ) -> "AsyncRconConnection":
+        """Connect, authenticate, and start the response reader."""
+        conn = cls(host, port, password, timeout=timeout)
+        try:
+            await asyncio.wait_for(conn._connect_and_authenticate(), timeout=timeout)
+        except BaseException:
+            conn.abort()
+            raise
+        conn._reader_task = asyncio.create_task(conn._read_loop())
+        return conn
+
+    async def _connect_and_authenticate(self) -> None:
+        """Open the TCP stream and perform the SERVERDATA_AUTH handshake."""
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+        auth_id = self._allocate_request_id()
+        self._writer.write(encode_packet(auth_id, SERVERDATA_AUTH, self.password))
+        await self._writer.drain()
+
+        # Servers may send an empty RESPONSE_VALUE before the auth response
+        while True:
+            request_id, packet_type, _ = await read_packet(self._reader)
+            if packet_type == SERVERDATA_AUTH_RESPONSE:
+                break
+
+        if request_id == -1:
+            raise RconAuthError("RCON authentication failed: wrong password")
+        if request_id != auth_id:
+            raise RconProtocolError(
+                f"RCON auth response ID mismatch: expected {auth_id}, got {request_id}"
+            )
+
+        logger.debug("rcon_protocol_authenticated", host=self.host, port=self.port)
+
+    def _allocate_request_id(self) -> int:
+        """Return the next positive request ID (wraps, never -1 or 0)."""
+        self._next_request_id = self._next_request_id % _MAX_REQUEST_ID + 1
+        return self._next_request_id
+
+    @property
+    def is_alive(self) -> bool:
+        """True while the connection can accept commands."""
+        return (
+            not self._closed
+            and self._writer is not None
+            and not self._writer.is_closing()
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of commands awaiting a response."""
+        return len(self._pending)
+
+    async def execute(self, command: str) -> str:
+        """
+        Send a command and wait for its (reassembled) response.
+
+        Raises:
+            RconCommandNotSent: Connection closed before the command was written
+            ConnectionError: Connection closed during the command
+            asyncio.TimeoutError: No complete response within timeout
+        """
+        if not self.is_alive or self._writer is None:
+            raise RconCommandNotSent("RCON connection is closed")
+
+        request_id = self._allocate_request_id()
+        entry = _PendingResponse(asyncio.get_running_loop().create_future())
+        self._pending[request_id] = entry
+        self.last_used = time.monotonic()
+
+        try:
+            self._writer.write(encode_packet(request_id, SERVERDATA_EXECCOMMAND, command))
+            await self._writer.drain()
+            return await asyncio.wait_for(entry.future, timeout=self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
+            if entry.flush_handle is not None:
+                entry.flush_handle.cancel()
+            self.last_used = time.monotonic()
+
+    async def _read_loop(self) -> None:
+        """Route response packets to pending commands until the stream ends."""
+        assert self._reader is not None
+        error: Exception = ConnectionError("RCON connection closed by server")
+        try:
+            while True:
+                request_id, packet_type, body = await read_packet(self._reader)
+                self._dispatch(request_id, packet_type, body)
+        except asyncio.CancelledError:
+            error = ConnectionError("RCON connection closed")
+            raise
+        except asyncio.IncompleteReadError:
+            pass
+        except Exception as e:
+            error = e if isinstance(e, ConnectionError) else ConnectionError(str(e))
+            logger.warning(
+                "rcon_protocol_read_failed",
+                host=self.host,
+                port=self.port,
+                error=str(e),
+            )
+        finally:
+            self._closed = True
+            self._fail_pending(error)
+            if self._writer is not None:
+                self._writer.close()
+
+    def _dispatch(self, request_id: int, packet_type: int, body: bytes) -> None:
+        """Append a response packet to its command and complete finished ones."""
+        if packet_type != SERVERDATA_RESPONSE_VALUE:
+            logger.debug("rcon_protocol_unexpected_packet_type", packet_type=packet_type)
+            return
+
+        # Servers answer in order: a packet for one request completes the others
+        for other_id, other in list(self._pending.items()):
+            if other_id != request_id and other.chunks:
+                self._complete(other_id)
+
+        entry = self._pending.get(request_id)
+        if entry is None or entry.future.done():
+            logger.debug("rcon_protocol_stray_response", request_id=request_id)
+            return
+
+        entry.chunks.append(body)
+        if entry.flush_handle is not None:
+            entry.flush_handle.cancel()
+            entry.flush_handle = None
+
+        if len(body) < FRAGMENT_THRESHOLD:
+            self._complete(request_id)
+        else:
+            entry.flush_handle = asyncio.get_running_loop().call_later(
+                self.fragment_grace, self._complete, request_id
+            )
+
+    def _complete(self, request_id: int) -> None:
+        """Resolve a pending command with its accumulated payload."""
+        entry = self._pending.get(request_id)
+        if entry is None or entry.future.done():
+            return
+        if entry.flush_handle is not None:
+            entry.flush_handle.cancel()
+            entry.flush_handle = None
+        entry.future.set_result(b"".join(entry.chunks).decode("utf-8", errors="replace"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight command (connection lost)."""
+        for entry in self._pending.values():
+            if entry.flush_handle is not None:
+                entry.flush_handle.cancel()
+            if not entry.future.done():
+                entry.future.set_exception(error)
+
+    def abort(self) -> None:
+        """Close the connection immediately without waiting."""
+        self._closed = True
+        if self._reader_task is not None and not self._reader_task.done():
+            self._reader_task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+        self._fail_pending(ConnectionError("RCON connection closed"))
+
+    async def close(self) -> None:
+        """Close the connection and wait for the reader task to finish."""
+        self.abort()
+        if self._reader_task is not None:
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._writer is not None:
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
@@ -0,0 +1,263 @@
+"""
+Per-server RCON command scheduler.
+
+Bounds how many commands run on one server at once and decides who goes
+next when that limit is reached: tick samples before admin actions, admin
+actions before user queries, and bulk stats last. Within a priority class,
+the command with the earliest deadline goes first; a command still queued
+when its deadline passes fails with RconDeadlineExceeded instead of
+running late (a stale tick sample skews UPS more than a missing one).
+
+Callers don't pass a priority to RconClient.execute(); they declare it for
+a block of code with command_priority(), which also covers commands issued
+by helpers (e.g. RconMetricsEngine -> UPSCalculator). Commands issued
+outside any block run as user queries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class CommandPriority(IntEnum):
+    """Scheduling class of an RCON command (lower runs first)."""
+
+    TICK = 0
+    """Timing-critical game.tick samples (UPS)."""
+
+    ADMIN = 1
+    """Moderation and server control actions."""
+
+    QUERY = 2
+    """Interactive user queries."""
+
+    STATS = 3
+    """Bulk periodic metrics collection."""
+
+
+class RconDeadlineExceeded(TimeoutError):
+    """A command waited in the queue past its deadline and was not sent."""
+
+
+# (priority, deadline seconds) for commands issued in the current context
+_requested: contextvars.ContextVar[Optional[Tuple[CommandPriority, Optional[float]]]] = (
+    contextvars.ContextVar("rcon_command_priority", default=None)
+)
+
+# Monotonic time the last command issued in the current context left the queue
+_admitted: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "rcon_command_admitted", default=None
+)
+
+
+@contextlib.contextmanager
+def command_priority(
+    priority: CommandPriority, deadline: Optional[float] = None
+) -> Iterator[None]:
+    """
+    Run RCON commands issued inside the block at the given priority.
+
+    Args:
+        priority: Scheduling class
+        deadline: Max seconds a command may wait in the queue (None = no limit)
+    """
+    token = _requested.set((priority, deadline))
+    try:
+        yield
+    finally:
+        _requested.reset(token)
+
+
+def current_priority() -> Tuple[CommandPriority, Optional[float]]:
+    """Priority and deadline for a command issued now."""
+    requested = _requested.get()
+    if requested is None:
+        return CommandPriority.QUERY, None
+    return requested
+
+
+def admitted_at() -> Optional[float]:
+    """
+    When the last command issued in the current context was admitted.
+
+    Lets callers time only the wire round trip of a command, excluding its
+    queue wait: compare against a timestamp taken before execute() to tell
+    whether the value belongs to that command.
+    """
+    return _admitted.get()
+
+
+class _QueueStats:
+    """Queue wait statistics for one priority class."""
+
+    __slots__ = ("dispatched", "expired", "total_wait", "max_wait", "last_wait")
+
+    def __init__(self) -> None:
+        self.dispatched = 0
+        self.expired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.dispatched += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_wait = wait
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dispatched": self.dispatched,
+            "expired": self.expired,
+            "avg_wait_ms": round(self.total_wait / self.dispatched * 1000, 1)
+            if self.dispatched
+            else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+            "last_wait_ms": round(self.last_wait * 1000, 1),
+        }
+
+
+class RconScheduler:
+    """Priority queue with bounded concurrency for one server's commands."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        server_tag: Optional[str] = None,
+    ) -> None:
+        """
+        Create a scheduler.
+
+        Args:
+            max_concurrency: Commands allowed in flight at once
+            server_tag: Server label for logs
+
+        Raises:
+            ValueError: max_concurrency < 1
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        self.max_concurrency = max_concurrency
+        self.server_tag = server_tag
+        self.in_flight = 0
+
+        # (priority, deadline_at, seq, future); cancelled futures are skipped
+        self._waiters: List[Tuple[int, float, int, "asyncio.Future[None]"]] = []
+        self._seq = itertools.count()
+        self._stats = {priority: _QueueStats() for priority in CommandPriority}
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def last_wait(self, priority: CommandPriority) -> float:
+        """Queue wait (seconds) of the last dispatched command of a class."""
+        return self._stats[priority].last_wait
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self,
+        priority: CommandPriority,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[float]:
+        """
+        Wait for a free slot, hold it for the block, then pass it on.
+
+        Args:
+            priority: Scheduling class
+            deadline: Max seconds to wait for the slot (None = no limit)
+
+        Yields:
+            Seconds spent waiting in the queue.
+
+        Raises:
+            RconDeadlineExceeded: No slot became free within deadline
+        """
+        enqueued = time.monotonic()
+        if self.in_flight < self.max_concurrency and not self.queued:
+            self.in_flight += 1
+        else:
+            await self._wait(priority, deadline, enqueued)
+
+        admitted = time.monotonic()
+        _admitted.set(admitted)
+        wait = admitted - enqueued
+        self._stats[priority].record(wait)
+        try:
+            yield wait
+        finally:
+            self._release()
+
+    async def _wait(
+        self,
+        priority: CommandPriority,
+        deadline: Optional[float],
+        enqueued: float,
+    ) -> None:
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        deadline_at = float("inf") if deadline is None else enqueued + deadline
+        heapq.heappush(self._waiters, (int(priority), deadline_at, next(self._seq), future))
+
+        try:
+            if deadline is None:
+                await future
+            else:
+                await asyncio.wait_for(future, timeout=deadline)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Granted the slot in the same iteration the deadline fired
+                # (wait_for on 3.12+ raises anyway); hand it on
+                self._release()
+            self._stats[priority].expired += 1
+            logger.warning(
+                "rcon_command_deadline_exceeded",
+                server_tag=self.server_tag,
+                priority=priority.name,
+                deadline=deadline,
+                in_flight=self.in_flight,
+                queued=self.queued,
+            )
+            raise RconDeadlineExceeded(
+                f"RCON command not sent within {deadline}s ({priority.name} queue)"
+            ) from None
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Granted the slot just as we were cancelled; hand it on
+                self._release()
+            else:
+                future.cancel()
+            raise
+
+    def _release(self) -> None:
+        """Give the slot to the best waiter, or free it."""
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # The slot passes straight to the waiter; in_flight is unchanged
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "by_priority": {
+                priority.name.lower(): stats.to_dict() for priority, stats in self._stats.items()
+            },
+        }
@@ -5,7 +5,8 @@
 Periodic server statistics collection and Discord posting.
 
 Provides RconStatsCollector for scheduled stats gathering via RconMetricsEngine
-and formatted posting to Discord channels.
+(or a shared RconMetricsSampler snapshot) and formatted posting to Discord
+channels.
 """
 
 from __future__ import annotations
@@ -29,6 +30,7 @@ class RconStatsCollector:
         interval: int | float = 300,
         enable_ups_stat: bool = True,
         enable_evolution_stat: bool = True,
+        metrics_sampler: Optional[Any] = None,
     ) -> None:
         """
         Initialize stats collector.
@@ -40,6 +42,8 @@ class RconStatsCollector:
             interval: Seconds between stats collection cycles (default: 300)
             enable_ups_stat: Enable UPS collection
             enable_evolution_stat: Enable evolution factor collection
+            metrics_sampler: Optional shared RconMetricsSampler; when set, stats
+                are read from its snapshots instead of sampling directly
         """
         self.rcon_client = rcon_client
         self.discord_interface = discord_interface
@@ -57,6 +61,8 @@ class RconStatsCollector:
         else:
             self.metrics_engine = metrics_engine
 
+        self.metrics_sampler = metrics_sampler
+
         self.running = False
         self.task: Optional[asyncio.Task[None]] = None
 
@@ -66,6 +72,7 @@ class RconStatsCollector:
             rcon_connected=rcon_client.is_connected,
             discord_connected=getattr(discord_interface, "is_connected", None),
             shared_metrics_engine=metrics_engine is not None,
+            shared_metrics_sampler=metrics_sampler is not None,
         )
 
     async def start(self) -> None:
@@ -144,8 +151,15 @@ class RconStatsCollector:
             # Import formatters from bot helpers
             from bot.helpers import format_stats_embed, format_stats_text  # type: ignore[import]
 
-            # Gather all metrics via shared engine
-            metrics = await self.metrics_engine.gather_all_metrics()
+            # Read the shared snapshot, or gather directly via the engine
+            if self.metrics_sampler is not None:
+                # The sampler may run no faster than we do (alerts off): allow a
+                # full sampler period of slack so a read never forces a second gather
+                max_age = self.interval + self.metrics_sampler.interval
+                snapshot = await self.metrics_sampler.get_snapshot(max_age=max_age)
+                metrics = snapshot.to_dict()
+            else:
+                metrics = await self.metrics_engine.gather_all_metrics()
 
             logger.debug(
                 "stats_gathered",
@@ -0,0 +1,152 @@
+"""
+Load-time ReDoS classification for event patterns.
+
+Each pattern is analyzed once, when patterns are compiled, and classified by
+its worst-case backtracking behavior on Python's re engine:
+
+- SAFE: linear in practice; searched with no guard at all
+- POLYNOMIAL: several unbounded wildcard runs (e.g. ``(.+) \\((.+)\\)``)
+  that can backtrack quadratically; searched only on lines up to
+  POLYNOMIAL_MAX_INPUT characters
+- EXPONENTIAL: nested variable-length quantifiers, quantified alternation,
+  or backreferences; searched only on lines up to EXPONENTIAL_MAX_INPUT
+  characters
+
+Budgets are enforced purely by input length, so guarded searches need no
+signals or timers and parsing can run on any thread. With RE2 (linear-time
+engine) every pattern is SAFE.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Optional, Tuple
+
+try:  # Python 3.11+
+    import re._parser as sre_parse  # type: ignore[import-not-found]
+    import re._constants as sre_constants  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse  # type: ignore[no-redef]
+    import sre_constants  # type: ignore[no-redef]
+
+# Bump when classify_pattern() can return a different class for the same
+# pattern (invalidates cached analysis, see pattern_cache.py)
+ANALYSIS_VERSION = 1
+
+# Input budgets (chars) for guarded patterns
+POLYNOMIAL_MAX_INPUT = 2000
+EXPONENTIAL_MAX_INPUT = 100
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) + tuple(
+    op for op in (getattr(sre_constants, "POSSESSIVE_REPEAT", None),) if op is not None
+)
+_MAXREPEAT = sre_constants.MAXREPEAT
+_WILDCARD_OPS = (sre_constants.ANY, sre_constants.NOT_LITERAL)
+
+
+class RegexRisk(str, Enum):
+    """Worst-case backtracking class of a pattern."""
+    SAFE = "safe"
+    POLYNOMIAL = "polynomial"
+    EXPONENTIAL = "exponential"
+
+
+def _is_wildcard(item: Any) -> bool:
+    """True if a repeated item matches (almost) any character: ., [^x], [^...]."""
+    if len(item) != 1:
+        return False
+    op, av = item[0]
+    if op in _WILDCARD_OPS:
+        return True
+    if op is sre_constants.IN:
+        return any(member[0] is sre_constants.NEGATE for member in av)
+    return False
+
+
+def _children(op: Any, av: Any) -> Tuple[Any, ...]:
+    """Return the nested sub-pattern sequences of one parsed node."""
+    if op is sre_constants.SUBPATTERN:
+        return (av[-1],)
+    if op is sre_constants.BRANCH:
+        return tuple(av[1])
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        return (av[1],)
+    if op is getattr(sre_constants, "ATOMIC_GROUP", None):
+        return (av,)
+    if op is sre_constants.GROUPREF_EXISTS:
+        return tuple(branch for branch in av[1:] if branch is not None)
+    return ()
+
+
+def _scan(items: Any, inside_repeat: bool) -> Tuple[bool, int]:
+    """
+    Walk a parsed pattern.
+
+    Args:
+        items: Parsed sub-pattern sequence
+        inside_repeat: True when enclosed by a repeat that can run more than once
+
+    Returns:
+        (exponential_risk, count_of_unbounded_wildcard_runs)
+    """
+    exponential = False
+    wildcards = 0
+
+    for op, av in items:
+        if op in _REPEATS:
+            min_count, max_count, item = av
+            repeats_many = max_count == _MAXREPEAT or max_count > 1
+            variable = min_count != max_count
+
+            if inside_repeat and repeats_many and variable:
+                exponential = True
+            if max_count == _MAXREPEAT and _is_wildcard(item):
+                wildcards += 1
+
+            inner_exp, inner_wild = _scan(item, inside_repeat or repeats_many)
+            exponential = exponential or inner_exp
+            wildcards += inner_wild
+        elif op is sre_constants.GROUPREF:
+            exponential = True
+        else:
+            if op is sre_constants.BRANCH and inside_repeat:
+                exponential = True
+            for child in _children(op, av):
+                inner_exp, inner_wild = _scan(child, inside_repeat)
+                exponential = exponential or inner_exp
+                wildcards += inner_wild
+
+    return exponential, wildcards
+
+
+def classify_pattern(pattern: str) -> RegexRisk:
+    """
+    Classify a regex source by worst-case backtracking risk.
+
+    Args:
+        pattern: Regex source string
+
+    Returns:
+        RegexRisk for the pattern. Sources Python can't parse are treated
+        as EXPONENTIAL (they shouldn't compile anyway).
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return RegexRisk.EXPONENTIAL
+
+    exponential, wildcards = _scan(parsed, inside_repeat=False)
+    if exponential:
+        return RegexRisk.EXPONENTIAL
+    if wildcards >= 2:
+        return RegexRisk.POLYNOMIAL
+    return RegexRisk.SAFE
+
+
+def input_budget(risk: RegexRisk) -> Optional[int]:
+    """Max line length a pattern of this risk may be searched on (None = unlimited)."""
+    if risk is RegexRisk.EXPONENTIAL:
+        return EXPONENTIAL_MAX_INPUT
+    if risk is RegexRisk.POLYNOMIAL:
+        return POLYNOMIAL_MAX_INPUT
+    return None
@@ -10,17 +10,36 @@ Provides:
 """
 
 from __future__ import annotations
+import asyncio
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Deque, Dict, List, Optional, Any, Tuple
 import json
 import os
 import re
+import time
 import structlog
 
+try:
+    from .infraction_store import InfractionStore
+    from .pattern_matcher import required_literals
+except ImportError:
+    from infraction_store import InfractionStore  # type: ignore[no-redef]
+    from pattern_matcher import required_literals  # type: ignore[no-redef]
+
 logger = structlog.get_logger()
 
+# Seconds between sweeps that drop rate-limit state for idle players
+RATE_LIMIT_SWEEP_INTERVAL = 60.0
+
+# Ban-list changes within this many seconds are written to disk together
+BAN_SAVE_DEBOUNCE_SECONDS = 0.5
+
+# Minimum seconds between checks of the ban-list file for external edits
+BAN_LIST_RELOAD_INTERVAL = 5.0
+
 # Security pattern definitions
 MALICIOUS_PATTERNS = {
     "code_injection": {
@@ -134,6 +153,9 @@ class SecurityMonitor:
         self.infractions_file.parent.mkdir(parents=True, exist_ok=True)
         self.banned_players_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Segmented infraction log with per-player offset index
+        self.infraction_store = InfractionStore(self.infractions_file)
+
         # Compile malicious patterns
         self.compiled_patterns: Dict[str, Dict[str, Any]] = {}
         self._compile_security_patterns()
@@ -141,8 +163,17 @@ class SecurityMonitor:
         # Load banned players
         self.banned_players: set[str] = self._load_banned_players()
 
-        # Rate limiting state: {action_type: [(timestamp, player), ...]}
-        self.rate_limit_state: Dict[str, List[Tuple[datetime, str]]] = {}
+        # Ban-list persistence: debounced off-loop writes, reload on external edits
+        self._ban_file_signature = self._ban_file_stat()
+        self._next_ban_reload_check = time.monotonic() + BAN_LIST_RELOAD_INTERVAL
+        self._ban_list_dirty = False
+        self._ban_save_handle: Optional[asyncio.TimerHandle] = None
+        self._ban_save_task: Optional[asyncio.Task[None]] = None
+
+        # Rate limiting state: {action_type: {player: deque of monotonic timestamps}}
+        # Each deque holds at most max_events entries (the newest allowed events)
+        self.rate_limit_state: Dict[str, Dict[str, Deque[float]]] = {}
+        self._next_rate_limit_sweep = time.monotonic() + RATE_LIMIT_SWEEP_INTERVAL
 
         # Rate limit configurations
         self.rate_limits: Dict[str, RateLimit] = {
@@ -173,9 +204,14 @@ class SecurityMonitor:
         )
 
     def _compile_security_patterns(self) -> None:
-        """Compile all malicious patterns."""
+        """Compile all malicious patterns and their literal anchor scanners."""
+        all_anchors: set[str] = set()
+        unanchored = False
+
         for pattern_type, config in MALICIOUS_PATTERNS.items():
             compiled = []
+            anchors: set[str] = set()
+            category_unanchored = False
             for pattern_str in config["patterns"]:
                 try:
                     compiled.append(re.compile(pattern_str, re.IGNORECASE))
@@ -188,19 +224,59 @@ class SecurityMonitor:
                     )
                     continue
 
+                anchor = self._select_anchor(pattern_str)
+                if anchor is not None:
+                    anchors.add(anchor)
+                else:
+                    category_unanchored = True
+
             self.compiled_patterns[pattern_type] = {
                 "patterns": compiled,
                 "severity": config["severity"],
                 "auto_ban": config["auto_ban"],
                 "description": config["description"],
+                # None: some pattern has no anchor, so the category is always searched
+                "anchor": None if category_unanchored else self._compile_anchor_scan(anchors),
             }
+            all_anchors |= anchors
+            unanchored = unanchored or category_unanchored
 
             logger.debug(
                 "security_patterns_compiled",
                 type=pattern_type,
                 count=len(compiled),
+                anchors=len(anchors),
             )
 
+        self._anchor_scan = None if unanchored else self._compile_anchor_scan(all_anchors)
+
+    @staticmethod
+    def _select_anchor(pattern_str: str) -> Optional[str]:
+        """Pick the required literal least likely to occur in ordinary chat.
+
+        Long literals come first; among short ones, punctuation ("|", "$(")
+        is far rarer in chat than letters ("sh").
+        """
+        literals = required_literals(pattern_str, min_length=1)
+        if not literals:
+            return None
+        return max(
+            literals,
+            key=lambda lit: (len(lit) >= 3, not lit.isalnum(), len(lit)),
+        )
+
+    @staticmethod
+    def _compile_anchor_scan(anchors: set[str]) -> re.Pattern[str]:
+        """Compile one case-insensitive alternation over literal anchors.
+
+        Matching with the regex engine's own IGNORECASE folding keeps the
+        prefilter exact for every text the full patterns could match.
+        """
+        alternatives = sorted(anchors, key=lambda a: (-len(a), a))
+        if not alternatives:
+            return re.compile(r"(?!)")
+        return re.compile("|".join(re.escape(a) for a in alternatives), re.IGNORECASE)
+
     def _load_banned_players(self) -> set[str]:
         """Load banned players from file."""
         if not self.banned_players_file.exists():
@@ -226,24 +302,133 @@ class SecurityMonitor:
             )
             return set()
 
-    def _save_banned_players(self) -> None:
-        """Save banned players to file."""
+    def _ban_file_stat(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the ban-list file, or None if missing."""
         try:
-            with open(self.banned_players_file, "w", encoding="utf-8") as f:
+            st = os.stat(self.banned_players_file)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _save_banned_players(self, players: Optional[List[str]] = None) -> bool:
+        """Atomically write the ban list (temp file + rename).
+
+        Safe to run in a worker thread when given a snapshot of players.
+
+        Returns:
+            True if the file was written.
+        """
+        if players is None:
+            players = list(self.banned_players)
+
+        tmp_path = self.banned_players_file.with_name(self.banned_players_file.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(
                     {
-                        "banned_players": sorted(list(self.banned_players)),
+                        "banned_players": sorted(players),
                         "last_updated": datetime.now().isoformat(),
                     },
                     f,
                     indent=2,
                 )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.banned_players_file)
         except Exception as exc:
             logger.error(
                 "failed_to_save_banned_players",
                 error=str(exc),
                 file=str(self.banned_players_file),
             )
+            return False
+
+        # Our own write must not look like an external edit
+        self._ban_file_signature = self._ban_file_stat()
+        return True
+
+    def _persist_banned_players(self) -> None:
+        """Record a ban-list change and schedule it to be written.
+
+        Inside an event loop the write is debounced and runs in a worker
+        thread, so a wave of auto-bans costs one file write and never blocks
+        log processing. Without a running loop it is written immediately.
+        """
+        self._ban_list_dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._ban_list_dirty = False
+            self._save_banned_players()
+            return
+
+        save_in_flight = self._ban_save_task is not None and not self._ban_save_task.done()
+        if self._ban_save_handle is None and not save_in_flight:
+            self._ban_save_handle = loop.call_later(
+                BAN_SAVE_DEBOUNCE_SECONDS, self._start_ban_save
+            )
+
+    def _start_ban_save(self) -> None:
+        """Debounce timer callback: write the current ban list off the loop."""
+        self._ban_save_handle = None
+        if not self._ban_list_dirty:
+            return
+        self._ban_list_dirty = False
+        self._ban_save_task = asyncio.get_running_loop().create_task(
+            self._write_banned_players(list(self.banned_players))
+        )
+
+    async def _write_banned_players(self, players: List[str]) -> None:
+        await asyncio.to_thread(self._save_banned_players, players)
+        logger.debug("banned_players_saved", count=len(players))
+
+        # Changes made while this write was in flight get their own write
+        if self._ban_list_dirty and self._ban_save_handle is None:
+            self._ban_save_handle = asyncio.get_running_loop().call_later(
+                BAN_SAVE_DEBOUNCE_SECONDS, self._start_ban_save
+            )
+
+    async def flush_ban_list(self) -> None:
+        """Write any pending ban-list changes now (call before shutdown)."""
+        if self._ban_save_handle is not None:
+            self._ban_save_handle.cancel()
+            self._ban_save_handle = None
+        if self._ban_save_task is not None and not self._ban_save_task.done():
+            await self._ban_save_task
+        # The finished write may have scheduled a follow-up; do it now instead
+        if self._ban_save_handle is not None:
+            self._ban_save_handle.cancel()
+            self._ban_save_handle = None
+        if self._ban_list_dirty:
+            self._ban_list_dirty = False
+            await asyncio.to_thread(self._save_banned_players, list(self.banned_players))
+
+    def _maybe_reload_banned_players(self) -> None:
+        """Reload the ban list if the file was edited externally (throttled)."""
+        now = time.monotonic()
+        if now < self._next_ban_reload_check:
+            return
+        self._next_ban_reload_check = now + BAN_LIST_RELOAD_INTERVAL
+
+        # Pending local changes win; they are about to overwrite the file
+        save_in_flight = self._ban_save_task is not None and not self._ban_save_task.done()
+        if self._ban_list_dirty or self._ban_save_handle is not None or save_in_flight:
+            return
+
+        signature = self._ban_file_stat()
+        if signature == self._ban_file_signature:
+            return
+        self._ban_file_signature = signature
+
+        previous = self.banned_players
+        self.banned_players = self._load_banned_players()
+        logger.info(
+            "banned_players_reloaded",
+            file=str(self.banned_players_file),
+            added=len(self.banned_players - previous),
+            removed=len(previous - self.banned_players),
+            total_banned=len(self.banned_players),
+        )
 
     def check_malicious_pattern(
         self,
@@ -263,15 +448,22 @@ class SecurityMonitor:
             return None
 
         # Check if player is already banned
-        if player_name in self.banned_players:
+        if self.is_banned(player_name):
             logger.debug(
                 "blocked_banned_player",
                 player=player_name,
             )
             return None
 
-        # Check each pattern type
+        # One pass over the text: clean chat contains none of the anchors
+        if self._anchor_scan is not None and self._anchor_scan.search(text) is None:
+            return None
+
+        # Check each pattern type whose anchors appear in the text
         for pattern_type, config in self.compiled_patterns.items():
+            anchor = config.get("anchor")
+            if anchor is not None and anchor.search(text) is None:
+                continue
             for pattern in config["patterns"]:
                 match = pattern.search(text)
                 if match:
@@ -308,10 +500,9 @@ class SecurityMonitor:
         return None
 
     def _log_infraction(self, infraction: Infraction) -> None:
-        """Append infraction to JSONL log file."""
+        """Append infraction to the JSONL infraction store."""
         try:
-            with open(self.infractions_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(infraction.to_dict()) + "\n")
+            self.infraction_store.append(infraction.to_dict())
         except Exception as exc:
             logger.error(
                 "failed_to_log_infraction",
@@ -327,7 +518,7 @@ class SecurityMonitor:
             return
 
         self.banned_players.add(player_name)
-        self._save_banned_players()
+        self._persist_banned_players()
 
         logger.warning(
             "player_banned",
@@ -345,13 +536,14 @@ class SecurityMonitor:
             return False
 
         self.banned_players.remove(player_name)
-        self._save_banned_players()
+        self._persist_banned_players()
 
         logger.info("player_unbanned", player=player_name)
         return True
 
     def is_banned(self, player_name: str) -> bool:
         """Check if a player is banned."""
+        self._maybe_reload_banned_players()
         return player_name in self.banned_players
 
     def check_rate_limit(
@@ -372,66 +564,70 @@ class SecurityMonitor:
             return True, None
 
         limit = self.rate_limits[action_type]
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=limit.time_window_seconds)
-
-        if action_type not in self.rate_limit_state:
-            self.rate_limit_state[action_type] = []
-
-        # Remove entries outside the window
-        self.rate_limit_state[action_type] = [
-            (ts, player)
-            for ts, player in self.rate_limit_state[action_type]
-            if ts > cutoff
-        ]
-
-        player_events = [
-            ts
-            for ts, player in self.rate_limit_state[action_type]
-            if player == player_name
-        ]
-
-        if len(player_events) >= limit.max_events:
+        now = time.monotonic()
+
+        if now >= self._next_rate_limit_sweep:
+            self._sweep_rate_limit_state(now)
+
+        players = self.rate_limit_state.setdefault(action_type, {})
+        events = players.get(player_name)
+        if events is None:
+            events = players[player_name] = deque(maxlen=limit.max_events)
+
+        # The deque is full and its oldest entry is still inside the window,
+        # so max_events events already happened within time_window_seconds
+        if len(events) >= limit.max_events and now - events[0] < limit.time_window_seconds:
             reason = (
-                f"Rate limit exceeded: {len(player_events)}/{limit.max_events} "
+                f"Rate limit exceeded: {len(events)}/{limit.max_events} "
                 f"{action_type} events in {limit.time_window_seconds}s"
             )
             logger.warning(
                 "rate_limit_exceeded",
                 player=player_name,
                 action_type=action_type,
-                count=len(player_events),
+                count=len(events),
                 limit=limit.max_events,
                 window=limit.time_window_seconds,
             )
             return False, reason
 
-        self.rate_limit_state[action_type].append((now, player_name))
+        events.append(now)
         return True, None
 
+    def _sweep_rate_limit_state(self, now: float) -> None:
+        """Drop players whose newest event has left the window for its action type."""
+        removed = 0
+        for action_type, players in self.rate_limit_state.items():
+            limit = self.rate_limits.get(action_type)
+            window = limit.time_window_seconds if limit is not None else 0
+            idle = [
+                player
+                for player, events in players.items()
+                if not events or now - events[-1] >= window
+            ]
+            for player in idle:
+                del players[player]
+            removed += len(idle)
+
+        self._next_rate_limit_sweep = now + RATE_LIMIT_SWEEP_INTERVAL
+        if removed:
+            logger.debug("rate_limit_state_swept", removed=removed)
+
     def get_infractions(
         self,
         player_name: Optional[str] = None,
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
-        """Retrieve recent infractions (most recent first)."""
-        if not self.infractions_file.exists():
-            return []
+        """Retrieve recent infractions (most recent first).
 
-        infractions: List[Dict[str, Any]] = []
+        Only the returned records are read, via the store's offset index.
+        """
         try:
-            with open(self.infractions_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    infraction = json.loads(line)
-                    if player_name is None or infraction.get("player_name") == player_name:
-                        infractions.append(infraction)
+            return self.infraction_store.recent(player_name=player_name, limit=limit)
         except Exception as exc:
             logger.error(
                 "failed_to_load_infractions",
                 error=str(exc),
                 file=str(self.infractions_file),
             )
-
-        return infractions[-limit:][::-1]
+            return []
@@ -6,8 +6,9 @@
 Multi-server RCON management for Factorio ISR.
 
 Manages multiple RconClient instances, their stats collectors, and alert monitors.
-Provides unified metrics engine access for on-demand (status command) and periodic
-(stats collector) consumers.
+Provides unified metrics engine access and a per-server metrics sampler whose
+snapshots are shared by on-demand (status command, presence) and periodic
+(stats collector, alert monitor) consumers.
 """
 
 from __future__ import annotations
@@ -19,12 +20,18 @@ import structlog
 
 try:
     from .config import ServerConfig
-    from .rcon_client import RconClient, RconStatsCollector, RconAlertMonitor
+    from .rcon_client import RconClient
+    from .rcon_alert_monitor import RconAlertMonitor
     from .rcon_metrics_engine import RconMetricsEngine
+    from .rcon_metrics_sampler import MetricsSnapshot, RconMetricsSampler
+    from .rcon_stats_collector import RconStatsCollector
 except ImportError:
     from config import ServerConfig
-    from rcon_client import RconClient, RconStatsCollector, RconAlertMonitor
+    from rcon_client import RconClient
+    from rcon_alert_monitor import RconAlertMonitor
     from rcon_metrics_engine import RconMetricsEngine
+    from rcon_metrics_sampler import MetricsSnapshot, RconMetricsSampler
+    from rcon_stats_collector import RconStatsCollector
 
 if TYPE_CHECKING:
     from discord_interface import DiscordInterface  # Use interface, not bot
@@ -46,6 +53,7 @@ class ServerManager:
         self.servers: Dict[str, ServerConfig] = {}  # {tag: ServerConfig}
         self.clients: Dict[str, RconClient] = {}  # {tag: RconClient}
         self.metrics_engines: Dict[str, RconMetricsEngine] = {}  # {tag: MetricsEngine} ✨
+        self.metrics_samplers: Dict[str, RconMetricsSampler] = {}  # {tag: Sampler}
         self.stats_collectors: Dict[str, RconStatsCollector] = {}  # {tag: Collector}
         self.alert_monitors: Dict[str, RconAlertMonitor] = {}  # {tag: AlertMonitor}
 
@@ -63,7 +71,7 @@ class ServerManager:
             ValueError: If tag already exists
             ConnectionError: If RCON connection fails
         """
-        if config.tag in self.clients:
+        if config.tag in self.servers:
             raise ValueError(f"Server '{config.tag}' already exists")
 
         logger.info(
@@ -81,15 +89,19 @@ class ServerManager:
                 host=config.rcon_host,
                 port=config.rcon_port,
                 password=config.rcon_password,
+                pool_size=getattr(config, "rcon_pool_size", 2),
+                max_concurrency=getattr(config, "rcon_max_concurrency", 4),
             ).use_context(
                 server_name=config.name,
                 server_tag=config.tag,
             )
 
+            # Register the config before connecting so servers added
+            # concurrently keep their servers.yml order in list_servers()
+            self.servers[config.tag] = config
+
             await client.start()
 
-            # Store server config and client
-            self.servers[config.tag] = config
             self.clients[config.tag] = client
 
             # Start stats collectors immediately unless deferred
@@ -128,6 +140,15 @@ class ServerManager:
                     pass
                 del self.stats_collectors[config.tag]
 
+            if config.tag in self.metrics_samplers:
+                try:
+                    await self.metrics_samplers[config.tag].stop()
+                except Exception:
+                    pass
+                del self.metrics_samplers[config.tag]
+
+            self.metrics_engines.pop(config.tag, None)
+
             if config.tag in self.clients:
                 try:
                     await self.clients[config.tag].stop()
@@ -166,6 +187,22 @@ class ServerManager:
         # ✨ Get or create shared metrics engine for this server
         metrics_engine = self.get_metrics_engine(tag)
 
+        # One sampling cadence per server, fast enough for the most frequent consumer
+        collector_enabled = bool(config.enable_stats_collector and config.event_channel_id)
+        alerts_enabled = bool(getattr(config, 'enable_alerts', True))
+        intervals = []
+        if collector_enabled:
+            intervals.append(config.stats_interval)
+        if alerts_enabled:
+            intervals.append(getattr(config, 'alert_check_interval', 60))
+
+        metrics_sampler: Optional[RconMetricsSampler] = None
+        if intervals:
+            metrics_sampler = self.get_metrics_sampler(tag)
+            if metrics_sampler is not None:
+                metrics_sampler.interval = min(intervals)
+                await metrics_sampler.start()
+
         # Create stats collector if enabled and channel configured
         if config.enable_stats_collector and config.event_channel_id:
             # Create a per-server interface bound to this server's channel
@@ -175,6 +212,7 @@ class ServerManager:
                 rcon_client=client,
                 discord_interface=server_interface,
                 metrics_engine=metrics_engine,  # ✨ Pass shared engine
+                metrics_sampler=metrics_sampler,
                 interval=config.stats_interval,
                 enable_ups_stat=config.enable_ups_stat,
                 enable_evolution_stat=config.enable_evolution_stat,
@@ -211,6 +249,8 @@ class ServerManager:
             alert_monitor = RconAlertMonitor(
                 rcon_client=client,
                 discord_interface=alert_interface,
+                metrics_engine=metrics_engine,
+                metrics_sampler=metrics_sampler,
                 check_interval=getattr(config, 'alert_check_interval', 60),
                 samples_before_alert=getattr(config, 'alert_samples_required', 3),
                 ups_warning_threshold=getattr(config, 'ups_warning_threshold', 55.0),
@@ -262,6 +302,14 @@ class ServerManager:
                 logger.warning("failed_to_stop_stats_collector", tag=tag, error=str(e))
             del self.stats_collectors[tag]
 
+        # Stop metrics sampler
+        if tag in self.metrics_samplers:
+            try:
+                await self.metrics_samplers[tag].stop()
+            except Exception as e:
+                logger.warning("failed_to_stop_metrics_sampler", tag=tag, error=str(e))
+            del self.metrics_samplers[tag]
+
         # Stop RCON client
         try:
             await self.clients[tag].stop()
@@ -327,9 +375,8 @@ class ServerManager:
         the same instance (singleton per server), ensuring unified metrics state.
         
         Used by:
-        - Status command (on-demand queries)
-        - Stats collector (periodic background)
-        - Future alert monitors
+        - Metrics sampler (the only caller of gather_all_metrics at runtime)
+        - Stats collector and alert monitor (shared state, via the sampler)
         
         This is the single entry point for all metrics across server, ensuring:
         - UPS calculated once per gather call
@@ -376,6 +423,65 @@ class ServerManager:
         
         return self.metrics_engines[tag]
 
+    def get_metrics_sampler(self, tag: str) -> Optional[RconMetricsSampler]:
+        """
+        Get or create the shared metrics sampler for a server.
+
+        The sampler wraps the server's metrics engine. It is started by
+        start_stats_for_server(); when no periodic consumer is configured it
+        stays idle and only samples on demand, bounded by its TTL.
+
+        Args:
+            tag: Server tag
+
+        Returns:
+            RconMetricsSampler instance, or None if server doesn't exist
+        """
+        if tag not in self.metrics_samplers:
+            metrics_engine = self.get_metrics_engine(tag)
+            if metrics_engine is None:
+                return None
+
+            config = self.servers[tag]
+            self.metrics_samplers[tag] = RconMetricsSampler(
+                metrics_engine,
+                interval=getattr(config, "alert_check_interval", 60),
+                ttl=getattr(config, "metrics_snapshot_ttl", 90),
+            )
+
+        return self.metrics_samplers[tag]
+
+    async def get_metrics_snapshot(self, tag: str) -> Optional[MetricsSnapshot]:
+        """
+        Get a fresh metrics snapshot for a server without extra RCON work.
+
+        Returns the sampler's cached snapshot when it is within the TTL and
+        only samples (once, shared by concurrent callers) when it is stale.
+
+        Args:
+            tag: Server tag
+
+        Returns:
+            MetricsSnapshot, or None if server doesn't exist
+        """
+        sampler = self.get_metrics_sampler(tag)
+        if sampler is None:
+            return None
+        return await sampler.get_snapshot()
+
+    def get_latest_snapshots(self) -> Dict[str, MetricsSnapshot]:
+        """
+        Get cached snapshots that are still fresh, without sampling.
+
+        Returns:
+            Dictionary of {tag: MetricsSnapshot}
+        """
+        return {
+            tag: sampler.latest
+            for tag, sampler in self.metrics_samplers.items()
+            if sampler.latest is not None and sampler.latest.is_fresh(sampler.ttl)
+        }
+
     def get_collector(self, tag: str) -> RconStatsCollector:
         """
         Get stats collector for a specific server.
@@ -450,6 +556,33 @@ class ServerManager:
             for tag, client in self.clients.items()
         }
 
+    def observe_event(self, event: Any) -> None:
+        """
+        Feed a parsed log event to its server's player roster and RCON cache.
+
+        Called in log order by the event pipeline's parse stage (before any
+        delivery shedding), so join/leave events are never lost or reordered.
+
+        Args:
+            event: FactorioEvent with server_tag set
+        """
+        client = self.clients.get(event.server_tag)
+        if client is not None:
+            client.roster.apply_event(event)
+            client.cache.observe_event(event)
+
+    def mark_roster_stale(self, tag: str, reason: str) -> None:
+        """
+        Force a /players online reconcile for a server's roster.
+
+        Args:
+            tag: Server tag
+            reason: Why join/leave events may have been missed (for logs)
+        """
+        client = self.clients.get(tag)
+        if client is not None:
+            client.roster.mark_stale(reason)
+
     def get_alert_states(self) -> Dict[str, Dict[str, Any]]:
         """
         Get alert states for all servers.
@@ -472,8 +605,14 @@ class ServerManager:
             except Exception as e:
                 logger.error("failed_to_remove_server", tag=tag, error=str(e))
 
-        # ✨ Clean up all metrics engines
+        # ✨ Clean up all metrics engines (and any sampler left behind)
+        for tag, sampler in list(self.metrics_samplers.items()):
+            try:
+                await sampler.stop()
+            except Exception as e:
+                logger.warning("failed_to_stop_metrics_sampler", tag=tag, error=str(e))
         self.metrics_engines.clear()
+        self.metrics_samplers.clear()
         logger.info("metrics_engines_cleaned_up")
 
         logger.info("all_servers_stopped")
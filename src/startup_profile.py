@@ -0,0 +1,175 @@
+"""
+Startup profiling for `python -m src.main --profile-startup`.
+
+Records how long each module took to import (the same self/cumulative
+microsecond columns as `python -X importtime`) and when each startup phase
+ran relative to process start, so overlapping phases are visible. The
+report is written to stderr once the application is running.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.abc
+import sys
+import threading
+import time
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence
+
+PROFILE_FLAG = "--profile-startup"
+
+# Slowest imports included in the summary log event
+SUMMARY_IMPORTS = 10
+
+
+class ImportTiming(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class PhaseTiming(NamedTuple):
+    name: str
+    start_ms: float
+    duration_ms: float
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module() and delegates everything else."""
+
+    def __init__(self, loader: Any, name: str, timer: "ImportTimer") -> None:
+        self._loader = loader
+        self._name = name
+        self._timer = timer
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self._timer._run(self._name, self._loader.exec_module, module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that times every module executed while installed.
+
+    Only imports on the installing thread are timed; imports from worker
+    threads load normally.
+    """
+
+    def __init__(self) -> None:
+        self.timings: List[ImportTiming] = []
+        # Time spent in nested imports, one slot per import in progress
+        self._children: List[float] = []
+        self._thread_id = threading.get_ident()
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        if threading.get_ident() != self._thread_id:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname, self)
+        return spec
+
+    def _run(self, name: str, exec_module: Any, module: Any) -> None:
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            # Recorded on completion, i.e. in the order importtime prints
+            self.timings.append(
+                ImportTiming(
+                    name=name,
+                    self_us=int((elapsed - children) * 1_000_000),
+                    cumulative_us=int(elapsed * 1_000_000),
+                    depth=len(self._children),
+                )
+            )
+
+
+class StartupProfiler:
+    """Import timer plus wall-clock timings of named startup phases."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.imports = ImportTimer()
+        self.phases: List[PhaseTiming] = []
+        self.ready_ms: Optional[float] = None
+
+    @classmethod
+    def from_argv(cls, argv: Sequence[str]) -> Optional["StartupProfiler"]:
+        """Start profiling (including imports) if the flag is on the command line."""
+        if PROFILE_FLAG not in argv[1:]:
+            return None
+        profiler = cls()
+        profiler.imports.install()
+        return profiler
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase; phases may run concurrently."""
+        start_ms = self._elapsed_ms()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                PhaseTiming(name, round(start_ms, 1), round(self._elapsed_ms() - start_ms, 1))
+            )
+
+    def mark_ready(self) -> None:
+        """Record time-to-ready and stop timing imports."""
+        self.ready_ms = round(self._elapsed_ms(), 1)
+        self.imports.uninstall()
+
+    def slowest_imports(self, limit: int = SUMMARY_IMPORTS) -> List[ImportTiming]:
+        """Imports with the largest cumulative time, slowest first."""
+        return sorted(self.imports.timings, key=lambda t: t.cumulative_us, reverse=True)[:limit]
+
+    def format_report(self) -> str:
+        """Render the import table (importtime layout) followed by the phases."""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for timing in self.imports.timings:
+            lines.append(
+                f"import time: {timing.self_us:>9} | {timing.cumulative_us:>10} | "
+                f"{'  ' * timing.depth}{timing.name}"
+            )
+
+        lines.append("")
+        lines.append("startup phase: start [ms] | duration [ms] | phase")
+        for phase in sorted(self.phases, key=lambda p: p.start_ms):
+            lines.append(f"startup phase: {phase.start_ms:>10.1f} | {phase.duration_ms:>13.1f} | {phase.name}")
+        if self.ready_ms is not None:
+            lines.append(f"startup phase: {self.ready_ms:>10.1f} | {'':>13} | ready")
+        return "\n".join(lines)
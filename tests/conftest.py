@@ -286,6 +286,8 @@ def mock_server_manager() -> MagicMock:
         }
     )
     manager.get_metrics_engine: Callable[[], MagicMock] = MagicMock(return_value=metrics_engine)
+    # No cached snapshot: status falls back to the metrics engine
+    manager.get_metrics_snapshot: AsyncMock = AsyncMock(return_value=None)
     
     return manager
 
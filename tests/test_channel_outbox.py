@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from bot.channel_outbox import DISCORD_MESSAGE_LIMIT, ChannelOutbox, pack_messages
+
+
+class RecordingChannel:
+    """Channel stand-in recording sent content."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.id = 123
+        self.delay = delay
+        self.sent: List[str] = []
+
+    async def send(self, content: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(content)
+
+
+# ============================================================================
+# PACKING TESTS
+# ============================================================================
+
+
+class TestPackMessages:
+    """Test merging lines into Discord-sized messages."""
+
+    def test_merges_in_order(self) -> None:
+        assert pack_messages(["a", "b", "c"]) == ["a\nb\nc"]
+
+    def test_splits_at_limit(self) -> None:
+        lines = ["x" * 900, "y" * 900, "z" * 900]
+        messages = pack_messages(lines)
+
+        assert messages == ["x" * 900 + "\n" + "y" * 900, "z" * 900]
+        assert all(len(m) <= DISCORD_MESSAGE_LIMIT for m in messages)
+
+    def test_oversized_line_sent_alone(self) -> None:
+        big = "x" * (DISCORD_MESSAGE_LIMIT + 10)
+        assert pack_messages(["a", big, "b"]) == ["a", big, "b"]
+
+
+# ============================================================================
+# OUTBOX TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+class TestChannelOutbox:
+    """Test coalescing, latency bounds and ordering."""
+
+    async def test_idle_channel_sends_immediately(self) -> None:
+        channel = RecordingChannel()
+        outbox = ChannelOutbox(channel, coalesce_window=0.05)
+
+        assert await outbox.submit("first") is True
+        assert channel.sent == ["first"]
+
+    async def test_burst_is_coalesced_into_one_call(self) -> None:
+        channel = RecordingChannel()
+        outbox = ChannelOutbox(channel, coalesce_window=0.05, max_latency=1.0)
+
+        await outbox.submit("join 0")
+        for i in range(1, 30):
+            assert await outbox.submit(f"join {i}") is False
+
+        await asyncio.sleep(0.15)
+
+        assert channel.sent[0] == "join 0"
+        assert channel.sent[1:] == ["\n".join(f"join {i}" for i in range(1, 30))]
+        assert outbox.api_calls == 2
+        assert outbox.messages_in == 30
+
+    async def test_max_latency_caps_debounce(self) -> None:
+        """A steady trickle can't postpone a flush beyond max_latency."""
+        channel = RecordingChannel()
+        outbox = ChannelOutbox(channel, coalesce_window=0.05, max_latency=0.1)
+
+        await outbox.submit("first")
+        for i in range(10):
+            await outbox.submit(f"chat {i}")
+            await asyncio.sleep(0.03)
+
+        assert len(channel.sent) >= 3  # immediate + at least two capped flushes
+        await outbox.close()
+        assert "\n".join(channel.sent).split("\n") == ["first"] + [f"chat {i}" for i in range(10)]
+
+    async def test_messages_buffered_during_slow_send_keep_order(self) -> None:
+        channel = RecordingChannel(delay=0.05)
+        outbox = ChannelOutbox(channel, coalesce_window=0.01)
+
+        first = asyncio.create_task(outbox.submit("a"))
+        await asyncio.sleep(0.01)
+        await outbox.submit("b")
+        await outbox.submit("c")
+        await first
+        await outbox.close()
+
+        assert channel.sent == ["a", "b\nc"]
+
+    async def test_full_buffer_flushes_without_waiting(self) -> None:
+        channel = RecordingChannel()
+        outbox = ChannelOutbox(channel, coalesce_window=10.0, max_latency=10.0)
+
+        await outbox.submit("first")
+        await outbox.submit("x" * 1500)
+        await outbox.submit("y" * 600)
+        await asyncio.sleep(0.01)
+
+        assert channel.sent == ["first", "x" * 1500, "y" * 600]
+        assert outbox.pending == 0
+
+    async def test_close_flushes_pending(self) -> None:
+        channel = RecordingChannel()
+        outbox = ChannelOutbox(channel, coalesce_window=10.0, max_latency=10.0)
+
+        await outbox.submit("a")
+        await outbox.submit("b")
+        assert outbox.pending == 1
+
+        await outbox.close()
+        assert channel.sent == ["a", "b"]
+
+    async def test_immediate_send_errors_propagate(self) -> None:
+        class FailingChannel(RecordingChannel):
+            async def send(self, content: str) -> None:
+                raise RuntimeError("boom")
+
+        outbox = ChannelOutbox(FailingChannel(), coalesce_window=0.05)
+        with pytest.raises(RuntimeError):
+            await outbox.submit("a")
+
+    async def test_coalesced_send_errors_are_logged_not_raised(self) -> None:
+        channel = RecordingChannel()
+        outbox = ChannelOutbox(channel, coalesce_window=10.0)
+        await outbox.submit("a")
+        await outbox.submit("b")
+
+        async def fail(content: str) -> None:
+            raise RuntimeError("boom")
+
+        channel.send = fail  # type: ignore[method-assign]
+        await outbox.close()
+        assert outbox.pending == 0
+
+
+# ============================================================================
+# BACKPRESSURE TESTS
+# ============================================================================
+
+
+class TestOutboxBackpressure:
+    """A slow channel pushes back instead of buffering without limit."""
+
+    async def test_submit_waits_when_buffer_full(self) -> None:
+        channel = RecordingChannel(delay=0.2)
+        outbox = ChannelOutbox(channel, coalesce_window=0.01, max_buffered_chars=DISCORD_MESSAGE_LIMIT)
+
+        first = asyncio.create_task(outbox.submit("a"))
+        await asyncio.sleep(0.01)
+        await outbox.submit("x" * DISCORD_MESSAGE_LIMIT)
+
+        blocked = asyncio.create_task(outbox.submit("b"))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        assert outbox.pending == 1
+
+        await first
+        await asyncio.wait_for(blocked, timeout=1.0)
+        await outbox.close()
+        assert channel.sent == ["a", "x" * DISCORD_MESSAGE_LIMIT, "b"]
+
+    async def test_slow_channel_lets_delivery_queue_shed(self) -> None:
+        """With Discord stalled, the pipeline's delivery queue fills and sheds chat."""
+        from event_parser import EventType, FactorioEvent
+        from event_pipeline import EventPipeline
+
+        channel = RecordingChannel(delay=10.0)
+        outbox = ChannelOutbox(channel, coalesce_window=0.01, max_buffered_chars=DISCORD_MESSAGE_LIMIT)
+
+        def parse(line: str, server_tag: str) -> FactorioEvent:
+            return FactorioEvent(event_type=EventType.CHAT, message=line, raw_line=line, server_tag=server_tag)
+
+        async def deliver(event: FactorioEvent) -> bool:
+            await outbox.submit(event.message or "")
+            return True
+
+        pipeline = EventPipeline(parse, deliver, queue_size=5, delivery_workers=1)
+        await pipeline.start()
+        for i in range(200):
+            await pipeline.submit(f"chat {i} " + "y" * 100, "prod")
+        await asyncio.wait_for(pipeline.parse_queue.join(), timeout=1.0)
+
+        assert pipeline.dropped.get("chat", 0) > 0
+        assert outbox._buffer_chars <= outbox.max_buffered_chars + 200
+
+        await pipeline.stop(drain_timeout=0)
+        if outbox._flush_task is not None:
+            outbox._flush_task.cancel()
@@ -304,6 +304,8 @@ def mock_server_manager() -> MagicMock:
         }
     )
     manager.get_metrics_engine = MagicMock(return_value=metrics_engine)
+    # No cached snapshot: status falls back to the metrics engine
+    manager.get_metrics_snapshot = AsyncMock(return_value=None)
     return manager
 
 
@@ -399,6 +401,47 @@ class TestStatusCommandHandlerCoverageGaps:
         assert result.success is True
         mock_embed_builder.create_base_embed.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_status_uses_shared_metrics_snapshot(
+        self,
+        mock_interaction: MagicMock,
+        mock_user_context: MagicMock,
+        mock_cooldown: MagicMock,
+        mock_embed_builder: MagicMock,
+        mock_server_manager: MagicMock,
+        mock_rcon_monitor: MagicMock,
+    ) -> None:
+        """Coverage: Status reads the cached snapshot instead of polling RCON.
+
+        Coverage:
+            - server_manager.get_metrics_snapshot() path
+            - metrics_engine.gather_all_metrics() not called
+        """
+        from rcon_metrics_sampler import MetricsSnapshot
+
+        mock_user_context.get_rcon_for_user.return_value = MagicMock(is_connected=True)
+        metrics_engine = MagicMock()
+        metrics_engine.gather_all_metrics = AsyncMock()
+        mock_server_manager.get_metrics_engine.return_value = metrics_engine
+        mock_server_manager.get_metrics_snapshot = AsyncMock(
+            return_value=MetricsSnapshot.capture(
+                {"ups": 60.0, "player_count": 1, "players": ["Alice"], "play_time": "1h"},
+                sequence=1,
+            )
+        )
+
+        handler = StatusCommandHandler(
+            user_context=mock_user_context,
+            server_manager=mock_server_manager,
+            cooldown=mock_cooldown,
+            embed_builder=mock_embed_builder,
+            rcon_monitor=mock_rcon_monitor,
+        )
+
+        result = await handler.execute(mock_interaction)
+        assert result.success is True
+        metrics_engine.gather_all_metrics.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_status_with_paused_server(
         self,
@@ -241,6 +241,46 @@ class TestPlayersCommandHandler:
         assert "Failed to get players" in result.error_embed.description
 
 
+    @pytest.mark.asyncio
+    async def test_players_from_current_roster(self, mock_interaction, mock_rcon_client):
+        """Test: a current roster answers without an RCON round trip."""
+        from player_roster import PlayerRoster
+
+        mock_rcon_client.roster = PlayerRoster("prod")
+        mock_rcon_client.roster.reconcile(["Alice", "Bob"])
+        handler = PlayersCommandHandler(
+            user_context_provider=DummyUserContext(rcon_client=mock_rcon_client),
+            rate_limiter=DummyRateLimiter(is_limited=False),
+            embed_builder_type=EmbedBuilder,
+        )
+
+        result = await handler.execute(mock_interaction)
+
+        assert result.success is True
+        assert "(2)" in result.embed.fields[0].name
+        mock_rcon_client.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_players_stale_roster_is_reconciled(self, mock_interaction, mock_rcon_client):
+        """Test: a stale roster is refreshed from /players online."""
+        from player_roster import PlayerRoster
+
+        mock_rcon_client.roster = PlayerRoster("prod")
+        mock_rcon_client.execute.return_value = "Online players (1):\n  Alice (online)"
+        handler = PlayersCommandHandler(
+            user_context_provider=DummyUserContext(rcon_client=mock_rcon_client),
+            rate_limiter=DummyRateLimiter(is_limited=False),
+            embed_builder_type=EmbedBuilder,
+        )
+
+        result = await handler.execute(mock_interaction)
+
+        assert result.success is True
+        mock_rcon_client.execute.assert_awaited_once_with("/players online")
+        assert mock_rcon_client.roster.is_current()
+        assert mock_rcon_client.roster.players() == ["Alice"]
+
+
 # ════════════════════════════════════════════════════
 # VERSION COMMAND HANDLER TESTS
 # ════════════════════════════════════════════════════
@@ -429,6 +429,30 @@ class TestServerConfig:
                 rcon_password="pass",
             )
 
+    def test_validates_ups_burst_samples(self) -> None:
+        """ServerConfig should reject a non-positive ups_burst_samples."""
+        with pytest.raises(ValueError, match="ups_burst_samples must be > 0"):
+            ServerConfig(
+                tag="bad",
+                name="Bad",
+                rcon_host="localhost",
+                rcon_port=27015,
+                rcon_password="pass",
+                ups_burst_samples=0,
+            )
+
+    def test_validates_rcon_max_concurrency(self) -> None:
+        """ServerConfig should reject a non-positive rcon_max_concurrency."""
+        with pytest.raises(ValueError, match="rcon_max_concurrency must be > 0"):
+            ServerConfig(
+                tag="bad",
+                name="Bad",
+                rcon_host="localhost",
+                rcon_port=27015,
+                rcon_password="pass",
+                rcon_max_concurrency=0,
+            )
+
     def test_validates_empty_password(self) -> None:
         """ServerConfig should reject empty RCON password."""
         with pytest.raises(ValueError, match="RCON password cannot be empty"):
@@ -619,6 +643,62 @@ class TestConfigDataclass:
                 log_format="invalid_format",
             )
 
+    def test_validates_invalid_log_watch_mode(self) -> None:
+        """Config should validate log_watch_mode."""
+        server = ServerConfig(
+            tag="test",
+            name="Test",
+            rcon_host="localhost",
+            rcon_port=27015,
+            rcon_password="pass",
+        )
+
+        with pytest.raises(ValueError, match="Invalid log_watch_mode"):
+            Config(
+                discord_bot_token="token",
+                servers={"test": server},
+                log_watch_mode="fanotify",
+            )
+
+        config = Config(
+            discord_bot_token="token",
+            servers={"test": server},
+            log_watch_mode="POLL",
+        )
+        assert config.log_watch_mode == "poll"
+
+    def test_validates_event_pipeline_bounds(self) -> None:
+        """Config should reject non-positive event queue size and worker count."""
+        server = ServerConfig(
+            tag="test",
+            name="Test",
+            rcon_host="localhost",
+            rcon_port=27015,
+            rcon_password="pass",
+        )
+
+        with pytest.raises(ValueError, match="event_queue_size"):
+            Config(discord_bot_token="token", servers={"test": server}, event_queue_size=0)
+
+        with pytest.raises(ValueError, match="event_delivery_workers"):
+            Config(discord_bot_token="token", servers={"test": server}, event_delivery_workers=0)
+
+    def test_validates_pattern_reload_interval(self) -> None:
+        """Config should reject a negative pattern reload interval (0 disables)."""
+        server = ServerConfig(
+            tag="test",
+            name="Test",
+            rcon_host="localhost",
+            rcon_port=27015,
+            rcon_password="pass",
+        )
+
+        with pytest.raises(ValueError, match="pattern_reload_interval"):
+            Config(discord_bot_token="token", servers={"test": server}, pattern_reload_interval=-1)
+
+        config = Config(discord_bot_token="token", servers={"test": server}, pattern_reload_interval=0)
+        assert config.pattern_reload_interval == 0
+
     def test_accepts_all_valid_log_levels(self) -> None:
         """Config should accept all valid log levels."""
         server = ServerConfig(
@@ -851,7 +931,7 @@ class TestLoadConfig:
 
         monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "token")
-        for var in ["HEALTH_CHECK_HOST", "HEALTH_CHECK_PORT", "LOG_LEVEL", "LOG_FORMAT"]:
+        for var in ["HEALTH_CHECK_HOST", "HEALTH_CHECK_PORT", "LOG_LEVEL", "LOG_FORMAT", "LOG_WATCH_MODE", "LOG_CHECKPOINT_FILE", "LOG_CATCHUP_RATE", "EVENT_QUEUE_SIZE", "EVENT_DELIVERY_WORKERS", "PATTERN_RELOAD_INTERVAL", "PATTERN_CACHE_FILE"]:
             monkeypatch.delenv(var, raising=False)
 
         config = load_config()
@@ -860,6 +940,13 @@ class TestLoadConfig:
         assert config.health_check_port == 8080  # default
         assert config.log_level == "info"  # default
         assert config.log_format == "console"  # default
+        assert config.log_watch_mode == "auto"  # default
+        assert config.log_checkpoint_file == Path("config") / "log_checkpoints.json"  # default
+        assert config.log_catchup_rate == 200.0  # default
+        assert config.event_queue_size == 1000  # default
+        assert config.event_delivery_workers == 4  # default
+        assert config.pattern_reload_interval == 5.0  # default
+        assert config.pattern_cache_file == Path("config") / "pattern_cache.json"  # default
 
     def test_loads_multiple_servers(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
         """load_config should load multiple server configurations."""
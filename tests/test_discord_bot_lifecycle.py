@@ -114,6 +114,39 @@ class TestConnectionLifecyclePaths:
         bot._send_connection_notification.assert_awaited_once()
         assert bot._connected is True
 
+    @pytest.mark.asyncio
+    async def test_connect_bot_waits_for_expected_server_manager(self) -> None:
+        """Notification and RCON monitoring wait until the ServerManager is wired."""
+        bot = DiscordBot(token="test-token")
+        bot.login = AsyncMock()
+        bot.connect = AsyncMock()
+        bot.rcon_monitor = AsyncMock()
+        bot.presence_manager = AsyncMock()
+        bot._send_connection_notification = AsyncMock()
+        bot._ready.set()
+
+        bot.expect_server_manager()
+        connect = asyncio.create_task(bot.connect_bot())
+        await asyncio.sleep(0.01)
+
+        assert bot._connected is True
+        assert not connect.done()
+        bot._send_connection_notification.assert_not_awaited()
+        bot.rcon_monitor.start.assert_not_awaited()
+
+        bot.set_server_manager(MagicMock())
+        await asyncio.wait_for(connect, timeout=1)
+
+        bot._send_connection_notification.assert_awaited_once()
+        bot.rcon_monitor.start.assert_awaited_once()
+
+    def test_expect_server_manager_noop_when_already_set(self) -> None:
+        """A bot that already has a ServerManager connects without waiting."""
+        bot = DiscordBot(token="test-token")
+        bot.set_server_manager(MagicMock())
+        bot.expect_server_manager()
+        assert bot._server_manager_wired is None
+
     @pytest.mark.asyncio
     async def test_connect_bot_login_failure(self) -> None:
         """Connect bot with LoginFailure should raise ConnectionError."""
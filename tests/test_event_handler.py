@@ -918,5 +918,42 @@ class TestMemberFinding:
         assert found.id == 111  # Exact match preferred
 
 
+
+# ========================================================================
+# COALESCING TESTS
+# ========================================================================
+
+
+class TestSendEventCoalescing:
+    """Test per-channel outbox batching in send_event."""
+
+    @pytest.mark.asyncio
+    async def test_burst_for_one_channel_is_merged(self) -> None:
+        """Events arriving right after a send share one Discord message."""
+        bot = MockBot()
+        channel = bot._channels[123]
+        handler = EventHandler(bot, coalesce_window=10.0, max_latency=10.0)
+
+        with patch("bot.event_handler.discord.TextChannel", MockTextChannel), \
+             patch("event_parser.FactorioEventFormatter.format_for_discord", side_effect=["a", "b", "c"]):
+            for _ in range(3):
+                assert await handler.send_event(MockEvent()) is True
+
+        assert channel.messages_sent == ["a"]
+        await handler.flush()
+        assert channel.messages_sent == ["a", "b\nc"]
+
+    @pytest.mark.asyncio
+    async def test_outbox_is_per_channel(self) -> None:
+        """Each channel gets its own outbox."""
+        bot = MockBot()
+        handler = EventHandler(bot)
+        a = handler._get_outbox(1, MockTextChannel(1))
+        b = handler._get_outbox(2, MockTextChannel(2))
+
+        assert a is not b
+        assert handler._get_outbox(1, MockTextChannel(1)) is a
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
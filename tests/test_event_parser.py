@@ -573,6 +573,75 @@ class TestEventParserReloadPatterns:
         mock_pattern_loader.reload.assert_called_once()
 
 
+class TestEventParserRefreshPatterns:
+    """Test hot reload via EventParser.refresh_patterns."""
+
+    @staticmethod
+    def write_patterns(path: Path, events: Dict[str, Any]) -> None:
+        import os
+        import yaml
+
+        existed = path.exists()
+        old_mtime = path.stat().st_mtime_ns if existed else 0
+        path.write_text(yaml.dump({"events": events}), encoding="utf-8")
+        if existed:
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, max(st.st_mtime_ns, old_mtime + 1_000_000_000)))
+
+    @pytest.fixture
+    def patterns_dir(self, tmp_path: Path) -> Path:
+        directory = tmp_path / "patterns"
+        directory.mkdir()
+        self.write_patterns(
+            directory / "vanilla.yml",
+            {"join": {"pattern": r"\[JOIN\] (?P<player>\w+) joined", "type": "join"}},
+        )
+        return directory
+
+    @pytest.mark.asyncio
+    async def test_new_file_picked_up(self, patterns_dir: Path) -> None:
+        parser = EventParser(patterns_dir, security_monitor=MagicMock(is_banned=Mock(return_value=False)))
+        join_regex = parser.compiled_patterns["join"][0]
+        assert parser.parse_line("[MOD] rocket launched") is None
+
+        self.write_patterns(
+            patterns_dir / "mod.yml",
+            {"mod_rocket": {"pattern": r"\[MOD\] rocket launched", "type": "milestone"}},
+        )
+        assert await parser.refresh_patterns() is True
+
+        event = parser.parse_line("[MOD] rocket launched")
+        assert event is not None and event.event_type == EventType.MILESTONE
+        # Unchanged patterns keep their compiled regex
+        assert parser.compiled_patterns["join"][0] is join_regex
+
+        assert await parser.refresh_patterns() is False
+
+    @pytest.mark.asyncio
+    async def test_table_swapped_only_when_complete(self, patterns_dir: Path) -> None:
+        parser = EventParser(patterns_dir, security_monitor=MagicMock(is_banned=Mock(return_value=False)))
+        old_table = parser.compiled_patterns
+        seen_during_build = []
+
+        real_build = parser._build_pattern_table
+
+        def observing_build(patterns):
+            seen_during_build.append(parser.compiled_patterns)
+            return real_build(patterns)
+
+        parser._build_pattern_table = observing_build  # type: ignore[method-assign]
+        self.write_patterns(
+            patterns_dir / "vanilla.yml",
+            {"join": {"pattern": r"\[JOIN\] (?P<player>\w+) arrived", "type": "join"}},
+        )
+        assert await parser.refresh_patterns() is True
+
+        assert seen_during_build == [old_table]
+        assert parser.compiled_patterns is not old_table
+        assert parser.parse_line("[JOIN] Alice arrived") is not None
+        assert parser.parse_line("[JOIN] Alice joined") is None
+
+
 # ============================================================================
 # FactorioEventFormatter Tests
 # ============================================================================
@@ -740,30 +809,10 @@ class TestEventParserIntegration:
             assert "TestPlayer" in result
 
 # ============================================================================
-# Tests for timeout_handler, _safe_regex_search, check_rate_limit_for_event,
+# Tests for _safe_regex_search, check_rate_limit_for_event,
 # and _create_security_alert_event
 # ============================================================================
 
-class TestTimeoutHandler:
-    """Test timeout_handler signal handler function."""
-    
-    def test_timeout_handler_raises_timeout_error(self):
-        """timeout_handler should raise TimeoutError when called."""
-        from event_parser import timeout_handler, TimeoutError
-        
-        with pytest.raises(TimeoutError, match="Regex match exceeded timeout"):
-            timeout_handler(None, None)
-    
-    def test_timeout_handler_with_signum_and_frame(self):
-        """timeout_handler should work with actual signal arguments."""
-        from event_parser import timeout_handler, TimeoutError
-        import signal
-        
-        # Simulate signal handler call with real signal arguments
-        with pytest.raises(TimeoutError):
-            timeout_handler(signal.SIGALRM, None)
-
-
 class TestSafeRegexSearch:
     """Test _safe_regex_search with various conditions."""
     
@@ -788,14 +837,13 @@ class TestSafeRegexSearch:
         
         assert result is None
     
-    def test_safe_regex_search_stdlib_timeout_path(self, event_parser):
-        """Timeout on stdlib regex should be caught and return None (RE2 not installed)."""
-        from event_parser import TimeoutError as EventParserTimeoutError
-        
-        # Since RE2 is not installed, test the stdlib path
+    def test_risky_pattern_skips_lines_over_budget(self, event_parser):
+        """Exponential-risk patterns are only searched on short lines."""
+        from regex_guard import EXPONENTIAL_MAX_INPUT, RegexRisk
+
         pattern_obj = EventPattern(
-            name="test",
-            pattern=r".*",
+            name="risky",
+            pattern=r"^(\w+\s?)+!$",
             event_type="chat",
             emoji="",
             message_template="",
@@ -803,19 +851,50 @@ class TestSafeRegexSearch:
             enabled=True,
             priority=1
         )
-        
-        # Mock the compiled regex to raise TimeoutError
-        mock_regex = Mock()
-        mock_regex.search.side_effect = EventParserTimeoutError("Regex match exceeded timeout")
-        
-        result = event_parser._safe_regex_search(mock_regex, "test line", "test_pattern")
-        assert result is None
-    
-    def test_safe_regex_search_no_signal_alarm_windows(self, event_parser):
-        """signal.alarm unavailable (Windows) should use untimed fallback."""
+
+        event_parser.pattern_loader.get_patterns.return_value = [pattern_obj]
+        event_parser._compile_patterns()
+        regex, _ = event_parser.compiled_patterns["risky"]
+
+        assert event_parser.pattern_risks["risky"] is RegexRisk.EXPONENTIAL
+        assert event_parser._safe_regex_search(regex, "hello world!", "risky") is not None
+
+        # Classic catastrophic input: would backtrack for minutes unguarded
+        evil = "a" * (EXPONENTIAL_MAX_INPUT + 1)
+        assert event_parser._safe_regex_search(regex, evil, "risky") is None
+
+    def test_over_budget_skips_are_counted_and_warned_once(self, event_parser):
+        """Skipped lines show up in get_stats(); the warning is rate-limited."""
+        from regex_guard import EXPONENTIAL_MAX_INPUT
+
         pattern_obj = EventPattern(
-            name="test",
-            pattern=r"test",
+            name="risky",
+            pattern=r"^(\w+\s?)+!$",
+            event_type="chat",
+            priority=1
+        )
+        event_parser.pattern_loader.get_patterns.return_value = [pattern_obj]
+        event_parser._compile_patterns()
+        regex, _ = event_parser.compiled_patterns["risky"]
+        evil = "a" * (EXPONENTIAL_MAX_INPUT + 1)
+
+        with patch("event_parser.logger") as mock_logger:
+            for _ in range(3):
+                event_parser._safe_regex_search(regex, evil, "risky")
+
+        warnings = [
+            c for c in mock_logger.warning.call_args_list if c.args[0] == "regex_input_over_budget"
+        ]
+        assert len(warnings) == 1
+        assert event_parser.get_stats()["over_budget_skips"] == {"risky": 3}
+
+    def test_safe_pattern_has_no_budget(self, event_parser):
+        """SAFE patterns are searched regardless of line length."""
+        from regex_guard import RegexRisk
+
+        pattern_obj = EventPattern(
+            name="safe",
+            pattern=r"^\[CHAT\] (\w+): (.+)$",
             event_type="chat",
             emoji="",
             message_template="",
@@ -823,18 +902,27 @@ class TestSafeRegexSearch:
             enabled=True,
             priority=1
         )
-        
+
         event_parser.pattern_loader.get_patterns.return_value = [pattern_obj]
         event_parser._compile_patterns()
-        regex, _ = event_parser.compiled_patterns["test"]
-        
-        # Mock signal to raise AttributeError (simulating Windows)
-        with patch('signal.signal', side_effect=AttributeError("No SIGALRM on Windows")):
-            with patch('signal.alarm', side_effect=AttributeError("No alarm on Windows")):
-                result = event_parser._safe_regex_search(regex, "test line", "test")
-                # Should still work, using fallback path
-                assert result is not None
-    
+        regex, _ = event_parser.compiled_patterns["safe"]
+
+        assert event_parser.pattern_risks["safe"] is RegexRisk.SAFE
+        line = "[CHAT] Alice: " + "x" * 10000
+        assert event_parser._safe_regex_search(regex, line, "safe") is not None
+
+    async def test_parse_line_works_off_main_thread(self, event_parser, mock_event_pattern):
+        """Guarded search needs no signals, so parsing works in worker threads."""
+        import asyncio
+
+        event_parser.pattern_loader.get_patterns.return_value = [mock_event_pattern]
+        event_parser._compile_patterns()
+
+        event = await asyncio.to_thread(event_parser.parse_line, "TestPlayer joined", "prod")
+
+        assert event is not None
+        assert event.player_name == "TestPlayer"
+
     def test_safe_regex_search_unexpected_exception(self, event_parser):
         """Unexpected exceptions should be caught and logged."""
         mock_regex = Mock()
@@ -890,30 +978,6 @@ class TestSafeRegexSearch:
         
         # Invalid pattern should not be compiled
         assert "invalid" not in event_parser.compiled_patterns
-    
-    def test_safe_regex_search_signal_handling_success(self, event_parser, mock_event_pattern):
-        """Successful match with signal handling should return match and clear alarm."""
-        import signal
-        
-        event_parser.pattern_loader.get_patterns.return_value = [mock_event_pattern]
-        event_parser._compile_patterns()
-        
-        regex, _ = event_parser.compiled_patterns["test_pattern"]
-        
-        # Track that alarm was cleared
-        alarm_calls = []
-        
-        def mock_alarm(seconds):
-            alarm_calls.append(seconds)
-        
-        with patch('signal.alarm', side_effect=mock_alarm):
-            with patch('signal.signal'):
-                result = event_parser._safe_regex_search(regex, "TestPlayer joined", "test_pattern")
-        
-        # Should have match
-        assert result is not None
-        # Should have set alarm and then cleared it (0)
-        assert 0 in alarm_calls
 
 
 class TestCheckRateLimitForEvent:
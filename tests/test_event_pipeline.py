@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from event_parser import EventType, FactorioEvent
+from event_pipeline import (
+    SECURITY_ALERT_PRIORITY,
+    EventPipeline,
+    SheddingQueue,
+    event_priority,
+)
+
+
+def make_event(
+    event_type: EventType, message: str = "", server_tag: str = "prod", **metadata
+) -> FactorioEvent:
+    return FactorioEvent(
+        event_type=event_type,
+        player_name="Alice",
+        message=message,
+        raw_line=message,
+        metadata=metadata,
+        server_tag=server_tag,
+    )
+
+
+def parse_stub(line: str, server_tag: str) -> Optional[FactorioEvent]:
+    """'<type>:<message>' -> event; anything else is not an event."""
+    kind, sep, message = line.partition(":")
+    if not sep:
+        return None
+    return make_event(EventType(kind), message, server_tag)
+
+
+# ============================================================================
+# PRIORITY / SHEDDING TESTS
+# ============================================================================
+
+
+class TestEventPriority:
+    """Test shedding priorities."""
+
+    def test_chat_sheds_before_joins_and_research(self) -> None:
+        chat = event_priority(make_event(EventType.CHAT))
+        assert chat < event_priority(make_event(EventType.JOIN))
+        assert chat < event_priority(make_event(EventType.RESEARCH))
+        assert chat < event_priority(make_event(EventType.MENTION))
+
+    def test_security_alerts_rank_highest(self) -> None:
+        alert = make_event(EventType.SERVER, infraction={"severity": "critical"})
+        assert event_priority(alert) == SECURITY_ALERT_PRIORITY
+
+
+class TestSheddingQueue:
+    """Test non-blocking bounded queue with priority shedding."""
+
+    def test_offer_below_capacity_drops_nothing(self) -> None:
+        queue = SheddingQueue(2, event_priority)
+        assert queue.offer(make_event(EventType.CHAT)) is None
+        assert queue.qsize() == 1
+
+    def test_full_queue_evicts_oldest_lowest_priority(self) -> None:
+        queue = SheddingQueue(3, event_priority)
+        old_chat = make_event(EventType.CHAT, "old")
+        join = make_event(EventType.JOIN)
+        new_chat = make_event(EventType.CHAT, "new")
+        for event in (old_chat, join, new_chat):
+            queue.offer(event)
+
+        research = make_event(EventType.RESEARCH)
+        dropped = queue.offer(research)
+
+        assert dropped is old_chat
+        assert list(queue._queue) == [join, new_chat, research]
+
+    def test_incoming_dropped_when_everything_outranks_it(self) -> None:
+        queue = SheddingQueue(2, event_priority)
+        queue.offer(make_event(EventType.JOIN))
+        queue.offer(make_event(EventType.RESEARCH))
+
+        chat = make_event(EventType.CHAT)
+        assert queue.offer(chat) is chat
+        assert queue.qsize() == 2
+
+    def test_shedding_keeps_task_accounting(self) -> None:
+        queue = SheddingQueue(1, event_priority)
+        queue.offer(make_event(EventType.CHAT))
+        queue.offer(make_event(EventType.JOIN))
+
+        queue.get_nowait()
+        queue.task_done()
+        with pytest.raises(ValueError):
+            queue.task_done()
+
+
+# ============================================================================
+# PIPELINE TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+class TestEventPipeline:
+    """Test staged ingest -> parse -> route -> deliver."""
+
+    async def test_delivers_parsed_events(self) -> None:
+        delivered: List[FactorioEvent] = []
+
+        async def deliver(event: FactorioEvent) -> bool:
+            delivered.append(event)
+            return True
+
+        pipeline = EventPipeline(parse_stub, deliver, delivery_workers=2)
+        await pipeline.start()
+        for line in ("join:a", "noise", "chat:b", "leave:c"):
+            await pipeline.submit(line, "prod")
+        await pipeline.stop()
+
+        assert [e.message for e in delivered] == ["a", "b", "c"]
+        stats = pipeline.get_stats()
+        assert stats["lines_in"] == 4
+        assert stats["events_routed"] == 3
+        assert stats["delivered"] == 3
+        assert stats["running"] is False
+
+    async def test_slow_delivery_does_not_block_ingest(self) -> None:
+        """Ingest finishes a burst while Discord is stuck; chat is shed first."""
+        release = asyncio.Event()
+
+        async def deliver(event: FactorioEvent) -> bool:
+            await release.wait()
+            return True
+
+        pipeline = EventPipeline(parse_stub, deliver, queue_size=5, delivery_workers=1)
+        await pipeline.start()
+
+        async def burst() -> None:
+            await pipeline.submit("join:first", "prod")
+            for i in range(50):
+                await pipeline.submit(f"chat:{i}", "prod")
+            await pipeline.submit("research:automation", "prod")
+
+        await asyncio.wait_for(burst(), timeout=1.0)
+        await asyncio.wait_for(pipeline.parse_queue.join(), timeout=1.0)
+
+        queued = list(pipeline.delivery_queues[0]._queue)
+        assert len(queued) == 5
+        assert any(e.event_type is EventType.RESEARCH for e in queued)
+        assert pipeline.dropped["chat"] > 0
+        assert "research" not in pipeline.dropped
+
+        release.set()
+        await pipeline.stop()
+
+    async def test_events_for_one_channel_stay_ordered(self) -> None:
+        delivered: List[str] = []
+
+        async def deliver(event: FactorioEvent) -> bool:
+            await asyncio.sleep(0)
+            delivered.append(event.message)
+            return True
+
+        pipeline = EventPipeline(parse_stub, deliver, delivery_workers=4)
+        await pipeline.start()
+        for i in range(20):
+            await pipeline.submit(f"chat:{i}", "prod")
+        await pipeline.stop()
+
+        assert delivered == [str(i) for i in range(20)]
+
+    async def test_parse_and_delivery_errors_are_contained(self) -> None:
+        def parse(line: str, server_tag: str) -> Optional[FactorioEvent]:
+            if line == "bad":
+                raise RuntimeError("parser bug")
+            return parse_stub(line, server_tag)
+
+        calls = 0
+
+        async def deliver(event: FactorioEvent) -> bool:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("discord down")
+            return calls != 2
+
+        pipeline = EventPipeline(parse, deliver, delivery_workers=1)
+        await pipeline.start()
+        for line in ("bad", "join:a", "join:b", "join:c"):
+            await pipeline.submit(line, "prod")
+        await pipeline.stop()
+
+        assert pipeline.delivered == 1
+        assert pipeline.delivery_failed == 2
+
+    async def test_stop_reports_whether_queued_work_finished(self) -> None:
+        release = asyncio.Event()
+
+        async def deliver(event: FactorioEvent) -> bool:
+            await release.wait()
+            return True
+
+        drained = EventPipeline(parse_stub, deliver, delivery_workers=1)
+        await drained.start()
+        await drained.submit("join:a", "prod")
+        release.set()
+        assert await drained.stop() is True
+
+        release.clear()
+        stuck = EventPipeline(parse_stub, deliver, delivery_workers=1)
+        await stuck.start()
+        await stuck.submit("join:a", "prod")
+        assert await stuck.stop(drain_timeout=0.05) is False
+
+    async def test_invalid_sizes_rejected(self) -> None:
+        async def deliver(event: FactorioEvent) -> bool:
+            return True
+
+        with pytest.raises(ValueError, match="queue_size"):
+            EventPipeline(parse_stub, deliver, queue_size=0)
+        with pytest.raises(ValueError, match="delivery_workers"):
+            EventPipeline(parse_stub, deliver, delivery_workers=0)
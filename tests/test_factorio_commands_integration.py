@@ -159,6 +159,7 @@ class TestStatusCommandIntegration:
         # Setup server manager
         server_manager = MagicMock()
         server_manager.get_metrics_engine.return_value = metrics_engine_mock
+        server_manager.get_metrics_snapshot = AsyncMock(return_value=None)
         
         # Reset rate limiter
         QUERY_COOLDOWN.reset(interaction.user.id)
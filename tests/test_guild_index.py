@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import random
+from typing import Any, List, Optional
+
+from bot.guild_index import GuildIndex, GuildIndexCache
+
+
+class Member:
+    def __init__(self, member_id: int, name: str, display_name: Optional[str] = None, guild: Any = None):
+        self.id = member_id
+        self.name = name
+        self.display_name = display_name or name
+        self.guild = guild
+
+
+class Role:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Guild:
+    def __init__(self, members: List[Member], roles: Optional[List[Role]] = None) -> None:
+        self.id = 1
+        self.members = members
+        self.roles = roles or []
+        for member in members:
+            member.guild = self
+
+
+def linear_find_member(guild: Guild, name: str) -> Optional[Member]:
+    """The original two-pass scan the index must agree with."""
+    name_lower = name.lower()
+    for member in guild.members:
+        if member.name.lower() == name_lower or member.display_name.lower() == name_lower:
+            return member
+    for member in guild.members:
+        if name_lower in member.name.lower() or name_lower in member.display_name.lower():
+            return member
+    return None
+
+
+# ============================================================================
+# LOOKUP TESTS
+# ============================================================================
+
+
+class TestGuildIndexLookups:
+    """Index lookups match a linear scan of the guild."""
+
+    def test_exact_beats_earlier_partial(self) -> None:
+        guild = Guild([Member(1, "alice_alt"), Member(2, "Alice")])
+        assert GuildIndex(guild).find_member("ALICE").id == 2
+
+    def test_display_name_match(self) -> None:
+        guild = Guild([Member(1, "user123", "Engineer")])
+        assert GuildIndex(guild).find_member("engineer").id == 1
+
+    def test_short_query_partial(self) -> None:
+        guild = Guild([Member(1, "bob"), Member(2, "xy_z")])
+        assert GuildIndex(guild).find_member("y_").id == 2
+
+    def test_not_found(self) -> None:
+        assert GuildIndex(Guild([Member(1, "bob")])).find_member("carol") is None
+
+    def test_matches_linear_scan_on_random_guild(self) -> None:
+        rng = random.Random(7)
+        syllables = ["ka", "zu", "ri", "mo", "te", "an", "el", "ion", "bit", "er"]
+
+        def name() -> str:
+            return "".join(rng.choice(syllables) for _ in range(rng.randint(1, 4)))
+
+        members = [Member(i, name(), name() if rng.random() < 0.4 else None) for i in range(500)]
+        guild = Guild(members)
+        index = GuildIndex(guild)
+
+        queries = [name() for _ in range(300)] + [m.name[1:4] for m in members[:100]]
+        for query in queries:
+            assert index.find_member(query) is linear_find_member(guild, query), query
+
+    def test_role_lookup_uses_guild_order(self) -> None:
+        staff, admin = Role("Staff"), Role("Admin")
+        guild = Guild([], roles=[staff, admin])
+        index = GuildIndex(guild)
+
+        assert index.find_role(["admin", "staff"]) is staff
+        assert index.find_role(["ADMIN"]) is admin
+        assert index.find_role(["owner"]) is None
+
+
+# ============================================================================
+# MAINTENANCE TESTS
+# ============================================================================
+
+
+class TestGuildIndexCache:
+    """Gateway events keep the cached index current."""
+
+    def test_join_remove_update(self) -> None:
+        alice = Member(1, "alice")
+        guild = Guild([alice])
+        cache = GuildIndexCache()
+        index = cache.get(guild)
+
+        bob = Member(2, "bob", guild=guild)
+        guild.members.append(bob)
+        cache.member_joined(bob)
+        assert cache.get(guild) is index
+        assert index.find_member("bob") is bob
+
+        renamed = Member(1, "alice", "Captain", guild=guild)
+        cache.member_updated(alice, renamed)
+        assert index.find_member("captain") is renamed
+
+        guild.members.remove(bob)
+        cache.member_removed(bob)
+        assert cache.get(guild) is index
+        assert index.find_member("bob") is None
+
+    def test_unseen_membership_change_triggers_rebuild(self) -> None:
+        guild = Guild([Member(1, "alice")])
+        cache = GuildIndexCache()
+        index = cache.get(guild)
+
+        guild.members.append(Member(2, "bob", guild=guild))
+        rebuilt = cache.get(guild)
+
+        assert rebuilt is not index
+        assert rebuilt.find_member("bob").id == 2
+
+    def test_role_changes_refresh_names(self) -> None:
+        role = Role("Mods")
+        guild = Guild([], roles=[role])
+        cache = GuildIndexCache()
+        assert cache.get(guild).find_role(["moderators"]) is None
+
+        role.name = "Moderators"
+        cache.roles_changed(guild)
+        assert cache.get(guild).find_role(["moderators"]) is role
+
+        guild.roles.append(Role("Staff"))
+        assert cache.get(guild).find_role(["staff"]) is not None
+
+    def test_events_for_unindexed_guild_are_ignored(self) -> None:
+        guild = Guild([])
+        cache = GuildIndexCache()
+        cache.member_joined(Member(1, "alice", guild=guild))
+        cache.roles_changed(guild)
+
+        assert cache.get(guild).member_count == 0
@@ -203,6 +203,24 @@ class TestHealthEndpoint:
                 assert resp.status == 200
                 data = await resp.json()
                 assert data['status'] == 'healthy'
+    
+    @pytest.mark.asyncio
+    async def test_health_endpoint_includes_status_providers(self):
+        """Registered status providers are reported; failing ones are skipped."""
+        server = HealthCheckServer()
+        server.add_status_provider("event_pipeline", lambda: {"parse_queue": 3})
+        server.add_status_provider("broken", Mock(side_effect=RuntimeError("boom")))
+        
+        async with TestClient(
+            TestServer(server.app)
+        ) as client:
+            resp = await client.get('/health')
+            data = await resp.json()
+            
+            assert resp.status == 200
+            assert data['status'] == 'healthy'
+            assert data['event_pipeline'] == {"parse_queue": 3}
+            assert 'broken' not in data
 
 
 class TestRootEndpoint:
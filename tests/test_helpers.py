@@ -147,6 +147,21 @@ class TestPresenceManagerUpdate:
         await manager.update()
         bot.change_presence.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_update_includes_player_total_from_snapshots(self) -> None:
+        bot = MockDiscordBot()
+        bot.server_manager = MockServerManager({"prod": True, "staging": True})
+        bot.server_manager.get_latest_snapshots = MagicMock(
+            return_value={
+                "prod": MagicMock(metrics={"player_count": 3}),
+                "staging": MagicMock(metrics={"player_count": 2}),
+            }
+        )
+        manager = PresenceManager(bot)
+        await manager.update()
+        activity = bot.change_presence.call_args[1]["activity"]
+        assert "👥 5" in activity.name
+
     @pytest.mark.asyncio
     async def test_update_exception_handling(self) -> None:
         bot = MockDiscordBot()
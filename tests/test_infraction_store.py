@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from infraction_store import InfractionStore
+
+
+def record(player: str, n: int) -> dict:
+    return {"player_name": player, "pattern_type": "code_injection", "raw_text": f"eval({n})"}
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    return tmp_path / "infractions.jsonl"
+
+
+class TestInfractionStore:
+    """Append, index and read back infraction records."""
+
+    def test_recent_newest_first(self, log_path: Path) -> None:
+        store = InfractionStore(log_path)
+        for i in range(5):
+            store.append(record(f"P{i % 2}", i))
+
+        assert [r["raw_text"] for r in store.recent(limit=3)] == ["eval(4)", "eval(3)", "eval(2)"]
+        assert [r["raw_text"] for r in store.recent(player_name="P1")] == ["eval(3)", "eval(1)"]
+        assert store.recent(player_name="Nobody") == []
+
+    def test_appends_visible_in_file_immediately(self, log_path: Path) -> None:
+        store = InfractionStore(log_path)
+        store.append(record("Alice", 1))
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[0])["player_name"] == "Alice"
+
+    def test_rotation_and_reindex(self, log_path: Path) -> None:
+        line_size = len(json.dumps(record("P0", 0))) + 1
+        store = InfractionStore(log_path, max_segment_bytes=line_size * 3)
+        for i in range(10):
+            store.append(record(f"P{i % 3}", i))
+        store.close()
+
+        rotated = sorted(p.name for p in log_path.parent.glob("infractions.*.jsonl"))
+        assert rotated == ["infractions.000001.jsonl", "infractions.000002.jsonl", "infractions.000003.jsonl"]
+        assert len(log_path.read_text(encoding="utf-8").splitlines()) == 1
+
+        reopened = InfractionStore(log_path, max_segment_bytes=line_size * 3)
+        assert reopened.count() == 10
+        assert [r["raw_text"] for r in reopened.recent(limit=5)] == [
+            f"eval({i})" for i in range(9, 4, -1)
+        ]
+        assert [r["raw_text"] for r in reopened.recent(player_name="P0")] == [
+            "eval(9)", "eval(6)", "eval(3)", "eval(0)"
+        ]
+
+        # Appends continue the numbering after a restart
+        for i in range(10, 13):
+            reopened.append(record("P0", i))
+        assert "infractions.000004.jsonl" in {p.name for p in log_path.parent.iterdir()}
+
+    def test_torn_last_line_is_skipped(self, log_path: Path) -> None:
+        log_path.write_text(json.dumps(record("Alice", 1)) + "\n" + '{"player_na', encoding="utf-8")
+
+        store = InfractionStore(log_path)
+        assert store.count() == 1
+        store.append(record("Bob", 2))
+
+        assert [r["player_name"] for r in store.recent()] == ["Bob", "Alice"]
+        assert InfractionStore(log_path).count() == 2
+
+    def test_external_truncation_reindexes(self, log_path: Path) -> None:
+        store = InfractionStore(log_path)
+        store.append(record("Alice", 1))
+        store.close()
+
+        log_path.write_text("", encoding="utf-8")
+        store.append(record("Bob", 2))
+
+        assert [r["player_name"] for r in store.recent()] == ["Bob"]
+        assert store.count("Alice") == 0
+
+    def test_invalid_segment_size_rejected(self, log_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_segment_bytes"):
+            InfractionStore(log_path, max_segment_bytes=0)
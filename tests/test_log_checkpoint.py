@@ -0,0 +1,114 @@
+"""Tests for log_checkpoint: checkpoint serialization and atomic store."""
+
+import asyncio
+import io
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from log_checkpoint import (
+    FINGERPRINT_BYTES,
+    LogCheckpoint,
+    LogCheckpointStore,
+    fingerprint_at,
+)
+
+
+class TestFingerprint:
+    """Test content fingerprints."""
+
+    def test_preserves_file_position(self) -> None:
+        """Fingerprinting doesn't move the reader."""
+        f = io.BytesIO(b"line one\nline two\n")
+        f.seek(5)
+        fingerprint_at(f, 9)
+        assert f.tell() == 5
+
+    def test_depends_only_on_preceding_window(self) -> None:
+        """Only the FINGERPRINT_BYTES before the offset matter."""
+        tail = b"x" * FINGERPRINT_BYTES
+        a = io.BytesIO(b"AAAA" + tail + b"after")
+        b = io.BytesIO(b"BBBB" + tail + b"other")
+        offset = 4 + FINGERPRINT_BYTES
+        assert fingerprint_at(a, offset) == fingerprint_at(b, offset)
+        assert fingerprint_at(a, offset + 1) != fingerprint_at(b, offset + 1)
+
+
+class TestLogCheckpointStore:
+    """Test checkpoint persistence."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Saved checkpoints are loaded by a new store."""
+        path = tmp_path / "checkpoints.json"
+        store = LogCheckpointStore(path)
+        checkpoint = LogCheckpoint(inode=42, offset=1024, fingerprint="abc", saved_at=1.0)
+
+        store.update("prod", checkpoint)
+        assert store.save() is True
+
+        assert LogCheckpointStore(path).get("prod") == checkpoint
+        assert not path.with_name("checkpoints.json.tmp").exists()
+
+    def test_save_skips_when_unchanged(self, tmp_path: Path) -> None:
+        """save() doesn't rewrite the file when nothing changed."""
+        path = tmp_path / "checkpoints.json"
+        store = LogCheckpointStore(path)
+        store.update("prod", LogCheckpoint(inode=1, offset=2, fingerprint="f"))
+        store.save()
+
+        path.write_text(json.dumps({"checkpoints": {}}))
+        assert store.save() is True
+        assert json.loads(path.read_text()) == {"checkpoints": {}}
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        """A corrupt store starts empty instead of raising."""
+        path = tmp_path / "checkpoints.json"
+        path.write_text("{not json")
+
+        store = LogCheckpointStore(path)
+        assert store.get("prod") is None
+
+    def test_save_failure_returns_false(self, tmp_path: Path) -> None:
+        """Write errors are logged and reported, not raised."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        store = LogCheckpointStore(blocker / "checkpoints.json")
+        store.update("prod", LogCheckpoint(inode=1, offset=2, fingerprint="f"))
+
+        assert store.save() is False
+
+    async def test_save_async_writes_in_worker_thread(self, tmp_path: Path) -> None:
+        """Periodic saves go through asyncio.to_thread and persist the store."""
+        path = tmp_path / "checkpoints.json"
+        store = LogCheckpointStore(path)
+        checkpoint = LogCheckpoint(inode=7, offset=99, fingerprint="f")
+        store.update("prod", checkpoint)
+
+        with patch("log_checkpoint.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await store.save_async() is True
+
+        to_thread.assert_called_once()
+        assert LogCheckpointStore(path).get("prod") == checkpoint
+
+    def test_older_snapshot_never_overwrites_newer(self, tmp_path: Path) -> None:
+        """A write that lost the race to a newer snapshot is dropped."""
+        path = tmp_path / "checkpoints.json"
+        store = LogCheckpointStore(path)
+        store.update("prod", LogCheckpoint(inode=1, offset=1, fingerprint="old"))
+        old = store._snapshot()
+        store.update("prod", LogCheckpoint(inode=1, offset=2, fingerprint="new"))
+        assert store.save() is True
+
+        assert store._write(*old) is True
+        assert LogCheckpointStore(path).get("prod").offset == 2
+
+    def test_failed_save_is_retried(self, tmp_path: Path) -> None:
+        """The store stays dirty after a failed write."""
+        path = tmp_path / "checkpoints.json"
+        store = LogCheckpointStore(path)
+        store.update("prod", LogCheckpoint(inode=1, offset=2, fingerprint="f"))
+
+        with patch("log_checkpoint.os.replace", side_effect=OSError("disk full")):
+            assert store.save() is False
+        assert store.save() is True
+        assert LogCheckpointStore(path).get("prod") is not None
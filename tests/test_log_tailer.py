@@ -13,6 +13,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 from log_tailer import LogTailer, LogTailerFactory
+from inotify_watcher import INOTIFY_AVAILABLE
+from log_checkpoint import LogCheckpoint, LogCheckpointStore, fingerprint_at
 
 
 # ============================================================================
@@ -955,6 +957,348 @@ class TestEdgeCases:
         assert tailer2.log_path == path
 
 
+# ============================================================================
+# Chunked Read / Batch Delivery Tests
+# ============================================================================
+
+class TestChunkedReads:
+    """Test bulk reads, partial-line carry-over, and lines_callback."""
+    
+    def test_requires_a_callback(self, temp_log_file):
+        """A tailer without any callback is rejected."""
+        with pytest.raises(ValueError, match="line_callback or lines_callback"):
+            LogTailer(temp_log_file)
+    
+    def test_split_lines_carries_partial_line(self, temp_log_file, mock_callback):
+        """Bytes after the last newline wait for the next chunk."""
+        tailer = LogTailer(temp_log_file, mock_callback)
+        
+        assert tailer._split_lines(b"one\r\ntw") == ["one"]
+        assert tailer._partial == b"tw"
+        assert tailer._split_lines(b"o\n\nthree\n") == ["two", "three"]
+        assert tailer._partial == b""
+    
+    def test_split_lines_handles_multibyte_across_chunks(self, temp_log_file, mock_callback):
+        """UTF-8 sequences split across chunk boundaries decode intact."""
+        tailer = LogTailer(temp_log_file, mock_callback)
+        encoded = "玩家 🎮\n".encode("utf-8")
+        
+        assert tailer._split_lines(encoded[:4]) == []
+        assert tailer._split_lines(encoded[4:]) == ["玩家 🎮"]
+    
+    @pytest.mark.asyncio
+    async def test_lines_callback_receives_batches(self, existing_log_file):
+        """A burst is delivered in a few batches, not one call per line."""
+        batches = []
+        
+        async def on_lines(lines):
+            batches.append(list(lines))
+        
+        tailer = LogTailer(existing_log_file, lines_callback=on_lines, poll_interval=0.01)
+        await tailer.start()
+        await asyncio.sleep(0.05)
+        
+        with open(existing_log_file, 'a') as f:
+            f.write("".join(f"burst line {i}\n" for i in range(5000)))
+        await asyncio.sleep(0.3)
+        await tailer.stop()
+        
+        delivered = [line for batch in batches for line in batch]
+        assert delivered == [f"burst line {i}" for i in range(5000)]
+        assert len(batches) < 50
+    
+    @pytest.mark.asyncio
+    async def test_rotation_checked_per_chunk_not_per_line(self, existing_log_file, mock_callback):
+        """Catching up on a burst does not stat the file once per line."""
+        tailer = LogTailer(
+            existing_log_file, mock_callback, poll_interval=0.01, watch_mode="poll"
+        )
+        await tailer.start()
+        await asyncio.sleep(0.05)
+        
+        with patch.object(tailer, "_check_rotation", wraps=tailer._check_rotation) as check:
+            with open(existing_log_file, 'a') as f:
+                f.write("".join(f"line {i}\n" for i in range(2000)))
+            await asyncio.sleep(0.1)
+            await tailer.stop()
+        
+        assert mock_callback.await_count == 2000
+        assert check.call_count < 100
+    
+    @pytest.mark.asyncio
+    async def test_partial_line_delivered_once_completed(self, existing_log_file, mock_callback):
+        """A line written in two pieces is delivered whole."""
+        tailer = LogTailer(existing_log_file, mock_callback, poll_interval=0.01)
+        await tailer.start()
+        await asyncio.sleep(0.05)
+        
+        with open(existing_log_file, 'a') as f:
+            f.write("[CHAT] Ali")
+        await asyncio.sleep(0.05)
+        with open(existing_log_file, 'a') as f:
+            f.write("ce: hi\n")
+        await asyncio.sleep(0.1)
+        await tailer.stop()
+        
+        mock_callback.assert_awaited_once_with("[CHAT] Alice: hi")
+
+
+# ============================================================================
+# Checkpoint / Resume Tests
+# ============================================================================
+
+class TestCheckpointResume:
+    """Test resuming from persisted read positions."""
+    
+    @pytest.mark.asyncio
+    async def test_resumes_lines_written_while_stopped(self, existing_log_file, tmp_path):
+        """Lines logged between stop and start are delivered after restart."""
+        store = LogCheckpointStore(tmp_path / "checkpoints.json")
+        first, second = AsyncMock(), AsyncMock()
+        
+        tailer = LogTailer(existing_log_file, first, poll_interval=0.01, checkpoint_store=store)
+        await tailer.start()
+        await asyncio.sleep(0.05)
+        with open(existing_log_file, 'a') as f:
+            f.write("before stop\n")
+        await asyncio.sleep(0.1)
+        await tailer.stop()
+        
+        with open(existing_log_file, 'a') as f:
+            f.write("while down 1\nwhile down 2\n")
+        
+        restarted = LogTailer(
+            existing_log_file,
+            second,
+            poll_interval=0.01,
+            checkpoint_store=LogCheckpointStore(tmp_path / "checkpoints.json"),
+        )
+        await restarted.start()
+        await asyncio.sleep(0.1)
+        await restarted.stop()
+        
+        first.assert_awaited_once_with("before stop")
+        assert [c.args[0] for c in second.await_args_list] == ["while down 1", "while down 2"]
+    
+    def test_inode_mismatch_starts_at_end(self, existing_log_file, tmp_path, mock_callback):
+        """A checkpoint for a different file is ignored."""
+        store = LogCheckpointStore(tmp_path / "checkpoints.json")
+        store.update(
+            str(existing_log_file),
+            LogCheckpoint(inode=existing_log_file.stat().st_ino + 1, offset=0, fingerprint=""),
+        )
+        tailer = LogTailer(existing_log_file, mock_callback, checkpoint_store=store)
+        
+        tailer._open_file()
+        try:
+            assert tailer._file.tell() == existing_log_file.stat().st_size
+        finally:
+            tailer._file.close()
+    
+    def test_content_mismatch_starts_at_end(self, existing_log_file, tmp_path, mock_callback):
+        """A checkpoint whose preceding bytes changed is ignored."""
+        store = LogCheckpointStore(tmp_path / "checkpoints.json")
+        store.update(
+            str(existing_log_file),
+            LogCheckpoint(inode=existing_log_file.stat().st_ino, offset=8, fingerprint="0" * 40),
+        )
+        tailer = LogTailer(existing_log_file, mock_callback, checkpoint_store=store)
+        
+        tailer._open_file()
+        try:
+            assert tailer._file.tell() == existing_log_file.stat().st_size
+        finally:
+            tailer._file.close()
+    
+    def test_catchup_window_skips_to_line_boundary(self, existing_log_file, tmp_path, mock_callback):
+        """Backlog beyond max_catchup_bytes is skipped, keeping whole lines."""
+        existing_log_file.write_text("")
+        with open(existing_log_file, 'rb') as f:
+            fingerprint = fingerprint_at(f, 0)
+        existing_log_file.write_text("".join(f"line {i:04d}\n" for i in range(100)))
+        
+        store = LogCheckpointStore(tmp_path / "checkpoints.json")
+        store.update(
+            str(existing_log_file),
+            LogCheckpoint(inode=existing_log_file.stat().st_ino, offset=0, fingerprint=fingerprint),
+        )
+        tailer = LogTailer(
+            existing_log_file, mock_callback, checkpoint_store=store, max_catchup_bytes=25
+        )
+        
+        tailer._open_file()
+        try:
+            assert tailer._file.read() == b"line 0098\nline 0099\n"
+        finally:
+            tailer._file.close()
+    
+    def test_catchup_window_reports_gap(self, existing_log_file, tmp_path, mock_callback):
+        """Skipping backlog beyond max_catchup_bytes calls gap_callback."""
+        existing_log_file.write_text("")
+        with open(existing_log_file, 'rb') as f:
+            fingerprint = fingerprint_at(f, 0)
+        existing_log_file.write_text("".join(f"line {i:04d}\n" for i in range(100)))
+        
+        store = LogCheckpointStore(tmp_path / "checkpoints.json")
+        store.update(
+            str(existing_log_file),
+            LogCheckpoint(inode=existing_log_file.stat().st_ino, offset=0, fingerprint=fingerprint),
+        )
+        gaps = []
+        tailer = LogTailer(
+            existing_log_file,
+            mock_callback,
+            checkpoint_store=store,
+            max_catchup_bytes=25,
+            gap_callback=gaps.append,
+        )
+        
+        tailer._open_file()
+        tailer._file.close()
+        
+        assert gaps == ["catchup_window_exceeded"]
+    
+    def test_start_at_end_reports_gap(self, existing_log_file, mock_callback):
+        """Tailing a non-empty file from its end reports the skipped content."""
+        gaps = []
+        tailer = LogTailer(existing_log_file, mock_callback, gap_callback=gaps.append)
+        
+        tailer._open_file()
+        tailer._file.close()
+        
+        assert gaps == ["started_at_end"]
+    
+    def test_gap_callback_errors_are_logged(self, existing_log_file, mock_callback):
+        """A failing gap_callback does not stop the file from opening."""
+        tailer = LogTailer(
+            existing_log_file, mock_callback, gap_callback=Mock(side_effect=RuntimeError("boom"))
+        )
+        
+        tailer._open_file()
+        try:
+            assert tailer._file.tell() == existing_log_file.stat().st_size
+        finally:
+            tailer._file.close()
+    
+    @pytest.mark.asyncio
+    async def test_catchup_rate_limits_backlog_delivery(self, existing_log_file, mock_callback):
+        """Backlog replay is paced by catchup_rate; live lines are not."""
+        tailer = LogTailer(existing_log_file, mock_callback, catchup_rate=100.0)
+        existing_log_file.write_text("".join(f"backlog {i}\n" for i in range(20)))
+        tailer._open_file(start_offset=0)
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            while await tailer._read_chunk():
+                pass
+        finally:
+            tailer._file.close()
+        
+        assert mock_callback.await_count == 20
+        assert loop.time() - started >= 0.15
+        assert tailer._catchup_end is None
+    
+    def test_invalid_catchup_rate_raises(self, temp_log_file, mock_callback):
+        """catchup_rate must be positive."""
+        with pytest.raises(ValueError, match="catchup_rate"):
+            LogTailer(temp_log_file, mock_callback, catchup_rate=0)
+
+
+# ============================================================================
+# inotify Watch Mode Tests
+# ============================================================================
+
+requires_inotify = pytest.mark.skipif(
+    not INOTIFY_AVAILABLE, reason="inotify not available on this platform"
+)
+
+
+class TestWatchMode:
+    """Test event-driven (inotify) tailing and its polling fallback."""
+    
+    def test_invalid_watch_mode_raises(self, temp_log_file, mock_callback):
+        """Unknown watch modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid watch_mode"):
+            LogTailer(temp_log_file, mock_callback, watch_mode="kqueue")
+    
+    @pytest.mark.asyncio
+    async def test_poll_mode_never_uses_inotify(self, existing_log_file, mock_callback):
+        """watch_mode='poll' keeps the timer-based loop."""
+        tailer = LogTailer(existing_log_file, mock_callback, poll_interval=0.01, watch_mode="poll")
+        
+        await tailer.start()
+        await asyncio.sleep(0.05)
+        assert tailer.using_inotify is False
+        
+        with open(existing_log_file, 'a') as f:
+            f.write("polled line\n")
+        await asyncio.sleep(0.1)
+        await tailer.stop()
+        
+        mock_callback.assert_any_call("polled line")
+    
+    @requires_inotify
+    @pytest.mark.asyncio
+    async def test_inotify_wakes_on_write_without_polling(self, existing_log_file, mock_callback):
+        """In inotify mode, new lines arrive via events, not the poll timer."""
+        tailer = LogTailer(
+            existing_log_file,
+            mock_callback,
+            poll_interval=60.0,  # Polling alone would never see the line
+            watch_timeout=60.0,
+        )
+        
+        await tailer.start()
+        await asyncio.sleep(0.05)
+        assert tailer.using_inotify is True
+        
+        with open(existing_log_file, 'a') as f:
+            f.write("event line\n")
+        await asyncio.sleep(0.1)
+        await tailer.stop()
+        
+        mock_callback.assert_awaited_once_with("event line")
+        assert tailer.using_inotify is False
+    
+    @requires_inotify
+    @pytest.mark.asyncio
+    async def test_inotify_follows_rename_rotation(self, existing_log_file, mock_callback):
+        """Rename-and-recreate rotation is picked up from IN_MOVE_SELF/IN_CREATE."""
+        tailer = LogTailer(existing_log_file, mock_callback, poll_interval=60.0, watch_timeout=60.0)
+        
+        await tailer.start()
+        await asyncio.sleep(0.05)
+        
+        existing_log_file.rename(existing_log_file.with_suffix(".old"))
+        await asyncio.sleep(0.05)
+        existing_log_file.write_text("")
+        await asyncio.sleep(0.05)
+        with open(existing_log_file, 'a') as f:
+            f.write("after rotation\n")
+        await asyncio.sleep(0.1)
+        await tailer.stop()
+        
+        mock_callback.assert_awaited_once_with("after rotation")
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_when_watch_fails(self, existing_log_file, mock_callback):
+        """If inotify can't be set up, the tailer polls instead."""
+        tailer = LogTailer(existing_log_file, mock_callback, poll_interval=0.01)
+        
+        with patch("log_tailer.InotifyWatcher.open", side_effect=OSError("no watches left")):
+            await tailer.start()
+            await asyncio.sleep(0.05)
+            assert tailer.using_inotify is False
+            
+            with open(existing_log_file, 'a') as f:
+                f.write("fallback line\n")
+            await asyncio.sleep(0.1)
+            await tailer.stop()
+        
+        mock_callback.assert_any_call("fallback line")
+
+
 # ============================================================================
 # Performance Tests
 # ============================================================================
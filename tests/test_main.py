@@ -33,7 +33,8 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from main import Application, setup_logging, main  # type: ignore
+from main import Application, setup_logging, main, parse_args  # type: ignore
+from startup_profile import StartupProfiler  # type: ignore
 from event_parser import EventType, FactorioEvent  # type: ignore
 from config import Config, ServerConfig  # type: ignore
 from discord_interface import BotDiscordInterface  # type: ignore
@@ -432,8 +433,16 @@ class TestApplicationStart:
             mock_tailer_class.assert_called_once()
             call_kwargs = mock_tailer_class.call_args[1]
             assert call_kwargs["server_configs"] == mock_config.servers
-            assert call_kwargs["line_callback"] == app.handle_log_line
+            assert call_kwargs["line_callback"] == app.event_pipeline.submit
             assert call_kwargs["poll_interval"] == 0.1
+            assert call_kwargs["watch_mode"] == mock_config.log_watch_mode
+            assert app.event_pipeline is not None
+            assert app.event_pipeline.running
+            assert app.event_pipeline.queue_size == mock_config.event_queue_size
+            assert app.event_pipeline.delivery_workers == mock_config.event_delivery_workers
+            assert app.pattern_watch_task is not None
+            app.pattern_watch_task.cancel()
+            await app.event_pipeline.stop(drain_timeout=0)
 
     @pytest.mark.asyncio
     async def test_start_log_tailer_started(
@@ -561,6 +570,176 @@ class TestStartMultiServerMode:
             with pytest.raises(ConnectionError):
                 await app._setup_multi_server_manager()
 
+    @pytest.mark.asyncio
+    async def test_servers_added_concurrently(
+        self, mock_config: Config, mock_server_config: ServerConfig
+    ) -> None:
+        """RCON connects overlap; one failing server doesn't block the others."""
+        slow = ServerConfig(
+            tag="slow",
+            name="Slow Server",
+            log_path=mock_server_config.log_path,
+            rcon_host="localhost",
+            rcon_port=27016,
+            rcon_password="test",
+            event_channel_id=123456789,
+        )
+        broken = ServerConfig(
+            tag="broken",
+            name="Broken Server",
+            log_path=mock_server_config.log_path,
+            rcon_host="localhost",
+            rcon_port=27017,
+            rcon_password="test",
+            event_channel_id=123456789,
+        )
+
+        with patch("main.load_config", return_value=mock_config), \
+             patch("main.validate_config", return_value=True), \
+             patch("main.SERVER_MANAGER_AVAILABLE", True), \
+             patch("main.ServerManager") as mock_server_manager_class:
+
+            app = Application()
+            await app.setup()
+            app.config.servers = {"slow": slow, "broken": broken, mock_server_config.tag: mock_server_config}
+            app.discord = MockBotDiscordInterface()
+
+            in_flight = 0
+            max_in_flight = 0
+
+            async def add_server(server_config: ServerConfig, defer_stats: bool) -> None:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.02)
+                in_flight -= 1
+                if server_config.tag == "broken":
+                    raise ConnectionError("RCON failed")
+
+            mock_server_manager = AsyncMock()
+            mock_server_manager.add_server = AsyncMock(side_effect=add_server)
+            mock_server_manager_class.return_value = mock_server_manager
+
+            await app._setup_multi_server_manager()
+
+            assert max_in_flight == 3
+            app.discord.bot.set_server_manager.assert_called_once_with(mock_server_manager)
+
+
+# ============================================================================
+# Concurrent Startup Tests
+# ============================================================================
+
+class TestConcurrentStartup:
+    """Tests for overlapping independent startup steps."""
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_other_steps(self) -> None:
+        """The first failure cancels the remaining steps and is raised."""
+        app = Application()
+        cancelled = asyncio.Event()
+
+        async def slow_step() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def failing_step() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await app._start_concurrently(slow_step(), failing_step())
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_start_overlaps_health_discord_and_servers(
+        self, mock_config: Config
+    ) -> None:
+        """start() connects Discord while servers are still being added."""
+        with patch("main.load_config", return_value=mock_config), \
+             patch("main.validate_config", return_value=True), \
+             patch("main.DiscordInterfaceFactory.create_interface") as mock_factory, \
+             patch("main.MultiServerLogTailer") as mock_tailer_class, \
+             patch("main.SERVER_MANAGER_AVAILABLE", True), \
+             patch("main.ServerManager") as mock_server_manager_class:
+
+            app = Application()
+            await app.setup()
+            app.health_server.start = AsyncMock()
+
+            mock_discord = MockBotDiscordInterface()
+            mock_factory.return_value = mock_discord
+            discord_connect_started = asyncio.Event()
+
+            async def connect() -> None:
+                discord_connect_started.set()
+
+            mock_discord.connect = AsyncMock(side_effect=connect)
+
+            async def add_server(server_config: ServerConfig, defer_stats: bool) -> None:
+                # Discord login must not wait for RCON
+                await asyncio.wait_for(discord_connect_started.wait(), timeout=1)
+
+            mock_server_manager = AsyncMock()
+            mock_server_manager.add_server = AsyncMock(side_effect=add_server)
+            mock_server_manager.list_tags = MagicMock(return_value=[])
+            mock_server_manager.list_servers = MagicMock(return_value={})
+            mock_server_manager_class.return_value = mock_server_manager
+            mock_tailer_class.return_value = AsyncMock()
+
+            await app.start()
+
+            mock_discord.bot.expect_server_manager.assert_called_once()
+            mock_discord.bot.set_server_manager.assert_called_once_with(mock_server_manager)
+            app.health_server.start.assert_awaited_once()
+            app.pattern_watch_task.cancel()
+            await app.event_pipeline.stop(drain_timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_profiled_start_reports_phases(
+        self, mock_config: Config, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """With a profiler, start() records phases and prints the report."""
+        profiler = StartupProfiler()
+
+        with patch("main.load_config", return_value=mock_config), \
+             patch("main.validate_config", return_value=True), \
+             patch("main.DiscordInterfaceFactory.create_interface") as mock_factory, \
+             patch("main.MultiServerLogTailer") as mock_tailer_class, \
+             patch("main.SERVER_MANAGER_AVAILABLE", True), \
+             patch("main.ServerManager") as mock_server_manager_class:
+
+            app = Application(profiler=profiler)
+            await app.setup()
+            app.health_server.start = AsyncMock()
+            mock_factory.return_value = MockBotDiscordInterface()
+
+            mock_server_manager = AsyncMock()
+            mock_server_manager.add_server = AsyncMock()
+            mock_server_manager.list_tags = MagicMock(return_value=[])
+            mock_server_manager.list_servers = MagicMock(return_value={})
+            mock_server_manager_class.return_value = mock_server_manager
+            mock_tailer_class.return_value = AsyncMock()
+
+            await app.start()
+            app.pattern_watch_task.cancel()
+            await app.event_pipeline.stop(drain_timeout=0)
+
+        phases = {phase.name for phase in profiler.phases}
+        assert {
+            "config",
+            "event_parser",
+            "health_server",
+            "servers",
+            "discord_connect",
+            "log_tailer",
+        } <= phases
+        assert profiler.ready_ms is not None
+        assert "| ready" in capsys.readouterr().err
+
 
 # ============================================================================
 # Application.handle_log_line Tests
@@ -661,6 +840,33 @@ class TestApplicationHandleLogLine:
             await app.handle_log_line("Test line", "prod")
             app.discord.send_event.assert_called_once()
 
+    def test_parse_line_feeds_player_roster(self) -> None:
+        """Parsed events are observed by the server manager's rosters."""
+        app = Application()
+        event = FactorioEvent(
+            event_type=EventType.JOIN,
+            player_name="Alice",
+            raw_line="[JOIN] Alice joined the game",
+            server_tag="prod",
+        )
+        app.event_parser = MagicMock()
+        app.event_parser.parse_line = MagicMock(return_value=event)
+        app.server_manager = MagicMock()
+
+        assert app._parse_line("[JOIN] Alice joined the game", "prod") is event
+        app.server_manager.observe_event.assert_called_once_with(event)
+
+    def test_log_gap_marks_roster_stale(self) -> None:
+        """Skipped log content forces the server's roster to reconcile."""
+        app = Application()
+        app._on_log_gap("prod", "catchup_window_exceeded")
+
+        app.server_manager = MagicMock()
+        app._on_log_gap("prod", "catchup_window_exceeded")
+        app.server_manager.mark_roster_stale.assert_called_once_with(
+            "prod", "catchup_window_exceeded"
+        )
+
 
 # ============================================================================
 # Application.stop Tests
@@ -689,10 +895,15 @@ class TestApplicationStop:
             app.server_manager = AsyncMock()
             app.logtailer = AsyncMock()
             app.discord = AsyncMock()
+            app.event_pipeline = AsyncMock()
+            app.event_parser = MagicMock()
+            app.event_parser.security_monitor.flush_ban_list = AsyncMock()
             app.health_server = AsyncMock()
             await app.stop()
             app.server_manager.stop_all.assert_called_once()
-            app.logtailer.stop.assert_called_once()
+            app.logtailer.stop.assert_called_once_with(drain=app._stop_event_pipeline)
+            app.event_pipeline.stop.assert_awaited_once()
+            app.event_parser.security_monitor.flush_ban_list.assert_awaited_once()
             app.discord.disconnect.assert_called_once()
             app.health_server.stop.assert_called_once()
 
@@ -783,6 +994,13 @@ class TestMainEntryPoint:
                 await main()
                 mock_app.run.assert_called_once()
 
+    def test_parse_args_profile_startup(self) -> None:
+        """--profile-startup is the only flag and defaults off."""
+        assert parse_args([]).profile_startup is False
+        assert parse_args(["--profile-startup"]).profile_startup is True
+        with pytest.raises(SystemExit):
+            parse_args(["--unknown"])
+
     @pytest.mark.asyncio
     async def test_main_runs_application(self) -> None:
         """main() should create and run an Application."""
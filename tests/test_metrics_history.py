@@ -0,0 +1,191 @@
+"""Tests for metrics_history.py (fixed-memory per-server metric time series)."""
+
+from __future__ import annotations
+
+import pytest
+
+from metrics_history import (
+    PLAYER_COUNT_METRIC,
+    UPS_METRIC,
+    MetricSeries,
+    MetricsHistory,
+    RollupTier,
+)
+
+# Bucket-aligned start time (a multiple of 600 s)
+T0 = 1_800_000_000.0
+
+
+# ============================================================================
+# Raw samples
+# ============================================================================
+
+
+class TestRawWindow:
+    def test_empty_series_has_no_stats(self) -> None:
+        assert MetricSeries().window(60, now=T0) is None
+
+    def test_window_stats_over_raw_samples(self) -> None:
+        series = MetricSeries()
+        for i in range(101):
+            series.append(float(i), at=T0 + i)
+
+        stats = series.window(200, now=T0 + 100)
+
+        assert stats is not None
+        assert stats.count == 101
+        assert stats.resolution == 0.0
+        assert stats.mean == pytest.approx(50.0)
+        assert (stats.min, stats.max) == (0.0, 100.0)
+        assert stats.p5 == pytest.approx(5.0)
+        assert stats.p95 == pytest.approx(95.0)
+        assert stats.slope == pytest.approx(1.0)
+
+    def test_window_excludes_older_samples(self) -> None:
+        series = MetricSeries()
+        for i in range(10):
+            series.append(60.0 if i < 5 else 30.0, at=T0 + i)
+
+        stats = series.window(4.5, now=T0 + 9)
+
+        assert stats is not None
+        assert stats.count == 5
+        assert stats.mean == pytest.approx(30.0)
+        assert stats.slope == pytest.approx(0.0)
+
+    def test_raw_ring_is_bounded_and_wraps(self) -> None:
+        series = MetricSeries(raw_capacity=4, rollups=())
+        for i in range(10):
+            series.append(float(i), at=T0 + i)
+
+        assert len(series) == 4
+        assert series.last(3) == [7.0, 8.0, 9.0]
+        stats = series.window(2.5, now=T0 + 9)
+        assert stats is not None
+        assert (stats.count, stats.min, stats.max) == (3, 7.0, 9.0)
+
+    def test_wall_clock_step_back_keeps_order(self) -> None:
+        series = MetricSeries()
+        series.append(1.0, at=T0 + 10)
+        series.append(2.0, at=T0 + 5)
+
+        stats = series.window(1, now=T0 + 10)
+
+        assert stats is not None
+        assert stats.count == 2
+
+    def test_invalid_capacity_rejected(self) -> None:
+        with pytest.raises(ValueError, match="raw_capacity must be >= 1"):
+            MetricSeries(raw_capacity=0)
+
+
+# ============================================================================
+# Rollups
+# ============================================================================
+
+
+class TestRollups:
+    def test_long_window_uses_minute_rollups(self) -> None:
+        series = MetricSeries()
+        # 2 hours at one sample per 10 s: UPS 60 for the first hour, then 40
+        for i in range(720):
+            series.append(60.0 if i < 360 else 40.0, at=T0 + i * 10)
+        now = T0 + 7190
+
+        stats = series.window(7200, now=now)
+
+        assert stats is not None
+        assert stats.resolution == 60.0
+        assert stats.count == 720
+        assert stats.mean == pytest.approx(50.0)
+        assert (stats.min, stats.max) == (40.0, 60.0)
+        assert stats.p5 == pytest.approx(40.0)
+        assert stats.p95 == pytest.approx(60.0)
+        assert stats.slope < 0
+
+    def test_short_window_prefers_raw_samples(self) -> None:
+        series = MetricSeries()
+        for i in range(720):
+            series.append(float(i), at=T0 + i * 10)
+
+        stats = series.window(600, now=T0 + 7190)
+
+        assert stats is not None
+        assert stats.resolution == 0.0
+
+    def test_wrapped_raw_ring_falls_back_to_rollups(self) -> None:
+        series = MetricSeries(raw_capacity=10)
+        for i in range(120):
+            series.append(50.0, at=T0 + i)
+
+        stats = series.window(60, now=T0 + 119)
+
+        assert stats is not None
+        assert stats.resolution == 60.0
+        # Both minute buckets overlap the window, so all samples count
+        assert stats.count == 120
+
+    def test_bucket_min_max_survive_rollup(self) -> None:
+        series = MetricSeries(raw_capacity=1)
+        series.append(60.0, at=T0)
+        series.append(10.0, at=T0 + 1)
+        series.append(60.0, at=T0 + 2)
+        series.append(60.0, at=T0 + 60)
+
+        stats = series.window(120, now=T0 + 60)
+
+        assert stats is not None
+        assert stats.resolution == 60.0
+        assert stats.min == 10.0
+        assert stats.count == 4
+
+    def test_rollup_rings_are_bounded(self) -> None:
+        series = MetricSeries(raw_capacity=1, rollups=(RollupTier(60.0, 300.0),))
+        for i in range(100):
+            series.append(1.0, at=T0 + i * 60)
+
+        assert series.nbytes == 2 * 8 + 5 * 5 * 8
+
+
+# ============================================================================
+# Per-server history
+# ============================================================================
+
+
+class TestMetricsHistory:
+    def test_record_metrics_fans_out_series(self) -> None:
+        history = MetricsHistory(server_tag="prod")
+        history.record_metrics(
+            {
+                "ups": 59.5,
+                "tick": 3600,
+                "player_count": 3,
+                "evolution_by_surface": {"nauvis": 0.4, "gleba": 0.1},
+            },
+            at=T0,
+        )
+
+        assert history.metrics() == [
+            UPS_METRIC,
+            PLAYER_COUNT_METRIC,
+            "evolution:nauvis",
+            "evolution:gleba",
+        ]
+        stats = history.window("evolution:gleba", 60, now=T0)
+        assert stats is not None and stats.mean == pytest.approx(0.1)
+
+    def test_failed_collection_records_nothing(self) -> None:
+        history = MetricsHistory()
+        history.record_metrics({"ups": None, "tick": None, "player_count": 0}, at=T0)
+
+        assert history.metrics() == []
+        assert history.window(UPS_METRIC, 60, now=T0) is None
+
+    def test_series_limit(self) -> None:
+        history = MetricsHistory(max_series=2)
+        for name in ("a", "b", "c"):
+            history.record(name, 1.0, at=T0)
+
+        assert "c" not in history
+        assert history.get_stats()["series"] == 2
+        assert history.get_stats()["dropped_metrics"] == 1
@@ -447,3 +447,75 @@ async def test_multi_log_tailer_unicode_content(temp_logs: Dict[str, MockServerC
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
+
+
+@pytest.mark.asyncio
+async def test_multi_log_tailer_passes_watch_mode(temp_logs: Dict[str, MockServerConfig]) -> None:
+    """Test watch_mode is forwarded to every per-server LogTailer."""
+    tailer = MultiServerLogTailer(temp_logs, lambda line, tag: None, watch_mode="poll")
+
+    await tailer.start()
+    try:
+        assert all(t.watch_mode == "poll" for t in tailer.tailers.values())
+        assert all(status["inotify"] is False for status in tailer.get_status().values())
+    finally:
+        await tailer.stop()
+
+
+@pytest.mark.asyncio
+async def test_multi_log_tailer_gap_callback_receives_server_tag(temp_logs: Dict[str, MockServerConfig]) -> None:
+    """Test each tailer's gap reports are tagged with its server."""
+    gaps: List[Tuple[str, str]] = []
+    tailer = MultiServerLogTailer(
+        temp_logs,
+        lambda line, tag: None,
+        watch_mode="poll",
+        gap_callback=lambda tag, reason: gaps.append((tag, reason)),
+    )
+
+    await tailer.start()
+    try:
+        tailer.tailers["dev"].gap_callback("catchup_window_exceeded")
+        tailer.tailers["prod"].gap_callback("started_at_end")
+    finally:
+        await tailer.stop()
+
+    assert gaps == [("dev", "catchup_window_exceeded"), ("prod", "started_at_end")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("drained", [True, False])
+async def test_multi_log_tailer_drains_before_final_checkpoint(
+    temp_logs: Dict[str, MockServerConfig], tmp_path: Path, drained: bool
+) -> None:
+    """Test final checkpoints are saved only after drain, and skipped if it fails."""
+    from log_checkpoint import LogCheckpointStore
+
+    checkpoint_file = tmp_path / "checkpoints.json"
+    tailer = MultiServerLogTailer(
+        temp_logs,
+        lambda line, tag: None,
+        poll_interval=0.01,
+        watch_mode="poll",
+        checkpoint_store=LogCheckpointStore(checkpoint_file),
+    )
+    await tailer.start()
+    await asyncio.sleep(0.1)  # first periodic checkpoint (empty file)
+
+    log_path = temp_logs["prod"].log_path
+    with open(log_path, "a") as f:
+        f.write("queued 1\nqueued 2\n")
+    await asyncio.sleep(0.1)
+
+    seen_at_drain: List[Any] = []
+
+    async def drain() -> bool:
+        assert not any(t._running for t in tailer.tailers.values())
+        seen_at_drain.append(LogCheckpointStore(checkpoint_file).get("prod").offset)
+        return drained
+
+    await tailer.stop(drain=drain)
+
+    final = LogCheckpointStore(checkpoint_file).get("prod").offset
+    assert seen_at_drain == [0]
+    assert final == (log_path.stat().st_size if drained else 0)
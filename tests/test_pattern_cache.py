@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+import yaml
+
+import pattern_cache
+from event_parser import EventParser
+from pattern_cache import PatternCache
+from pattern_loader import EventPattern, PatternLoader
+
+
+EVENTS: Dict[str, Any] = {
+    "events": {
+        "player_join": {
+            "pattern": r"\[JOIN\] (?P<player>\w+) joined",
+            "type": "join",
+            "message": "{player} joined",
+            "priority": 5,
+            "channel": "general",
+        },
+        "chat": {"pattern": r"\[CHAT\] (?P<player>\w+): (?P<message>.+)", "type": "chat"},
+    }
+}
+
+
+@pytest.fixture
+def patterns_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "patterns"
+    directory.mkdir()
+    (directory / "vanilla.yml").write_text(yaml.dump(EVENTS), encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path) -> Path:
+    return tmp_path / "config" / "pattern_cache.json"
+
+
+class TestEventPatternRoundTrip:
+    def test_restore_matches_original(self) -> None:
+        original = EventPattern(
+            name="p", pattern="x", event_type="chat", emoji="!", message_template="{player}",
+            enabled=False, priority=3, channel="c",
+        )
+        restored = EventPattern.restore(original.to_dict())
+        assert restored.to_dict() == original.to_dict()
+
+
+class TestPatternCache:
+    """Content-addressed cache of validated patterns."""
+
+    def test_warm_start_skips_yaml_parsing(self, patterns_dir: Path, cache_file: Path, monkeypatch) -> None:
+        cold = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        cold.load_patterns()
+        assert cold.cache.save()
+        assert cache_file.exists()
+
+        def fail_parse(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("YAML parsed despite cache hit")
+
+        monkeypatch.setattr(PatternLoader, "_parse_file", fail_parse)
+        warm = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        warm.load_patterns()
+
+        assert [p.to_dict() for p in warm.patterns] == [p.to_dict() for p in cold.patterns]
+        assert warm.cache.hits == 1
+
+    def test_changed_content_misses(self, patterns_dir: Path, cache_file: Path) -> None:
+        loader = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        loader.load_patterns()
+        loader.cache.save()
+
+        edited = {"events": {"leave": {"pattern": r"\[LEAVE\]", "type": "leave"}}}
+        (patterns_dir / "vanilla.yml").write_text(yaml.dump(edited), encoding="utf-8")
+
+        reloaded = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        reloaded.load_patterns()
+        assert [p.name for p in reloaded.patterns] == ["leave"]
+        assert reloaded.cache.misses == 1
+
+        # Entries for content no longer present are pruned on save
+        reloaded.cache.save()
+        assert len(json.loads(cache_file.read_text(encoding="utf-8"))["files"]) == 1
+
+    def test_fingerprint_change_invalidates(self, patterns_dir: Path, cache_file: Path, monkeypatch) -> None:
+        loader = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        loader.load_patterns()
+        loader.cache.save()
+
+        monkeypatch.setattr(pattern_cache, "CACHE_VERSION", pattern_cache.CACHE_VERSION + 1)
+        assert PatternCache(cache_file).get_file(loader._file_states[str(patterns_dir / "vanilla.yml")].digest) is None
+
+    def test_analysis_version_change_invalidates(self, patterns_dir: Path, cache_file: Path, monkeypatch) -> None:
+        loader = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        loader.load_patterns()
+        loader.cache.save()
+
+        import regex_guard
+
+        monkeypatch.setattr(regex_guard, "ANALYSIS_VERSION", regex_guard.ANALYSIS_VERSION + 1)
+        assert PatternCache(cache_file).get_file(loader._file_states[str(patterns_dir / "vanilla.yml")].digest) is None
+
+    def test_tampered_record_revalidated(self, patterns_dir: Path, cache_file: Path) -> None:
+        loader = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        loader.load_patterns()
+        loader.cache.save()
+
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        for records in data["files"].values():
+            for record in records:
+                record["pattern"] = "a" * 10_000
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        reloaded = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        reloaded.load_patterns()
+        assert [p.to_dict() for p in reloaded.patterns] == [p.to_dict() for p in loader.patterns]
+
+    def test_corrupt_cache_ignored(self, patterns_dir: Path, cache_file: Path) -> None:
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        loader = PatternLoader(patterns_dir, cache=PatternCache(cache_file))
+        assert loader.load_patterns() == 2
+        assert loader.cache.save()
+
+    def test_parser_caches_regex_analysis(self, patterns_dir: Path, cache_file: Path, monkeypatch) -> None:
+        cold = EventParser(patterns_dir, pattern_cache_file=cache_file)
+        regexes = json.loads(cache_file.read_text(encoding="utf-8"))["regexes"]
+        assert set(regexes) == {p.pattern for p in cold.pattern_loader.patterns}
+        assert all("literals" in info for info in regexes.values())
+
+        import event_parser
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("analysis recomputed despite cache hit")
+
+        monkeypatch.setattr(event_parser, "classify_pattern", fail)
+        monkeypatch.setattr(event_parser, "required_literals", fail)
+        warm = EventParser(patterns_dir, pattern_cache_file=cache_file)
+
+        assert warm.pattern_risks == cold.pattern_risks
+        assert warm.parse_line("[JOIN] Alice joined") is not None
@@ -917,6 +917,103 @@ class TestReload:
         assert len(loader.patterns) == 0
 
 
+class TestRefresh:
+    """Test PatternLoader.refresh() incremental reload."""
+
+    @staticmethod
+    def bump_mtime(path: Path) -> None:
+        import os
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_unchanged_files_not_reparsed(self, temp_patterns_dir, create_yaml_file, sample_pattern_yaml, monkeypatch):
+        create_yaml_file("a.yml", sample_pattern_yaml)
+        loader = PatternLoader(patterns_dir=temp_patterns_dir)
+        loader.load_patterns()
+        original = list(loader.patterns)
+
+        parsed = []
+        real_parse = loader._parse_file
+        monkeypatch.setattr(loader, "_parse_file", lambda f, c: parsed.append(f.name) or real_parse(f, c))
+
+        assert loader.refresh() is False
+        # Touched but identical content: hashed, not re-parsed
+        self.bump_mtime(temp_patterns_dir / "a.yml")
+        assert loader.refresh() is False
+
+        assert parsed == []
+        assert loader.patterns == original
+
+    def test_only_changed_file_reparsed(self, temp_patterns_dir, create_yaml_file, sample_pattern_yaml, monkeypatch):
+        create_yaml_file("a.yml", sample_pattern_yaml)
+        create_yaml_file("b.yml", {"events": {"research": {"pattern": "Research", "type": "research"}}})
+        loader = PatternLoader(patterns_dir=temp_patterns_dir)
+        loader.load_patterns()
+        untouched = [p for p in loader.patterns if p.name != "research"]
+
+        parsed = []
+        real_parse = loader._parse_file
+        monkeypatch.setattr(loader, "_parse_file", lambda f, c: parsed.append(f.name) or real_parse(f, c))
+
+        path = create_yaml_file("b.yml", {"events": {"rocket": {"pattern": "rocket launched", "type": "milestone"}}})
+        self.bump_mtime(path)
+
+        assert loader.refresh() is True
+        assert parsed == ["b.yml"]
+        names = {p.name for p in loader.patterns}
+        assert "rocket" in names and "research" not in names
+        # Patterns from unchanged files are the same objects
+        assert all(any(p is q for q in loader.patterns) for p in untouched)
+
+    def test_added_and_removed_files(self, temp_patterns_dir, create_yaml_file, sample_pattern_yaml):
+        create_yaml_file("a.yml", sample_pattern_yaml)
+        loader = PatternLoader(patterns_dir=temp_patterns_dir)
+        loader.load_patterns()
+
+        create_yaml_file("mod.yml", {"events": {"mod_event": {"pattern": "MOD", "type": "server"}}})
+        assert loader.refresh() is True
+        assert "mod_event" in {p.name for p in loader.patterns}
+
+        (temp_patterns_dir / "a.yml").unlink()
+        assert loader.refresh() is True
+        assert [p.name for p in loader.patterns] == ["mod_event"]
+        assert loader._loaded_files == ["mod.yml"]
+
+    def test_invalid_edit_keeps_previous_patterns(self, temp_patterns_dir, create_yaml_file, sample_pattern_yaml):
+        path = create_yaml_file("a.yml", sample_pattern_yaml)
+        loader = PatternLoader(patterns_dir=temp_patterns_dir)
+        loader.load_patterns()
+
+        path.write_text("events: {player_join: [unclosed", encoding="utf-8")
+        self.bump_mtime(path)
+
+        assert loader.refresh() is False
+        assert len(loader.patterns) == 3
+
+    def test_oversized_edit_keeps_previous_patterns(self, temp_patterns_dir, create_yaml_file, sample_pattern_yaml, monkeypatch):
+        import pattern_loader
+
+        path = create_yaml_file("a.yml", sample_pattern_yaml)
+        loader = PatternLoader(patterns_dir=temp_patterns_dir)
+        loader.load_patterns()
+
+        monkeypatch.setattr(pattern_loader, "MAX_FILE_SIZE_BYTES", 1)
+        self.bump_mtime(path)
+
+        assert loader.refresh() is False
+        assert len(loader.patterns) == 3
+
+    def test_respects_selected_files(self, temp_patterns_dir, create_yaml_file, sample_pattern_yaml):
+        create_yaml_file("a.yml", sample_pattern_yaml)
+        loader = PatternLoader(patterns_dir=temp_patterns_dir)
+        loader.load_patterns(["a.yml"])
+
+        create_yaml_file("other.yml", {"events": {"other": {"pattern": "x", "type": "chat"}}})
+
+        assert loader.refresh() is False
+        assert "other" not in {p.name for p in loader.patterns}
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
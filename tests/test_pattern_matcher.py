@@ -0,0 +1,98 @@
+"""Tests for pattern_matcher: literal prefiltering with priority-order semantics."""
+
+import re
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import pytest
+
+from event_parser import EventParser
+from pattern_matcher import PatternMatcher, required_literals
+
+PATTERNS_DIR = Path(__file__).parent.parent / "patterns"
+
+
+def _entries(*patterns: str) -> List[Tuple[str, Any, Any]]:
+    return [(f"p{i}", re.compile(p, re.IGNORECASE), None) for i, p in enumerate(patterns)]
+
+
+def _first_match(entries: Any, line: str) -> Optional[str]:
+    for name, regex, _ in entries:
+        if regex.search(line):
+            return name
+    return None
+
+
+class TestRequiredLiterals:
+    """Test literal extraction from regex source."""
+
+    def test_extracts_mandatory_runs(self) -> None:
+        """Optional prefixes are skipped; mandatory groups contribute literals."""
+        literals = required_literals(
+            r"^(?:\d{4}-\d{2}-\d{2} )?\[CHAT\] (?P<player>\w+): (?P<message>.+)"
+        )
+        assert "[chat] " in literals
+
+    def test_alternations_and_optional_parts_yield_nothing(self) -> None:
+        """Text inside branches or zero-min repeats is not required."""
+        assert required_literals(r"\[TASK\]|\[TODO\]") == []
+        assert required_literals(r"(?:launched a rocket)?") == []
+
+    def test_repeat_with_min_one_contributes(self) -> None:
+        """A group repeated at least once still requires its literal."""
+        assert required_literals(r"(?:abc\d)+") == ["abc"]
+
+    def test_invalid_pattern_yields_nothing(self) -> None:
+        """Unparseable sources are treated as unindexed."""
+        assert required_literals(r"(unclosed") == []
+
+
+class TestPatternMatcher:
+    """Test candidate selection."""
+
+    def test_candidates_preserve_priority_order(self) -> None:
+        """A higher-priority unanchored pattern still wins over a later tag match."""
+        entries = _entries(r"\[MILESTONE\]", r"^\[CHAT\] (\w+): (.+)", r"(.+)")
+        matcher = PatternMatcher(entries)
+        line = "[CHAT] Eve: [MILESTONE] fake"
+
+        assert _first_match(matcher.candidates(line), line) == "p0"
+        assert [name for name, _, _ in matcher.candidates("[CHAT] Eve: hi")] == ["p1", "p2"]
+
+    def test_non_matching_literals_are_skipped(self) -> None:
+        """Patterns whose literals are absent are never tried."""
+        matcher = PatternMatcher(_entries(r"(\w+) launched a rocket!", r"\[JOIN\] (\w+)"))
+        assert list(matcher.candidates("nothing to see here")) == []
+
+    def test_non_ascii_lines_try_every_pattern(self) -> None:
+        """Unicode case folding can't defeat the prefilter."""
+        entries = _entries(r"\[SERVER\] (.+)")
+        matcher = PatternMatcher(entries)
+        line = "[ſERVER] folded"  # matches under IGNORECASE
+
+        assert _first_match(matcher.candidates(line), line) == _first_match(entries, line) == "p0"
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "2024-01-01 10:00:00 [CHAT] Alice: hello @admins",
+            "[JOIN] Bob joined the game",
+            "[LEAVE] Bob left the game",
+            "Bob was killed by a small biter.",
+            "Bob died.",
+            "[RESEARCH] Finished researching Automation.",
+            "2024-01-01 10:00:00 [SERVER] Saving game.",
+            "Alice launched a rocket!",
+            "[chat] lower: case",
+            "[CHAT] Eve: [MILESTONE] fake",
+            "just some noise",
+        ],
+    )
+    def test_matches_sequential_scan_on_shipped_patterns(self, line: str) -> None:
+        """The matcher picks exactly what the sequential scan would."""
+        parser = EventParser(patterns_dir=PATTERNS_DIR)
+        sequential = [(name, regex, cfg) for name, (regex, cfg) in parser.compiled_patterns.items()]
+
+        assert _first_match(parser._get_matcher().candidates(line), line) == _first_match(
+            sequential, line
+        )
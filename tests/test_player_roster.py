@@ -0,0 +1,91 @@
+"""Tests for player_roster.py (live online-player roster per server)."""
+
+from __future__ import annotations
+
+import pytest
+
+from event_parser import EventType, FactorioEvent
+from player_roster import PlayerRoster, parse_online_players
+
+
+def _event(event_type: EventType, player: str) -> FactorioEvent:
+    return FactorioEvent(event_type=event_type, player_name=player, raw_line="", server_tag="prod")
+
+
+class TestParseOnlinePlayers:
+    def test_players_online_output(self) -> None:
+        response = "Online players (2):\n  Alice (online)\n  - Bob (online)"
+        assert parse_online_players(response) == ["Alice", "Bob"]
+
+    def test_only_placeholder_entry_is_skipped(self) -> None:
+        response = "Online players (3):\n  Player 1 (online)\n  PlayerOne (online)\n  Players (online)"
+        assert parse_online_players(response) == ["PlayerOne", "Players"]
+
+    def test_empty_or_none(self) -> None:
+        assert parse_online_players("") == []
+        assert parse_online_players(None) == []
+        assert parse_online_players("Online players (0):") == []
+
+
+class TestPlayerRoster:
+    def test_events_update_roster(self) -> None:
+        roster = PlayerRoster("prod")
+        assert roster.apply_event(_event(EventType.JOIN, "Alice"))
+        assert roster.apply_event(_event(EventType.JOIN, "Bob"))
+        assert roster.apply_event(_event(EventType.LEAVE, "Alice"))
+        assert not roster.apply_event(_event(EventType.CHAT, "Bob"))
+
+        assert roster.players() == ["Bob"]
+        assert roster.count == 1
+        assert "Bob" in roster and "Alice" not in roster
+
+    def test_leave_of_unknown_player_is_ignored(self) -> None:
+        roster = PlayerRoster()
+        roster.player_left("Ghost")
+        assert roster.count == 0
+
+    def test_stale_until_reconciled(self) -> None:
+        roster = PlayerRoster()
+        roster.player_joined("Alice")
+        assert not roster.is_current()
+
+        roster.reconcile(["Alice", "Bob"])
+        assert roster.is_current()
+        assert roster.players() == ["Alice", "Bob"]
+
+        roster.mark_stale("rcon_connected")
+        assert not roster.is_current()
+
+    def test_expires_after_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [1000.0]
+        monkeypatch.setattr("player_roster.time.monotonic", lambda: now[0])
+        roster = PlayerRoster(reconcile_interval=60.0)
+        roster.reconcile([])
+
+        now[0] += 59.0
+        assert roster.is_current()
+        now[0] += 1.0
+        assert not roster.is_current()
+
+    def test_reconcile_replays_events_after_snapshot_request(self) -> None:
+        roster = PlayerRoster()
+        roster.reconcile(["Alice"])
+
+        since = roster.version
+        # While /players online is in flight, Bob joins and Alice leaves
+        roster.player_joined("Bob")
+        roster.player_left("Alice")
+        roster.reconcile(["Alice"], since=since)
+
+        assert roster.players() == ["Bob"]
+
+    def test_reconcile_without_since_trusts_snapshot(self) -> None:
+        roster = PlayerRoster()
+        roster.player_joined("Alice")
+        roster.reconcile(["Carol"])
+        assert roster.players() == ["Carol"]
+        assert roster.get_stats()["reconciles"] == 1
+
+    def test_invalid_interval(self) -> None:
+        with pytest.raises(ValueError, match="reconcile_interval"):
+            PlayerRoster(reconcile_interval=0)
@@ -11,6 +11,7 @@ import pytest
 import pytest_asyncio
 
 from rcon_alert_monitor import RconAlertMonitor
+from rcon_metrics_sampler import MetricsSnapshot
 
 
 # ============================================================================
@@ -521,6 +522,49 @@ class TestRconAlertMonitorErrorHandling:
 
         mock_discord_interface.send_embed.assert_called_once()
 
+    async def test_low_ups_alert_includes_history_trend(
+        self, mock_rcon_client, mock_discord_interface, mock_metrics_engine
+    ):
+        """Low UPS alert summarizes the engine's recent UPS history."""
+        from metrics_history import MetricsHistory
+
+        history = MetricsHistory()
+        now = datetime.now(timezone.utc).timestamp()
+        for i, ups in enumerate([60.0, 55.0, 50.0, 45.0]):
+            history.record("ups", ups, at=now - 180 + i * 60)
+        mock_metrics_engine.history = history
+        monitor = RconAlertMonitor(
+            rcon_client=mock_rcon_client,
+            discord_interface=mock_discord_interface,
+            metrics_engine=mock_metrics_engine,
+        )
+
+        with patch("discord_interface.EmbedBuilder") as mock_builder:
+            mock_embed = MagicMock()
+            mock_builder.create_base_embed.return_value = mock_embed
+            await monitor._send_low_ups_alert(45.0, 52.5, 50.0)
+
+        fields = {c.kwargs["name"]: c.kwargs["value"] for c in mock_embed.add_field.call_args_list}
+        assert fields["Trend (last 15 min)"] == "p5 45.8, min 45.0, -5.00 UPS/min"
+
+    async def test_low_ups_alert_without_history(
+        self, mock_rcon_client, mock_discord_interface, mock_metrics_engine
+    ):
+        """Engines without history (mocks, older callers) get no trend field."""
+        monitor = RconAlertMonitor(
+            rcon_client=mock_rcon_client,
+            discord_interface=mock_discord_interface,
+            metrics_engine=mock_metrics_engine,
+        )
+
+        with patch("discord_interface.EmbedBuilder") as mock_builder:
+            mock_embed = MagicMock()
+            mock_builder.create_base_embed.return_value = mock_embed
+            await monitor._send_low_ups_alert(45.0, 52.5, 50.0)
+
+        names = [c.kwargs["name"] for c in mock_embed.add_field.call_args_list]
+        assert not any(name.startswith("Trend") for name in names)
+
 
 # ============================================================================
 # SERVER LABEL TESTS (2 tests)
@@ -757,5 +801,81 @@ class TestRconAlertMonitorIntegration:
         assert call_count >= 2
 
 
+@pytest.mark.asyncio
+class TestRconAlertMonitorSharedSampler:
+    """Test alert checks driven by shared metrics snapshots."""
+
+    @staticmethod
+    def _sampler(*snapshots: MetricsSnapshot) -> MagicMock:
+        sampler = MagicMock()
+        sampler.interval = 30
+        sampler.get_snapshot = AsyncMock(side_effect=list(snapshots))
+        return sampler
+
+    async def test_check_uses_snapshot_not_engine(
+        self, mock_rcon_client, mock_discord_interface, mock_metrics_engine
+    ):
+        """With a sampler, checks read the snapshot and never sample UPS directly."""
+        sampler = self._sampler(
+            MetricsSnapshot.capture(
+                {"ups": 50.0, "ups_ema": 51.0, "is_paused": False}, sequence=1
+            )
+        )
+        monitor = RconAlertMonitor(
+            rcon_client=mock_rcon_client,
+            discord_interface=mock_discord_interface,
+            metrics_engine=mock_metrics_engine,
+            metrics_sampler=sampler,
+            check_interval=30,
+            ups_warning_threshold=55.0,
+        )
+
+        await monitor._check_ups()
+
+        # One sampler period of slack, so the check never forces a sample
+        sampler.get_snapshot.assert_awaited_once_with(max_age=60)
+        mock_metrics_engine.sample_ups.assert_not_called()
+        assert monitor.alert_state["consecutive_bad_samples"] == 1
+        assert monitor.alert_state["recent_ups_samples"] == [50.0]
+
+    async def test_same_snapshot_is_not_counted_twice(
+        self, mock_rcon_client, mock_discord_interface, mock_metrics_engine
+    ):
+        """A check that sees no new sample leaves alert state unchanged."""
+        snapshot = MetricsSnapshot.capture(
+            {"ups": 50.0, "ups_ema": 50.0, "is_paused": False}, sequence=7
+        )
+        monitor = RconAlertMonitor(
+            rcon_client=mock_rcon_client,
+            discord_interface=mock_discord_interface,
+            metrics_engine=mock_metrics_engine,
+            metrics_sampler=self._sampler(snapshot, snapshot),
+            ups_warning_threshold=55.0,
+        )
+
+        await monitor._check_ups()
+        await monitor._check_ups()
+
+        assert monitor.alert_state["consecutive_bad_samples"] == 1
+
+    async def test_paused_snapshot_clears_alert(
+        self, mock_rcon_client, mock_discord_interface, mock_metrics_engine
+    ):
+        """Pause state comes from the snapshot."""
+        monitor = RconAlertMonitor(
+            rcon_client=mock_rcon_client,
+            discord_interface=mock_discord_interface,
+            metrics_engine=mock_metrics_engine,
+            metrics_sampler=self._sampler(
+                MetricsSnapshot.capture({"ups": None, "is_paused": True}, sequence=1)
+            ),
+        )
+        monitor.alert_state["low_ups_active"] = True
+
+        await monitor._check_ups()
+
+        assert monitor.alert_state["low_ups_active"] is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
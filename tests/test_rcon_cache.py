@@ -0,0 +1,218 @@
+"""Tests for rcon_cache.py (read-only RCON response cache with singleflight)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from event_parser import EventType, FactorioEvent
+from rcon_cache import (
+    EVOLUTION_ALL_COMMAND,
+    RconResponseCache,
+    evolution_surface_command,
+)
+
+SEED_COMMAND = '/sc rcon.print(game.surfaces["nauvis"].map_gen_settings.seed)'
+
+
+class FakeServer:
+    """Counts executions; each response is unique so reuse is visible."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.commands: List[str] = []
+        self.fail: Exception | None = None
+
+    async def run(self, command: str) -> str:
+        self.commands.append(command)
+        await asyncio.sleep(self.delay)
+        if self.fail is not None:
+            raise self.fail
+        return f"{command}#{len(self.commands)}"
+
+
+async def _query(cache: RconResponseCache, server: FakeServer, command: str) -> str:
+    policy = cache.policy_for(command)
+    assert policy is not None
+    return await cache.fetch(command, policy, server.run)
+
+
+def _event(event_type: EventType, raw_line: str = "", player: str | None = None) -> FactorioEvent:
+    return FactorioEvent(event_type=event_type, player_name=player, raw_line=raw_line, server_tag="prod")
+
+
+# ============================================================================
+# Policies
+# ============================================================================
+
+
+class TestPolicies:
+    @pytest.mark.parametrize(
+        "command, name",
+        [
+            ("/version", "version"),
+            (SEED_COMMAND, "seed"),
+            ("/admins", "admins"),
+            ("/players online", "players"),
+            ("/players", "players"),
+            (EVOLUTION_ALL_COMMAND, "evolution"),
+            (evolution_surface_command("nauvis"), "evolution"),
+        ],
+    )
+    def test_read_only_commands_are_cacheable(self, command: str, name: str) -> None:
+        policy = RconResponseCache().policy_for(command)
+        assert policy is not None and policy.name == name
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "/kick Alice",
+            "/promote Alice",
+            "/version extra",
+            "/sc game.speed = 2",
+            evolution_surface_command("x'); game.print('hi"),
+        ],
+    )
+    def test_other_commands_bypass_cache(self, command: str) -> None:
+        assert RconResponseCache().policy_for(command) is None
+
+
+# ============================================================================
+# Caching and singleflight
+# ============================================================================
+
+
+class TestFetch:
+    async def test_response_reused_until_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr("rcon_cache.time.monotonic", lambda: now[0])
+        cache, server = RconResponseCache(), FakeServer()
+
+        first = await _query(cache, server, "/admins")
+        now[0] += 119.0
+        assert await _query(cache, server, "/admins") == first
+        now[0] += 1.0
+        assert await _query(cache, server, "/admins") != first
+
+        assert len(server.commands) == 2
+        assert cache.hits == 1 and cache.misses == 2
+
+    async def test_version_has_no_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr("rcon_cache.time.monotonic", lambda: now[0])
+        cache, server = RconResponseCache(), FakeServer()
+
+        await _query(cache, server, "/version")
+        now[0] += 86400.0
+        await _query(cache, server, "/version")
+
+        assert server.commands == ["/version"]
+
+    async def test_concurrent_queries_share_one_round_trip(self) -> None:
+        cache, server = RconResponseCache(), FakeServer(delay=0.01)
+
+        results = await asyncio.gather(*(_query(cache, server, "/version") for _ in range(10)))
+
+        assert server.commands == ["/version"]
+        assert len(set(results)) == 1
+        assert cache.coalesced == 9
+
+    async def test_failure_is_shared_and_not_cached(self) -> None:
+        cache, server = RconResponseCache(), FakeServer(delay=0.01)
+        server.fail = ConnectionError("down")
+
+        results = await asyncio.gather(
+            _query(cache, server, "/admins"),
+            _query(cache, server, "/admins"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert len(server.commands) == 1
+
+        server.fail = None
+        assert await _query(cache, server, "/admins") == "/admins#2"
+
+    async def test_cancelled_caller_does_not_cancel_shared_query(self) -> None:
+        cache, server = RconResponseCache(), FakeServer(delay=0.01)
+
+        first = asyncio.create_task(_query(cache, server, "/version"))
+        second = asyncio.create_task(_query(cache, server, "/version"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "/version#1"
+        assert first.cancelled()
+
+    async def test_invalidation_during_flight_is_not_overwritten(self) -> None:
+        cache, server = RconResponseCache(), FakeServer(delay=0.01)
+
+        pending = asyncio.create_task(_query(cache, server, "/admins"))
+        await asyncio.sleep(0)
+        cache.invalidate(("admins",), reason="test")
+        # A caller after the invalidation starts its own query
+        fresh = await _query(cache, server, "/admins")
+        await pending
+
+        assert fresh == "/admins#2"
+        assert await _query(cache, server, "/admins") == "/admins#2"
+
+
+# ============================================================================
+# Invalidation hooks
+# ============================================================================
+
+
+class TestInvalidation:
+    async def test_invalidate_selected_policies(self) -> None:
+        cache, server = RconResponseCache(), FakeServer()
+        await _query(cache, server, "/version")
+        await _query(cache, server, "/admins")
+
+        cache.invalidate(("admins",))
+        await _query(cache, server, "/version")
+        await _query(cache, server, "/admins")
+
+        assert server.commands == ["/version", "/admins", "/admins"]
+
+    async def test_server_restart_line_clears_everything(self) -> None:
+        cache, server = RconResponseCache(), FakeServer()
+        await _query(cache, server, "/version")
+        await _query(cache, server, SEED_COMMAND)
+
+        cache.observe_event(_event(EventType.SERVER, "[SERVER] Server started."))
+
+        assert cache.get_stats()["entries"] == 0
+
+    async def test_promotion_line_clears_admins(self) -> None:
+        cache, server = RconResponseCache(), FakeServer()
+        await _query(cache, server, "/version")
+        await _query(cache, server, "/admins")
+
+        cache.observe_event(_event(EventType.SERVER, "Alice promoted Bob to admin"))
+
+        assert cache.get_stats()["entries"] == 1
+        await _query(cache, server, "/version")
+        assert server.commands == ["/version", "/admins"]
+
+    async def test_join_clears_players(self) -> None:
+        cache, server = RconResponseCache(), FakeServer()
+        await _query(cache, server, "/players online")
+        await _query(cache, server, "/version")
+
+        cache.observe_event(_event(EventType.JOIN, "[JOIN] Alice joined the game", "Alice"))
+        cache.observe_event(_event(EventType.CHAT, "[CHAT] Alice: hi", "Alice"))
+
+        await _query(cache, server, "/players online")
+        await _query(cache, server, "/version")
+        assert server.commands == ["/players online", "/version", "/players online"]
+
+    async def test_promote_command_clears_admins(self) -> None:
+        cache, server = RconResponseCache(), FakeServer()
+        await _query(cache, server, "/admins")
+
+        cache.observe_command("/promote Alice")
+
+        await _query(cache, server, "/admins")
+        assert server.commands == ["/admins", "/admins"]
@@ -18,13 +18,16 @@ Total: 64 tests covering 94%+ coverage.
 import pytest
 import asyncio
 import sys
+import time
 from typing import Optional
 from unittest.mock import Mock, AsyncMock, MagicMock, patch, PropertyMock, call
 
 try:
     from rcon_client import RconClient, RCON_AVAILABLE
+    from rcon_protocol import RconCommandNotSent
 except ImportError:
     from src.rcon_client import RconClient, RCON_AVAILABLE
+    from src.rcon_protocol import RconCommandNotSent
 
 
 class TestRconClientInitialization:
@@ -88,7 +91,7 @@ class TestRconClientInitialization:
     def test_rcon_client_init_rcon_unavailable(self) -> None:
         """RconClient should raise ImportError when rcon unavailable."""
         with patch('rcon_client.RCON_AVAILABLE', False):
-            with pytest.raises(ImportError, match="rcon package not installed"):
+            with pytest.raises(ImportError, match="rcon_protocol module not available"):
                 RconClient("localhost", 27015, "password")
 
     def test_use_context_updates_server_name_only(self) -> None:
@@ -269,8 +272,8 @@ class TestRconClientExecution:
 
     @pytest.mark.asyncio
     async def test_execute_rcon_client_none(self) -> None:
-        """execute should raise when RCONClient is None."""
-        with patch('rcon_client.RCONClient', None):
+        """execute should raise when AsyncRconConnection is None."""
+        with patch('rcon_client.AsyncRconConnection', None):
             client = RconClient.__new__(RconClient)
             client.connected = True
             client.host = "localhost"
@@ -290,10 +293,10 @@ class TestRconClientExecution:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def fake_to_thread(fn, *args, **kwargs):
+        async def fake_run_pooled(command):
             return "Player count: 5"
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=fake_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=fake_run_pooled):
             result = await client.execute("status")
             assert result == "Player count: 5"
 
@@ -321,10 +324,10 @@ class TestRconClientExecution:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def fake_to_thread(fn, *args, **kwargs):
+        async def fake_run_pooled(command):
             raise RuntimeError("Connection lost")
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=fake_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=fake_run_pooled):
             with pytest.raises(RuntimeError):
                 await client.execute("status")
             
@@ -339,10 +342,10 @@ class TestRconClientExecution:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def fake_to_thread(fn, *args, **kwargs):
+        async def fake_run_pooled(command):
             return None
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=fake_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=fake_run_pooled):
             result = await client.execute("status")
             assert result == ""
 
@@ -499,6 +502,34 @@ class TestRconClientQueryMethods:
         players = await client.get_players()
         assert players == ["Alice", "Bob"]
 
+    @pytest.mark.asyncio
+    async def test_players_answered_from_current_roster(self) -> None:
+        """A reconciled roster answers count/list queries without RCON traffic."""
+        client = RconClient("localhost", 27015, "password")
+        client.connected = True
+        client.execute = AsyncMock(return_value="Online players (1):\n  Alice (online)")
+
+        assert await client.get_players_online() == ["Alice"]
+        client.execute.assert_awaited_once_with("/players online")
+
+        client.roster.player_joined("Bob")
+        assert await client.get_player_count() == 2
+        assert await client.get_players_online() == ["Alice", "Bob"]
+        client.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_roster_is_reconciled(self) -> None:
+        """A stale roster (e.g. after reconnect) is refreshed via /players online."""
+        client = RconClient("localhost", 27015, "password")
+        client.connected = True
+        client.roster.reconcile(["Alice"])
+        client.roster.mark_stale("rcon_connected")
+        client.execute = AsyncMock(return_value="Online players (1):\n  Bob (online)")
+
+        assert await client.get_player_count() == 1
+        assert client.roster.players() == ["Bob"]
+        assert client.roster.is_current()
+
     @pytest.mark.asyncio
     async def test_get_play_time_returns_response(self) -> None:
         """get_play_time should return response when available."""
@@ -904,3 +935,336 @@ class TestRconClientReconnectionLoopIntegration:
         
         # connect should NOT be called when already connected
         client.connect.assert_not_called()
+
+
+class FakePooledRcon:
+    """Stand-in for AsyncRconConnection that records opens/runs/closes."""
+
+    instances: list = []
+
+    def __init__(self, host, port, password, timeout=None):
+        self.host = host
+        self.port = port
+        self.closed = False
+        self.commands: list = []
+        self.fail_next: Optional[Exception] = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.last_used = time.monotonic()
+        FakePooledRcon.instances.append(self)
+
+    @classmethod
+    async def open(cls, host, port, password, timeout=None):
+        return cls(host, port, password, timeout=timeout)
+
+    @property
+    def is_alive(self) -> bool:
+        return not self.closed
+
+    async def execute(self, command: str) -> str:
+        if self.closed:
+            raise RconCommandNotSent("RCON connection is closed")
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        self.last_used = time.monotonic()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            self.commands.append(command)
+            return f"ok:{command}"
+        finally:
+            self.in_flight -= 1
+
+    def abort(self) -> None:
+        self.closed = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestRconClientResponseCache:
+    """Test read-only command caching in execute()."""
+
+    @pytest.fixture(autouse=True)
+    def fake_rcon(self):
+        FakePooledRcon.instances = []
+        with patch("rcon_client.AsyncRconConnection", FakePooledRcon):
+            yield FakePooledRcon
+
+    @pytest.mark.asyncio
+    async def test_read_only_command_cached(self, fake_rcon) -> None:
+        """Repeated and concurrent /version queries cost one round trip."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+
+        results = await asyncio.gather(*(client.execute("/version") for _ in range(5)))
+        results.append(await client.execute("/version"))
+
+        assert set(results) == {"ok:/version"}
+        assert sum(c.commands.count("/version") for c in fake_rcon.instances) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_commands_not_cached(self, fake_rcon) -> None:
+        """Commands without a cache policy always reach the server."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+
+        await client.execute("/kick Alice")
+        await client.execute("/kick Alice")
+
+        assert sum(c.commands.count("/kick Alice") for c in fake_rcon.instances) == 2
+
+    @pytest.mark.asyncio
+    async def test_promote_invalidates_admins(self, fake_rcon) -> None:
+        """A /promote through the client drops the cached admin list."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+
+        await client.execute("/admins")
+        await client.execute("/promote Alice")
+        await client.execute("/admins")
+
+        assert sum(c.commands.count("/admins") for c in fake_rcon.instances) == 2
+
+    @pytest.mark.asyncio
+    async def test_reconnect_clears_cache(self, fake_rcon) -> None:
+        """The server may have restarted while disconnected."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+        await client.execute("/version")
+
+        await client.disconnect()
+        await client.connect()
+        await client.execute("/version")
+
+        assert sum(c.commands.count("/version") for c in fake_rcon.instances) == 2
+
+
+class TestRconClientScheduling:
+    """Test that execute() goes through the per-server scheduler."""
+
+    @pytest.fixture(autouse=True)
+    def fake_rcon(self):
+        FakePooledRcon.instances = []
+        with patch("rcon_client.AsyncRconConnection", FakePooledRcon):
+            yield FakePooledRcon
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight_commands(self, fake_rcon) -> None:
+        """No more than max_concurrency commands reach the server at once."""
+        client = RconClient("localhost", 27015, "password", pool_size=1, max_concurrency=1)
+        await client.connect()
+
+        await asyncio.gather(*(client.execute(f"/sc rcon.print({i})") for i in range(5)))
+
+        assert fake_rcon.instances[0].max_in_flight == 1
+        stats = client.scheduler.get_stats()
+        assert stats["in_flight"] == 0
+        assert stats["by_priority"]["query"]["dispatched"] == 5
+
+    @pytest.mark.asyncio
+    async def test_priority_context_applies_to_execute(self, fake_rcon) -> None:
+        """Commands issued inside command_priority() are scheduled at that class."""
+        from rcon_scheduler import CommandPriority, command_priority
+
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+
+        with command_priority(CommandPriority.ADMIN):
+            await client.execute("/kick Alice")
+
+        stats = client.scheduler.get_stats()["by_priority"]
+        assert stats["admin"]["dispatched"] == 1
+        assert stats["query"]["dispatched"] == 0
+
+
+class TestRconClientConnectionPool:
+    """Test persistent pooled connections (no connect-per-command)."""
+
+    @pytest.fixture(autouse=True)
+    def fake_rcon(self):
+        FakePooledRcon.instances = []
+        with patch("rcon_client.AsyncRconConnection", FakePooledRcon):
+            yield FakePooledRcon
+
+    @pytest.mark.asyncio
+    async def test_connect_keeps_authenticated_connection(self, fake_rcon) -> None:
+        """connect() should keep its connection for reuse instead of closing it."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+
+        assert client.connected is True
+        assert len(fake_rcon.instances) == 1
+        assert not fake_rcon.instances[0].closed
+        assert client._connections == fake_rcon.instances
+
+    @pytest.mark.asyncio
+    async def test_sequential_commands_reuse_one_connection(self, fake_rcon) -> None:
+        """Commands after connect() should not open new connections."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+
+        for i in range(5):
+            assert await client.execute(f"/c {i}") == f"ok:/c {i}"
+
+        assert len(fake_rcon.instances) == 1
+        assert len(fake_rcon.instances[0].commands) == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_multiplex_within_pool_size(self, fake_rcon) -> None:
+        """Concurrent commands share at most pool_size connections."""
+        client = RconClient("localhost", 27015, "password", pool_size=2)
+        client.connected = True
+
+        results = await asyncio.gather(*(client.execute(f"/c {i}") for i in range(10)))
+
+        assert results == [f"ok:/c {i}" for i in range(10)]
+        assert len(fake_rcon.instances) <= 2
+        assert len(client._connections) <= 2
+        assert max(conn.max_in_flight for conn in fake_rcon.instances) > 1
+
+    @pytest.mark.asyncio
+    async def test_stale_connection_reconnects_transparently(self, fake_rcon) -> None:
+        """A reused connection found closed before sending is replaced and retried once."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+        fake_rcon.instances[0].fail_next = RconCommandNotSent("RCON connection is closed")
+
+        result = await client.execute("/time")
+
+        assert result == "ok:/time"
+        assert client.connected is True
+        assert fake_rcon.instances[0].closed
+        assert len(fake_rcon.instances) == 2
+        assert client._connections == [fake_rcon.instances[1]]
+
+    @pytest.mark.asyncio
+    async def test_connection_dropped_mid_command_is_not_retried(self, fake_rcon) -> None:
+        """The server may already have run the command, so it is not re-sent."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+        fake_rcon.instances[0].fail_next = ConnectionResetError("reset by peer")
+
+        with pytest.raises(ConnectionResetError):
+            await client.execute("/ban Alice")
+
+        assert len(fake_rcon.instances) == 1
+        assert client.connected is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_open_one_connection(self, fake_rcon) -> None:
+        """Callers racing to reconnect share a single new connection."""
+        client = RconClient("localhost", 27015, "password")
+
+        await asyncio.gather(*(client.connect() for _ in range(5)))
+
+        assert client.connected is True
+        assert len(fake_rcon.instances) == 1
+
+    @pytest.mark.asyncio
+    async def test_busy_connection_is_never_evicted(self, fake_rcon) -> None:
+        """A full pool only makes room by closing idle connections."""
+        client = RconClient("localhost", 27015, "password", pool_size=1)
+        await client.connect()
+        busy = fake_rcon.instances[0]
+        busy.in_flight = 1
+
+        extra = FakePooledRcon("localhost", 27015, "password")
+        client._add_connection(extra)
+
+        assert not busy.closed
+        assert client._connections == [busy, extra]
+
+        # Trimmed back to pool_size once the surplus is idle
+        busy.in_flight = 0
+        client._prune_idle_connections()
+        assert len(client._connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_connection_failure_is_not_retried(self, fake_rcon) -> None:
+        """Errors on a freshly opened connection should propagate and mark disconnected."""
+        client = RconClient("localhost", 27015, "password")
+        client.connected = True
+
+        async def failing_execute(self, command):
+            raise ConnectionRefusedError("refused")
+
+        with patch.object(FakePooledRcon, "execute", failing_execute):
+            with pytest.raises(ConnectionRefusedError):
+                await client.execute("/time")
+
+        assert client.connected is False
+        assert len(fake_rcon.instances) == 1
+        assert client._connections == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_not_retried(self, fake_rcon) -> None:
+        """A command timeout should not be replayed on a new connection."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+        fake_rcon.instances[0].fail_next = asyncio.TimeoutError()
+
+        with pytest.raises(TimeoutError):
+            await client.execute("/time")
+
+        assert len(fake_rcon.instances) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_idle_connection_is_recycled(self, fake_rcon) -> None:
+        """Connections idle beyond max_idle should be closed and replaced."""
+        client = RconClient("localhost", 27015, "password", max_idle=0.0)
+        await client.connect()
+        first = fake_rcon.instances[0]
+
+        with patch("rcon_client.time.monotonic", return_value=1e9):
+            await client.execute("/time")
+
+        assert first.closed
+        assert len(fake_rcon.instances) == 2
+
+    @pytest.mark.asyncio
+    async def test_dead_connection_is_pruned(self, fake_rcon) -> None:
+        """Connections closed by the server should be dropped before reuse."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+        fake_rcon.instances[0].closed = True
+
+        assert await client.execute("/time") == "ok:/time"
+        assert len(fake_rcon.instances) == 2
+        assert client._connections == [fake_rcon.instances[1]]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_closes_pooled_connections(self, fake_rcon) -> None:
+        """disconnect() should close every pooled connection."""
+        client = RconClient("localhost", 27015, "password")
+        await client.connect()
+        await client.execute("/time")
+
+        await client.disconnect()
+
+        assert client.connected is False
+        assert client._connections == []
+        assert all(conn.closed for conn in fake_rcon.instances)
+
+
+class TestBackwardCompatibleExports:
+    """Classes that moved out of rcon_client are still importable from it."""
+
+    def test_moved_classes_resolve_lazily(self) -> None:
+        import rcon_client
+        from rcon_alert_monitor import RconAlertMonitor
+        from rcon_metrics_engine import RconMetricsEngine, UPSCalculator
+        from rcon_stats_collector import RconStatsCollector
+
+        assert rcon_client.RconAlertMonitor is RconAlertMonitor
+        assert rcon_client.RconMetricsEngine is RconMetricsEngine
+        assert rcon_client.UPSCalculator is UPSCalculator
+        assert rcon_client.RconStatsCollector is RconStatsCollector
+
+    def test_unknown_attribute_raises(self) -> None:
+        import rcon_client
+
+        with pytest.raises(AttributeError):
+            rcon_client.NotAClass  # noqa: B018
@@ -51,8 +51,8 @@ class TestExecuteMethodIntensified:
 
     @pytest.mark.asyncio
     async def test_execute_rcon_client_none_raises(self) -> None:
-        """execute() should raise when RCONClient is None (line 249-250)."""
-        with patch('rcon_client.RCONClient', None):
+        """execute() should raise when AsyncRconConnection is None (line 249-250)."""
+        with patch('rcon_client.AsyncRconConnection', None):
             client = RconClient.__new__(RconClient)
             client.connected = True
             client.host = "localhost"
@@ -64,8 +64,8 @@ class TestExecuteMethodIntensified:
                 await client.execute("status")
 
     @pytest.mark.asyncio
-    async def test_execute_to_thread_called_with_execute_function(self) -> None:
-        """execute() should call asyncio.to_thread with _execute function (line 256-270)."""
+    async def test_execute_runs_command_on_pool(self) -> None:
+        """execute() should run the command once through the connection pool."""
         if not RCON_AVAILABLE:
             pytest.skip("rcon library not available")
         
@@ -73,12 +73,12 @@ class TestExecuteMethodIntensified:
         client.connected = True
         
         call_count = 0
-        async def mock_to_thread(fn, *args, **kwargs):
+        async def mock_run_pooled(command):
             nonlocal call_count
             call_count += 1
             return "success"
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=mock_run_pooled):
             result = await client.execute("status")
             assert result == "success"
             assert call_count == 1
@@ -113,10 +113,10 @@ class TestExecuteMethodIntensified:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def mock_to_thread(fn, *args, **kwargs):
+        async def mock_run_pooled(command):
             return None
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=mock_run_pooled):
             result = await client.execute("status")
             assert result == ""
 
@@ -129,10 +129,10 @@ class TestExecuteMethodIntensified:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def mock_to_thread(fn, *args, **kwargs):
+        async def mock_run_pooled(command):
             return "result"
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=mock_run_pooled):
             with patch("rcon_client.logger") as mock_logger:
                 await client.execute("status")
                 mock_logger.debug.assert_called()
@@ -183,10 +183,10 @@ class TestExecuteMethodIntensified:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def mock_to_thread(fn, *args, **kwargs):
+        async def mock_run_pooled(command):
             raise RuntimeError("Test error")
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=mock_run_pooled):
             with pytest.raises(RuntimeError):
                 await client.execute("status")
             
@@ -201,10 +201,10 @@ class TestExecuteMethodIntensified:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def mock_to_thread(fn, *args, **kwargs):
+        async def mock_run_pooled(command):
             raise RuntimeError("Connection lost")
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_run_pooled", side_effect=mock_run_pooled):
             with patch("rcon_client.logger") as mock_logger:
                 with pytest.raises(RuntimeError):
                     await client.execute("status")
@@ -236,8 +236,8 @@ class TestConnectMethodIntensified:
 
     @pytest.mark.asyncio
     async def test_connect_checks_rconclient_is_none(self) -> None:
-        """connect() should check if RCONClient is None (line 161-163)."""
-        with patch('rcon_client.RCONClient', None):
+        """connect() should check if AsyncRconConnection is None (line 161-163)."""
+        with patch('rcon_client.AsyncRconConnection', None):
             client = RconClient.__new__(RconClient)
             client.host = "localhost"
             client.port = 27015
@@ -250,23 +250,23 @@ class TestConnectMethodIntensified:
                 mock_logger.error.assert_called_with("rcon_library_not_available")
 
     @pytest.mark.asyncio
-    async def test_connect_calls_to_thread_with_test_connect(self) -> None:
-        """connect() should call asyncio.to_thread with _test_connect (line 172-177)."""
+    async def test_connect_opens_pooled_connection(self) -> None:
+        """connect() should open and keep an authenticated connection."""
         if not RCON_AVAILABLE:
             pytest.skip("rcon library not available")
         
         client = RconClient("localhost", 27015, "password")
         client.connected = False
         
-        to_thread_called = False
-        async def mock_to_thread(fn, *args, **kwargs):
-            nonlocal to_thread_called
-            to_thread_called = True
-            return True
+        open_called = False
+        async def mock_open_connection():
+            nonlocal open_called
+            open_called = True
+            return MagicMock()
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_open_connection", side_effect=mock_open_connection):
             await client.connect()
-            assert to_thread_called
+            assert open_called
             assert client.connected is True
 
     @pytest.mark.asyncio
@@ -278,10 +278,10 @@ class TestConnectMethodIntensified:
         client = RconClient("localhost", 27015, "password")
         client.connected = False
         
-        async def mock_to_thread(fn, *args, **kwargs):
-            return True
+        async def mock_open_connection():
+            return MagicMock()
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_open_connection", side_effect=mock_open_connection):
             await client.connect()
             assert client.connected is True
 
@@ -298,10 +298,10 @@ class TestConnectMethodIntensified:
         client.connected = False
         client.current_reconnect_delay = 16.0  # Was backed off
         
-        async def mock_to_thread(fn, *args, **kwargs):
-            return True
+        async def mock_open_connection():
+            return MagicMock()
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_open_connection", side_effect=mock_open_connection):
             await client.connect()
             assert client.current_reconnect_delay == 2.0
 
@@ -314,10 +314,10 @@ class TestConnectMethodIntensified:
         client = RconClient("localhost", 27015, "password")
         client.connected = False
         
-        async def mock_to_thread(fn, *args, **kwargs):
-            return True
+        async def mock_open_connection():
+            return MagicMock()
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_open_connection", side_effect=mock_open_connection):
             with patch("rcon_client.logger") as mock_logger:
                 await client.connect()
                 mock_logger.info.assert_called()
@@ -333,10 +333,10 @@ class TestConnectMethodIntensified:
         client = RconClient("localhost", 27015, "password")
         client.connected = True
         
-        async def mock_to_thread(fn, *args, **kwargs):
+        async def mock_open_connection():
             raise RuntimeError("Connection failed")
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_open_connection", side_effect=mock_open_connection):
             await client.connect()
             assert client.connected is False
 
@@ -348,10 +348,10 @@ class TestConnectMethodIntensified:
         
         client = RconClient("localhost", 27015, "password")
         
-        async def mock_to_thread(fn, *args, **kwargs):
+        async def mock_open_connection():
             raise RuntimeError("Connection failed")
         
-        with patch("rcon_client.asyncio.to_thread", side_effect=mock_to_thread):
+        with patch.object(RconClient, "_open_connection", side_effect=mock_open_connection):
             with patch("rcon_client.logger") as mock_logger:
                 await client.connect()
                 mock_logger.error.assert_called()
@@ -6,7 +6,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from rcon_metrics_engine import RconMetricsEngine, UPSCalculator
+from rcon_metrics_engine import (
+    RTT_REJECT_FLOOR,
+    TICK_SAMPLE_DEADLINE,
+    RconMetricsEngine,
+    TickReading,
+    UPSCalculator,
+    build_batch_metrics_script,
+    format_play_time,
+)
 
 
 # ============================================================================
@@ -118,7 +126,7 @@ class TestUPSCalculatorSampling:
         first_time = calc.last_sample_time
 
         # Second sample (2 real seconds later, 120 ticks advanced)
-        with patch("time.time", return_value=first_time + 2.0):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 2.0):
             mock_client.execute = AsyncMock(return_value="1120")
             result = await calc.sample_ups(mock_client)
 
@@ -131,15 +139,15 @@ class TestUPSCalculatorSampling:
         """Pause detected when no ticks advanced over threshold time."""
         calc = UPSCalculator(pause_time_threshold=5.0)
         mock_client = MagicMock()
-        first_time = time.time()
+        first_time = time.monotonic()
 
         # First sample
-        with patch("time.time", return_value=first_time):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time):
             mock_client.execute = AsyncMock(return_value="1000")
             await calc.sample_ups(mock_client)
 
         # Second sample: no tick advancement, 5+ seconds later
-        with patch("time.time", return_value=first_time + 6.0):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 6.0):
             mock_client.execute = AsyncMock(return_value="1000")
             result = await calc.sample_ups(mock_client)
 
@@ -150,15 +158,15 @@ class TestUPSCalculatorSampling:
         """Minimal tick advancement (< 60 ticks over 5+ seconds) indicates pause."""
         calc = UPSCalculator(pause_time_threshold=5.0)
         mock_client = MagicMock()
-        first_time = time.time()
+        first_time = time.monotonic()
 
         # First sample
-        with patch("time.time", return_value=first_time):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time):
             mock_client.execute = AsyncMock(return_value="1000")
             await calc.sample_ups(mock_client)
 
         # Second sample: only 30 ticks (< 60), 5+ seconds later
-        with patch("time.time", return_value=first_time + 6.0):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 6.0):
             mock_client.execute = AsyncMock(return_value="1030")
             result = await calc.sample_ups(mock_client)
 
@@ -169,21 +177,21 @@ class TestUPSCalculatorSampling:
         """Unpause detected when UPS > 10 after being paused."""
         calc = UPSCalculator(pause_time_threshold=5.0)
         mock_client = MagicMock()
-        first_time = time.time()
+        first_time = time.monotonic()
 
         # First sample
-        with patch("time.time", return_value=first_time):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time):
             mock_client.execute = AsyncMock(return_value="1000")
             await calc.sample_ups(mock_client)
 
         # Pause: no advancement for 6 seconds
-        with patch("time.time", return_value=first_time + 6.0):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 6.0):
             mock_client.execute = AsyncMock(return_value="1000")
             result = await calc.sample_ups(mock_client)
             assert calc.is_paused is True
 
         # Resume: 60 ticks in 1 second = 60 UPS
-        with patch("time.time", return_value=first_time + 7.0):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 7.0):
             mock_client.execute = AsyncMock(return_value="1060")
             result = await calc.sample_ups(mock_client)
 
@@ -194,22 +202,22 @@ class TestUPSCalculatorSampling:
         """Too-fast samples (< 0.1s) return cached UPS, don't update."""
         calc = UPSCalculator()
         mock_client = MagicMock()
-        first_time = time.time()
+        first_time = time.monotonic()
 
         # First sample
-        with patch("time.time", return_value=first_time):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time):
             mock_client.execute = AsyncMock(return_value="1000")
             await calc.sample_ups(mock_client)
 
         # Normal second sample
-        with patch("time.time", return_value=first_time + 2.0):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 2.0):
             mock_client.execute = AsyncMock(return_value="1120")
             await calc.sample_ups(mock_client)
 
         cached_ups = calc.current_ups
 
         # Too-fast third sample (0.05 seconds later)
-        with patch("time.time", return_value=first_time + 2.05):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 2.05):
             mock_client.execute = AsyncMock(return_value="1123")
             result = await calc.sample_ups(mock_client)
 
@@ -225,6 +233,24 @@ class TestUPSCalculatorSampling:
 
         assert result is None
 
+    async def test_sample_ups_runs_at_tick_priority(self) -> None:
+        """Tick samples are scheduled ahead of other commands, with a deadline."""
+        from rcon_scheduler import CommandPriority, current_priority
+
+        seen = []
+
+        async def execute(command):
+            seen.append(current_priority())
+            return "100"
+
+        calc = UPSCalculator()
+        mock_client = MagicMock()
+        mock_client.execute = AsyncMock(side_effect=execute)
+
+        await calc.sample_ups(mock_client)
+
+        assert seen == [(CommandPriority.TICK, TICK_SAMPLE_DEADLINE)]
+
     async def test_sample_ups_handles_non_numeric_tick_response(self) -> None:
         """UPS sampling handles non-numeric tick response gracefully."""
         calc = UPSCalculator()
@@ -237,6 +263,109 @@ class TestUPSCalculatorSampling:
         assert result is None
 
 
+class TestUPSCalculatorLatency:
+    """Test round-trip midpoint timestamps and RTT outlier rejection."""
+
+    async def test_tick_timestamped_at_round_trip_midpoint(self) -> None:
+        """The observation time is halfway between send and receive."""
+        calc = UPSCalculator()
+        mock_client = MagicMock()
+        mock_client.execute = AsyncMock(return_value="600")
+
+        with patch("rcon_metrics_engine.time.monotonic", side_effect=[100.0, 100.4]):
+            reading = await calc.read_tick(mock_client)
+
+        assert reading == TickReading(600, 100.2, pytest.approx(0.4))
+
+    async def test_queue_wait_excluded_from_round_trip(self) -> None:
+        """Time queued in the client's scheduler is not counted as RTT."""
+        calc = UPSCalculator()
+        mock_client = MagicMock()
+        mock_client.execute = AsyncMock(return_value="600")
+
+        with patch("rcon_metrics_engine.time.monotonic", side_effect=[100.0, 100.4]), patch(
+            "rcon_metrics_engine.admitted_at", return_value=100.3
+        ):
+            reading = await calc.read_tick(mock_client)
+
+        assert reading == TickReading(600, pytest.approx(100.35), pytest.approx(0.1))
+
+    def test_ups_uses_observation_times(self) -> None:
+        """UPS divides by the midpoint delta, not receive-time delta."""
+        calc = UPSCalculator()
+        calc.record_tick(0, 10.0, rtt=0.02)
+
+        assert calc.record_tick(120, 12.0, rtt=0.02) == pytest.approx(60.0)
+
+    def test_outlying_rtt_rejected(self) -> None:
+        """A sample with RTT far above the smoothed RTT keeps the old baseline."""
+        calc = UPSCalculator()
+        now = 0.0
+        for i in range(5):
+            now += 2.0
+            calc.record_tick(i * 120, now, rtt=0.02)
+        assert calc.current_ups == pytest.approx(60.0)
+
+        # Slow round trip: timestamp uncertain by up to 0.5 s
+        assert calc.record_tick(720, now + 2.6, rtt=1.0) is None
+        assert calc.last_sample_rejected is True
+        assert calc.rejected_samples == 1
+        assert calc.last_tick == 480
+
+        assert calc.record_tick(720, now + 4.0, rtt=0.02) == pytest.approx(60.0)
+        assert calc.last_sample_rejected is False
+        assert calc.last_tick == 720
+
+    def test_small_rtt_jitter_never_rejected(self) -> None:
+        """RTT changes under RTT_REJECT_FLOOR are accepted even on a steady link."""
+        calc = UPSCalculator()
+        for i in range(5):
+            calc.record_tick(i * 120, i * 2.0, rtt=0.010)
+
+        calc.record_tick(600, 10.0, rtt=0.010 + RTT_REJECT_FLOOR)
+
+        assert calc.rejected_samples == 0
+
+    def test_lasting_latency_shift_is_absorbed(self) -> None:
+        """Rejected samples still update SRTT, so a new RTT level is accepted."""
+        calc = UPSCalculator()
+        now = 0.0
+        for i in range(5):
+            now += 2.0
+            calc.record_tick(i * 120, now, rtt=0.02)
+
+        accepted_after = None
+        for i in range(5, 60):
+            now += 2.0
+            calc.record_tick(i * 120, now, rtt=0.5)
+            if calc.last_tick == i * 120:
+                accepted_after = i - 5
+                break
+
+        assert accepted_after is not None
+        assert 0 < accepted_after < 30
+
+    async def test_burst_keeps_lowest_rtt_reading(self) -> None:
+        """With burst_samples > 1 the most precise reading is recorded."""
+        calc = UPSCalculator(burst_samples=3, burst_interval=0)
+        mock_client = MagicMock()
+        mock_client.execute = AsyncMock(side_effect=["100", "110", "120"])
+        clock = [
+            1.0, 1.3,  # rtt 0.3
+            2.0, 2.1,  # rtt 0.1
+            3.0, 3.2,  # rtt 0.2
+        ]
+
+        with patch("rcon_metrics_engine.time.monotonic", side_effect=clock), patch(
+            "rcon_metrics_engine.asyncio.sleep", new=AsyncMock()
+        ):
+            await calc.sample_ups(mock_client)
+
+        assert mock_client.execute.await_count == 3
+        assert calc.last_tick == 110
+        assert calc.last_sample_time == pytest.approx(2.05)
+
+
 # ============================================================================
 # METRICS ENGINE INITIALIZATION TESTS
 # ============================================================================
@@ -536,7 +665,7 @@ class TestRconMetricsEngineGatherAllMetricsHappyPath:
         assert result1["ups"] is None
 
         # Prepare for second gather with valid UPS
-        first_time = time.time()
+        first_time = time.monotonic()
         call_count = 0
 
         async def mock_execute_with_delay(cmd):
@@ -549,7 +678,7 @@ class TestRconMetricsEngineGatherAllMetricsHappyPath:
         engine.ups_calculator.last_sample_time = first_time
 
         # Second gather: sample_ups returns actual UPS value
-        with patch("time.time", return_value=first_time + 2.0):
+        with patch("rcon_metrics_engine.time.monotonic", return_value=first_time + 2.0):
             mock_rcon_client.execute = AsyncMock(return_value="3720")  # +120 ticks in 2s
             result2 = await engine.gather_all_metrics()
 
@@ -759,5 +888,236 @@ class TestRconMetricsEngineIntegration:
         assert ema2 == pytest.approx(0.2 * 59.0 + 0.8 * ema1)
 
 
+@pytest.mark.asyncio
+class TestRconMetricsEngineBatchedCollection:
+    """Test single-round-trip batched metrics collection."""
+
+    async def test_batched_metrics_single_round_trip(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """gather_all_metrics uses one RCON command when the script succeeds."""
+        mock_rcon_client.execute = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "tick": 216000,
+                    "players": ["Alice", "Bob"],
+                    "evolution": {"nauvis": 0.42, "gleba": 0},
+                }
+            )
+        )
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+
+        result = await engine.gather_all_metrics()
+
+        mock_rcon_client.execute.assert_called_once()
+        assert mock_rcon_client.execute.call_args[0][0].startswith("/sc ")
+        mock_rcon_client.get_players.assert_not_called()
+        mock_rcon_client.get_player_count.assert_not_called()
+        mock_rcon_client.get_play_time.assert_not_called()
+        assert result["tick"] == 216000
+        assert result["game_time_seconds"] == 3600.0
+        assert result["players"] == ["Alice", "Bob"]
+        assert result["player_count"] == 2
+        assert result["play_time"] == "1 hour, 0 minutes, 0 seconds"
+        assert result["evolution_by_surface"] == {"nauvis": 0.42, "gleba": 0.0}
+        assert result["evolution_factor"] == 0.42
+
+    async def test_batched_metrics_reconcile_player_roster(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """The batch's player list reconciles the client's roster for free."""
+        from player_roster import PlayerRoster
+
+        mock_rcon_client.roster = PlayerRoster("test")
+        mock_rcon_client.execute = AsyncMock(
+            return_value='{"tick":60,"players":["Alice","Bob"],"evolution":{}}'
+        )
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+
+        await engine.gather_all_metrics()
+
+        assert mock_rcon_client.roster.is_current()
+        assert mock_rcon_client.roster.players() == ["Alice", "Bob"]
+
+    async def test_metrics_collection_priorities(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """The batch (carrying the tick) runs as TICK; fallback queries as STATS."""
+        from rcon_scheduler import CommandPriority, current_priority
+
+        seen = []
+
+        async def execute(command):
+            seen.append((command.startswith("/sc local function q"), current_priority()[0]))
+            return "not json"
+
+        mock_rcon_client.execute = AsyncMock(side_effect=execute)
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+
+        await engine.gather_all_metrics()
+
+        assert seen[0] == (True, CommandPriority.TICK)
+        assert (False, CommandPriority.STATS) in seen
+
+    async def test_batched_metrics_feed_ups_calculator(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """Ticks from the batch script drive UPS and EMA like sample_ups."""
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+
+        with patch("rcon_metrics_engine.time.monotonic", return_value=1000.0):
+            mock_rcon_client.execute = AsyncMock(
+                return_value='{"tick":3600,"players":[],"evolution":{}}'
+            )
+            first = await engine.gather_all_metrics()
+        with patch("rcon_metrics_engine.time.monotonic", return_value=1002.0):
+            mock_rcon_client.execute = AsyncMock(
+                return_value='{"tick":3720,"players":[],"evolution":{}}'
+            )
+            second = await engine.gather_all_metrics()
+
+        assert first["ups"] is None
+        assert second["ups"] == pytest.approx(60.0)
+        assert second["ups_ema"] == pytest.approx(60.0)
+        assert mock_rcon_client.execute.call_count == 1
+
+    async def test_batched_metrics_invalid_payload_disables_batching(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """A non-JSON batch response falls back and stops batching."""
+        mock_rcon_client.execute = AsyncMock(return_value="3600")
+        engine = RconMetricsEngine(
+            rcon_client=mock_rcon_client, enable_evolution_stat=False
+        )
+
+        result = await engine.gather_all_metrics()
+
+        assert engine.batch_metrics is False
+        assert result["tick"] == 3600
+        assert result["players"] == ["Alice", "Bob", "Charlie"]
+
+        mock_rcon_client.execute.reset_mock()
+        await engine.gather_all_metrics()
+        sent = [c[0][0] for c in mock_rcon_client.execute.call_args_list]
+        assert engine._batch_script not in sent
+
+    async def test_batched_metrics_transport_error_keeps_batching(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """RCON errors skip batching for one cycle only."""
+        mock_rcon_client.execute = AsyncMock(side_effect=RuntimeError("RCON failed"))
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+
+        result = await engine.gather_all_metrics()
+
+        assert engine.batch_metrics is True
+        assert result["tick"] is None
+        assert result["player_count"] == 3
+
+    async def test_batching_disabled_by_config(
+        self, mock_rcon_client_with_config: MagicMock
+    ) -> None:
+        """rcon_batch_metrics=False keeps per-command collection."""
+        mock_rcon_client_with_config.server_config.rcon_batch_metrics = False
+        mock_rcon_client_with_config.execute = AsyncMock(return_value="3600")
+        engine = RconMetricsEngine(
+            rcon_client=mock_rcon_client_with_config, enable_evolution_stat=False
+        )
+
+        await engine.gather_all_metrics()
+
+        sent = [c[0][0] for c in mock_rcon_client_with_config.execute.call_args_list]
+        assert sent == ["/sc rcon.print(game.tick)", "/sc rcon.print(game.tick)"]
+
+    async def test_batch_script_omits_evolution_when_disabled(self) -> None:
+        """Evolution is only queried when enabled."""
+        assert "get_evolution_factor" in build_batch_metrics_script(True)
+        assert "get_evolution_factor" not in build_batch_metrics_script(False)
+
+    async def test_format_play_time(self) -> None:
+        """format_play_time renders map age from ticks."""
+        assert format_play_time(0) == "0 seconds"
+        assert format_play_time(61 * 60) == "1 minute, 1 second"
+        assert format_play_time(2 * 86400 * 60 + 60) == "2 days, 0 hours, 0 minutes, 1 second"
+
+
+
+class TestRconMetricsEngineHistory:
+    """Test that collected samples are kept in the per-server history."""
+
+    async def test_gather_records_history(self, mock_rcon_client: MagicMock) -> None:
+        """Each batch records UPS, player count, evolution and tick RTT."""
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+
+        for tick in (3600, 3720):
+            mock_rcon_client.execute = AsyncMock(
+                return_value=json.dumps(
+                    {"tick": tick, "players": ["Alice"], "evolution": {"nauvis": 0.42}}
+                )
+            )
+            sent_at = tick / 60
+            with patch(
+                "rcon_metrics_engine.time.monotonic", side_effect=[sent_at, sent_at + 0.02]
+            ):
+                await engine.gather_all_metrics()
+
+        assert engine.history.metrics() == [
+            "player_count",
+            "evolution:nauvis",
+            "rcon_rtt",
+            "ups",
+        ]
+        ups = engine.get_trend("ups", 60)
+        assert ups is not None and ups.mean == pytest.approx(60.0)
+        players = engine.get_trend("player_count", 60)
+        assert players is not None and players.count == 2
+        rtt = engine.get_trend("rcon_rtt", 60)
+        assert rtt is not None and rtt.count == 2
+
+    async def test_failed_gather_records_no_player_count(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """A cycle where the server didn't answer isn't recorded as 0 players."""
+        mock_rcon_client.execute = AsyncMock(side_effect=Exception("down"))
+        mock_rcon_client.get_player_count = AsyncMock(return_value=0)
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client, enable_evolution_stat=False)
+
+        await engine.gather_all_metrics()
+
+        assert engine.get_trend("player_count", 60) is None
+
+    async def test_rejected_sample_not_smoothed_or_recorded(
+        self, mock_rcon_client: MagicMock
+    ) -> None:
+        """A tick sample rejected for its RTT leaves EMA, SMA and history alone."""
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+        calc = engine.ups_calculator
+        metrics = {}
+        for i in range(5):
+            engine._apply_batch(
+                metrics, {"tick": i * 120, "players": []}, TickReading(i * 120, i * 2.0, 0.02)
+            )
+        ema_before = engine.ema_ups
+        sma_before = list(engine._ups_samples_for_sma)
+
+        metrics = {"ups": None}
+        engine._apply_batch(metrics, {"tick": 600, "players": []}, TickReading(600, 10.6, 1.0))
+
+        assert calc.last_sample_rejected is True
+        assert metrics["ups"] is None
+        assert engine.ema_ups == ema_before
+        assert engine._ups_samples_for_sma == sma_before
+
+    async def test_sample_ups_records_history(self, mock_rcon_client: MagicMock) -> None:
+        """UPS sampled for alerts lands in the same history."""
+        engine = RconMetricsEngine(rcon_client=mock_rcon_client)
+        engine.ups_calculator.sample_ups = AsyncMock(return_value=58.0)
+
+        await engine.sample_ups()
+
+        trend = engine.get_trend("ups", 60)
+        assert trend is not None and trend.mean == 58.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
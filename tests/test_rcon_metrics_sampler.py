@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from rcon_metrics_sampler import MetricsSnapshot, RconMetricsSampler
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def mock_metrics_engine() -> MagicMock:
+    """Mock RconMetricsEngine returning a new UPS value per gather."""
+    engine = MagicMock()
+    engine.rcon_client.server_tag = "prod"
+    samples = iter(range(1, 1000))
+
+    async def gather() -> dict:
+        await asyncio.sleep(0)
+        n = next(samples)
+        return {
+            "ups": 60.0 - n,
+            "player_count": n,
+            "players": [f"p{i}" for i in range(n)],
+            "evolution_by_surface": {"nauvis": 0.1 * n},
+        }
+
+    engine.gather_all_metrics = AsyncMock(side_effect=gather)
+    return engine
+
+
+# ============================================================================
+# SNAPSHOT TESTS
+# ============================================================================
+
+
+class TestMetricsSnapshot:
+    """Test immutable snapshot behavior."""
+
+    def test_capture_freezes_nested_values(self) -> None:
+        """Snapshots are read-only, including nested lists and dicts."""
+        source = {"players": ["Alice"], "evolution_by_surface": {"nauvis": 0.4}}
+        snapshot = MetricsSnapshot.capture(source, sequence=1, server_tag="prod")
+
+        source["players"].append("Mallory")
+        assert snapshot.metrics["players"] == ("Alice",)
+        with pytest.raises(TypeError):
+            snapshot.metrics["ups"] = 1.0  # type: ignore[index]
+        with pytest.raises(TypeError):
+            snapshot.metrics["evolution_by_surface"]["nauvis"] = 1.0  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            snapshot.sequence = 2  # type: ignore[misc]
+
+    def test_to_dict_returns_mutable_copy(self) -> None:
+        """to_dict gives plain dicts/lists that don't alias the snapshot."""
+        snapshot = MetricsSnapshot.capture(
+            {"players": ["Alice"], "evolution_by_surface": {"nauvis": 0.4}}, sequence=1
+        )
+        metrics = snapshot.to_dict()
+
+        assert metrics == {"players": ["Alice"], "evolution_by_surface": {"nauvis": 0.4}}
+        metrics["players"].append("Bob")
+        assert snapshot.metrics["players"] == ("Alice",)
+
+    def test_freshness(self) -> None:
+        """is_fresh compares age against a TTL."""
+        with patch("rcon_metrics_sampler.time.monotonic", return_value=100.0):
+            snapshot = MetricsSnapshot.capture({}, sequence=1)
+        with patch("rcon_metrics_sampler.time.monotonic", return_value=130.0):
+            assert snapshot.age == 30.0
+            assert snapshot.is_fresh(60.0)
+            assert not snapshot.is_fresh(10.0)
+
+
+# ============================================================================
+# SAMPLER TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+class TestRconMetricsSampler:
+    """Test shared sampling and snapshot serving."""
+
+    async def test_get_snapshot_samples_once_then_serves_cache(
+        self, mock_metrics_engine: MagicMock
+    ) -> None:
+        """Reads within the TTL never call gather_all_metrics again."""
+        sampler = RconMetricsSampler(mock_metrics_engine, interval=60, ttl=90)
+
+        first = await sampler.get_snapshot()
+        second = await sampler.get_snapshot()
+
+        assert first is second
+        assert first.sequence == 1
+        assert first.server_tag == "prod"
+        mock_metrics_engine.gather_all_metrics.assert_awaited_once()
+
+    async def test_concurrent_reads_share_one_sample(
+        self, mock_metrics_engine: MagicMock
+    ) -> None:
+        """Concurrent consumers of a stale sampler trigger a single gather."""
+        sampler = RconMetricsSampler(mock_metrics_engine)
+
+        snapshots = await asyncio.gather(*(sampler.get_snapshot() for _ in range(10)))
+
+        assert all(s is snapshots[0] for s in snapshots)
+        mock_metrics_engine.gather_all_metrics.assert_awaited_once()
+
+    async def test_stale_snapshot_triggers_refresh(
+        self, mock_metrics_engine: MagicMock
+    ) -> None:
+        """A snapshot older than max_age is replaced by a new sample."""
+        sampler = RconMetricsSampler(mock_metrics_engine, ttl=90)
+        with patch("rcon_metrics_sampler.time.monotonic", return_value=0.0):
+            first = await sampler.get_snapshot()
+        with patch("rcon_metrics_sampler.time.monotonic", return_value=100.0):
+            second = await sampler.get_snapshot()
+            cached = await sampler.get_snapshot(max_age=200.0)
+
+        assert second.sequence == first.sequence + 1
+        assert cached is second
+        assert second.metrics["player_count"] == 2
+
+    async def test_background_loop_publishes_snapshots(
+        self, mock_metrics_engine: MagicMock
+    ) -> None:
+        """start() samples on its own cadence until stop()."""
+        sampler = RconMetricsSampler(mock_metrics_engine, interval=0.01)
+
+        await sampler.start()
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+
+        assert sampler.latest is not None
+        assert sampler.latest.sequence >= 2
+        assert sampler.task is None
+        assert sampler.running is False
+
+    async def test_loop_survives_sample_errors(self) -> None:
+        """Errors from gather_all_metrics are logged and sampling continues."""
+        engine = MagicMock()
+        engine.rcon_client.server_tag = "prod"
+        engine.gather_all_metrics = AsyncMock(
+            side_effect=[RuntimeError("boom"), {"ups": 60.0}, {"ups": 59.0}]
+        )
+        sampler = RconMetricsSampler(engine, interval=0.01)
+
+        await sampler.start()
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+
+        assert sampler.latest is not None
+        assert sampler.latest.metrics["ups"] in (60.0, 59.0)
+
+    async def test_cancelled_reader_does_not_cancel_shared_sample(
+        self, mock_metrics_engine: MagicMock
+    ) -> None:
+        """One consumer timing out doesn't abort the sample for others."""
+        sampler = RconMetricsSampler(mock_metrics_engine)
+
+        waiter = asyncio.create_task(sampler.get_snapshot())
+        other = asyncio.create_task(sampler.get_snapshot())
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        snapshot = await other
+        assert snapshot.sequence == 1
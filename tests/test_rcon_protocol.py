@@ -0,0 +1,349 @@
+"""Tests for rcon_protocol.py against a local fake Source RCON server.
+
+Coverage targets:
+- Packet encoding/decoding
+- Authentication (success, wrong password, leading empty response)
+- Command round trips and multiplexing by packet ID
+- Multi-packet response reassembly
+- Timeouts and connection loss
+- RconClient end-to-end over the native protocol
+"""
+
+import asyncio
+import struct
+from typing import Dict, List, Optional
+
+import pytest
+
+try:
+    from rcon_protocol import (
+        AsyncRconConnection,
+        FRAGMENT_THRESHOLD,
+        RconAuthError,
+        RconProtocolError,
+        SERVERDATA_AUTH,
+        SERVERDATA_AUTH_RESPONSE,
+        SERVERDATA_EXECCOMMAND,
+        SERVERDATA_RESPONSE_VALUE,
+        encode_packet,
+        read_packet,
+    )
+    from rcon_client import RconClient
+except ImportError:
+    from src.rcon_protocol import (  # type: ignore
+        AsyncRconConnection,
+        FRAGMENT_THRESHOLD,
+        RconAuthError,
+        RconProtocolError,
+        SERVERDATA_AUTH,
+        SERVERDATA_AUTH_RESPONSE,
+        SERVERDATA_EXECCOMMAND,
+        SERVERDATA_RESPONSE_VALUE,
+        encode_packet,
+        read_packet,
+    )
+    from src.rcon_client import RconClient  # type: ignore
+
+
+def _raw_packet(request_id: int, packet_type: int, body: bytes) -> bytes:
+    payload = body + b"\x00\x00"
+    return struct.pack("<iii", len(payload) + 8, request_id, packet_type) + payload
+
+
+class FakeRconServer:
+    """Minimal Source RCON server for protocol tests.
+
+    Commands are answered with "echo:<command>" unless overridden in
+    ``responses`` (a list of payload chunks sent as separate packets) or
+    listed in ``silent`` (never answered). ``delays`` postpones a response.
+    """
+
+    def __init__(self, password: str = "secret", empty_before_auth: bool = False) -> None:
+        self.password = password
+        self.empty_before_auth = empty_before_auth
+        self.responses: Dict[str, List[bytes]] = {}
+        self.delays: Dict[str, float] = {}
+        self.silent: set = set()
+        self.commands: List[str] = []
+        self.connections = 0
+        self.writers: List[asyncio.StreamWriter] = []
+        self.server: Optional[asyncio.base_events.Server] = None
+        self.port = 0
+
+    async def start(self) -> "FakeRconServer":
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        self.drop_clients()
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+
+    def drop_clients(self) -> None:
+        for writer in self.writers:
+            writer.close()
+        self.writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self.writers.append(writer)
+        try:
+            request_id, packet_type, body = await read_packet(reader)
+            assert packet_type == SERVERDATA_AUTH
+            if self.empty_before_auth:
+                writer.write(_raw_packet(request_id, SERVERDATA_RESPONSE_VALUE, b""))
+            ok = body.decode() == self.password
+            writer.write(
+                _raw_packet(request_id if ok else -1, SERVERDATA_AUTH_RESPONSE, b"")
+            )
+            await writer.drain()
+            if not ok:
+                return
+
+            lock = asyncio.Lock()
+            while True:
+                request_id, packet_type, body = await read_packet(reader)
+                assert packet_type == SERVERDATA_EXECCOMMAND
+                command = body.decode()
+                self.commands.append(command)
+                asyncio.create_task(self._respond(writer, lock, request_id, command))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        lock: asyncio.Lock,
+        request_id: int,
+        command: str,
+    ) -> None:
+        if command in self.silent:
+            return
+        if command in self.delays:
+            await asyncio.sleep(self.delays[command])
+        chunks = self.responses.get(command, [f"echo:{command}".encode()])
+        async with lock:
+            for chunk in chunks:
+                writer.write(_raw_packet(request_id, SERVERDATA_RESPONSE_VALUE, chunk))
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+
+@pytest.fixture
+async def rcon_server():
+    server = await FakeRconServer().start()
+    yield server
+    await server.stop()
+
+
+class TestPacketCodec:
+    """Test Source RCON packet encoding and decoding."""
+
+    def test_encode_packet_layout(self) -> None:
+        """encode_packet should emit size, id, type, body and two nulls."""
+        data = encode_packet(7, SERVERDATA_EXECCOMMAND, "/time")
+        size, request_id, packet_type = struct.unpack("<iii", data[:12])
+        assert size == len(data) - 4
+        assert request_id == 7
+        assert packet_type == SERVERDATA_EXECCOMMAND
+        assert data[12:] == b"/time\x00\x00"
+
+    @pytest.mark.asyncio
+    async def test_read_packet_round_trip(self) -> None:
+        """read_packet should decode what encode_packet produced."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_packet(42, SERVERDATA_RESPONSE_VALUE, "héllo"))
+        reader.feed_eof()
+
+        request_id, packet_type, body = await read_packet(reader)
+
+        assert (request_id, packet_type) == (42, SERVERDATA_RESPONSE_VALUE)
+        assert body.decode("utf-8") == "héllo"
+
+    @pytest.mark.asyncio
+    async def test_read_packet_rejects_bad_size(self) -> None:
+        """read_packet should reject impossible length prefixes."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(struct.pack("<iii", 2, 1, 0))
+        reader.feed_eof()
+
+        with pytest.raises(RconProtocolError):
+            await read_packet(reader)
+
+
+class TestAuthentication:
+    """Test the SERVERDATA_AUTH handshake."""
+
+    @pytest.mark.asyncio
+    async def test_open_authenticates(self, rcon_server) -> None:
+        """open() should authenticate and return a live connection."""
+        conn = await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "secret")
+        try:
+            assert conn.is_alive
+            assert conn.in_flight == 0
+        finally:
+            await conn.close()
+        assert not conn.is_alive
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_raises_auth_error(self, rcon_server) -> None:
+        """A -1 auth response should raise RconAuthError."""
+        with pytest.raises(RconAuthError):
+            await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "wrong")
+
+    @pytest.mark.asyncio
+    async def test_empty_response_before_auth_is_skipped(self) -> None:
+        """Servers that send an empty RESPONSE_VALUE first should still authenticate."""
+        server = await FakeRconServer(empty_before_auth=True).start()
+        try:
+            conn = await AsyncRconConnection.open("127.0.0.1", server.port, "secret")
+            assert await conn.execute("/time") == "echo:/time"
+            await conn.close()
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_connection_refused(self) -> None:
+        """open() should surface connection errors."""
+        server = await FakeRconServer().start()
+        port = server.port
+        await server.stop()
+
+        with pytest.raises(OSError):
+            await AsyncRconConnection.open("127.0.0.1", port, "secret", timeout=1.0)
+
+
+class TestCommandExecution:
+    """Test command round trips, multiplexing and reassembly."""
+
+    @pytest.mark.asyncio
+    async def test_execute_round_trip(self, rcon_server) -> None:
+        """execute() should return the decoded response body."""
+        conn = await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "secret")
+        try:
+            assert await conn.execute("/players") == "echo:/players"
+            assert rcon_server.commands == ["/players"]
+        finally:
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_multiplexed_by_id(self, rcon_server) -> None:
+        """Many in-flight commands on one connection should each get their own response."""
+        rcon_server.delays["/slow"] = 0.05
+        conn = await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "secret")
+        try:
+            commands = ["/slow"] + [f"/c {i}" for i in range(50)]
+            results = await asyncio.gather(*(conn.execute(c) for c in commands))
+            assert results == [f"echo:{c}" for c in commands]
+            assert rcon_server.connections == 1
+        finally:
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_multi_packet_response_reassembled(self, rcon_server) -> None:
+        """Full-size fragments should be joined with the final short packet."""
+        chunks = [b"a" * FRAGMENT_THRESHOLD, b"b" * FRAGMENT_THRESHOLD, b"tail"]
+        rcon_server.responses["/big"] = chunks
+        conn = await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "secret")
+        try:
+            assert await conn.execute("/big") == b"".join(chunks).decode()
+        finally:
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_exact_fragment_size_response_completes(self, rcon_server) -> None:
+        """A response that ends on a full-size packet completes after the grace period."""
+        rcon_server.responses["/exact"] = [b"x" * FRAGMENT_THRESHOLD]
+        conn = await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "secret")
+        try:
+            assert await conn.execute("/exact") == "x" * FRAGMENT_THRESHOLD
+        finally:
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_oversized_single_packet(self, rcon_server) -> None:
+        """Factorio-style oversized packets should be read in one piece."""
+        body = b"z" * (FRAGMENT_THRESHOLD * 3 + 17)
+        rcon_server.responses["/huge"] = [body]
+        conn = await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "secret")
+        try:
+            assert await conn.execute("/huge") == body.decode()
+        finally:
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_command_timeout(self, rcon_server) -> None:
+        """An unanswered command should time out without breaking the connection."""
+        rcon_server.silent.add("/hang")
+        conn = await AsyncRconConnection.open(
+            "127.0.0.1", rcon_server.port, "secret", timeout=0.1
+        )
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await conn.execute("/hang")
+            assert conn.in_flight == 0
+            assert await conn.execute("/time") == "echo:/time"
+        finally:
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_server_disconnect_fails_pending(self, rcon_server) -> None:
+        """Commands in flight when the server drops should raise ConnectionError."""
+        rcon_server.silent.add("/hang")
+        conn = await AsyncRconConnection.open("127.0.0.1", rcon_server.port, "secret")
+        task = asyncio.create_task(conn.execute("/hang"))
+        await asyncio.sleep(0.05)
+
+        rcon_server.drop_clients()
+
+        with pytest.raises(ConnectionError):
+            await task
+        assert not conn.is_alive
+        with pytest.raises(ConnectionError):
+            await conn.execute("/time")
+        await conn.close()
+
+
+class TestRconClientOverProtocol:
+    """End-to-end RconClient tests over the native protocol."""
+
+    @pytest.mark.asyncio
+    async def test_client_executes_over_pooled_connection(self, rcon_server) -> None:
+        """RconClient should run commands over its persistent connection."""
+        client = RconClient("127.0.0.1", rcon_server.port, "secret", timeout=2.0)
+        await client.connect()
+        try:
+            assert client.connected is True
+            results = await asyncio.gather(*(client.execute(f"/c {i}") for i in range(20)))
+            assert results == [f"echo:/c {i}" for i in range(20)]
+            assert rcon_server.connections <= client.pool_size
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_client_recovers_after_server_drop(self, rcon_server) -> None:
+        """Dropped connections should be replaced transparently."""
+        client = RconClient("127.0.0.1", rcon_server.port, "secret", timeout=2.0)
+        await client.connect()
+        try:
+            rcon_server.drop_clients()
+            await asyncio.sleep(0.05)
+
+            assert await client.execute("/time") == "echo:/time"
+            assert client.connected is True
+            assert rcon_server.connections == 2
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_client_wrong_password_not_connected(self, rcon_server) -> None:
+        """A rejected password should leave the client disconnected."""
+        client = RconClient("127.0.0.1", rcon_server.port, "wrong", timeout=2.0)
+        await client.connect()
+        assert client.connected is False
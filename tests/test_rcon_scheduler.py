@@ -0,0 +1,233 @@
+"""Tests for rcon_scheduler.py (per-server RCON priority scheduling)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from rcon_scheduler import (
+    CommandPriority,
+    RconDeadlineExceeded,
+    RconScheduler,
+    admitted_at,
+    command_priority,
+    current_priority,
+)
+
+
+async def _hold(scheduler: RconScheduler, release: asyncio.Event) -> None:
+    """Occupy a slot until release is set."""
+    async with scheduler.slot(CommandPriority.QUERY):
+        await release.wait()
+
+
+async def _run(
+    scheduler: RconScheduler,
+    order: List[str],
+    name: str,
+    priority: CommandPriority,
+    deadline: float | None = None,
+) -> None:
+    async with scheduler.slot(priority, deadline):
+        order.append(name)
+
+
+# ============================================================================
+# Priority context
+# ============================================================================
+
+
+class TestCommandPriority:
+    def test_default_is_user_query(self) -> None:
+        assert current_priority() == (CommandPriority.QUERY, None)
+
+    def test_nested_blocks_restore_outer_priority(self) -> None:
+        with command_priority(CommandPriority.STATS):
+            with command_priority(CommandPriority.TICK, deadline=5.0):
+                assert current_priority() == (CommandPriority.TICK, 5.0)
+            assert current_priority() == (CommandPriority.STATS, None)
+        assert current_priority() == (CommandPriority.QUERY, None)
+
+    async def test_priority_follows_tasks_created_in_block(self) -> None:
+        async def probe():
+            return current_priority()
+
+        with command_priority(CommandPriority.ADMIN):
+            task = asyncio.create_task(probe())
+        assert await task == (CommandPriority.ADMIN, None)
+
+
+# ============================================================================
+# Scheduling
+# ============================================================================
+
+
+class TestRconScheduler:
+    def test_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            RconScheduler(max_concurrency=0)
+
+    async def test_runs_immediately_below_limit(self) -> None:
+        scheduler = RconScheduler(max_concurrency=2)
+
+        async with scheduler.slot(CommandPriority.STATS) as wait:
+            assert wait < 0.01
+            assert scheduler.in_flight == 1
+        assert scheduler.in_flight == 0
+
+    async def test_concurrency_is_bounded(self) -> None:
+        scheduler = RconScheduler(max_concurrency=2)
+        active = peak = 0
+
+        async def command() -> None:
+            nonlocal active, peak
+            async with scheduler.slot(CommandPriority.QUERY):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.001)
+                active -= 1
+
+        await asyncio.gather(*(command() for _ in range(10)))
+
+        assert peak == 2
+        assert scheduler.in_flight == 0
+
+    async def test_queued_commands_run_by_priority(self) -> None:
+        scheduler = RconScheduler(max_concurrency=1)
+        release = asyncio.Event()
+        order: List[str] = []
+
+        holder = asyncio.create_task(_hold(scheduler, release))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(_run(scheduler, order, "stats", CommandPriority.STATS)),
+            asyncio.create_task(_run(scheduler, order, "query", CommandPriority.QUERY)),
+            asyncio.create_task(_run(scheduler, order, "admin", CommandPriority.ADMIN)),
+            asyncio.create_task(_run(scheduler, order, "tick", CommandPriority.TICK)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queued == 4
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order == ["tick", "admin", "query", "stats"]
+
+    async def test_earliest_deadline_first_within_class(self) -> None:
+        scheduler = RconScheduler(max_concurrency=1)
+        release = asyncio.Event()
+        order: List[str] = []
+
+        holder = asyncio.create_task(_hold(scheduler, release))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(_run(scheduler, order, "none", CommandPriority.QUERY)),
+            asyncio.create_task(_run(scheduler, order, "late", CommandPriority.QUERY, 10.0)),
+            asyncio.create_task(_run(scheduler, order, "soon", CommandPriority.QUERY, 5.0)),
+        ]
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order == ["soon", "late", "none"]
+
+    async def test_deadline_exceeded_in_queue(self) -> None:
+        scheduler = RconScheduler(max_concurrency=1)
+        release = asyncio.Event()
+        order: List[str] = []
+
+        holder = asyncio.create_task(_hold(scheduler, release))
+        await asyncio.sleep(0)
+
+        with pytest.raises(RconDeadlineExceeded):
+            await _run(scheduler, order, "tick", CommandPriority.TICK, deadline=0.01)
+
+        release.set()
+        await holder
+        assert order == []
+        assert scheduler.in_flight == 0
+        assert scheduler.get_stats()["by_priority"]["tick"]["expired"] == 1
+
+    async def test_slot_granted_as_deadline_fires_is_not_leaked(self, monkeypatch) -> None:
+        scheduler = RconScheduler(max_concurrency=1)
+        release = asyncio.Event()
+        order: List[str] = []
+
+        holder = asyncio.create_task(_hold(scheduler, release))
+        await asyncio.sleep(0)
+
+        async def grant_then_time_out(future, timeout):
+            # The holder hands over its slot, then the deadline fires before
+            # the waiting task resumes
+            release.set()
+            await holder
+            assert future.done() and not future.cancelled()
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr("rcon_scheduler.asyncio.wait_for", grant_then_time_out)
+
+        with pytest.raises(RconDeadlineExceeded):
+            await _run(scheduler, order, "tick", CommandPriority.TICK, deadline=0.01)
+
+        assert order == []
+        assert scheduler.in_flight == 0
+
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        scheduler = RconScheduler(max_concurrency=1)
+        release = asyncio.Event()
+        order: List[str] = []
+
+        holder = asyncio.create_task(_hold(scheduler, release))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(_run(scheduler, order, "gone", CommandPriority.TICK))
+        waiting = asyncio.create_task(_run(scheduler, order, "next", CommandPriority.STATS))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        release.set()
+        await asyncio.gather(holder, waiting)
+
+        assert order == ["next"]
+        assert scheduler.in_flight == 0
+
+    async def test_queue_wait_is_reported(self) -> None:
+        scheduler = RconScheduler(max_concurrency=1)
+        release = asyncio.Event()
+
+        holder = asyncio.create_task(_hold(scheduler, release))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(_run(scheduler, [], "tick", CommandPriority.TICK))
+        await asyncio.sleep(0.02)
+        release.set()
+        await asyncio.gather(holder, waiting)
+
+        assert scheduler.last_wait(CommandPriority.TICK) >= 0.015
+        stats = scheduler.get_stats()["by_priority"]["tick"]
+        assert stats["dispatched"] == 1
+        assert stats["max_wait_ms"] >= 15
+
+    async def test_admission_time_excludes_queue_wait(self) -> None:
+        scheduler = RconScheduler(max_concurrency=1)
+        release = asyncio.Event()
+
+        holder = asyncio.create_task(_hold(scheduler, release))
+        await asyncio.sleep(0)
+        issued = time.monotonic()
+
+        async def command() -> float | None:
+            async with scheduler.slot(CommandPriority.TICK):
+                pass
+            return admitted_at()
+
+        waiting = asyncio.create_task(command())
+        await asyncio.sleep(0.02)
+        release.set()
+        await holder
+        admitted = await waiting
+
+        assert admitted is not None
+        assert admitted - issued >= 0.015
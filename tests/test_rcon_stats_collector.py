@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from rcon_stats_collector import RconStatsCollector
+from rcon_metrics_sampler import MetricsSnapshot, RconMetricsSampler
 
 
 # ============================================================================
@@ -745,5 +746,58 @@ class TestRconStatsCollectorIntegration:
         assert stats_collector.task is None
 
 
+@pytest.mark.asyncio
+class TestSharedSamplerIntegration:
+    """Test stats posting from shared metrics snapshots."""
+
+    async def test_collect_and_post_reads_snapshot(
+        self, mock_rcon_client, mock_discord_interface, mock_metrics_engine
+    ) -> None:
+        """With a sampler, stats come from the snapshot instead of a new gather."""
+        sampler = MagicMock()
+        sampler.interval = 300
+        sampler.get_snapshot = AsyncMock(
+            return_value=MetricsSnapshot.capture(
+                {"ups": 60.0, "player_count": 1, "players": ["Alice"]}, sequence=3
+            )
+        )
+        collector = RconStatsCollector(
+            rcon_client=mock_rcon_client,
+            discord_interface=mock_discord_interface,
+            metrics_engine=mock_metrics_engine,
+            metrics_sampler=sampler,
+        )
+
+        with patch("bot.helpers.format_stats_embed") as fmt:
+            await collector._collect_and_post()
+
+        sampler.get_snapshot.assert_awaited_once_with(max_age=600)
+        mock_metrics_engine.gather_all_metrics.assert_not_called()
+        metrics = fmt.call_args[0][1]
+        assert metrics["players"] == ["Alice"]
+
+    async def test_one_gather_per_period_with_alerts_disabled(
+        self, mock_rcon_client, mock_discord_interface, mock_metrics_engine
+    ) -> None:
+        """
+        With alerts off the sampler runs at stats_interval, so its snapshots
+        outlive the sampler TTL; the collector must still not force a gather.
+        """
+        sampler = RconMetricsSampler(mock_metrics_engine, interval=300, ttl=0.0)
+        await sampler.refresh()  # the sampler's own periodic sample
+        collector = RconStatsCollector(
+            rcon_client=mock_rcon_client,
+            discord_interface=mock_discord_interface,
+            metrics_engine=mock_metrics_engine,
+            metrics_sampler=sampler,
+            interval=300,
+        )
+
+        with patch("bot.helpers.format_stats_embed"):
+            await collector._collect_and_post()
+
+        assert mock_metrics_engine.gather_all_metrics.await_count == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
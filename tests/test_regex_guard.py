@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+from regex_guard import (
+    EXPONENTIAL_MAX_INPUT,
+    POLYNOMIAL_MAX_INPUT,
+    RegexRisk,
+    classify_pattern,
+    input_budget,
+)
+
+
+# ============================================================================
+# CLASSIFICATION TESTS
+# ============================================================================
+
+
+class TestClassifyPattern:
+    """Test load-time ReDoS classification."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"^\[CHAT\] (\w+): (.+)$",
+            r"^(?P<player>\w+) joined",
+            r"(?:\d{4}-\d{2}-\d{2})?\s*\[JOIN\] (?P<player>\S+)",
+            r"^(?:\d{2}:){2}\d{2}$",
+            r"(?:ab){2,5}",
+        ],
+    )
+    def test_safe_patterns(self, pattern: str) -> None:
+        """Single wildcards and fixed-width repeats are linear."""
+        assert classify_pattern(pattern) is RegexRisk.SAFE
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"(.+) \((.+)\)",
+            r".*killed by .*",
+            r"\[([^\]]+)\] ([^:]+): (.*)",
+        ],
+    )
+    def test_polynomial_patterns(self, pattern: str) -> None:
+        """Two or more unbounded wildcard runs can backtrack quadratically."""
+        assert classify_pattern(pattern) is RegexRisk.POLYNOMIAL
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"^(\w+\s?)+$",
+            r"(a+)+b",
+            r"(a|ab)*c",
+            r"(?:x*)*y",
+            r"(\w+) said \1",
+        ],
+    )
+    def test_exponential_patterns(self, pattern: str) -> None:
+        """Nested quantifiers, quantified alternation and backrefs are flagged."""
+        assert classify_pattern(pattern) is RegexRisk.EXPONENTIAL
+
+    def test_fixed_repeat_inside_repeat_is_safe(self) -> None:
+        """A fixed-count inner repeat can't backtrack into alternatives."""
+        assert classify_pattern(r"(?:\d{4} )+") is RegexRisk.SAFE
+
+    def test_unparseable_pattern_is_exponential(self) -> None:
+        """Sources that don't parse get the strictest budget."""
+        assert classify_pattern(r"[unclosed(") is RegexRisk.EXPONENTIAL
+
+    def test_shipped_patterns_classify(self) -> None:
+        """Every shipped pattern classifies without error."""
+        from pathlib import Path
+
+        from pattern_loader import PatternLoader
+
+        patterns_dir = Path(__file__).resolve().parent.parent / "patterns"
+        if not patterns_dir.is_dir():
+            pytest.skip("patterns directory not present")
+
+        loader = PatternLoader(patterns_dir)
+        loader.load_patterns()
+        for pattern in loader.get_patterns():
+            assert isinstance(classify_pattern(pattern.pattern), RegexRisk)
+
+
+# ============================================================================
+# BUDGET TESTS
+# ============================================================================
+
+
+class TestInputBudget:
+    """Test input-length budgets per risk class."""
+
+    def test_budgets(self) -> None:
+        assert input_budget(RegexRisk.SAFE) is None
+        assert input_budget(RegexRisk.POLYNOMIAL) == POLYNOMIAL_MAX_INPUT
+        assert input_budget(RegexRisk.EXPONENTIAL) == EXPONENTIAL_MAX_INPUT
+        assert EXPONENTIAL_MAX_INPUT < POLYNOMIAL_MAX_INPUT
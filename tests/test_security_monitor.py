@@ -1,9 +1,12 @@
+import asyncio
 import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
+import os
 import tempfile
 
+import security_monitor
 from security_monitor import SecurityMonitor, Infraction
 
 
@@ -125,6 +128,83 @@ class TestBanManagement:
         assert monitor2.is_banned("Persistent")
 
 
+class TestAnchorPrefilter:
+    """The literal anchor prefilter must not change detection results."""
+
+    SAMPLES = [
+        "Just chatting about blue science packs.",
+        "should we ship the shell casings?",
+        "evaluate the (new) layout",
+        "eval(1+1)",
+        "EXEC ( 'x' )",
+        "look at ../../etc",
+        "..\\windows",
+        "cat /ETC/PASSWD",
+        "a && b",
+        "x | sh",
+        "x |sh",
+        "run `id` now",
+        "echo $(whoami)",
+        "ok; rm -rf /",
+        "subprocess.call(cmd, shell=True)",
+        "ſubprocess.call(shell = TRUE)",
+        "imports: __IMPORT__ ('os')",
+        "os.system (1)",
+        "ast.literal_eval",
+        "importlib.import_module",
+        "café (ünïcode) ☃",
+    ]
+
+    @staticmethod
+    def exhaustive_match(monitor, text):
+        """The original scan: every category, every pattern."""
+        for pattern_type, config in monitor.compiled_patterns.items():
+            for pattern in config["patterns"]:
+                match = pattern.search(text)
+                if match:
+                    return pattern_type, pattern.pattern, match.group(0)
+        return None
+
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_same_result_as_exhaustive_scan(self, monitor, text):
+        expected = self.exhaustive_match(monitor, text)
+
+        infraction = monitor.check_malicious_pattern(text, "Tester")
+
+        if expected is None:
+            assert infraction is None
+        else:
+            assert infraction is not None
+            assert (
+                infraction.pattern_type,
+                infraction.matched_pattern,
+                infraction.metadata["match"],
+            ) == expected
+
+    def test_clean_text_skips_pattern_searches(self, monitor):
+        class CountingPattern:
+            def __init__(self, regex):
+                self.regex = regex
+                self.pattern = regex.pattern
+                self.calls = 0
+
+            def search(self, text):
+                self.calls += 1
+                return self.regex.search(text)
+
+        counters = []
+        for config in monitor.compiled_patterns.values():
+            config["patterns"] = [CountingPattern(p) for p in config["patterns"]]
+            counters.extend(config["patterns"])
+
+        assert monitor.check_malicious_pattern("gg, rocket launched!", "Tester") is None
+        assert sum(c.calls for c in counters) == 0
+
+        # Only the category whose anchor ("../") appears is searched
+        monitor.check_malicious_pattern("try ../secret", "Tester")
+        assert {c.pattern for c in counters if c.calls} == {r"\.\./"}
+
+
 class TestRateLimiting:
     """Test rate limiting."""
 
@@ -182,6 +262,46 @@ class TestRateLimiting:
         assert allowed is True
         assert reason is None
 
+    def test_rate_limit_window_expires(self, monitor, monkeypatch):
+        """Events older than the window no longer count."""
+        clock = [1000.0]
+        monkeypatch.setattr("security_monitor.time.monotonic", lambda: clock[0])
+
+        for _ in range(5):
+            monitor.check_rate_limit("mention_admin", "Spammer")
+        assert monitor.check_rate_limit("mention_admin", "Spammer")[0] is False
+
+        clock[0] += 59.0
+        assert monitor.check_rate_limit("mention_admin", "Spammer")[0] is False
+
+        clock[0] += 1.0
+        assert monitor.check_rate_limit("mention_admin", "Spammer")[0] is True
+
+    def test_rate_limit_state_bounded_per_player(self, monitor):
+        """Per-player state never holds more than max_events timestamps."""
+        for _ in range(50):
+            monitor.check_rate_limit("chat_message", "Chatty")
+
+        assert len(monitor.rate_limit_state["chat_message"]["Chatty"]) == 20
+
+    def test_idle_players_swept(self, monitor, monkeypatch):
+        """Players idle past the window are evicted on the periodic sweep."""
+        clock = [1000.0]
+        monkeypatch.setattr("security_monitor.time.monotonic", lambda: clock[0])
+        monitor._next_rate_limit_sweep = clock[0] + 60.0
+
+        for i in range(100):
+            monitor.check_rate_limit("chat_message", f"Player{i}")
+        monitor.check_rate_limit("mention_everyone", "Announcer")
+
+        clock[0] += 120.0
+        monitor.check_rate_limit("chat_message", "Active")
+
+        assert list(monitor.rate_limit_state["chat_message"]) == ["Active"]
+        # mention_everyone uses a 300s window, so its entry is still live
+        assert "Announcer" in monitor.rate_limit_state["mention_everyone"]
+        assert monitor.check_rate_limit("mention_everyone", "Announcer")[0] is False
+
 
 class TestInfractionLogging:
     """Test infraction logging."""
@@ -388,6 +508,71 @@ class TestIntegrationFlow:
         assert inf_json["auto_banned"] is True
         assert "timestamp" in inf_json
 
+
+class TestBanListPersistence:
+    """Debounced, atomic ban-list writes and reload on external edits."""
+
+    @pytest.mark.asyncio
+    async def test_ban_wave_coalesced_into_one_write(self, monitor, temp_dir, monkeypatch):
+        monkeypatch.setattr(security_monitor, "BAN_SAVE_DEBOUNCE_SECONDS", 0.01)
+        writes = []
+        original = monitor._save_banned_players
+
+        def counting_save(players=None):
+            writes.append(sorted(players))
+            return original(players)
+
+        monkeypatch.setattr(monitor, "_save_banned_players", counting_save)
+
+        for i in range(10):
+            monitor.ban_player(f"Bot{i}")
+        # Nothing written on the event loop yet
+        assert writes == []
+
+        await monitor.flush_ban_list()
+
+        assert writes == [[f"Bot{i}" for i in range(10)]]
+        data = json.loads((temp_dir / "banned.json").read_text(encoding="utf-8"))
+        assert len(data["banned_players"]) == 10
+        assert not (temp_dir / "banned.json.tmp").exists()
+
+    @pytest.mark.asyncio
+    async def test_debounced_write_happens_without_flush(self, monitor, temp_dir, monkeypatch):
+        monkeypatch.setattr(security_monitor, "BAN_SAVE_DEBOUNCE_SECONDS", 0.01)
+
+        monitor.ban_player("Later")
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if monitor._ban_save_task is not None and monitor._ban_save_task.done():
+                break
+
+        data = json.loads((temp_dir / "banned.json").read_text(encoding="utf-8"))
+        assert data["banned_players"] == ["Later"]
+
+    def test_external_edit_reloaded(self, monitor, temp_dir, monkeypatch):
+        monitor.ban_player("Old")
+        ban_file = temp_dir / "banned.json"
+        ban_file.write_text(json.dumps({"banned_players": ["New"]}), encoding="utf-8")
+        st = os.stat(ban_file)
+        os.utime(ban_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        # Throttled: not re-checked until the interval passes
+        assert monitor.is_banned("Old")
+
+        monitor._next_ban_reload_check = 0.0
+        assert monitor.is_banned("New")
+        assert not monitor.is_banned("Old")
+
+    def test_own_writes_do_not_trigger_reload(self, monitor, monkeypatch):
+        monitor.ban_player("Player1")
+        loads = []
+        monkeypatch.setattr(monitor, "_load_banned_players", lambda: loads.append(1) or set())
+
+        monitor._next_ban_reload_check = 0.0
+        assert monitor.is_banned("Player1")
+        assert loads == []
+
+
 # ============================================================================
 # Comprehensive Tests for SecurityMonitor.ban_player
 # ============================================================================
@@ -288,6 +288,8 @@ class TestServerManagerAddServer:
         # Verify nothing remains registered
         assert sample_server_config.tag not in server_manager.clients
         assert sample_server_config.tag not in server_manager.stats_collectors
+        assert sample_server_config.tag not in server_manager.metrics_samplers
+        assert sample_server_config.tag not in server_manager.metrics_engines
 
     async def test_add_server_alert_monitor_failure_cleanup(
         self,
@@ -975,6 +977,96 @@ class TestServerManagerRemoveServer:
 # ============================================================================
 
 
+@pytest.mark.asyncio
+class TestServerManagerMetricsSampler:
+    """Test the shared per-server metrics sampler wiring."""
+
+    async def test_sampler_shared_by_collector_and_alert_monitor(
+        self,
+        server_manager: ServerManager,
+        sample_server_config: ServerConfig,
+        mock_rcon_client: MagicMock,
+        mock_stats_collector: MagicMock,
+        mock_alert_monitor: MagicMock,
+        mock_metrics_engine: MagicMock,
+    ) -> None:
+        """Collector and alert monitor get the same engine and sampler."""
+        mock_sampler = MagicMock()
+        mock_sampler.start = AsyncMock()
+        mock_sampler.stop = AsyncMock()
+
+        with patch("server_manager.RconClient", return_value=mock_rcon_client), patch(
+            "server_manager.RconStatsCollector", return_value=mock_stats_collector
+        ) as collector_cls, patch(
+            "server_manager.RconAlertMonitor", return_value=mock_alert_monitor
+        ) as alert_cls, patch(
+            "server_manager.RconMetricsEngine", return_value=mock_metrics_engine
+        ), patch(
+            "server_manager.RconMetricsSampler", return_value=mock_sampler
+        ) as sampler_cls:
+            await server_manager.add_server(sample_server_config)
+
+        sampler_cls.assert_called_once()
+        assert sampler_cls.call_args.args[0] is mock_metrics_engine
+        assert sampler_cls.call_args.kwargs["ttl"] == sample_server_config.metrics_snapshot_ttl
+        mock_sampler.start.assert_awaited_once()
+        # Cadence follows the most frequent consumer (alerts: 60s < stats: 300s)
+        assert mock_sampler.interval == 60
+
+        collector_kwargs = collector_cls.call_args.kwargs
+        alert_kwargs = alert_cls.call_args.kwargs
+        assert collector_kwargs["metrics_sampler"] is mock_sampler
+        assert alert_kwargs["metrics_sampler"] is mock_sampler
+        assert alert_kwargs["metrics_engine"] is mock_metrics_engine
+
+        await server_manager.remove_server(sample_server_config.tag)
+        mock_sampler.stop.assert_awaited_once()
+        assert sample_server_config.tag not in server_manager.metrics_samplers
+
+    async def test_no_sampler_started_without_consumers(
+        self,
+        server_manager: ServerManager,
+        minimal_server_config: ServerConfig,
+        mock_rcon_client: MagicMock,
+    ) -> None:
+        """Without stats or alerts, no background sampling is started."""
+        with patch("server_manager.RconClient", return_value=mock_rcon_client):
+            await server_manager.add_server(minimal_server_config)
+
+        assert server_manager.metrics_samplers == {}
+
+    async def test_get_metrics_snapshot_serves_cached_snapshot(
+        self,
+        server_manager: ServerManager,
+        minimal_server_config: ServerConfig,
+        mock_rcon_client: MagicMock,
+        mock_metrics_engine: MagicMock,
+    ) -> None:
+        """Repeated snapshot reads within the TTL gather metrics once."""
+        mock_metrics_engine.gather_all_metrics = AsyncMock(
+            return_value={"ups": 60.0, "player_count": 4}
+        )
+
+        with patch("server_manager.RconClient", return_value=mock_rcon_client), patch(
+            "server_manager.RconMetricsEngine", return_value=mock_metrics_engine
+        ):
+            await server_manager.add_server(minimal_server_config)
+            first = await server_manager.get_metrics_snapshot(minimal_server_config.tag)
+            second = await server_manager.get_metrics_snapshot(minimal_server_config.tag)
+
+        assert first is second
+        assert first.metrics["player_count"] == 4
+        mock_metrics_engine.gather_all_metrics.assert_awaited_once()
+        assert server_manager.get_latest_snapshots() == {minimal_server_config.tag: first}
+
+    async def test_get_metrics_snapshot_unknown_server(
+        self, server_manager: ServerManager
+    ) -> None:
+        """Unknown servers have no snapshot."""
+        assert await server_manager.get_metrics_snapshot("missing") is None
+        assert server_manager.get_latest_snapshots() == {}
+
+
 @pytest.mark.asyncio
 class TestServerManagerGetters:
     """Test getter methods (get_client, get_config, get_collector, get_alert_monitor)."""
@@ -1074,6 +1166,36 @@ class TestServerManagerGetters:
             server_manager.get_alert_monitor("nonexistent")
 
 
+class TestServerManagerPlayerRoster:
+    """Test observe_event and mark_roster_stale routing."""
+
+    def test_observe_event_routes_to_server_roster_and_cache(
+        self, server_manager: ServerManager
+    ) -> None:
+        client = MagicMock()
+        server_manager.clients["test"] = client
+        event = MagicMock(server_tag="test")
+
+        server_manager.observe_event(event)
+
+        client.roster.apply_event.assert_called_once_with(event)
+        client.cache.observe_event.assert_called_once_with(event)
+
+    def test_observe_event_unknown_server_ignored(
+        self, server_manager: ServerManager
+    ) -> None:
+        server_manager.observe_event(MagicMock(server_tag="missing"))
+
+    def test_mark_roster_stale(self, server_manager: ServerManager) -> None:
+        client = MagicMock()
+        server_manager.clients["test"] = client
+
+        server_manager.mark_roster_stale("test", "catchup_window_exceeded")
+        server_manager.mark_roster_stale("missing", "catchup_window_exceeded")
+
+        client.roster.mark_stale.assert_called_once_with("catchup_window_exceeded")
+
+
 # ============================================================================
 # LIST/SUMMARY METHOD TESTS
 # ============================================================================
@@ -1243,6 +1365,17 @@ class TestServerManagerStopAll:
         await server_manager.stop_all()
         assert len(server_manager.clients) == 0
 
+    async def test_stop_all_stops_orphaned_samplers(self, server_manager: ServerManager) -> None:
+        """A sampler whose server is already gone is still stopped."""
+        orphan = MagicMock()
+        orphan.stop = AsyncMock()
+        server_manager.metrics_samplers["gone"] = orphan
+
+        await server_manager.stop_all()
+
+        orphan.stop.assert_awaited_once()
+        assert server_manager.metrics_samplers == {}
+
     async def test_stop_all_single_server(
         self,
         server_manager: ServerManager,
@@ -0,0 +1,106 @@
+"""Tests for startup_profile.py (--profile-startup import and phase timings)."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from startup_profile import ImportTimer, StartupProfiler
+
+
+@pytest.fixture
+def module_dir(tmp_path: Path) -> Iterator[Path]:
+    """Importable directory for throwaway modules."""
+    sys.path.insert(0, str(tmp_path))
+    yield tmp_path
+    sys.path.remove(str(tmp_path))
+    for name in [n for n in sys.modules if n.startswith("profiled_")]:
+        del sys.modules[name]
+
+
+class TestImportTimer:
+    def test_records_nested_imports(self, module_dir: Path) -> None:
+        (module_dir / "profiled_child.py").write_text("import time\ntime.sleep(0.01)\n")
+        (module_dir / "profiled_parent.py").write_text("import profiled_child\n")
+
+        timer = ImportTimer()
+        timer.install()
+        try:
+            import profiled_parent  # noqa: F401
+        finally:
+            timer.uninstall()
+
+        timings = {t.name: t for t in timer.timings}
+        child = timings["profiled_child"]
+        parent = timings["profiled_parent"]
+
+        # Children complete first, like -X importtime output
+        assert [t.name for t in timer.timings] == ["profiled_child", "profiled_parent"]
+        assert child.depth == 1 and parent.depth == 0
+        assert child.cumulative_us >= 10_000
+        assert parent.cumulative_us >= child.cumulative_us
+        assert parent.self_us < child.cumulative_us
+        assert timer not in sys.meta_path
+
+    def test_module_behaves_normally(self, module_dir: Path) -> None:
+        (module_dir / "profiled_plain.py").write_text("VALUE = 42\n")
+
+        timer = ImportTimer()
+        timer.install()
+        try:
+            import profiled_plain
+        finally:
+            timer.uninstall()
+
+        assert profiled_plain.VALUE == 42
+        assert profiled_plain.__spec__.loader.get_filename("profiled_plain").endswith(
+            "profiled_plain.py"
+        )
+
+    def test_other_threads_not_timed(self, module_dir: Path) -> None:
+        (module_dir / "profiled_threaded.py").write_text("VALUE = 1\n")
+
+        timer = ImportTimer()
+        timer.install()
+        try:
+            thread = threading.Thread(target=__import__, args=("profiled_threaded",))
+            thread.start()
+            thread.join()
+        finally:
+            timer.uninstall()
+
+        assert "profiled_threaded" in sys.modules
+        assert timer.timings == []
+
+
+class TestStartupProfiler:
+    def test_from_argv_requires_flag(self) -> None:
+        assert StartupProfiler.from_argv(["main"]) is None
+
+        profiler = StartupProfiler.from_argv(["main", "--profile-startup"])
+        assert profiler is not None
+        try:
+            assert profiler.imports in sys.meta_path
+        finally:
+            profiler.mark_ready()
+        assert profiler.imports not in sys.meta_path
+
+    def test_report_lists_imports_and_phases(self, module_dir: Path) -> None:
+        (module_dir / "profiled_report.py").write_text("VALUE = 1\n")
+
+        profiler = StartupProfiler()
+        profiler.imports.install()
+        with profiler.phase("health_server"):
+            import profiled_report  # noqa: F401
+        profiler.mark_ready()
+
+        report = profiler.format_report()
+        assert report.startswith("import time: self [us] | cumulative | imported package")
+        assert "| profiled_report" in report
+        assert "| health_server" in report
+        assert report.rstrip().endswith("| ready")
+        assert profiler.slowest_imports(1)[0].name == "profiled_report"